@@ -0,0 +1,613 @@
+"""
+Shared Audio Analysis
+Loads audio and computes the spectrogram used by every visualizer
+
+Results are cached on disk, keyed by a hash of the audio bytes plus the analysis
+parameters (sr, fps, n_fft, hop). The matrix is stored as a plain .npy file so
+later runs memory-map it and skip decode + STFT entirely.
+
+Bar magnitudes are produced the same way for the whole song: a bins -> bars
+weight matrix (built once per size) and one vectorized smoothing pass over time.
+
+StreamingSpectrum does the same analysis in blocks for multi-hour files, so peak
+memory stays bounded regardless of track length.
+
+Environment:
+    AS_CACHE_DIR   Cache location (default: ~/.cache/audio_spectrum)
+    AS_NO_CACHE=1  Disable the cache
+"""
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import librosa
+
+# scipy and soundfile are only needed by the streaming path and are imported there:
+# together they take over a second to import, which dominated one-mode previews
+
+
+# Bump when the stored analysis changes so stale entries are ignored
+CACHE_VERSION = 1
+
+N_FFT = 2048
+
+# Analyses already loaded by this process (batch workers render many modes of one clip)
+_memo = {}
+# Content hashes of audio files already read by this process
+_hash_memo = {}
+
+
+class SpectrumAnalysis:
+    """Spectrogram plus the timing info needed to map it onto video frames"""
+
+    def __init__(self, spectrogram, sample_rate, num_samples, hop_length, n_fft, fps):
+        """
+        Args:
+            spectrogram: (n_bins, num_frames) array, 0-1 normalized dB or raw dB
+            sample_rate: Native sample rate of the audio
+            num_samples: Length of the decoded audio in samples
+            hop_length: STFT hop in samples
+            n_fft: STFT window size
+            fps: Video frame rate the hop was derived from
+        """
+        self.spectrogram = spectrogram
+        self.sample_rate = sample_rate
+        self.num_samples = num_samples
+        self.hop_length = hop_length
+        self.n_fft = n_fft
+        self.fps = fps
+        self.duration = num_samples / sample_rate
+        self.num_frames = spectrogram.shape[1]
+
+
+def cache_dir():
+    """Directory for cached spectrograms, or None when caching is disabled"""
+    if os.getenv('AS_NO_CACHE') == '1':
+        return None
+    return Path(os.getenv('AS_CACHE_DIR', Path.home() / '.cache' / 'audio_spectrum'))
+
+
+def hash_audio_file(audio_path, chunk_size=1 << 20):
+    """Content hash of an audio file (streams the file, constant memory; memoized per file version)"""
+    stat = os.stat(audio_path)
+    memo_key = (os.path.realpath(audio_path), stat.st_mtime_ns, stat.st_size)
+    cached = _hash_memo.get(memo_key)
+    if cached is not None:
+        return cached
+    digest = hashlib.blake2b(digest_size=20)
+    with open(audio_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    cached = _hash_memo[memo_key] = digest.hexdigest()
+    return cached
+
+
+def _cache_key(audio_hash, params):
+    payload = json.dumps({'audio': audio_hash, 'version': CACHE_VERSION, **params}, sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+def _read_cache(directory, key):
+    meta_path = directory / f'{key}.json'
+    data_path = directory / f'{key}.npy'
+    if not (meta_path.exists() and data_path.exists()):
+        return None
+    try:
+        meta = json.loads(meta_path.read_text())
+        spectrogram = np.load(data_path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    return SpectrumAnalysis(spectrogram, meta['sample_rate'], meta['num_samples'],
+                            meta['hop_length'], meta['n_fft'], meta['fps'])
+
+
+def _write_cache(directory, key, analysis):
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # Write to temp files then rename, so parallel renders never see partial entries
+        with tempfile.NamedTemporaryFile(dir=directory, suffix='.npy', delete=False) as f:
+            np.save(f, analysis.spectrogram)
+        os.replace(f.name, directory / f'{key}.npy')
+
+        meta = {
+            'sample_rate': analysis.sample_rate,
+            'num_samples': analysis.num_samples,
+            'hop_length': analysis.hop_length,
+            'n_fft': analysis.n_fft,
+            'fps': analysis.fps,
+        }
+        with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.json', delete=False) as f:
+            json.dump(meta, f)
+        os.replace(f.name, directory / f'{key}.json')
+    except OSError as e:
+        print(f"Warning: Could not write spectrogram cache: {e}")
+
+
+def compute_spectrum(audio_path, fps, n_fft=N_FFT, hop='fps', scale='norm'):
+    """
+    Decode audio and compute its spectrogram (no caching)
+
+    Args:
+        audio_path: Path to audio file
+        fps: Video frames per second
+        n_fft: STFT window size
+        hop: 'fps' for hop = sr / fps, or 'frames' for one STFT column per video frame
+        scale: 'norm' for 0-1 normalized dB, 'db' for raw dB
+
+    Returns:
+        SpectrumAnalysis
+    """
+    y, sr = librosa.load(audio_path, sr=None)
+
+    if hop == 'fps':
+        hop_length = int(sr / fps)
+    else:
+        total_frames = int(len(y) / sr * fps)
+        hop_length = len(y) // total_frames if total_frames else 0
+        if hop_length == 0:
+            hop_length = 512
+
+    magnitude = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
+
+    # Convert to dB scale for better visualization
+    spectrogram = librosa.amplitude_to_db(magnitude, ref=np.max)
+    del magnitude
+
+    if scale == 'norm':
+        # Normalize to 0-1 range (in place, so only one spectrogram is alive)
+        db_min = spectrogram.min()
+        db_range = spectrogram.max() - db_min
+        spectrogram -= db_min
+        spectrogram /= db_range
+
+    return SpectrumAnalysis(spectrogram, sr, len(y), hop_length, n_fft, fps)
+
+
+def load_spectrum(audio_path, fps, n_fft=N_FFT, hop='fps', scale='norm'):
+    """
+    Spectrogram for an audio file, served from the on-disk cache when possible
+
+    Same arguments as compute_spectrum. Cached spectrograms come back as
+    read-only memory-mapped arrays; repeat calls in one process reuse the result.
+    """
+    stat = os.stat(audio_path)
+    memo_key = (os.path.realpath(audio_path), stat.st_mtime_ns, stat.st_size, fps, n_fft, hop, scale)
+    analysis = _memo.get(memo_key)
+    if analysis is not None:
+        return analysis
+
+    directory = cache_dir()
+    if directory is None:
+        analysis = compute_spectrum(audio_path, fps, n_fft=n_fft, hop=hop, scale=scale)
+    else:
+        params = {'sr': 'native', 'fps': fps, 'n_fft': n_fft, 'hop': hop, 'scale': scale}
+        key = _cache_key(hash_audio_file(audio_path), params)
+
+        analysis = _read_cache(directory, key)
+        if analysis is not None:
+            print(f"Using cached spectrogram: {key[:12]}")
+        else:
+            analysis = compute_spectrum(audio_path, fps, n_fft=n_fft, hop=hop, scale=scale)
+            _write_cache(directory, key, analysis)
+
+    _memo[memo_key] = analysis
+    return analysis
+
+
+@lru_cache(maxsize=None)
+def band_weights(n_bins, num_bars):
+    """
+    (num_bars, k) float32 matrix averaging the first k spectrogram bins into bars
+
+    Each bar averages a small window around a log-spaced position in the lower
+    60% of the spectrum (where most music energy is), so low frequencies get
+    more bars. k stops at the last bin any bar uses, so callers multiply with
+    spectrogram[:weights.shape[1]].
+    """
+    useful_freqs = int(n_bins * 0.6)
+    window_size = max(1, useful_freqs // (num_bars * 2))
+
+    weights = np.zeros((num_bars, max(1, useful_freqs)), dtype=np.float32)
+    for i in range(num_bars):
+        t = i / num_bars
+        freq_pos = int(useful_freqs * (t ** 1.5))
+
+        start_idx = max(0, freq_pos - window_size // 2)
+        end_idx = min(useful_freqs, freq_pos + window_size // 2)
+
+        if start_idx < end_idx:
+            weights[i, start_idx:end_idx] = 1.0 / (end_idx - start_idx)
+        elif freq_pos < weights.shape[1]:
+            weights[i, freq_pos] = 1.0
+
+    used = np.flatnonzero(weights.any(axis=0))
+    weights = weights[:, :used[-1] + 1] if len(used) else weights[:, :1]
+    weights.setflags(write=False)
+    return weights
+
+
+def video_frame_indices(num_frames, total_frames):
+    """Spectrogram column used for each video frame"""
+    indices = (np.arange(total_frames) * num_frames / total_frames).astype(int)
+    return np.minimum(indices, num_frames - 1)
+
+
+def smooth_track(track, smoothing, prev=None, block_size=256):
+    """
+    Exponential smoothing along the time axis of a (frames, bars) array
+
+    Equivalent to prev = smoothing * prev + (1 - smoothing) * current per frame,
+    with the first frame passed through unchanged unless prev (the smoothed frame
+    before this track) is given. Unrolled, each block is a scaled cumulative sum;
+    blocks stay short enough that smoothing ** -block_size cannot overflow.
+
+    Returns:
+        float64 array shaped like track
+    """
+    if len(track) == 0 or smoothing == 0:
+        return track.astype(np.float64)
+    if smoothing < 0.1:
+        block_size = max(1, min(block_size, int(200 / -np.log10(smoothing))))
+
+    smoothed = np.empty(track.shape, dtype=np.float64)
+    prev = track[0].astype(np.float64) if prev is None else prev
+    for start in range(0, len(track), block_size):
+        x = track[start:start + block_size].astype(np.float64)
+        decay = smoothing ** np.arange(len(x))[:, None]
+        accumulated = np.cumsum(x / decay, axis=0)
+        smoothed[start:start + len(x)] = decay * (smoothing * prev + (1 - smoothing) * accumulated)
+        prev = smoothed[start + len(x) - 1]
+    return smoothed
+
+
+def bar_track(spectrogram, num_bars, frame_indices, smoothing):
+    """
+    Smoothed bar magnitudes for a sequence of spectrogram columns
+
+    Args:
+        spectrogram: (n_bins, num_frames) normalized spectrogram
+        num_bars: Number of bars
+        frame_indices: Spectrogram column for each video frame
+        smoothing: Smoothing factor between frames (0-1)
+
+    Returns:
+        (len(frame_indices), num_bars) array in the spectrogram's dtype
+    """
+    weights = band_weights(spectrogram.shape[0], num_bars)
+    bars = np.asarray(weights @ spectrogram[:weights.shape[1]]).T[frame_indices]
+    return smooth_track(bars, smoothing).astype(spectrogram.dtype, copy=False)
+
+
+class StreamingSpectrum:
+    """
+    Constant-memory spectrogram analysis for long audio files
+
+    Decodes and transforms the file block by block (centered, zero-padded STFT
+    frames, same as librosa.stft). A first pass only tracks the magnitude range,
+    which fixes the global dB normalization; bar_frames() then runs a second pass
+    and yields smoothed bar magnitudes one video frame at a time. Output matches
+    load_spectrum + bar_track to float32 rounding.
+    """
+
+    # amplitude_to_db defaults
+    AMIN = 1e-5
+    TOP_DB = 80.0
+
+    def __init__(self, audio_path, fps, n_fft=N_FFT, block_size=1 << 18):
+        """
+        Args:
+            audio_path: Path to audio file (any format libsndfile can read)
+            fps: Video frames per second
+            n_fft: STFT window size
+            block_size: Samples decoded per block
+        """
+        self.audio_path = audio_path
+        self.fps = fps
+        self.n_fft = n_fft
+        self.block_size = block_size
+
+        import soundfile as sf
+        from scipy.signal import get_window
+
+        with sf.SoundFile(audio_path) as f:
+            self.sample_rate = f.samplerate
+        self.hop_length = int(self.sample_rate / fps)
+        self.window = get_window('hann', n_fft, fftbins=True)
+
+        self._scan()
+
+    def _scan(self):
+        """First pass: sample count, frame count and magnitude range"""
+        num_frames = 0
+        mag_min = np.inf
+        mag_max = 0.0
+        for magnitude in self._magnitude_blocks():
+            num_frames += magnitude.shape[1]
+            mag_min = min(mag_min, magnitude.min())
+            mag_max = max(mag_max, magnitude.max())
+
+        self.num_samples = self._samples_read
+        self.num_frames = num_frames
+        self.duration = self.num_samples / self.sample_rate
+
+        # Same arithmetic as amplitude_to_db(ref=np.max): the top is 0 dB and the
+        # floor is clipped at -top_db, so the normalization range is known up front
+        amin = np.float32(self.AMIN ** 2)
+        self._ref_db = np.float32(10.0) * np.log10(np.maximum(amin, np.float32(mag_max) ** 2))
+        db_min = np.float32(10.0) * np.log10(np.maximum(amin, np.float32(mag_min) ** 2)) - self._ref_db
+        self._db_min = np.maximum(db_min, np.float32(-self.TOP_DB))
+        self._db_range = np.float32(0.0) - self._db_min
+
+    def _sample_blocks(self):
+        """Mono float32 sample blocks"""
+        import soundfile as sf
+
+        self._samples_read = 0
+        with sf.SoundFile(self.audio_path) as f:
+            for block in f.blocks(blocksize=self.block_size, dtype='float32', always_2d=True):
+                self._samples_read += len(block)
+                yield block[:, 0] if block.shape[1] == 1 else block.mean(axis=1)
+
+    def _magnitude_blocks(self):
+        """Yield |STFT| column blocks (n_bins, k) in time order"""
+        hop = self.hop_length
+        pad = np.zeros(self.n_fft // 2, dtype=np.float32)
+
+        buffer = pad
+        for block in self._sample_blocks():
+            buffer = np.concatenate([buffer, block])
+            count = self._frames_ready(len(buffer))
+            if count:
+                yield self._stft(buffer, count)
+                # Keep the overlap the next frame still needs
+                buffer = buffer[count * hop:]
+
+        buffer = np.concatenate([buffer, pad])
+        count = self._frames_ready(len(buffer))
+        if count:
+            yield self._stft(buffer, count)
+
+    def _frames_ready(self, buffer_len):
+        if buffer_len < self.n_fft:
+            return 0
+        return (buffer_len - self.n_fft) // self.hop_length + 1
+
+    def _stft(self, buffer, count):
+        span = (count - 1) * self.hop_length + self.n_fft
+        frames = np.lib.stride_tricks.sliding_window_view(buffer[:span], self.n_fft)[::self.hop_length]
+        spectrum = np.fft.rfft(frames * self.window, axis=1).astype(np.complex64)
+        return np.abs(spectrum).T
+
+    def _normalized_blocks(self):
+        """Yield 0-1 normalized dB column blocks, as in load_spectrum(scale='norm')"""
+        amin = np.float32(self.AMIN ** 2)
+        for magnitude in self._magnitude_blocks():
+            db = np.float32(10.0) * np.log10(np.maximum(amin, np.square(magnitude)))
+            db -= self._ref_db
+            np.maximum(db, np.float32(-self.TOP_DB), out=db)
+            db -= self._db_min
+            db /= self._db_range
+            yield db
+
+    def bar_blocks(self, num_bars, smoothing, total_frames=None):
+        """
+        Second pass: smoothed bar magnitudes, one block of video frames at a time
+
+        Args:
+            num_bars: Number of bars
+            smoothing: Smoothing factor between frames (0-1)
+            total_frames: Video frame count (default: duration * fps)
+
+        Yields:
+            (k, num_bars) float32 arrays covering consecutive video frames
+        """
+        if total_frames is None:
+            total_frames = int(self.duration * self.fps)
+        indices = video_frame_indices(self.num_frames, total_frames)
+        weights = band_weights(self.n_fft // 2 + 1, num_bars)
+
+        frame_idx = 0
+        column_start = 0
+        prev = None
+        for block in self._normalized_blocks():
+            column_end = column_start + block.shape[1]
+            # Video frames whose spectrogram column falls inside this block
+            stop = np.searchsorted(indices, column_end, side='left')
+            if stop > frame_idx:
+                bars = np.asarray(weights @ block[:weights.shape[1]]).T[indices[frame_idx:stop] - column_start]
+                bars = smooth_track(bars, smoothing, prev)
+                prev = bars[-1]
+                yield bars.astype(np.float32)
+                frame_idx = stop
+            column_start = column_end
+
+    def bar_frames(self, num_bars, smoothing, total_frames=None):
+        """Same as bar_blocks, one (num_bars,) array per video frame"""
+        for bars in self.bar_blocks(num_bars, smoothing, total_frames):
+            yield from bars
+
+
+class FeatureFrame:
+    """Audio features for one video frame (what modes read via self.features)"""
+
+    __slots__ = ('magnitudes', 'bass', 'mids', 'highs', 'energy',
+                 'flux', 'onset', 'beat', 'peaks')
+
+    def __init__(self, magnitudes, bass, mids, highs, energy, flux, onset, beat, peaks):
+        self.magnitudes = magnitudes
+        self.bass = bass
+        self.mids = mids
+        self.highs = highs
+        self.energy = energy
+        self.flux = flux
+        self.onset = onset
+        self.beat = beat
+        self.peaks = peaks
+
+
+class FrameFeatures:
+    """
+    Feature track for a run of video frames
+
+    Attributes (one entry per frame):
+        bars: (T, num_bars) smoothed bar magnitudes
+        bass, mids, highs: Mean of the lower 25%, middle 50% and upper 25% of bars
+        energy: Mean of all bars
+        flux: Spectral flux (mean positive bar change since the previous frame)
+        onset: Flux above its recent average (0 when nothing new is happening)
+        beat: True on detected beats
+        peaks: (T, num_bars) peak-hold magnitudes (decaying maximum per bar)
+    """
+
+    def __init__(self, bars, bass, mids, highs, energy, flux, onset, beat, peaks):
+        self.bars = bars
+        self.bass = bass
+        self.mids = mids
+        self.highs = highs
+        self.energy = energy
+        self.flux = flux
+        self.onset = onset
+        self.beat = beat
+        self.peaks = peaks
+
+    def __len__(self):
+        return len(self.bars)
+
+    def frame(self, i):
+        """FeatureFrame for frame i (scalars as Python types)"""
+        return FeatureFrame(self.bars[i], float(self.bass[i]), float(self.mids[i]),
+                            float(self.highs[i]), float(self.energy[i]), float(self.flux[i]),
+                            float(self.onset[i]), bool(self.beat[i]), self.peaks[i])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.frame(i)
+
+
+class FeatureTracker:
+    """
+    Computes FrameFeatures over consecutive blocks of bar frames
+
+    All features are causal, so a song gives the same result whether it is
+    processed as one block (in-memory path) or many (streaming).
+    """
+
+    def __init__(self, peak_decay=0.95, beat_window=43, beat_threshold=1.5,
+                 beat_min_gap=8, min_flux=0.005):
+        """
+        Args:
+            peak_decay: Per-frame decay of the peak-hold values
+            beat_window: Frames of flux history used for the adaptive beat threshold
+            beat_threshold: Standard deviations above the recent mean that count as a beat
+            beat_min_gap: Minimum frames between beats
+            min_flux: Flux below this never counts as a beat
+        """
+        self.peak_decay = peak_decay
+        self.beat_window = beat_window
+        self.beat_threshold = beat_threshold
+        self.beat_min_gap = beat_min_gap
+        self.min_flux = min_flux
+
+        self._prev_bars = None
+        self._prev_peaks = None
+        self._flux_history = np.zeros(0)
+        self._frame = 0
+        self._last_beat = -beat_min_gap
+
+    def process(self, bars):
+        """
+        Features for the next block of bar frames
+
+        Args:
+            bars: (k, num_bars) bar magnitudes following the previous block
+
+        Returns:
+            FrameFeatures for the block
+        """
+        count, num_bars = bars.shape
+        quarter = num_bars // 4
+
+        # Same slices as BaseModeVisualizer.get_bass/get_mids/get_highs/get_energy
+        bass = np.mean(bars[:, :quarter], axis=1)
+        mids = np.mean(bars[:, quarter:3 * num_bars // 4], axis=1)
+        highs = np.mean(bars[:, 3 * num_bars // 4:], axis=1)
+        energy = np.mean(bars, axis=1)
+
+        previous = bars[:1] if self._prev_bars is None else self._prev_bars[None]
+        rise = np.diff(np.concatenate([previous, bars]), axis=0)
+        flux = np.maximum(rise, 0).mean(axis=1, dtype=np.float64)
+
+        onset, beat = self._onsets(flux)
+        peaks = self._peak_hold(bars)
+
+        if count:
+            self._prev_bars = bars[-1].copy()
+            self._prev_peaks = peaks[-1].copy()
+        self._frame += count
+
+        return FrameFeatures(bars, bass, mids, highs, energy, flux, onset, beat, peaks)
+
+    def _onsets(self, flux):
+        """Onset strength and beat flags against a trailing window of flux"""
+        history = self._flux_history
+        extended = np.concatenate([history, flux])
+        sums = np.concatenate([[0.0], np.cumsum(extended)])
+        squares = np.concatenate([[0.0], np.cumsum(extended ** 2)])
+
+        # Trailing window (excluding the frame itself) for each frame of the block
+        ends = len(history) + np.arange(len(flux))
+        starts = np.maximum(0, ends - self.beat_window)
+        counts = np.maximum(ends - starts, 1)
+        mean = (sums[ends] - sums[starts]) / counts
+        std = np.sqrt(np.maximum((squares[ends] - squares[starts]) / counts - mean ** 2, 0))
+        has_history = ends > starts
+
+        onset = np.where(has_history, np.maximum(flux - mean, 0), 0.0)
+
+        candidates = has_history & (flux > mean + self.beat_threshold * std) & (flux > self.min_flux)
+        beat = np.zeros(len(flux), dtype=bool)
+        for i in np.flatnonzero(candidates):
+            if self._frame + i - self._last_beat >= self.beat_min_gap:
+                beat[i] = True
+                self._last_beat = self._frame + i
+
+        self._flux_history = extended[-self.beat_window:]
+        return onset, beat
+
+    def _peak_hold(self, bars):
+        """
+        peak[t] = max(bars[t], peak[t-1] * decay), without a Python loop
+
+        Unrolled, peak[t] = max over s <= t of bars[s] * decay^(t - s), which is a
+        running maximum in the log domain.
+        """
+        if len(bars) == 0:
+            return bars.copy()
+        log_decay = np.log(self.peak_decay)
+        steps = np.arange(len(bars))[:, None]
+
+        logs = np.log(np.maximum(bars.astype(np.float64), 1e-12)) - steps * log_decay
+        peaks = np.exp(np.maximum.accumulate(logs, axis=0) + steps * log_decay)
+
+        if self._prev_peaks is not None:
+            carried = self._prev_peaks[None] * np.exp((steps + 1) * log_decay)
+            peaks = np.maximum(peaks, carried)
+        return peaks.astype(bars.dtype)
+
+
+def iter_frame_features(blocks, tracker=None):
+    """
+    Yield a FeatureFrame per video frame from blocks of bar frames
+
+    Args:
+        blocks: Iterable of (k, num_bars) arrays in time order
+        tracker: Optional FeatureTracker (default settings otherwise)
+    """
+    if tracker is None:
+        tracker = FeatureTracker()
+    for bars in blocks:
+        yield from tracker.process(bars)
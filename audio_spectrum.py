@@ -29,10 +29,17 @@ Examples:
 import sys
 import numpy as np
 import cv2
-import librosa
 import argparse
 from pathlib import Path
 
+from audio_analysis import (load_spectrum, band_weights, bar_track, video_frame_indices,
+                            StreamingSpectrum)
+from render_profiler import StageProfiler
+from render_pipeline import PipelinedWriter, prefetch
+from color_lut import bgr_to_hsv, hsv_to_bgr
+from ffmpeg_writer import (FFmpegWriter, profile_supported, alpha_output_path, alpha_profile_for,
+                           attach_alpha, opaque_alpha)
+
 
 class CircularSpectrumVisualizer:
     # Apple Design System - Minimal Color Palette (BGR format for OpenCV)
@@ -44,11 +51,14 @@ class CircularSpectrumVisualizer:
     TEXT_PRIMARY = (153, 153, 153)    # Muted gray for subtle elements
     TEXT_LIGHT = (255, 255, 255)      # White for dark backgrounds
 
+    # (style, width, height) -> read-only background template
+    _background_cache = {}
+
     def __init__(self, audio_path, output_path, width=1080, height=1080,
                  fps=30, num_bars=72, color=None, inner_radius=180,
                  bar_width_multiplier=0.8, smoothing=0.85, gradient=True,
                  gradient_color1=None, gradient_color2=None, mode=1,
-                 background_style='soft_gray'):
+                 background_style='soft_gray', streaming=False, profile_path=None):
         """
         Initialize the circular spectrum visualizer with Apple minimalist design
 
@@ -68,6 +78,8 @@ class CircularSpectrumVisualizer:
             gradient_color2: Right side color (BGR format, default: PRIMARY_ORANGE)
             mode: Visualization mode (1-10)
             background_style: Background style ('soft_gray', 'gradient', 'dark', 'transparent')
+            streaming: Analyze audio in blocks with bounded memory (for multi-hour files)
+            profile_path: Write a Chrome trace of per-stage render timings here (default: off)
         """
         self.audio_path = audio_path
         self.output_path = output_path
@@ -80,6 +92,8 @@ class CircularSpectrumVisualizer:
         self.inner_radius = inner_radius
         self.bar_width_multiplier = bar_width_multiplier
         self.smoothing = smoothing
+        self.streaming = streaming
+        self.profile_path = profile_path
         self.gradient = gradient
         # Default gradient: Apple blue to orange
         self.gradient_color1 = gradient_color1 if gradient_color1 is not None else self.PRIMARY_BLUE
@@ -97,6 +111,9 @@ class CircularSpectrumVisualizer:
         # Animation frame counter for smooth effects
         self.frame_counter = 0
 
+        # Reused output buffer for create_background()
+        self._frame_buffer = None
+
     @staticmethod
     def ease_out_cubic(t):
         """Apple-style cubic ease-out for smooth, natural deceleration"""
@@ -125,21 +142,40 @@ class CircularSpectrumVisualizer:
         """
         b, g, r = color
         # Convert to HSV for saturation control
-        hsv = cv2.cvtColor(np.uint8([[[b, g, r]]]), cv2.COLOR_BGR2HSV)
-        h, s, v = hsv[0][0]
+        h, s, v = bgr_to_hsv(b, g, r)
         # Reduce saturation
         s = int(s * (1 - reduction))
         # Convert back to BGR
-        bgr = cv2.cvtColor(np.uint8([[[h, s, v]]]), cv2.COLOR_HSV2BGR)
-        return tuple(map(int, bgr[0][0]))
+        return hsv_to_bgr(h, s, v)
 
     def create_background(self):
         """
         Create Apple-inspired background with soft gradients and optional vignette
 
+        The background is built once per (style, width, height) and copied into a
+        reused frame buffer, so each frame costs a single memcpy.
+
         Returns:
-            Background frame with selected style
+            Background frame with selected style (overwritten by the next call)
         """
+        template = self._background_template()
+        if self._frame_buffer is None or self._frame_buffer.shape != template.shape:
+            self._frame_buffer = np.empty_like(template)
+        np.copyto(self._frame_buffer, template)
+        return self._frame_buffer
+
+    def _background_template(self):
+        """Read-only background for the current style and size (shared across instances)"""
+        key = (self.background_style, self.width, self.height)
+        template = self._background_cache.get(key)
+        if template is None:
+            template = self._build_background()
+            template.setflags(write=False)
+            self._background_cache[key] = template
+        return template
+
+    def _build_background(self):
+        """Render the background style from scratch"""
         if self.background_style == 'transparent':
             # Pure black for transparency keying
             return np.zeros((self.height, self.width, 3), dtype=np.uint8)
@@ -153,19 +189,16 @@ class CircularSpectrumVisualizer:
 
         elif self.background_style == 'gradient':
             # Subtle radial gradient from center
-            frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
             center_y, center_x = self.center_y, self.center_x
             max_dist = np.sqrt(center_x**2 + center_y**2)
 
-            for y in range(self.height):
-                for x in range(self.width):
-                    dist = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-                    t = min(dist / max_dist, 1.0)
-                    # Smooth gradient from white to soft gray
-                    for i in range(3):
-                        frame[y, x, i] = int(self.SURFACE_WHITE[i] * (1 - t) + self.BG_SOFT_GRAY[i] * t)
-
-            return frame
+            y, x = np.ogrid[:self.height, :self.width]
+            dist = np.sqrt((x - center_x)**2 + (y - center_y)**2)
+            t = np.minimum(dist / max_dist, 1.0)[:, :, None]
+            # Smooth gradient from white to soft gray
+            white = np.array(self.SURFACE_WHITE, dtype=np.float64)
+            gray = np.array(self.BG_SOFT_GRAY, dtype=np.float64)
+            return (white * (1 - t) + gray * t).astype(np.uint8)
 
         elif self.background_style == 'dark':
             # Dark spotlight mode
@@ -197,83 +230,55 @@ class CircularSpectrumVisualizer:
         kernel = kernel_y * kernel_x.T
         mask = kernel / kernel.max()
 
-        # Apply vignette with specified strength
-        vignette = np.ones_like(frame, dtype=np.float32)
-        for i in range(3):
-            vignette[:, :, i] = mask
+        # Apply vignette with specified strength (one mask broadcast over the channels)
+        vignette = mask.astype(np.float32)[:, :, None]
 
         # Blend with strength parameter
         vignette = 1 - (1 - vignette) * strength
 
         return (frame * vignette).astype(np.uint8)
 
-    def load_audio(self):
-        """Load and process audio file"""
-        print(f"Loading audio from: {self.audio_path}")
-
-        # Load audio file
-        y, sr = librosa.load(self.audio_path, sr=None)
-        self.sample_rate = sr
-        self.duration = librosa.get_duration(y=y, sr=sr)
-
-        print(f"Audio loaded: {self.duration:.2f}s, Sample rate: {sr}Hz")
+    def to_bgra(self, frame):
+        """
+        Attach a real alpha plane to a rendered frame
 
-        # Calculate STFT (Short-Time Fourier Transform)
-        hop_length = int(sr / self.fps)
-        n_fft = 2048
+        Solid Apple backgrounds are fully opaque; the black 'transparent' canvas
+        uses drawn coverage as alpha, so nothing is keyed out by color threshold.
+        """
+        if self.background_style in ('soft_gray', 'gradient', 'dark'):
+            return opaque_alpha(frame)
+        return attach_alpha(frame)
 
-        stft = librosa.stft(y, n_fft=n_fft, hop_length=hop_length)
-        self.magnitude = np.abs(stft)
+    def load_audio(self):
+        """Load and process audio file (spectrogram comes from the shared analysis cache)"""
+        print(f"Loading audio from: {self.audio_path}")
 
-        # Convert to dB scale for better visualization
-        self.magnitude_db = librosa.amplitude_to_db(self.magnitude, ref=np.max)
+        if self.streaming:
+            # Block-wise analysis; bar frames are produced on demand while rendering
+            analysis = StreamingSpectrum(self.audio_path, self.fps)
+        else:
+            analysis = load_spectrum(self.audio_path, self.fps)
+            # 0-1 normalized dB spectrogram (read-only memory map on a cache hit)
+            self.magnitude_norm = analysis.spectrogram
+        self.analysis = analysis
+        self.sample_rate = analysis.sample_rate
+        self.duration = analysis.duration
 
-        # Normalize to 0-1 range
-        self.magnitude_norm = (self.magnitude_db - self.magnitude_db.min()) / \
-                              (self.magnitude_db.max() - self.magnitude_db.min())
+        print(f"Audio loaded: {self.duration:.2f}s, Sample rate: {self.sample_rate}Hz")
 
-        self.num_frames = self.magnitude_norm.shape[1]
+        self.num_frames = analysis.num_frames
         print(f"Processed {self.num_frames} frames")
 
-        return y, sr
+        return analysis
 
     def get_frequency_bands(self, frame_idx):
         """Extract frequency bands for a specific frame"""
         if frame_idx >= self.num_frames:
             frame_idx = self.num_frames - 1
 
-        # Get magnitude for this frame
-        frame_magnitudes = self.magnitude_norm[:, frame_idx]
-
-        # Use logarithmic spacing for more perceptually accurate frequency distribution
-        # This focuses more bars on lower frequencies where music has more energy
-        total_freqs = len(frame_magnitudes)
-
-        # Only use the lower 60% of frequencies (where most music energy is)
-        # and distribute them across all bars
-        useful_freqs = int(total_freqs * 0.6)
-
-        bar_magnitudes = []
-        for i in range(self.num_bars):
-            # Logarithmic distribution: more bars for lower frequencies
-            t = i / self.num_bars
-            # Exponential mapping to focus on lower frequencies
-            freq_pos = int(useful_freqs * (t ** 1.5))
-
-            # Get a small window around this frequency
-            window_size = max(1, useful_freqs // (self.num_bars * 2))
-            start_idx = max(0, freq_pos - window_size // 2)
-            end_idx = min(useful_freqs, freq_pos + window_size // 2)
-
-            # Average the frequencies in this window
-            if start_idx < end_idx:
-                avg_magnitude = np.mean(frame_magnitudes[start_idx:end_idx])
-            else:
-                avg_magnitude = frame_magnitudes[freq_pos] if freq_pos < len(frame_magnitudes) else 0
-
-            bar_magnitudes.append(avg_magnitude)
-
-        bar_magnitudes = np.array(bar_magnitudes)
+        # Log-spaced windows over the lower 60% of bins (see audio_analysis.band_weights)
+        weights = band_weights(self.magnitude_norm.shape[0], self.num_bars)
+        bar_magnitudes = weights @ self.magnitude_norm[:weights.shape[1], frame_idx]
 
         # Apply smoothing between frames
         if self.prev_magnitudes is not None:
@@ -284,6 +289,13 @@ class CircularSpectrumVisualizer:
 
         return bar_magnitudes
 
+    def get_band_track(self, total_frames):
+        """Smoothed bar magnitudes for every video frame (one matmul + smoothing pass)"""
+        if self.streaming:
+            return self.analysis.bar_frames(self.num_bars, self.smoothing, total_frames)
+        indices = video_frame_indices(self.num_frames, total_frames)
+        return bar_track(self.magnitude_norm, self.num_bars, indices, self.smoothing)
+
     def get_color_for_position(self, index, magnitude):
         """Get Apple-inspired minimalist color with sophisticated gradients and reduced saturation"""
         angle_step = 360 / self.num_bars
@@ -891,137 +903,101 @@ class CircularSpectrumVisualizer:
     def generate_video(self):
         """Generate the final video with transparent background"""
         print(f"Generating video: {self.output_path}")
+        profiler = StageProfiler(enabled=self.profile_path is not None)
 
         # Load audio
-        self.load_audio()
-
-        # Determine output format and codec based on file extension
-        ext = Path(self.output_path).suffix.lower()
-
-        # For transparency support, we'll create the video with WebM or MOV format
-        # MP4 doesn't support alpha channel, so we'll use ffmpeg to create a proper transparent video
-
-        # First, create a temporary video without transparency
-        temp_no_audio = str(Path(self.output_path).with_suffix('')) + '_temp_no_audio.mp4'
+        with profiler.stage('analysis'):
+            self.load_audio()
 
-        # Use mp4v codec for temporary file
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        # Output to .mov (ProRes 4444) unless .webm (VP9 alpha) was requested
+        final_output = alpha_output_path(self.output_path)
 
-        # Create video writer
-        video_writer = cv2.VideoWriter(
-            temp_no_audio,
-            fourcc,
-            self.fps,
-            (self.width, self.height),
-            True
-        )
-
-        if not video_writer.isOpened():
-            raise RuntimeError("Failed to open video writer")
-
-        # Generate frames
-        total_frames = int(self.duration * self.fps)
-
-        for frame_idx in range(total_frames):
-            # Create frame with Apple-minimalist background
-            frame = self.create_background()
-
-            # Get frequency data for this frame
-            audio_frame_idx = int(frame_idx * self.num_frames / total_frames)
-            magnitudes = self.get_frequency_bands(audio_frame_idx)
-
-            # Draw spectrum on the frame
-            frame = self.draw_circular_spectrum(frame, magnitudes)
-
-            # Apply final rendering optimizations for Apple aesthetic
-            # Subtle blur for smoothness (0.5 sigma for very gentle effect)
-            frame = cv2.GaussianBlur(frame, (3, 3), 0.5)
-
-            # Increment frame counter for animations
-            self.frame_counter += 1
-
-            # Write frame to video
-            video_writer.write(frame)
-
-            # Progress indicator
-            if (frame_idx + 1) % 30 == 0 or frame_idx == total_frames - 1:
-                progress = (frame_idx + 1) / total_frames * 100
-                print(f"Progress: {progress:.1f}% ({frame_idx + 1}/{total_frames} frames)")
-
-        video_writer.release()
-        print(f"\nVideo generation complete (silent): {temp_no_audio}")
-
-        # Now use ffmpeg to:
-        # 1. Add audio
-        # 2. Convert black pixels to transparent (using colorkey filter)
-        # 3. Output to .mov with alpha channel
-        print("Adding audio and transparency...")
-        import subprocess
+        # Frames carry their own alpha plane, so the encoder needs no keying stage:
+        # - ProRes 4444 / VP9 alpha straight from BGRA frames
+        # - Audio added in the same encode pass
+        profile = alpha_profile_for(final_output)
 
         try:
-            # Always output to .mov since it supports transparency
-            final_output = str(Path(self.output_path).with_suffix('.mov'))
-
-            # Use ffmpeg to:
-            # - Add audio
-            # - Convert black (0,0,0) to transparent using colorkey filter
-            # - Use ProRes 4444 codec which supports alpha channel
-            result = subprocess.run([
-                'ffmpeg', '-y',
-                '-i', temp_no_audio,      # Video input
-                '-i', self.audio_path,     # Audio input
-                '-filter_complex',
-                '[0:v]colorkey=0x000000:0.01:0.1[ckout];[ckout]format=yuva420p[video]',
-                '-map', '[video]',         # Use filtered video
-                '-map', '1:a',             # Use audio from second input
-                '-c:v', 'prores_ks',       # ProRes codec with alpha support
-                '-profile:v', '4444',      # ProRes 4444 profile (supports alpha)
-                '-c:a', 'aac',             # AAC audio codec
-                '-shortest',               # Match shortest stream
-                final_output
-            ], capture_output=True, text=True)
-
-            # Clean up temp file
-            Path(temp_no_audio).unlink()
-
-            if result.returncode == 0:
-                self.output_path = final_output
-                print(f"✓ Video with transparency and audio created successfully")
-                print(f"✓ Output: {final_output}")
-            else:
+            if not profile_supported(profile):
                 # Fallback: just add audio without transparency
                 print(f"Warning: Could not create transparent video. Creating standard video instead.")
-                print(f"FFmpeg error: {result.stderr}")
-
-                result = subprocess.run([
-                    'ffmpeg', '-y',
-                    '-i', temp_no_audio,
-                    '-i', self.audio_path,
-                    '-c:v', 'copy',
-                    '-c:a', 'aac',
-                    '-shortest',
-                    final_output
-                ], capture_output=True, text=True)
-
-                Path(temp_no_audio).unlink()
-
-                if result.returncode == 0:
-                    print(f"✓ Standard video created: {final_output}")
-                else:
-                    print(f"Error: Could not create video")
-
+                profile = 'h264'
+
+            # Raw frames are piped straight into ffmpeg - no temp file, no second encode
+            encoder = FFmpegWriter(
+                final_output,
+                self.width,
+                self.height,
+                self.fps,
+                audio_path=self.audio_path,
+                profile=profile
+            )
         except FileNotFoundError:
             print("Error: ffmpeg not found. Please install ffmpeg:")
             print("  brew install ffmpeg")
-            Path(temp_no_audio).unlink()
             raise
+
+        # Frames are converted to BGRA and encoded on a writer thread while the next
+        # one draws (see render_pipeline)
+        video_writer = PipelinedWriter(encoder, prepare=self.to_bgra if encoder.has_alpha else None,
+                                       profiler=profiler)
+
+        # Generate frames
+        total_frames = int(self.duration * self.fps)
+        with profiler.stage('bands'):
+            band_frames = prefetch(self.get_band_track(total_frames), profiler=profiler)
+
+        try:
+            for frame_idx in range(total_frames):
+                # Create frame with Apple-minimalist background
+                with profiler.stage('background'):
+                    frame = self.create_background()
+
+                # Get frequency data for this frame
+                with profiler.stage('wait'):
+                    magnitudes = next(band_frames)
+
+                # Draw spectrum on the frame
+                with profiler.stage('draw'):
+                    frame = self.draw_circular_spectrum(frame, magnitudes)
+
+                # Apply final rendering optimizations for Apple aesthetic
+                # Subtle blur for smoothness (0.5 sigma for very gentle effect)
+                # (a new array, so the reused background buffer never reaches the writer)
+                with profiler.stage('blur'):
+                    frame = cv2.GaussianBlur(frame, (3, 3), 0.5)
+
+                # Increment frame counter for animations
+                self.frame_counter += 1
+
+                # Queue the frame; the writer thread attaches the alpha plane and encodes it
+                with profiler.stage('queue'):
+                    video_writer.write(frame)
+
+                # Progress indicator
+                if (frame_idx + 1) % 30 == 0 or frame_idx == total_frames - 1:
+                    progress = (frame_idx + 1) / total_frames * 100
+                    print(f"Progress: {progress:.1f}% ({frame_idx + 1}/{total_frames} frames)")
+
+            print("Finalizing video...")
+            with profiler.stage('finalize'):
+                video_writer.release()
         except Exception as e:
             print(f"Error: Could not process video: {e}")
-            if Path(temp_no_audio).exists():
-                Path(temp_no_audio).unlink()
+            video_writer.abort()
             raise
+        finally:
+            band_frames.close()
+
+        self.output_path = final_output
+        if video_writer.has_alpha:
+            print(f"✓ Video with transparency and audio created successfully")
+        else:
+            print(f"✓ Standard video created: {final_output}")
+        print(f"✓ Output: {final_output}")
 
         print(f"Duration: {self.duration:.2f}s, Resolution: {self.width}x{self.height}, FPS: {self.fps}")
+        profiler.finish(self.profile_path)
 
 
 def main():
@@ -1075,6 +1051,10 @@ Examples:
     parser.add_argument('--inner-radius', type=int, default=180, help='Inner circle radius (default: 180 for more breathing room)')
     parser.add_argument('--bar-width', type=float, default=0.8, help='Bar width multiplier (default: 0.8 for thinner, elegant bars)')
     parser.add_argument('--smoothing', type=float, default=0.85, help='Smoothing factor 0-1 (default: 0.85 for fluid Apple motion)')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Analyze audio in blocks with bounded memory (for multi-hour mixes)')
+    parser.add_argument('--profile', type=str, default=None, metavar='TRACE_JSON',
+                        help='Write a Chrome trace of per-stage render timings and print a summary')
     parser.add_argument('--background', type=str, choices=['soft_gray', 'gradient', 'dark', 'transparent'],
                        default='soft_gray', help='Background style (default: soft_gray for Apple aesthetic)')
 
@@ -1160,7 +1140,9 @@ Examples:
         gradient_color1=gradient_color1_bgr,
         gradient_color2=gradient_color2_bgr,
         mode=args.mode,
-        background_style=args.background
+        background_style=args.background,
+        streaming=args.streaming,
+        profile_path=args.profile
     )
 
     # Generate video
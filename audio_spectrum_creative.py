@@ -178,17 +178,424 @@ import sys
 import os
 import numpy as np
 import cv2
-import librosa
 import argparse
 from pathlib import Path
 
 # Import mode registry for modular visualization modes
 from modes import register_modes, get_mode_method
+from modes.base import ParticleSystem
+from modes.layers import LayerCache
+from modes.symmetry import Kaleidoscope
+from audio_analysis import (load_spectrum, band_weights, bar_track, video_frame_indices,
+                            StreamingSpectrum, iter_frame_features, hash_audio_file)
+from render_profiler import StageProfiler
+from render_pipeline import PipelinedWriter, prefetch
+from render_random import render_entropy, frame_rng
+from checkpoint import render_checkpointed, DEFAULT_CHECKPOINT_EVERY
+from color_lut import hsv_pixel, hsv_to_bgr, hsv_to_bgr_array
+from ffmpeg_writer import (FFmpegWriter, profile_supported, alpha_output_path, alpha_profile_for,
+                           attach_alpha)
+
+
+# Initial state of the modes, copied into each mode's own state on first use
+# (see modes.base.ModeState); the visualizer itself only holds render context
+MODE_STATE_DEFAULTS = dict(
+    # Particle pools for the particle-based modes (struct-of-arrays, see modes.base)
+    rain_system=ParticleSystem(extra_fields=('trail',)),
+    firework_system=ParticleSystem(capacity=16384),
+    ember_system=ParticleSystem(),
+    show_rockets=[],
+    show_sparks=ParticleSystem(),
+    # Boid flocks (stepped by modes.flocking)
+    swarm_flock=ParticleSystem(),
+    satellite_system=ParticleSystem(),
+    # Metaballs of mode 54 (rendered by modes.metaballs)
+    metaball_system=ParticleSystem(extra_fields=('base_radius',)),
+    # Symmetry compositors of the kaleidoscope modes (draw one wedge, see modes.symmetry)
+    kaleidoscope_sections=Kaleidoscope(8),
+    radial_kaleidoscope=Kaleidoscope(8),
+    kaleidoscope_art=Kaleidoscope(6, mirror=True),
+
+    # Mode-specific state
+    rotation_angle=0,
+    cassette_reel_angle=0,
+    flower_petals=[],
+    pixel_clouds=[],
+    mercury_history=[],
+    cosmic_particles=[],
+
+    # New modes 11-20 state
+    quantum_strings=[],
+    lava_blobs=[],
+    dna_rotation=0,
+    lightning_bolts=[],
+    geometry_vertices=[],
+    ink_particles=[],
+    aurora_ribbons=[],
+    fractal_layers=[],
+    plasma_tendrils=[],
+    crystals=[],
+
+    # Modes 21-50 state
+    gravitational_objects=[],
+    magnetic_particles=[],
+    tribal_shockwaves=[],
+    cityscape_buildings=[],
+    heartbeat_history=[],
+    bioluminescent_creatures=[],
+    fire_particles=[],
+    collision_particles=[],
+    prism_rotation=0,
+    seismic_readings=[],
+    origami_folds=[],
+    storm_particles=[],
+    matrix_columns=[],
+    kaleidoscope_rotation=0,
+    laser_beams=[],
+    sand_particles=[],
+    ice_cracks=[],
+    cells=[],
+    neon_tubes=[],
+    cosmic_string_segments=[],
+    paint_splatters=[],
+    quantum_bubbles=[],
+    aztec_rotation=0,
+    fiber_pulses=[],
+    tornado_debris=[],
+    hologram_errors=[],
+    stars=[],
+    mandala_layers=[],
+    neon_signs=[],
+    black_hole_particles=[],
+
+    # Modes 51-100 state - HYPNOTIC EDITION
+    fractal_tree_branches=[],
+    city_blocks=[],
+    gravity_well_particles=[],
+    metaballs=[],
+    aurora_curtains=[],
+    stained_glass_panes=[],
+    nerve_nodes=[],
+    glitch_blocks=[],
+    warp_rings=[],
+    cellular_automaton=[],
+    ascii_chars=[],
+    water_ripples=[],
+    terrain_height=[],
+    string_art_points=[],
+    kaleidoscope_segments=[],
+    jellyfish_tentacles=[],
+    orbital_bodies=[],
+    cube_rotation=0,
+    typography_words=[],
+    sonar_blips=[],
+    vu_needle_positions=[0, 0],
+    lightning_cloud=[],
+    bouncing_balls=[],
+    ink_blooms=[],
+    stereo_landscape_left=[],
+    stereo_landscape_right=[],
+    latent_morph_state=0,
+    pixel_storm=[],
+    vine_segments=[],
+    haunted_face_alpha=0,
+    constellation_stars=[],
+    matrix_rain=[],
+    voxel_grid=[],
+    dna_helix_rungs=[],
+    shader_time=0,
+    spirograph_trail=[],
+    eq_tower_rings=[],
+    doodle_path=[],
+    firework_rockets=[],
+    microscopic_cells=[],
+    burning_paper=[],
+    swarm_boids=[],
+    pendulum_angles=[],
+    crt_flicker=0,
+    pulsing_polygon_vertices=[],
+    chromatic_orb_rotation=0,
+    textured_bar_scroll=[],
+    voronoi_seeds=[],
+    glass_cracks=[],
+    sun_position=0,
+
+    # Modes 101-150 state - ULTIMATE HYPNOTIC EDITION
+    neural_nodes=[],
+    neural_connections=[],
+    liquid_mercury_particles=[],
+    cosmic_strings=[],
+    particle_swarm=[],
+    crystal_lattice_nodes=[],
+    aurora_wave_points=[],
+    dna_helix_rotation=0,
+    fractal_bloom_petals=[],
+    circuit_board_traces=[],
+    quantum_field_particles=[],
+    origami_fold_state=0,
+    galaxy_spiral_stars=[],
+    rubber_bands=[],
+    ink_diffusion_particles=[],
+    geo_kaleidoscope_rotation=0,
+    cellular_growth_cells=[],
+    sound_ribbons=[],
+    matrix_rain_columns=[],
+    fire_mandala_flames=[],
+    tessellation_state=0,
+    seismic_wave_data=[],
+    neon_city_buildings=[],
+    magnetic_field_lines=[],
+    bubble_fusion_bubbles=[],
+    tribal_drum_patterns=[],
+    glass_shatter_fragments=[],
+    sound_architecture_blocks=[],
+    plasma_ball_arcs=[],
+    sand_mandala_grains=[],
+    laser_show_beams=[],
+    coral_reef_polyps=[],
+    wireframe_morph_vertices=[],
+    sound_garden_plants=[],
+    hologram_glitch_panels=[],
+    pendulum_wave_pendulums=[],
+    volcano_lava_particles=[],
+    butterfly_attractor_trail=[],
+    silk_weaving_threads=[],
+    clock_gears=[],
+    smoke_signal_particles=[],
+    stained_glass_rays=[],
+    string_theory_strings=[],
+    paper_craft_folds=[],
+    aurora_sky_bands=[],
+    cellular_automata_grid=[],
+    dragon_curve_points=[],
+    rain_circle_ripples=[],
+    fourier_epicycles=[],
+
+    # Modes 151-200 state - ULTIMATE CREATIVE HYPNOTIC EDITION
+    neon_halo_rings=[],
+    twin_orbiters=[],
+    bar_spiral_rotation=0,
+    ribbon_wave_points=[],
+    voxel_city_grid=[],
+    sunburst_ticks=[],
+    waterline_surface=[],
+    laser_tunnel_rings=[],
+    vector_field_particles=[],
+    orbit_ring_dots=[],
+    stitch_bars_grid=[],
+    aurora_curtain_points=[],
+    helix_bars_state=0,
+    polygon_echo_waves=[],
+    confetti_particles=[],
+    wireframe_dome_vertices=[],
+    pulse_dashes=[],
+    terrain_sweep_rows=[],
+    chromatic_bars_flash=0,
+    bubble_choir_bubbles=[],
+    starfield_grid_cells=[],
+    dna_ladder_rungs=[],
+    arc_meter_values=[0, 0, 0],
+    ink_splatter_splats=[],
+    hex_cell_states=[],
+    sonic_orbit_satellites=[],
+    liquid_bar_velocities=[],
+    clockwork_gears_state=[],
+    petal_resonator_petals=[],
+    kaleido_scope_rotation=0,
+    runway_lights_sweep=0,
+    constellation_points=[],
+    quake_grid_tiles=[],
+    sonic_rain_streaks=[],
+    halo_typo_glow=0,
+    wormhole_depth_particles=[],
+    fractal_leaves_branches=[],
+    tape_analyzer_reels=0,
+    slinky_circle_coils=[],
+    meteor_swarm_meteors=[],
+    piano_roll_bars=[],
+    ring_rainbows_state=[],
+    origami_fan_angle=0,
+    circuit_pulse_nodes=[],
+    sphere_harmonics_points=[],
+    split_screen_flash=0,
+    equalizer_rings_sectors=[],
+    liquid_bokeh_circles=[],
+    gooey_droplets=[],
+    arcade_histogram_palette=0,
+    # setB modes 176-200
+    serpentine_chain_segments=[],
+    pendulum_array_pendulums=[],
+    hologram_pyramid_rotation=0,
+    sonic_snow_flakes=[],
+    rail_scanner_position=0,
+    nebula_fog_density=[],
+    tri_arc_weave_state=[],
+    pixel_fountain_pixels=[],
+    time_ruler_markers=[],
+    moire_rings_offset=0,
+    comet_wheel_comets=[],
+    sliced_donut_tilt=0,
+    crosshair_pulse_spacing=0,
+    sonar_sweep_angle=0,
+    paper_strip_bends=[],
+    ripple_grid_emitters=[],
+    orbit_text_kerning=0,
+    triangulated_points=[],
+    slinky_stairs_heights=[],
+    orbital_rings_flung=[],
+    hatching_shader_density=0,
+    spectrum_curtain_state=0,
+    spiral_sand_grains=[],
+    iso_bars_cube_rotation=0,
+    spectrum_waterfall_columns=[],
+    magnetic_lines_field=[],
+    tiled_portals_grid=[],
+    crown_peaks_spikes=[],
+    silhouette_aura_sparks=[],
+    sine_quilt_tiles=[],
+    radial_barcode_rotation=0,
+    drum_orbit_markers_list=[],
+    spline_comet_path=[],
+    crystal_shards_pieces=[],
+    metaball_ring_blobs=[],
+    bezier_bouquet_stems=[],
+    pulse_grid_columns=[],
+    stacked_ribbons_layers=[],
+    compass_needles_angles=[],
+    rippled_donut_waveform=[],
+    neon_spirograph_path=[],
+    gated_squares_grid=[],
+    strobe_lattice_state=0,
+    sand_pendulum_trail=[],
+    tornado_columns_twist=0,
+    led_matrix_glyphs=[],
+    chromatic_beads_positions=[],
+    echo_circles_rings=[],
+    stacked_area_bands_state=[],
+    laser_lattice_3d_grid=[],
+    polygon_shimmer_clock_ticks=[],
+    feather_plume_strands=[],
+
+    # Modes 201-225 state - NEW CREATIVE SET
+    event_horizon_grid=[],
+    comet_conveyor_belt=[],
+    foam_bubbles=[],
+    aurora_crown_ribbons=[],
+    asteroid_dust=[],
+    hyperloop_cars=[],
+    pinball_entities=[],
+    inkblot_noise=0,
+    telemetry_rings=[],
+    wormhole_folds=[],
+    jellyfish_tentacles_holo=[],
+    moon_crane_bins=[],
+    constellation_letters=[],
+    cryo_crystals=[],
+    blueprint_callouts=[],
+    tide_caustics=[],
+    barcode_slicer_bars=[],
+    satellites_swarm=[],
+    pulse_weave_phase=0.0,
+    paint_spheres=[],
+    supernova_state={ 'energy': 0.0, 'blasting': False, 'filaments': [] },
+    martian_harp_strings=[],
+    teleporting_bars=[],
+    vinyl_halo_grooves=[],
+    photon_slits=[],
+    meteor_net_nodes=[],
+    space_hose_droplets=[],
+    horizon_monoliths=[],
+    slingshot_probes=[],
+    solar_notches=[],
+    tesseract_edges=[],
+    postcard_tiles=[],
+    cosmic_braille_dots=[],
+    harpoon_line=[],
+    galaxy_ticker_chars=[],
+    antimatter_chessboard=[],
+    star_nursery_stations=[],
+    magnetar_lines=[],
+    zero_kelvin_diamonds=[],
+    time_garden_planets=[],
+    ribbon_printer_points=[],
+    dark_matter_drops=[],
+    meteor_choir_cones=[],
+    folded_map_folds=[],
+    ion_thruster_particles=[],
+    dominoes_tiles=[],
+    suit_hud_state={ 'flash': 0 },
+    pulsar_beam_angle=0.0,
+    astro_terrarium_entities=[],
+    spark_curtain_particles=[],
+    transit_plot_points=[],
+    cryo_pod_mist=[],
+    boomerangs=[],
+    solar_sails=[],
+    dark_nebula_mask=[],
+
+    # Modes 226-275 state - HYPNOTIC SET D
+    phyllotaxis_angle=137.5,
+    phyllotaxis_breath=0.0,
+    mandala_weave_phase=0.0,
+    lissajous_t=0.0,
+    lotus_phase=0.0,
+    hypno_pendula=[],
+    moire_angle_a=0.0,
+    moire_angle_b=0.0,
+    shepard_zoom=1.0,
+    plasma_shift=0.0,
+    pulse_timer=0,
+    serpents_trail=[],
+    orb_choir=[],
+    sufi_spin_angle=0.0,
+    helmholtz_phase=0.0,
+    slinky_depth=0.0,
+    fern_points=[],
+    binaural_phase_l=0.0,
+    binaural_phase_r=0.0,
+    chakric_phase=0.0,
+    hypersphere_phase=0.0,
+    phi_kaleidos_phase=0.0,
+    cycloid_phase=0.0,
+    ocean_swell=0.0,
+    harmonograph_t=0.0,
+    ink_veins=[],
+    breath_vortex=0.0,
+    meteor_carousel=[],
+    ripple_glass_phase=0.0,
+    theta_lanterns=[],
+    iso_weave_phase=0.0,
+    orbiting_eye_angle=0.0,
+    ribbon_stair_phase=0.0,
+    toroidal_flow=0.0,
+    hypno_shell_twist=0.0,
+    tide_clock_phase=0.0,
+    kaleidofish_school=[],
+    compass_wave_phase=0.0,
+    glacial_bloom=[],
+    helix_lanterns=[],
+    soft_grid_phase=0.0,
+    ripple_dome_phase=0.0,
+    spirocloud_traces=[],
+    mosaic_cells=[],
+    bamboo_stalks=[],
+    nesting_circles_phase=0.0,
+    paper_cranes=[],
+    pulse_hologrid_phase=0.0,
+    ribbon_canopy=[],
+    auroral_gate_phase=0.0,
+    satin_ladder_phase=0.0,
+    opaline_orb_t=0.0,
+    quilt_loom_phase=0.0,
+)
 
 
 class CreativeSpectrumVisualizer:
+    mode_state_defaults = MODE_STATE_DEFAULTS
+
     def __init__(self, audio_path, output_path, width=1920, height=1080,
-                 fps=30, num_bars=120, smoothing=0.7, mode=1):
+                 fps=30, num_bars=120, smoothing=0.7, mode=1, streaming=False,
+                 profile_path=None, seed=0):
         """
         Initialize the creative spectrum visualizer
 
@@ -201,6 +608,10 @@ class CreativeSpectrumVisualizer:
             num_bars: Number of frequency bars/elements
             smoothing: Smoothing factor (0-1) for animation
             mode: Visualization mode (1-20)
+            streaming: Analyze audio in blocks with bounded memory (for multi-hour files)
+            profile_path: Write a Chrome trace of per-stage render timings here (default: off)
+            seed: Seed for the modes' random numbers; with the audio and mode it fixes
+                every frame of the render
         """
         self.audio_path = audio_path
         self.output_path = output_path
@@ -209,7 +620,10 @@ class CreativeSpectrumVisualizer:
         self.fps = fps
         self.num_bars = num_bars
         self.smoothing = smoothing
+        self.streaming = streaming
+        self.profile_path = profile_path
         self.mode = mode
+        self.seed = seed
 
         self.center_x = width // 2
         self.center_y = height // 2
@@ -218,438 +632,52 @@ class CreativeSpectrumVisualizer:
         # For smoothing between frames
         self.prev_magnitudes = None
 
-        # Mode-specific state
-        self.rotation_angle = 0
-        self.rain_particles = []
-        self.firework_particles = []
-        self.cassette_reel_angle = 0
-        self.flower_petals = []
-        self.pixel_clouds = []
-        self.mercury_history = []
-        self.cosmic_particles = []
-        self.frame_counter = 0
+        # Precomputed features of the frame being drawn (audio_analysis.FeatureFrame)
+        self.features = None
 
-        # New modes 11-20 state
-        self.quantum_strings = []
-        self.lava_blobs = []
-        self.dna_rotation = 0
-        self.lightning_bolts = []
-        self.geometry_vertices = []
-        self.ink_particles = []
-        self.aurora_ribbons = []
-        self.fractal_layers = []
-        self.plasma_tendrils = []
-        self.crystals = []
-
-        # Modes 21-50 state
-        self.gravitational_objects = []
-        self.magnetic_particles = []
-        self.tribal_shockwaves = []
-        self.cityscape_buildings = []
-        self.heartbeat_history = []
-        self.bioluminescent_creatures = []
-        self.fire_particles = []
-        self.collision_particles = []
-        self.prism_rotation = 0
-        self.seismic_readings = []
-        self.origami_folds = []
-        self.storm_particles = []
-        self.matrix_columns = []
-        self.kaleidoscope_rotation = 0
-        self.laser_beams = []
-        self.sand_particles = []
-        self.ice_cracks = []
-        self.cells = []
-        self.neon_tubes = []
-        self.cosmic_string_segments = []
-        self.paint_splatters = []
-        self.quantum_bubbles = []
-        self.aztec_rotation = 0
-        self.fiber_pulses = []
-        self.tornado_debris = []
-        self.hologram_errors = []
-        self.stars = []
-        self.mandala_layers = []
-        self.neon_signs = []
-        self.black_hole_particles = []
-
-        # Modes 51-100 state - HYPNOTIC EDITION
-        self.fractal_tree_branches = []
-        self.city_blocks = []
-        self.gravity_well_particles = []
-        self.metaballs = []
-        self.aurora_curtains = []
-        self.stained_glass_panes = []
-        self.nerve_nodes = []
-        self.glitch_blocks = []
-        self.warp_rings = []
-        self.cellular_automaton = []
-        self.ascii_chars = []
-        self.water_ripples = []
-        self.terrain_height = []
-        self.string_art_points = []
-        self.ember_particles = []
-        self.kaleidoscope_segments = []
-        self.jellyfish_tentacles = []
-        self.orbital_bodies = []
-        self.cube_rotation = 0
-        self.typography_words = []
-        self.sonar_blips = []
-        self.vu_needle_positions = [0, 0]
-        self.lightning_cloud = []
-        self.bouncing_balls = []
-        self.ink_blooms = []
-        self.stereo_landscape_left = []
-        self.stereo_landscape_right = []
-        self.latent_morph_state = 0
-        self.pixel_storm = []
-        self.vine_segments = []
-        self.haunted_face_alpha = 0
-        self.constellation_stars = []
-        self.matrix_rain = []
-        self.voxel_grid = []
-        self.dna_helix_rungs = []
-        self.shader_time = 0
-        self.spirograph_trail = []
-        self.eq_tower_rings = []
-        self.doodle_path = []
-        self.firework_rockets = []
-        self.microscopic_cells = []
-        self.burning_paper = []
-        self.swarm_boids = []
-        self.pendulum_angles = []
-        self.crt_flicker = 0
-        self.pulsing_polygon_vertices = []
-        self.chromatic_orb_rotation = 0
-        self.textured_bar_scroll = []
-        self.voronoi_seeds = []
-        self.glass_cracks = []
-        self.sun_position = 0
-
-        # Modes 101-150 state - ULTIMATE HYPNOTIC EDITION
-        self.neural_nodes = []
-        self.neural_connections = []
-        self.liquid_mercury_particles = []
-        self.cosmic_strings = []
-        self.particle_swarm = []
-        self.crystal_lattice_nodes = []
-        self.aurora_wave_points = []
-        self.dna_helix_rotation = 0
-        self.fractal_bloom_petals = []
-        self.circuit_board_traces = []
-        self.quantum_field_particles = []
-        self.origami_fold_state = 0
-        self.galaxy_spiral_stars = []
-        self.rubber_bands = []
-        self.ink_diffusion_particles = []
-        self.geo_kaleidoscope_rotation = 0
-        self.lightning_bolts = []
-        self.cellular_growth_cells = []
-        self.sound_ribbons = []
-        self.matrix_rain_columns = []
-        self.fire_mandala_flames = []
-        self.tessellation_state = 0
-        self.seismic_wave_data = []
-        self.neon_city_buildings = []
-        self.magnetic_field_lines = []
-        self.bubble_fusion_bubbles = []
-        self.tribal_drum_patterns = []
-        self.glass_shatter_fragments = []
-        self.bioluminescent_creatures = []
-        self.sound_architecture_blocks = []
-        self.plasma_ball_arcs = []
-        self.sand_mandala_grains = []
-        self.laser_show_beams = []
-        self.coral_reef_polyps = []
-        self.wireframe_morph_vertices = []
-        self.sound_garden_plants = []
-        self.hologram_glitch_panels = []
-        self.pendulum_wave_pendulums = []
-        self.volcano_lava_particles = []
-        self.butterfly_attractor_trail = []
-        self.silk_weaving_threads = []
-        self.clock_gears = []
-        self.smoke_signal_particles = []
-        self.stained_glass_rays = []
-        self.string_theory_strings = []
-        self.paper_craft_folds = []
-        self.aurora_sky_bands = []
-        self.cellular_automata_grid = []
-        self.dragon_curve_points = []
-        self.rain_circle_ripples = []
-        self.fourier_epicycles = []
-
-        # Modes 151-200 state - ULTIMATE CREATIVE HYPNOTIC EDITION
-        self.neon_halo_rings = []
-        self.twin_orbiters = []
-        self.bar_spiral_rotation = 0
-        self.ribbon_wave_points = []
-        self.voxel_city_grid = []
-        self.sunburst_ticks = []
-        self.waterline_surface = []
-        self.laser_tunnel_rings = []
-        self.vector_field_particles = []
-        self.orbit_ring_dots = []
-        self.stitch_bars_grid = []
-        self.aurora_curtain_points = []
-        self.helix_bars_state = 0
-        self.polygon_echo_waves = []
-        self.confetti_particles = []
-        self.wireframe_dome_vertices = []
-        self.pulse_dashes = []
-        self.terrain_sweep_rows = []
-        self.chromatic_bars_flash = 0
-        self.bubble_choir_bubbles = []
-        self.starfield_grid_cells = []
-        self.dna_ladder_rungs = []
-        self.arc_meter_values = [0, 0, 0]
-        self.ink_splatter_splats = []
-        self.hex_cell_states = []
-        self.sonic_orbit_satellites = []
-        self.liquid_bar_velocities = []
-        self.clockwork_gears_state = []
-        self.petal_resonator_petals = []
-        self.kaleido_scope_rotation = 0
-        self.runway_lights_sweep = 0
-        self.constellation_points = []
-        self.quake_grid_tiles = []
-        self.sonic_rain_streaks = []
-        self.halo_typo_glow = 0
-        self.wormhole_depth_particles = []
-        self.fractal_leaves_branches = []
-        self.tape_analyzer_reels = 0
-        self.slinky_circle_coils = []
-        self.meteor_swarm_meteors = []
-        self.piano_roll_bars = []
-        self.ring_rainbows_state = []
-        self.origami_fan_angle = 0
-        self.circuit_pulse_nodes = []
-        self.sphere_harmonics_points = []
-        self.split_screen_flash = 0
-        self.equalizer_rings_sectors = []
-        self.liquid_bokeh_circles = []
-        self.gooey_droplets = []
-        self.arcade_histogram_palette = 0
-        # setB modes 176-200
-        self.serpentine_chain_segments = []
-        self.pendulum_array_pendulums = []
-        self.hologram_pyramid_rotation = 0
-        self.sonic_snow_flakes = []
-        self.rail_scanner_position = 0
-        self.nebula_fog_density = []
-        self.tri_arc_weave_state = []
-        self.pixel_fountain_pixels = []
-        self.time_ruler_markers = []
-        self.moire_rings_offset = 0
-        self.comet_wheel_comets = []
-        self.sliced_donut_tilt = 0
-        self.crosshair_pulse_spacing = 0
-        self.sonar_sweep_angle = 0
-        self.paper_strip_bends = []
-        self.ripple_grid_emitters = []
-        self.orbit_text_kerning = 0
-        self.triangulated_points = []
-        self.slinky_stairs_heights = []
-        self.orbital_rings_flung = []
-        self.hatching_shader_density = 0
-        self.spectrum_curtain_state = 0
-        self.spiral_sand_grains = []
-        self.iso_bars_cube_rotation = 0
-        self.spectrum_waterfall_columns = []
-        self.magnetic_lines_field = []
-        self.tiled_portals_grid = []
-        self.crown_peaks_spikes = []
-        self.silhouette_aura_sparks = []
-        self.sine_quilt_tiles = []
-        self.radial_barcode_rotation = 0
-        self.drum_orbit_markers_list = []
-        self.spline_comet_path = []
-        self.crystal_shards_pieces = []
-        self.metaball_ring_blobs = []
-        self.bezier_bouquet_stems = []
-        self.pulse_grid_columns = []
-        self.stacked_ribbons_layers = []
-        self.compass_needles_angles = []
-        self.rippled_donut_waveform = []
-        self.neon_spirograph_path = []
-        self.gated_squares_grid = []
-        self.strobe_lattice_state = 0
-        self.sand_pendulum_trail = []
-        self.tornado_columns_twist = 0
-        self.led_matrix_glyphs = []
-        self.chromatic_beads_positions = []
-        self.echo_circles_rings = []
-        self.stacked_area_bands_state = []
-        self.laser_lattice_3d_grid = []
-        self.polygon_shimmer_clock_ticks = []
-        self.feather_plume_strands = []
-
-        # Modes 201-225 state - NEW CREATIVE SET
-        self.event_horizon_grid = []
-        self.comet_conveyor_belt = []
-        self.foam_bubbles = []
-        self.aurora_crown_ribbons = []
-        self.asteroid_dust = []
-        self.hyperloop_cars = []
-        self.pinball_entities = []
-        self.inkblot_noise = 0
-        self.telemetry_rings = []
-        self.wormhole_folds = []
-        self.jellyfish_tentacles_holo = []
-        self.moon_crane_bins = []
-        self.constellation_letters = []
-        self.cryo_crystals = []
-        self.blueprint_callouts = []
-        self.tide_caustics = []
-        self.barcode_slicer_bars = []
-        self.satellites_swarm = []
-        self.pulse_weave_phase = 0.0
-        self.paint_spheres = []
-        self.supernova_state = { 'energy': 0.0, 'blasting': False, 'filaments': [] }
-        self.martian_harp_strings = []
-        self.teleporting_bars = []
-        self.vinyl_halo_grooves = []
-        self.photon_slits = []
-        self.meteor_net_nodes = []
-        self.space_hose_droplets = []
-        self.horizon_monoliths = []
-        self.slingshot_probes = []
-        self.solar_notches = []
-        self.tesseract_edges = []
-        self.postcard_tiles = []
-        self.cosmic_braille_dots = []
-        self.harpoon_line = []
-        self.galaxy_ticker_chars = []
-        self.antimatter_chessboard = []
-        self.star_nursery_stations = []
-        self.magnetar_lines = []
-        self.zero_kelvin_diamonds = []
-        self.time_garden_planets = []
-        self.ribbon_printer_points = []
-        self.dark_matter_drops = []
-        self.meteor_choir_cones = []
-        self.folded_map_folds = []
-        self.ion_thruster_particles = []
-        self.dominoes_tiles = []
-        self.suit_hud_state = { 'flash': 0 }
-        self.pulsar_beam_angle = 0.0
-        self.astro_terrarium_entities = []
-        self.spark_curtain_particles = []
-        self.transit_plot_points = []
-        self.cryo_pod_mist = []
-        self.boomerangs = []
-        self.solar_sails = []
-        self.dark_nebula_mask = []
-
-        # Modes 226-275 state - HYPNOTIC SET D
-        self.phyllotaxis_angle = 137.5
-        self.phyllotaxis_breath = 0.0
-        self.mandala_weave_phase = 0.0
-        self.lissajous_t = 0.0
-        self.lotus_phase = 0.0
-        self.hypno_pendula = []
-        self.moire_angle_a = 0.0
-        self.moire_angle_b = 0.0
-        self.shepard_zoom = 1.0
-        self.plasma_shift = 0.0
-        self.pulse_timer = 0
-        self.serpents_trail = []
-        self.orb_choir = []
-        self.sufi_spin_angle = 0.0
-        self.helmholtz_phase = 0.0
-        self.slinky_depth = 0.0
-        self.fern_points = []
-        self.binaural_phase_l = 0.0
-        self.binaural_phase_r = 0.0
-        self.chakric_phase = 0.0
-        self.hypersphere_phase = 0.0
-        self.phi_kaleidos_phase = 0.0
-        self.cycloid_phase = 0.0
-        self.ocean_swell = 0.0
-        self.harmonograph_t = 0.0
-        self.ink_veins = []
-        self.breath_vortex = 0.0
-        self.meteor_carousel = []
-        self.ripple_glass_phase = 0.0
-        self.theta_lanterns = []
-        self.iso_weave_phase = 0.0
-        self.orbiting_eye_angle = 0.0
-        self.ribbon_stair_phase = 0.0
-        self.toroidal_flow = 0.0
-        self.hypno_shell_twist = 0.0
-        self.tide_clock_phase = 0.0
-        self.kaleidofish_school = []
-        self.compass_wave_phase = 0.0
-        self.glacial_bloom = []
-        self.helix_lanterns = []
-        self.soft_grid_phase = 0.0
-        self.ripple_dome_phase = 0.0
-        self.spirocloud_traces = []
-        self.mosaic_cells = []
-        self.bamboo_stalks = []
-        self.nesting_circles_phase = 0.0
-        self.paper_cranes = []
-        self.pulse_hologrid_phase = 0.0
-        self.ribbon_canopy = []
-        self.auroral_gate_phase = 0.0
-        self.satin_ladder_phase = 0.0
-        self.opaline_orb_t = 0.0
-        self.quilt_loom_phase = 0.0
+        # Random numbers for the modes: a seeded stream per frame (see render_random),
+        # keyed by the audio content once it is loaded
+        self.audio_hash = None
+        self.rng = frame_rng(render_entropy(None, mode, seed), 0)
+
+        # Static layers of modes with unchanging chrome (rasterized once, see modes.layers)
+        self.layer_cache = LayerCache()
+        self.frame_counter = 0
 
         # Register all visualization modes from the modes/ directory
         register_modes(self)
 
     def load_audio(self):
-        """Load and process audio file"""
+        """Load and process audio file (spectrogram comes from the shared analysis cache)"""
         print(f"Loading audio from: {self.audio_path}")
 
-        y, sr = librosa.load(self.audio_path, sr=None)
-        self.sample_rate = sr
-        self.duration = librosa.get_duration(y=y, sr=sr)
-
-        print(f"Audio loaded: {self.duration:.2f}s, Sample rate: {sr}Hz")
-
-        hop_length = int(sr / self.fps)
-        n_fft = 2048
-
-        stft = librosa.stft(y, n_fft=n_fft, hop_length=hop_length)
-        self.magnitude = np.abs(stft)
+        if self.streaming:
+            # Block-wise analysis; bar frames are produced on demand while rendering
+            analysis = StreamingSpectrum(self.audio_path, self.fps)
+        else:
+            analysis = load_spectrum(self.audio_path, self.fps)
+            # 0-1 normalized dB spectrogram (read-only memory map on a cache hit)
+            self.magnitude_norm = analysis.spectrogram
+        self.analysis = analysis
+        self.audio_hash = hash_audio_file(self.audio_path)
+        self.sample_rate = analysis.sample_rate
+        self.duration = analysis.duration
 
-        self.magnitude_db = librosa.amplitude_to_db(self.magnitude, ref=np.max)
-        self.magnitude_norm = (self.magnitude_db - self.magnitude_db.min()) / \
-                              (self.magnitude_db.max() - self.magnitude_db.min())
+        print(f"Audio loaded: {self.duration:.2f}s, Sample rate: {self.sample_rate}Hz")
 
-        self.num_frames = self.magnitude_norm.shape[1]
+        self.num_frames = analysis.num_frames
         print(f"Processed {self.num_frames} frames")
 
-        return y, sr
+        return analysis
 
     def get_frequency_bands(self, frame_idx):
         """Extract frequency bands for a specific frame"""
         if frame_idx >= self.num_frames:
             frame_idx = self.num_frames - 1
 
-        frame_magnitudes = self.magnitude_norm[:, frame_idx]
-        total_freqs = len(frame_magnitudes)
-        useful_freqs = int(total_freqs * 0.6)
-
-        bar_magnitudes = []
-        for i in range(self.num_bars):
-            t = i / self.num_bars
-            freq_pos = int(useful_freqs * (t ** 1.5))
-
-            window_size = max(1, useful_freqs // (self.num_bars * 2))
-            start_idx = max(0, freq_pos - window_size // 2)
-            end_idx = min(useful_freqs, freq_pos + window_size // 2)
-
-            if start_idx < end_idx:
-                avg_magnitude = np.mean(frame_magnitudes[start_idx:end_idx])
-            else:
-                avg_magnitude = frame_magnitudes[freq_pos] if freq_pos < len(frame_magnitudes) else 0
-
-            bar_magnitudes.append(avg_magnitude)
-
-        bar_magnitudes = np.array(bar_magnitudes)
+        # Log-spaced windows over the lower 60% of bins (see audio_analysis.band_weights)
+        weights = band_weights(self.magnitude_norm.shape[0], self.num_bars)
+        bar_magnitudes = weights @ self.magnitude_norm[:weights.shape[1], frame_idx]
 
         if self.prev_magnitudes is not None:
             bar_magnitudes = (self.smoothing * self.prev_magnitudes +
@@ -659,6 +687,13 @@ class CreativeSpectrumVisualizer:
 
         return bar_magnitudes
 
+    def get_band_blocks(self, total_frames):
+        """Smoothed bar magnitudes for every video frame, as (frames, bars) blocks"""
+        if self.streaming:
+            return self.analysis.bar_blocks(self.num_bars, self.smoothing, total_frames)
+        indices = video_frame_indices(self.num_frames, total_frames)
+        return [bar_track(self.magnitude_norm, self.num_bars, indices, self.smoothing)]
+
     def get_apple_style_color(self, hue, magnitude, saturation_multiplier=0.6, value_multiplier=0.85):
         """
         Convert vibrant colors to Apple-style minimalist aesthetic
@@ -680,10 +715,23 @@ class CreativeSpectrumVisualizer:
         value = int(180 + magnitude * 75 * value_multiplier)
         value = min(240, value)
 
-        color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-        color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+        return hsv_to_bgr(hue, saturation, value)
 
-        return tuple(int(c) for c in color_bgr)
+    def get_apple_style_colors(self, hues, magnitudes, saturation_multiplier=0.6, value_multiplier=0.85):
+        """
+        Batch get_apple_style_color: one color per (hue, magnitude) pair
+
+        Args:
+            hues: Array of base hues (0-180 in OpenCV HSV)
+            magnitudes: Array of audio magnitudes (0-1), broadcast against hues
+
+        Returns:
+            (N, 3) uint8 array of BGR colors, row i equal to get_apple_style_color(hues[i], magnitudes[i])
+        """
+        magnitudes = np.asarray(magnitudes, dtype=np.float64)
+        saturation = np.minimum(180, (100 + magnitudes * 80 * saturation_multiplier).astype(np.int64))
+        value = np.minimum(240, (180 + magnitudes * 75 * value_multiplier).astype(np.int64))
+        return hsv_to_bgr_array(hues, saturation, value)
 
     def apply_elegant_glow(self, frame, x, y, color, size, intensity=0.3):
         """
@@ -727,8 +775,7 @@ class CreativeSpectrumVisualizer:
             hue = 30 + magnitude * 20  # Amber to gold range
             saturation = 180 + int(magnitude * 75)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             # Thickness varies with magnitude
@@ -1496,8 +1543,7 @@ class CreativeSpectrumVisualizer:
             x = np.random.randint(0, self.center_x)
             y = np.random.randint(0, self.height)
             jitter = int(np.random.randn()*6)
-            color_hsv = np.array([[[hue, 180, 200]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 180, 200)
             cv2.circle(frame, (x, y+jitter), 3, tuple(map(int, color)), -1)
             cv2.circle(frame, (self.width-x, y+jitter), 3, tuple(map(int, color)), -1)
         return frame
@@ -2159,8 +2205,7 @@ class CreativeSpectrumVisualizer:
 
                 # Rainbow colors for jazz energy
                 hue = np.random.randint(0, 180)
-                color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, 255, 255)
                 color = tuple(int(c) for c in color_bgr)
 
                 self.firework_particles.append({
@@ -2187,8 +2232,7 @@ class CreativeSpectrumVisualizer:
                     speed = 3 + np.random.random() * 10
 
                     hue = np.random.randint(0, 180)
-                    color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color_bgr = hsv_pixel(hue, 255, 255)
                     color = tuple(int(c) for c in color_bgr)
 
                     self.firework_particles.append({
@@ -2475,8 +2519,7 @@ class CreativeSpectrumVisualizer:
             hue = 140 + layer * 5 + int(avg_magnitude * 20)  # Purple-pink range
             saturation = 200 + int(avg_magnitude * 55)
             value = 100 + int(avg_magnitude * 100) - layer * 15
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             alpha = 0.3 / layer
@@ -2488,8 +2531,7 @@ class CreativeSpectrumVisualizer:
         hue = 150 + int(avg_magnitude * 30)
         saturation = 220 + int(avg_magnitude * 35)
         value = 180 + int(avg_magnitude * 75)
-        color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-        color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+        color_bgr = hsv_pixel(hue, saturation, value)
         main_color = tuple(int(c) for c in color_bgr)
 
         cv2.fillPoly(frame, [points], main_color, lineType=cv2.LINE_AA)
@@ -2531,8 +2573,7 @@ class CreativeSpectrumVisualizer:
             hue = (petal_idx * 15 + self.frame_counter) % 180
             saturation = 100 + int(magnitude * 100)
             value = 200 + int(magnitude * 55)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             petal_color = tuple(int(c) for c in color_bgr)
 
             # Draw petal as rotated ellipse
@@ -2869,8 +2910,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((string_idx / num_strings) * 180)
                 saturation = 200 + int(avg_mag * 55)
                 value = 150 + int(avg_mag * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw glowing string
@@ -2925,8 +2965,7 @@ class CreativeSpectrumVisualizer:
 
                     saturation = 200 + int(alpha * 55)
                     value = 150 + int(alpha * 105)
-                    color_hsv = np.array([[[blob['hue'], saturation, value]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color_bgr = hsv_pixel(blob['hue'], saturation, value)
                     color = tuple(int(c * alpha) for c in color_bgr)
 
                     cv2.circle(frame, (x, y), layer_size, color, -1, lineType=cv2.LINE_AA)
@@ -2987,8 +3026,7 @@ class CreativeSpectrumVisualizer:
             hue = 90 + int(mag * 50)
             saturation = 200 + int(mag * 55)
             value = 150 + int(mag * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             cv2.line(frame, tuple(p1), tuple(p2), color, 2, lineType=cv2.LINE_AA)
@@ -3110,8 +3148,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((edge_idx / len(edge_pairs)) * 180 + self.frame_counter) % 180
                 saturation = 220
                 value = 200 + int(avg_magnitude * 55)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 cv2.line(frame, p1, p2, color, 3, lineType=cv2.LINE_AA)
@@ -3224,8 +3261,7 @@ class CreativeSpectrumVisualizer:
                 hue = int(100 + ribbon_idx * 15 + self.frame_counter * 0.5) % 180
                 saturation = 180 + int(np.mean(magnitudes) * 75)
                 value = 120 + int(np.mean(magnitudes) * 100)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c * 0.6) for c in color_bgr)
 
                 # Draw semi-transparent ribbon
@@ -3275,8 +3311,7 @@ class CreativeSpectrumVisualizer:
                     hue = int((layer / num_layers) * 180 + magnitude * 40)
                     saturation = 200 + int(magnitude * 55)
                     value = 150 + int(magnitude * 105)
-                    color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color_bgr = hsv_pixel(hue, saturation, value)
                     color = tuple(int(c) for c in color_bgr)
 
                     thickness = max(1, 4 - layer)
@@ -3357,8 +3392,7 @@ class CreativeSpectrumVisualizer:
 
                         saturation = 220
                         value = int(150 + trail_alpha * 105)
-                        color_hsv = np.array([[[tendril['hue'], saturation, value]]], dtype=np.uint8)
-                        color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                        color_bgr = hsv_pixel(tendril['hue'], saturation, value)
                         color = tuple(int(c * trail_alpha) for c in color_bgr)
 
                         thickness = max(1, int(3 * trail_alpha))
@@ -3429,8 +3463,7 @@ class CreativeSpectrumVisualizer:
                 # Color with transparency effect
                 saturation = 150 + int(crystal['life'] * 105)
                 value = 200 + int(crystal['life'] * 55)
-                color_hsv = np.array([[[crystal['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(crystal['hue'], saturation, value)
                 color = tuple(int(c * crystal['life']) for c in color_bgr)
 
                 # Draw crystal
@@ -3577,8 +3610,7 @@ class CreativeSpectrumVisualizer:
                 hue = 10 + int(wave['magnitude'] * 20)
                 saturation = 200 + int(wave['magnitude'] * 55)
                 value = 150 + int(wave['magnitude'] * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c * alpha) for c in color_bgr)
 
                 cv2.circle(frame, (self.center_x, self.center_y),
@@ -3638,8 +3670,7 @@ class CreativeSpectrumVisualizer:
             hue = (i * 30 + self.frame_counter) % 180
             saturation = 220 + int(magnitude * 35)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             # Draw building
@@ -3947,8 +3978,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((i / num_beams) * 180)
                 saturation = 255
                 value = 200 + int(magnitude * 55)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw beam with glow
@@ -4060,8 +4090,7 @@ class CreativeSpectrumVisualizer:
             hue = int(seg_idx * 22.5) % 180
             saturation = int(magnitude * 150)
             value = 220 + int(magnitude * 35)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             cv2.fillPoly(frame, [points], color, lineType=cv2.LINE_AA)
@@ -4204,8 +4233,7 @@ class CreativeSpectrumVisualizer:
                 # Color
                 saturation = 255
                 value = 255
-                color_hsv = np.array([[[elem['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(elem['hue'], saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 cv2.circle(frame, (x, y), elem['size'], color, -1, lineType=cv2.LINE_AA)
@@ -4243,8 +4271,7 @@ class CreativeSpectrumVisualizer:
                 hue = (i * 30 + self.frame_counter) % 180
                 saturation = 255
                 value = 200 + int(magnitude * 55)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 self.laser_beams.append({
@@ -4469,8 +4496,7 @@ class CreativeSpectrumVisualizer:
                 # Cell color
                 saturation = 180 + int(cell['life'] * 75)
                 value = 150 + int(cell['life'] * 105)
-                color_hsv = np.array([[[cell['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(cell['hue'], saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw cell
@@ -4517,8 +4543,7 @@ class CreativeSpectrumVisualizer:
                 hue = (tube_idx * 25 + self.frame_counter) % 180
                 saturation = 255
                 value = 180 + int(magnitude * 75)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Tube thickness based on magnitude
@@ -4578,8 +4603,7 @@ class CreativeSpectrumVisualizer:
             hue = 120 + int(magnitude * 40)
             saturation = 200 + int(magnitude * 55)
             value = 180 + int(magnitude * 75)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             # Draw string with energy glow
@@ -4637,8 +4661,7 @@ class CreativeSpectrumVisualizer:
 
                 saturation = 220 + int(alpha * 35)
                 value = 180 + int(alpha * 75)
-                color_hsv = np.array([[[paint['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(paint['hue'], saturation, value)
                 color = tuple(int(c * alpha) for c in color_bgr)
 
                 # Draw trail
@@ -4684,8 +4707,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((bubble['phase'] * 30 + self.frame_counter) % 180)
                 saturation = 200 + int(alpha * 55)
                 value = 150 + int(alpha * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c * alpha * 0.6) for c in color_bgr)
 
                 # Draw bubble
@@ -4736,8 +4758,7 @@ class CreativeSpectrumVisualizer:
             hue = 15 + int(avg_magnitude * 15)
             saturation = 180 + int(avg_magnitude * 75)
             value = 150 + int(avg_magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             cv2.circle(frame, (self.center_x, self.center_y), radius,
@@ -4798,8 +4819,7 @@ class CreativeSpectrumVisualizer:
                     hue = (fiber_idx * 30) % 180
                     saturation = 255
                     value = 200 + int(magnitude * 55)
-                    color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color_bgr = hsv_pixel(hue, saturation, value)
                     color = tuple(int(c) for c in color_bgr)
 
                     # Draw light pulse
@@ -5028,8 +5048,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((layer_idx * 20 + elem_idx * 10 + self.frame_counter * 0.5) % 180)
                 saturation = 200 + int(layer_mag * 55)
                 value = 150 + int(layer_mag * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw petal/element
@@ -5076,8 +5095,7 @@ class CreativeSpectrumVisualizer:
                 # Neon color
                 saturation = 255
                 value = int(200 * flicker + magnitude * 55)
-                color_hsv = np.array([[[sign['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(sign['hue'], saturation, value)
                 color = tuple(int(c * flicker) for c in color_bgr)
 
                 # Calculate text position (centered)
@@ -5152,8 +5170,7 @@ class CreativeSpectrumVisualizer:
 
                 saturation = 220 + int(proximity * 35)
                 value = 150 + int(proximity * 105)
-                color_hsv = np.array([[[final_hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(final_hue, saturation, value)
                 color = tuple(int(c * alpha) for c in color_bgr)
 
                 # Size based on distance (gravitational lensing)
@@ -5224,8 +5241,7 @@ class CreativeSpectrumVisualizer:
                 # Bloom flowers on treble
                 if treble > 0.4 and branch['generation'] > 0:
                     bloom_size = int(3 + treble * 10)
-                    bloom_color_hsv = np.array([[[int(treble * 180), 255, 255]]], dtype=np.uint8)
-                    bloom_color = cv2.cvtColor(bloom_color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    bloom_color = hsv_pixel(int(treble * 180), 255, 255)
                     cv2.circle(frame, (end_x, end_y), bloom_size, tuple(map(int, bloom_color * alpha)), -1, lineType=cv2.LINE_AA)
 
                 branch['life'] -= 0.003
@@ -5253,8 +5269,7 @@ class CreativeSpectrumVisualizer:
             hue = int((i / num_blocks) * 180)
             saturation = 180 + int(magnitude * 75)
             value = 100 + int(magnitude * 155)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw building
             cv2.rectangle(frame, (x_left, base_y), (x_right, top_y), tuple(map(int, color)), -1)
@@ -5314,8 +5329,7 @@ class CreativeSpectrumVisualizer:
             p['y'] += p['vy']
 
             if dist > well_radius and 0 < p['x'] < self.width and 0 < p['y'] < self.height:
-                color_hsv = np.array([[[p['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(p['hue'], 255, 255)
                 cv2.circle(frame, (int(p['x']), int(p['y'])), 3, tuple(map(int, color)), -1)
                 new_particles.append(p)
 
@@ -5357,8 +5371,7 @@ class CreativeSpectrumVisualizer:
             hue = int((i / num_balls) * 180)
             saturation = 200 + int(magnitude * 55)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw with gradient
             for r in range(radius, 0, -5):
@@ -5399,8 +5412,7 @@ class CreativeSpectrumVisualizer:
             hue = 60 + curtain_idx * 15
             saturation = 180 + int(treble * 75)
             value = 120 + int(bass * 135)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw curtain with thickness
             if len(points) > 1:
@@ -5433,8 +5445,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((pane_idx / len(magnitudes)) * 180)
                 saturation = 255
                 value = int(80 + magnitude * 175)  # Glow intensity
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, value)
 
                 # Draw pane
                 cv2.rectangle(frame, (x1, y1), (x2, y2), tuple(map(int, color)), -1)
@@ -5552,8 +5563,7 @@ class CreativeSpectrumVisualizer:
             hue = int((depth + self.frame_counter * 0.01) * 180) % 180
             saturation = 200 + int(magnitude * 55)
             value = int(150 * (1 - depth) + magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw ring
             thickness = int(2 + magnitude * 8)
@@ -5719,8 +5729,7 @@ class CreativeSpectrumVisualizer:
             if idx1 != idx2:
                 hue = int(treble * 180)
                 alpha = 0.3
-                color_hsv = np.array([[[hue, 200, int(255 * alpha)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, int(255 * alpha))
                 cv2.line(frame, points[idx1], points[idx2], tuple(map(int, color)), 1, lineType=cv2.LINE_AA)
 
         # Draw points
@@ -5747,8 +5756,7 @@ class CreativeSpectrumVisualizer:
             hue = int(10 + np.random.random() * 20)  # Orange-yellow
             saturation = 255
             value = 200 + int(np.random.random() * 55)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             cv2.circle(frame, (flame_x, flame_y), flame_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -5798,8 +5806,7 @@ class CreativeSpectrumVisualizer:
                 y = int(self.center_y + np.sin(angle) * distance)
 
                 hue = int((i / 30) * 180)
-                color_hsv = np.array([[[hue, 255, int(255 * magnitude)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, int(255 * magnitude))
 
                 # Draw in all mirrored segments
                 for seg in range(num_segments):
@@ -5875,8 +5882,7 @@ class CreativeSpectrumVisualizer:
 
             # Planet color
             hue = int((i / num_planets) * 180)
-            color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 255)
 
             cv2.circle(frame, (planet_x, planet_y), planet_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -6144,8 +6150,7 @@ class CreativeSpectrumVisualizer:
 
             # Draw ball
             ball_size = int(10 + magnitude * 20)
-            color_hsv = np.array([[[ball['color_hue'], 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(ball['color_hue'], 255, 255)
 
             cv2.circle(frame, (int(ball['x']), int(ball['y'])), ball_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -6187,8 +6192,7 @@ class CreativeSpectrumVisualizer:
 
             if bloom['life'] > 0 and bloom['radius'] < bloom['max_radius']:
                 alpha = bloom['life']
-                color_hsv = np.array([[[bloom['hue'], 200, int(255 * alpha)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(bloom['hue'], 200, int(255 * alpha))
 
                 cv2.circle(frame, (int(bloom['x']), int(bloom['y'])), int(bloom['radius']),
                           tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
@@ -6258,8 +6262,7 @@ class CreativeSpectrumVisualizer:
             hue = int((self.latent_morph_state * 50 + i * 12) % 180)
             saturation = 180 + int(treble * 75)
             value = 150 + int(avg_magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw with transparency effect
             cv2.circle(frame, (x, y), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -6299,8 +6302,7 @@ class CreativeSpectrumVisualizer:
             pixel['life'] -= 0.01
 
             if pixel['life'] > 0 and 0 < pixel['y'] < self.height:
-                color_hsv = np.array([[[pixel['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(pixel['hue'], 255, 255)
 
                 # 8-bit pixel (small rectangle)
                 pixel_size = 4
@@ -6550,8 +6552,7 @@ class CreativeSpectrumVisualizer:
                 hue = np.clip(int((noise_val * 0.5 + 0.5) * 180), 0, 179)
                 saturation = np.clip(200 + int(treble * 55), 0, 255)
                 value = np.clip(int((noise_val * 0.5 + 0.5) * 200 + bass * 55), 0, 255)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, value)
 
                 cv2.rectangle(frame, (x, y), (x+4, y+4), tuple(map(int, color)), -1)
 
@@ -6582,8 +6583,7 @@ class CreativeSpectrumVisualizer:
 
             # Color based on treble
             hue = int(treble * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
 
             cv2.polylines(frame, [points], False, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
@@ -6602,8 +6602,7 @@ class CreativeSpectrumVisualizer:
             hue = int((i / num_rings) * 180)
             saturation = 200 + int(magnitude * 55)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Ring thickness
             thickness = int(2 + magnitude * 10)
@@ -6653,8 +6652,7 @@ class CreativeSpectrumVisualizer:
             # Color based on mids
             hue = int(mids * 180)
             alpha = (i / len(self.doodle_path))
-            color_hsv = np.array([[[hue, 200, int(255 * alpha)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, int(255 * alpha))
 
             cv2.line(frame, (int(p1['x']), int(p1['y'])), (int(p2['x']), int(p2['y'])),
                     tuple(map(int, color)), 3, lineType=cv2.LINE_AA)
@@ -6715,8 +6713,7 @@ class CreativeSpectrumVisualizer:
                         # Color from mids
                         hue = int(mids * 180)
                         alpha = particle['life']
-                        color_hsv = np.array([[[hue, 255, int(255 * alpha)]]], dtype=np.uint8)
-                        color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                        color = hsv_pixel(hue, 255, int(255 * alpha))
 
                         size = int(2 + treble * 6)
                         cv2.circle(frame, (int(particle['x']), int(particle['y'])), size,
@@ -6786,8 +6783,7 @@ class CreativeSpectrumVisualizer:
             hue = int((freq_idx / len(magnitudes)) * 180)
             saturation = 200 + int(magnitude * 55)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             cv2.circle(frame, (int(cell['x']), int(cell['y'])), int(cell['radius']),
                       tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -6822,8 +6818,7 @@ class CreativeSpectrumVisualizer:
                     hue = 10 + layer * 5  # Yellow to red
                     saturation = 255
                     value = 200 - layer * 40
-                    color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                    color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color = hsv_pixel(hue, saturation, value)
 
                     # Flickering width
                     flicker = int((np.random.random() - 0.5) * 5)
@@ -6966,8 +6961,7 @@ class CreativeSpectrumVisualizer:
             # Draw bob
             bob_size = int(5 + magnitude * 15)
             hue = int((i / num_pendulums) * 180)
-            color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 255)
 
             cv2.circle(frame, (x_end, y_end), bob_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -7035,8 +7029,7 @@ class CreativeSpectrumVisualizer:
             hue = int(self.frame_counter * 2 % 180)
             saturation = 200 + int(avg_magnitude * 55)
             value = 150 + int(avg_magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             cv2.fillPoly(frame, [pts], tuple(map(int, color)), lineType=cv2.LINE_AA)
             cv2.polylines(frame, [pts], True, (255, 255, 255), 3, lineType=cv2.LINE_AA)
@@ -7075,8 +7068,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((angle / (2 * np.pi) + radius_factor + self.frame_counter * 0.01) * 180) % 180
                 saturation = 200 + int(avg_magnitude * 55)
                 value = int(brightness)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, value)
 
                 cv2.circle(frame, (x, y), 3, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -7145,8 +7137,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((closest_idx / num_seeds) * 180)
                 saturation = 200 + int(magnitude * 55)
                 value = 100 + int(magnitude * 155)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, value)
 
                 cv2.rectangle(frame, (x, y), (x+5, y+5), tuple(map(int, color)), -1)
 
@@ -7214,8 +7205,7 @@ class CreativeSpectrumVisualizer:
             saturation = int(200 - gradient_factor * 100)
             value = int(255 - gradient_factor * 100)
 
-            color_hsv = np.array([[[sky_hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(sky_hue, saturation, value)
 
             cv2.line(frame, (0, y), (self.width, y), tuple(map(int, color)), 1)
 
@@ -7281,8 +7271,7 @@ class CreativeSpectrumVisualizer:
             hue = int(140 + node['layer'] * 30)  # Purple to cyan
             intensity = int(200 + node['active'] * 55)
 
-            color_hsv = np.array([[[hue, 255, intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, intensity)
 
             cv2.circle(frame, (node['x'], node['y']), radius, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
             cv2.circle(frame, (node['x'], node['y']), radius + 3, (255, 255, 255), 1, lineType=cv2.LINE_AA)
@@ -7374,8 +7363,7 @@ class CreativeSpectrumVisualizer:
             hue = 30  # Gold
             intensity = int(200 + string['magnitude'] * 55)
 
-            color_hsv = np.array([[[hue, 200, intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, intensity)
 
             cv2.polylines(frame, [points], False, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
@@ -7438,8 +7426,7 @@ class CreativeSpectrumVisualizer:
             velocity = np.sqrt(particle['vx']**2 + particle['vy']**2)
             hue = int(120 - min(velocity * 50, 120))  # Blue to red
 
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
 
             # Draw trail
             if len(particle['trail']) > 1:
@@ -7499,8 +7486,7 @@ class CreativeSpectrumVisualizer:
             radius = int(5 + node['magnitude'] * 15)
             hue = int((z_rot + 300) / 600 * 180)  # Rainbow based on depth
 
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
 
             cv2.circle(frame, (x_2d, y_2d), radius, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
             cv2.circle(frame, (x_2d, y_2d), radius + 2, (255, 255, 255), 1, lineType=cv2.LINE_AA)
@@ -7542,8 +7528,7 @@ class CreativeSpectrumVisualizer:
                 hue = int(60 + mids * 60 + curtain_idx * 20)  # Green to purple to blue
                 saturation = int(200 + treble * 55)
 
-                color_hsv = np.array([[[hue, saturation, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, 255)
 
                 # Draw vertical curtain strands
                 for y_offset in range(0, 200, 10):
@@ -7633,8 +7618,7 @@ class CreativeSpectrumVisualizer:
             saturation = int(200 + mids * 55)
             value = int(200 + bass * 55)
 
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw petal
             petal_points = []
@@ -7763,8 +7747,7 @@ class CreativeSpectrumVisualizer:
                 intensity = int(100 + particle['state'] * 155)
                 radius = 2
 
-            color_hsv = np.array([[[hue, 255, intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, intensity)
 
             if 0 <= draw_x < self.width and 0 <= draw_y < self.height:
                 cv2.circle(frame, (draw_x, draw_y), radius, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -7788,8 +7771,7 @@ class CreativeSpectrumVisualizer:
             y2 = int(self.center_y + np.sin(angle + 0.5) * size * 0.7)
             
             hue = int((i / num_segments) * 180)
-            color_hsv = np.array([[[hue, int(200 + mids * 55), 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, int(200 + mids * 55), 255)
             
             points = np.array([[self.center_x, self.center_y], [x1, y1], [x2, y2]], dtype=np.int32)
             cv2.fillPoly(frame, [points], tuple(map(int, color)), lineType=cv2.LINE_AA)
@@ -7819,8 +7801,7 @@ class CreativeSpectrumVisualizer:
             
             brightness = int((star['brightness'] + mids) * 127.5)
             hue = int(140 - star['distance'] / 3)
-            color_hsv = np.array([[[hue, 255, brightness]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, brightness)
             
             if 0 <= x < self.width and 0 <= y < self.height:
                 size = 1 if star['distance'] > 200 else 2
@@ -7849,8 +7830,7 @@ class CreativeSpectrumVisualizer:
                 points.append([x, int(band['y'] + wave)])
             
             hue = int(i * 18)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             pts = np.array(points, dtype=np.int32)
             cv2.polylines(frame, [pts], False, tuple(map(int, color)), 3, lineType=cv2.LINE_AA)
@@ -7882,8 +7862,7 @@ class CreativeSpectrumVisualizer:
             
             if particle['life'] > 0:
                 alpha = particle['life'] / 100
-                color_hsv = np.array([[[particle['hue'], 255, int(200 * alpha)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(particle['hue'], 255, int(200 * alpha))
                 
                 size = int((1 - alpha) * 30 + 5)
                 cv2.circle(frame, (int(particle['x']), int(particle['y'])), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -7914,8 +7893,7 @@ class CreativeSpectrumVisualizer:
                     points.append([x, y])
                 
                 hue = int((seg * 22.5 + layer * 60) % 180)
-                color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, 255)
                 
                 pts = np.array(points, dtype=np.int32)
                 cv2.polylines(frame, [pts], True, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
@@ -7977,8 +7955,7 @@ class CreativeSpectrumVisualizer:
             cell['size'] = 20 + bass * 30
             
             hue = int(60 + cell['gen'] * 20) % 180
-            color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 255)
             
             cv2.circle(frame, (int(cell['x']), int(cell['y'])), int(cell['size']), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
             cv2.circle(frame, (int(cell['x']), int(cell['y'])), int(cell['size'] * 0.5), tuple(map(int, color * 0.7)), -1, lineType=cv2.LINE_AA)
@@ -8002,8 +7979,7 @@ class CreativeSpectrumVisualizer:
                 points.append([x, y])
             
             hue = int(ribbon_idx * 36) % 180
-            color_hsv = np.array([[[hue, 255, int(200 + mids * 55)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(200 + mids * 55))
             
             pts = np.array(points, dtype=np.int32)
             cv2.polylines(frame, [pts], False, tuple(map(int, color)), int(8 + bass * 10), lineType=cv2.LINE_AA)
@@ -8090,8 +8066,7 @@ class CreativeSpectrumVisualizer:
             for x in range(0, self.width, tile_size):
                 shift = int(self.frame_counter * mids) % 3
                 hue = int((x + y) / 10 + self.frame_counter) % 180
-                color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, 255)
                 
                 if shift == 0:
                     cv2.rectangle(frame, (x, y), (x + tile_size, y + tile_size), tuple(map(int, color)), -1)
@@ -8215,8 +8190,7 @@ class CreativeSpectrumVisualizer:
                 continue
             
             hue = int((bubble['y'] / self.height) * 180)
-            color_hsv = np.array([[[hue, 100, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 100, 255)
             
             cv2.circle(frame, (int(bubble['x']), int(bubble['y'])), bubble['radius'], tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
             cv2.circle(frame, (int(bubble['x'] - bubble['radius'] // 3), int(bubble['y'] - bubble['radius'] // 3)),
@@ -8325,8 +8299,7 @@ class CreativeSpectrumVisualizer:
             glow_intensity = int(150 + np.sin(self.frame_counter * 0.1 + creature['phase']) * 50 + bass * 55)
             
             hue = int(90 + mids * 60)
-            color_hsv = np.array([[[hue, 255, glow_intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, glow_intensity)
             
             size = int(15 + bass * 20)
             cv2.circle(frame, (int(creature['x']), int(creature['y'])), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -8387,8 +8360,7 @@ class CreativeSpectrumVisualizer:
                 
                 hue = int(120 + seg * 5)
                 intensity = int(255 - seg * 10)
-                color_hsv = np.array([[[hue, 255, intensity]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, intensity)
                 
                 cv2.line(frame, (current_x, current_y), (next_x, next_y), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
                 
@@ -8474,8 +8446,7 @@ class CreativeSpectrumVisualizer:
                 
                 size = int(5 + (coral['height'] - h) / coral['height'] * 15 * (1 + bass * 0.3))
                 
-                color_hsv = np.array([[[coral['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(coral['hue'], 255, 255)
                 
                 if 0 <= x < self.width and 0 <= y < self.height:
                     cv2.circle(frame, (x, y), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -8530,8 +8501,7 @@ class CreativeSpectrumVisualizer:
         for i, v1 in enumerate(vertices_2d):
             for v2 in vertices_2d[i+1:i+5]:
                 hue = int(100 + mids * 80)
-                color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, 255)
                 
                 cv2.line(frame, v1, v2, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
         
@@ -8566,8 +8536,7 @@ class CreativeSpectrumVisualizer:
                 petal_x = int(bloom_x + np.cos(angle) * plant['bloom_size'])
                 petal_y = int(bloom_y + np.sin(angle) * plant['bloom_size'])
                 
-                color_hsv = np.array([[[plant['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(plant['hue'], 255, 255)
                 
                 cv2.circle(frame, (petal_x, petal_y), int(plant['bloom_size'] * 0.5),
                           tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -8631,8 +8600,7 @@ class CreativeSpectrumVisualizer:
             cv2.line(frame, (x, 100), (bob_x, bob_y), (200, 200, 200), 1, lineType=cv2.LINE_AA)
             
             hue = int((i / num_pendulums) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             cv2.circle(frame, (bob_x, bob_y), 10, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
         
@@ -8713,8 +8681,7 @@ class CreativeSpectrumVisualizer:
             py2 = int(self.center_y + z2 * 10)
             
             hue = int((i / len(self.butterfly_attractor_trail)) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             if 0 <= px1 < self.width and 0 <= py1 < self.height and 0 <= px2 < self.width and 0 <= py2 < self.height:
                 cv2.line(frame, (px1, py1), (px2, py2), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
@@ -8731,8 +8698,7 @@ class CreativeSpectrumVisualizer:
             vertical_offset = int(np.sin(i * 0.05 + self.frame_counter * 0.1) * 30 * bass)
             
             hue = int((i / self.width) * 180)
-            color_hsv = np.array([[[hue, int(150 + mids * 105), 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, int(150 + mids * 105), 255)
             
             cv2.line(frame, (i, vertical_offset), (i, self.height + vertical_offset), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
         
@@ -8740,8 +8706,7 @@ class CreativeSpectrumVisualizer:
             horizontal_offset = int(np.sin(j * 0.05 + self.frame_counter * 0.1) * 30 * mids)
             
             hue = int(60 + (j / self.height) * 120)
-            color_hsv = np.array([[[hue, int(150 + bass * 105), 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, int(150 + bass * 105), 255)
             
             cv2.line(frame, (horizontal_offset, j), (self.width + horizontal_offset, j), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
         
@@ -8822,8 +8787,7 @@ class CreativeSpectrumVisualizer:
                 hue = int((x + y) / 10) % 180
                 brightness = int(150 + bass * 105)
                 
-                color_hsv = np.array([[[hue, 200, brightness]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, brightness)
                 
                 cv2.rectangle(frame, (x, y), (x + pane_size, y + pane_size), tuple(map(int, color)), -1)
                 cv2.rectangle(frame, (x, y), (x + pane_size, y + pane_size), (30, 30, 30), 4)
@@ -8857,8 +8821,7 @@ class CreativeSpectrumVisualizer:
             
             hue = int((string_idx / num_strings) * 180)
             alpha = 0.3 + treble * 0.7
-            color_hsv = np.array([[[hue, 255, int(255 * alpha)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(255 * alpha))
             
             pts = np.array(points, dtype=np.int32)
             cv2.polylines(frame, [pts], False, tuple(map(int, color)), 1, lineType=cv2.LINE_AA)
@@ -8912,8 +8875,7 @@ class CreativeSpectrumVisualizer:
                 
                 hue = int(60 + mids * 60 + band * 10)
                 brightness = int(200 + treble * 55)
-                color_hsv = np.array([[[hue, 200, brightness]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, brightness)
                 
                 for y_offset in range(40):
                     alpha = 1.0 - (y_offset / 40)
@@ -9007,8 +8969,7 @@ class CreativeSpectrumVisualizer:
         
         for i in range(1, len(points)):
             hue = int((i / len(points)) * 180)
-            color_hsv = np.array([[[hue, 255, int(200 + mids * 55)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(200 + mids * 55))
             
             if (0 <= points[i-1][0] < self.width and 0 <= points[i-1][1] < self.height and
                 0 <= points[i][0] < self.width and 0 <= points[i][1] < self.height):
@@ -9063,8 +9024,7 @@ class CreativeSpectrumVisualizer:
             next_y = y + int(np.sin(angle) * radius)
             
             hue = int((i / num_circles) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             cv2.circle(frame, (x, y), radius, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
             cv2.line(frame, (x, y), (next_x, next_y), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
@@ -9180,8 +9140,7 @@ class CreativeSpectrumVisualizer:
             y1 = int(y + np.sin(angle_perp) * bar_length)
 
             hue = int((i / num_bars) * 180)
-            color_hsv = np.array([[[hue, 255, int(200 + magnitude * 55)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(200 + magnitude * 55))
 
             cv2.line(frame, (x, y), (x1, y1), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
@@ -9340,8 +9299,7 @@ class CreativeSpectrumVisualizer:
             thickness = max(1, int(5 * (1 - z)))
 
             hue = (hue_shift + i * 12) % 180
-            color_hsv = np.array([[[hue, 255, 200]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 200)
 
             cv2.circle(frame, (self.center_x, self.center_y), scale, tuple(map(int, color)), thickness, lineType=cv2.LINE_AA)
 
@@ -9409,8 +9367,7 @@ class CreativeSpectrumVisualizer:
 
             # Draw dot
             hue = int((i / ring_count) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             cv2.circle(frame, (x, y), dot_size, tuple(map(int, color)), -1)
 
         return frame
@@ -9460,8 +9417,7 @@ class CreativeSpectrumVisualizer:
 
             # Draw curtain
             hue = int((c / curtain_count) * 180)
-            color_hsv = np.array([[[hue, 200, 200]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 200)
 
             for i in range(1, len(points)):
                 cv2.line(frame, points[i-1], points[i], tuple(map(int, color)), 3, lineType=cv2.LINE_AA)
@@ -9568,8 +9524,7 @@ class CreativeSpectrumVisualizer:
             particle['life'] -= 1
 
             if particle['life'] > 0:
-                color_hsv = np.array([[[particle['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(particle['hue'], 255, 255)
                 cv2.circle(frame, (int(particle['x']), int(particle['y'])), 3, tuple(map(int, color)), -1)
 
         self.confetti_particles = [p for p in self.confetti_particles if p['life'] > 0 and 0 <= p['y'] < self.height]
@@ -9676,8 +9631,7 @@ class CreativeSpectrumVisualizer:
             # Draw line
             for i in range(1, len(points)):
                 hue = int((height / 1.0) * 180)
-                color_hsv = np.array([[[hue, 255, 200]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, 200)
                 cv2.line(frame, points[i-1], points[i], tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
         return frame
@@ -9708,8 +9662,7 @@ class CreativeSpectrumVisualizer:
             x_right = self.center_x + i * (bar_width + gap)
 
             hue = (hue_offset + i * 3) % 180
-            color_hsv = np.array([[[hue, 255, min(255, 200 + flash_add)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, min(255, 200 + flash_add))
 
             # Left bar
             cv2.rectangle(frame, (x_left, self.center_y - height), (x_left + bar_width, self.center_y), tuple(map(int, color)), -1)
@@ -9922,16 +9875,26 @@ class CreativeSpectrumVisualizer:
         return frame
 
     def draw_spectrum(self, frame, magnitudes):
-        """Draw spectrum based on selected mode using dynamic dispatch"""
+        """Draw the next frame of the selected mode"""
         self.frame_counter += 1
+        return self.draw_mode(self.mode, frame, magnitudes)
+
+    def draw_mode(self, mode, frame, magnitudes):
+        """
+        Draw any mode at the current frame_counter using dynamic dispatch
+
+        Each mode keeps its own state, so several modes can be drawn from the same
+        frame's features without affecting each other.
+        """
+        self.rng = frame_rng(render_entropy(self.audio_hash, mode, self.seed), self.frame_counter)
 
         # Get mode method from registry
-        mode_method = get_mode_method(self.mode)
+        mode_method = get_mode_method(mode, self)
         if mode_method:
             return mode_method(frame, magnitudes)
         else:
             # Fallback: simple bars if mode not found
-            print(f"Warning: Mode {self.mode} not found, using fallback")
+            print(f"Warning: Mode {mode} not found, using fallback")
             for i in range(min(self.num_bars, len(magnitudes))):
                 height = int(magnitudes[i] * self.height * 0.8)
                 x = int((i + 0.5) * self.width / self.num_bars)
@@ -9939,125 +9902,100 @@ class CreativeSpectrumVisualizer:
                             (x + 5, self.height), (100, 150, 255), -1)
             return frame
 
+    def reset_modes(self):
+        """Forget the state of every mode and restart the frame count"""
+        for mode_instance in self.mode_instances.values():
+            mode_instance.reset_state()
+        self.frame_counter = 0
+        self.prev_magnitudes = None
+
+    def output_target(self, output_path=None):
+        """(final output path, ffmpeg_writer codec profile) for this render, or for output_path"""
+        output_path = self.output_path if output_path is None else output_path
+        # Fast preview path: skip transparency/prores when AS_PREVIEW=1
+        if os.getenv('AS_PREVIEW') == '1':
+            return str(Path(output_path)), 'h264'
+
+        final_output = alpha_output_path(output_path)
+        profile = alpha_profile_for(final_output)
+        if not profile_supported(profile):
+            print(f"Warning: Could not create transparent video. Creating standard video instead.")
+            profile = 'h264'
+        return final_output, profile
+
     def generate_video(self):
         """Generate the final video with transparent background"""
         print(f"Generating video: {self.output_path}")
+        profiler = StageProfiler(enabled=self.profile_path is not None)
 
-        self.load_audio()
+        with profiler.stage('analysis'):
+            self.load_audio()
 
-        temp_no_audio = str(Path(self.output_path).with_suffix('')) + '_temp_no_audio.mp4'
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-
-        video_writer = cv2.VideoWriter(
-            temp_no_audio, fourcc, self.fps,
-            (self.width, self.height), True
-        )
-
-        if not video_writer.isOpened():
-            raise RuntimeError("Failed to open video writer")
+        try:
+            final_output, profile = self.output_target()
+
+            # Frames are piped straight into a single ffmpeg encode that also muxes the audio
+            encoder = FFmpegWriter(
+                final_output, self.width, self.height, self.fps,
+                audio_path=self.audio_path,
+                profile=profile
+            )
+        except FileNotFoundError:
+            print("Error: ffmpeg not found. Please install ffmpeg:")
+            print("  brew install ffmpeg")
+            raise
 
+        # Pipelined loop: bars/features are computed ahead on a prefetch thread and
+        # frames are alpha-converted and encoded on a writer thread while the next
+        # frame draws. The black canvas becomes transparent through a real alpha
+        # plane (no colorkey).
+        video_writer = PipelinedWriter(encoder, prepare=attach_alpha if encoder.has_alpha else None,
+                                       profiler=profiler)
         total_frames = int(self.duration * self.fps)
+        with profiler.stage('bands'):
+            feature_frames = prefetch(iter_frame_features(self.get_band_blocks(total_frames)),
+                                      profiler=profiler)
 
-        for frame_idx in range(total_frames):
-            frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-
-            audio_frame_idx = int(frame_idx * self.num_frames / total_frames)
-            magnitudes = self.get_frequency_bands(audio_frame_idx)
-
-            frame = self.draw_spectrum(frame, magnitudes)
-            video_writer.write(frame)
+        try:
+            for frame_idx in range(total_frames):
+                # A fresh canvas per frame: the writer thread owns every written frame
+                frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
 
-            if (frame_idx + 1) % 30 == 0 or frame_idx == total_frames - 1:
-                progress = (frame_idx + 1) / total_frames * 100
-                print(f"Progress: {progress:.1f}% ({frame_idx + 1}/{total_frames} frames)")
+                # Bars plus features shared by all modes (bass/mids/highs, flux, beats, peaks)
+                with profiler.stage('wait'):
+                    self.features = next(feature_frames)
+                magnitudes = self.features.magnitudes
 
-        video_writer.release()
-        print(f"\nVideo generation complete (silent): {temp_no_audio}")
+                with profiler.stage('draw'):
+                    frame = self.draw_spectrum(frame, magnitudes)
 
-        print("Adding audio and finalizing...")
-        import subprocess
+                # Blocks only while the encoder is `depth` frames behind
+                with profiler.stage('queue'):
+                    video_writer.write(frame)
 
-        try:
-            # Fast preview path: skip transparency/prores when AS_PREVIEW=1
-            if os.getenv('AS_PREVIEW') == '1':
-                final_output = str(Path(self.output_path))
-                result = subprocess.run([
-                    'ffmpeg', '-y',
-                    '-i', temp_no_audio,
-                    '-i', self.audio_path,
-                    '-c:v', 'libx264',
-                    '-preset', 'veryfast',
-                    '-crf', '23',
-                    '-c:a', 'aac',
-                    '-shortest',
-                    final_output
-                ], capture_output=True, text=True)
-
-                Path(temp_no_audio).unlink(missing_ok=True)
-
-                if result.returncode == 0:
-                    self.output_path = final_output
-                    print(f"✓ Preview video created: {final_output}")
-                    return
-                else:
-                    print(f"Warning: Preview mux failed, falling back to transparency path")
-
-            final_output = str(Path(self.output_path).with_suffix('.mov'))
-
-            result = subprocess.run([
-                'ffmpeg', '-y',
-                '-i', temp_no_audio,
-                '-i', self.audio_path,
-                '-filter_complex',
-                '[0:v]colorkey=0x000000:0.01:0.1[ckout];[ckout]format=yuva420p[video]',
-                '-map', '[video]',
-                '-map', '1:a',
-                '-c:v', 'prores_ks',
-                '-profile:v', '4444',
-                '-c:a', 'aac',
-                '-shortest',
-                final_output
-            ], capture_output=True, text=True)
-
-            Path(temp_no_audio).unlink(missing_ok=True)
-
-            if result.returncode == 0:
-                self.output_path = final_output
-                print(f"✓ Video with transparency and audio created successfully")
-                print(f"✓ Output: {final_output}")
-            else:
-                print(f"Warning: Could not create transparent video. Creating standard video instead.")
-                print(f"FFmpeg error: {result.stderr}")
-
-                result = subprocess.run([
-                    'ffmpeg', '-y',
-                    '-i', temp_no_audio,
-                    '-i', self.audio_path,
-                    '-c:v', 'copy',
-                    '-c:a', 'aac',
-                    '-shortest',
-                    final_output
-                ], capture_output=True, text=True)
-
-                Path(temp_no_audio).unlink(missing_ok=True)
-
-                if result.returncode == 0:
-                    print(f"✓ Standard video created: {final_output}")
-                else:
-                    print(f"Error: Could not create video")
+                if (frame_idx + 1) % 30 == 0 or frame_idx == total_frames - 1:
+                    progress = (frame_idx + 1) / total_frames * 100
+                    print(f"Progress: {progress:.1f}% ({frame_idx + 1}/{total_frames} frames)")
 
-        except FileNotFoundError:
-            print("Error: ffmpeg not found. Please install ffmpeg:")
-            print("  brew install ffmpeg")
-            Path(temp_no_audio).unlink()
-            raise
+            print("Finalizing video...")
+            with profiler.stage('finalize'):
+                video_writer.release()
         except Exception as e:
             print(f"Error: Could not process video: {e}")
-            if Path(temp_no_audio).exists():
-                Path(temp_no_audio).unlink()
+            video_writer.abort()
             raise
+        finally:
+            feature_frames.close()
+
+        self.output_path = final_output
+        if video_writer.has_alpha:
+            print(f"✓ Video with transparency and audio created successfully")
+        else:
+            print(f"✓ Video with audio created successfully")
+        print(f"✓ Output: {final_output}")
 
         print(f"Duration: {self.duration:.2f}s, Resolution: {self.width}x{self.height}, FPS: {self.fps}")
+        profiler.finish(self.profile_path)
 
 
 def main():
@@ -10077,6 +10015,9 @@ Examples:
 
   # Electric heartbeat for emotional jazz
   python audio_spectrum_creative.py input.mp3 output.mov --mode 7
+
+  # Long mix, resumable: rerun the same command after a crash
+  python audio_spectrum_creative.py mix.wav output.mov --mode 12 --checkpoint-dir output.ckpt
         """
     )
 
@@ -10089,6 +10030,16 @@ Examples:
     parser.add_argument('--fps', type=int, default=30, help='Frames per second (default: 30)')
     parser.add_argument('--num-bars', type=int, default=120, help='Number of frequency elements (default: 120)')
     parser.add_argument('--smoothing', type=float, default=0.7, help='Smoothing factor 0-1 (default: 0.7)')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Analyze audio in blocks with bounded memory (for multi-hour mixes)')
+    parser.add_argument('--profile', type=str, default=None, metavar='TRACE_JSON',
+                        help='Write a Chrome trace of per-stage render timings and print a summary')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for random elements; same audio, mode and seed give the same video (default: 0)')
+    parser.add_argument('--checkpoint-dir', type=str, default=None, metavar='DIR',
+                        help='Render in parts with mode state snapshots here; rerun to resume a failed render')
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY, metavar='FRAMES',
+                        help=f'Frames between checkpoints (default: {DEFAULT_CHECKPOINT_EVERY})')
 
     args = parser.parse_args()
 
@@ -10333,11 +10284,17 @@ Examples:
         fps=args.fps,
         num_bars=args.num_bars,
         smoothing=args.smoothing,
-        mode=args.mode
+        mode=args.mode,
+        streaming=args.streaming,
+        profile_path=args.profile,
+        seed=args.seed
     )
 
     try:
-        visualizer.generate_video()
+        if args.checkpoint_dir:
+            render_checkpointed(visualizer, args.checkpoint_dir, every=args.checkpoint_every)
+        else:
+            visualizer.generate_video()
         print("\nSuccess! Your creative audio spectrum video is ready.")
         print(f"Perfect for lofi and jazz/soul YouTube channels!")
     except Exception as e:
@@ -24,15 +24,20 @@ Examples:
 import sys
 import numpy as np
 import cv2
-import librosa
 import argparse
 from pathlib import Path
 from typing import List, Tuple
 
+from audio_analysis import load_spectrum, hash_audio_file
+from render_pipeline import PipelinedWriter, prefetch
+from render_profiler import StageProfiler
+from render_random import render_entropy, frame_rng
+from ffmpeg_writer import FFmpegWriter, profile_supported, alpha_profile_for
+
 
 class ImageSpectrumVisualizer:
     def __init__(self, audio_path, output_path, image_path, width=1920, height=1080,
-                 fps=30, num_bars=120, smoothing=0.7, mode=1):
+                 fps=30, num_bars=120, smoothing=0.7, mode=1, profile_path=None, seed=0):
         """
         Initialize the image-based spectrum visualizer
 
@@ -46,6 +51,9 @@ class ImageSpectrumVisualizer:
             num_bars: Number of frequency bars/elements
             smoothing: Smoothing factor (0-1) for animation
             mode: Visualization mode (1-10)
+            profile_path: Write a Chrome trace of per-stage render timings here (default: off)
+            seed: Seed for the modes' random numbers; with the audio, image and mode it
+                fixes every frame of the render
         """
         self.audio_path = audio_path
         self.output_path = output_path
@@ -56,6 +64,8 @@ class ImageSpectrumVisualizer:
         self.num_bars = num_bars
         self.smoothing = smoothing
         self.mode = mode
+        self.profile_path = profile_path
+        self.seed = seed
 
         self.center_x = width // 2
         self.center_y = height // 2
@@ -66,6 +76,11 @@ class ImageSpectrumVisualizer:
         # For smoothing between frames
         self.prev_magnitudes = None
 
+        # Random numbers for the modes: a seeded stream per frame (see render_random),
+        # keyed by the audio content once it is loaded
+        self.audio_hash = None
+        self.rng = frame_rng(render_entropy(None, mode, seed), 0)
+
         # Mode-specific state
         self.particles = []
         self.shards = []
@@ -108,39 +123,29 @@ class ImageSpectrumVisualizer:
         return tuple(map(int, color))
 
     def load_audio(self):
-        """Load and process audio file"""
+        """Load and process audio file (spectrogram comes from the shared analysis cache)"""
         print(f"Loading audio from {self.audio_path}...")
-        y, sr = librosa.load(self.audio_path, sr=None)
 
-        # Calculate duration
-        duration = len(y) / sr
-        total_frames = int(duration * self.fps)
+        # One STFT column per video frame, raw dB scale
+        analysis = load_spectrum(self.audio_path, self.fps, hop='frames', scale='db')
+        self.audio_hash = hash_audio_file(self.audio_path)
+        total_frames = int(analysis.duration * self.fps)
 
-        print(f"Audio duration: {duration:.2f}s, Sample rate: {sr}Hz")
+        print(f"Audio duration: {analysis.duration:.2f}s, Sample rate: {analysis.sample_rate}Hz")
         print(f"Generating {total_frames} frames at {self.fps}fps...")
 
-        # Compute STFT
-        hop_length = len(y) // total_frames
-        if hop_length == 0:
-            hop_length = 512
-
-        D = np.abs(librosa.stft(y, hop_length=hop_length, n_fft=2048))
-
-        # Convert to dB scale
-        db = librosa.amplitude_to_db(D, ref=np.max)
-
-        return db, total_frames, y, sr
+        return analysis.spectrogram, total_frames
 
     def render_mode_1_image_particles(self, frame, magnitudes):
         """Mode 1: Image Particles - Pixels explode and react to audio"""
         # Initialize particles if needed
         if len(self.particles) < 500:
             for _ in range(500 - len(self.particles)):
-                x = np.random.randint(0, self.width)
-                y = np.random.randint(0, self.height)
+                x = self.rng.integers(0, self.width)
+                y = self.rng.integers(0, self.height)
                 color = self._get_color_at_pixel(x, y)
-                vx = np.random.uniform(-2, 2)
-                vy = np.random.uniform(-2, 2)
+                vx = self.rng.uniform(-2, 2)
+                vy = self.rng.uniform(-2, 2)
                 self.particles.append({
                     'x': x, 'y': y, 'vx': vx, 'vy': vy,
                     'color': color, 'size': 3, 'life': 1.0
@@ -153,8 +158,8 @@ class ImageSpectrumVisualizer:
         for particle in self.particles:
             # Apply audio energy as force
             force_scale = energy * 5
-            particle['vx'] += np.random.uniform(-force_scale, force_scale)
-            particle['vy'] += np.random.uniform(-force_scale, force_scale)
+            particle['vx'] += self.rng.uniform(-force_scale, force_scale)
+            particle['vy'] += self.rng.uniform(-force_scale, force_scale)
 
             # Damping
             particle['vx'] *= 0.95
@@ -219,7 +224,7 @@ class ImageSpectrumVisualizer:
         # Spawn new fountain particles at bottom
         if self.frame_counter % 2 == 0:
             for i in range(20):
-                x = np.random.randint(0, self.width)
+                x = self.rng.integers(0, self.width)
                 color = self._get_color_at_pixel(x, self.height - 1)
 
                 mag_idx = int((x / self.width) * len(magnitudes))
@@ -228,7 +233,7 @@ class ImageSpectrumVisualizer:
                 self.fountain_particles.append({
                     'x': x,
                     'y': self.height - 1,
-                    'vx': np.random.uniform(-1, 1),
+                    'vx': self.rng.uniform(-1, 1),
                     'vy': -velocity,
                     'color': color,
                     'life': 1.0
@@ -274,7 +279,7 @@ class ImageSpectrumVisualizer:
                         'x': x,
                         'y': y,
                         'rotation': 0,
-                        'phase': np.random.random() * 2 * np.pi
+                        'phase': self.rng.random() * 2 * np.pi
                     })
 
         # Update and draw shards
@@ -455,8 +460,8 @@ class ImageSpectrumVisualizer:
         # Initialize vortex particles
         if len(self.vortex_particles) < 1000:
             for _ in range(1000 - len(self.vortex_particles)):
-                angle = np.random.random() * 2 * np.pi
-                radius = np.random.random() * min(self.width, self.height) / 2
+                angle = self.rng.random() * 2 * np.pi
+                radius = self.rng.random() * min(self.width, self.height) / 2
 
                 x = self.center_x + radius * np.cos(angle)
                 y = self.center_y + radius * np.sin(angle)
@@ -464,7 +469,7 @@ class ImageSpectrumVisualizer:
                 self.vortex_particles.append({
                     'angle': angle,
                     'radius': radius,
-                    'angular_vel': np.random.uniform(0.01, 0.05),
+                    'angular_vel': self.rng.uniform(0.01, 0.05),
                     'color': self._get_color_at_pixel(x, y) if 0 <= x < self.width and 0 <= y < self.height else (128, 128, 128, 255)
                 })
 
@@ -539,6 +544,8 @@ class ImageSpectrumVisualizer:
 
     def generate_frame(self, magnitudes):
         """Generate a single frame of visualization"""
+        self.rng = frame_rng(render_entropy(self.audio_hash, self.mode, self.seed), self.frame_counter)
+
         # Create transparent frame (BGRA)
         frame = np.zeros((self.height, self.width, 4), dtype=np.uint8)
 
@@ -575,52 +582,11 @@ class ImageSpectrumVisualizer:
         self.frame_counter += 1
         return frame
 
-    def create_visualization(self):
-        """Main function to create the complete visualization"""
-        # Load audio
-        db_spectrum, total_frames, audio_data, sample_rate = self.load_audio()
-
-        # Validate output file extension
-        output_ext = Path(self.output_path).suffix.lower()
-        if output_ext not in ['.mov', '.mp4', '.avi']:
-            raise ValueError(f"Output file must be a video file (.mov, .mp4, or .avi), got: {output_ext}")
-
-        # Setup video writer - try multiple codec options
-        codecs_to_try = [
-            ('avc1', 'H.264'),  # H.264 (widely supported)
-            ('mp4v', 'MPEG-4'),  # MPEG-4
-            ('XVID', 'Xvid'),    # Xvid
-        ]
-
-        out = None
-        for fourcc_str, codec_name in codecs_to_try:
-            fourcc = cv2.VideoWriter_fourcc(*fourcc_str)
-            out = cv2.VideoWriter(
-                self.output_path,
-                fourcc,
-                self.fps,
-                (self.width, self.height),
-                True
-            )
-
-            if out.isOpened():
-                print(f"Using {codec_name} codec")
-                break
-            else:
-                out.release()
-                out = None
-
-        if out is None or not out.isOpened():
-            raise RuntimeError(f"Failed to open video writer for {self.output_path}. Try using .mp4 extension.")
-
-        print(f"Rendering {total_frames} frames...")
-
-        # Process each frame
+    def band_frames(self, db_spectrum, total_frames):
+        """Yield the bar magnitudes (0-100) of each video frame"""
+        # Select evenly spaced frequency bins
+        indices = np.linspace(0, db_spectrum.shape[0] - 1, self.num_bars, dtype=int)
         for frame_idx in range(total_frames):
-            if frame_idx % 30 == 0:
-                progress = (frame_idx / total_frames) * 100
-                print(f"Progress: {progress:.1f}% ({frame_idx}/{total_frames} frames)")
-
             # Get frequency spectrum for this frame
             if frame_idx < db_spectrum.shape[1]:
                 frame_spectrum = db_spectrum[:, frame_idx]
@@ -633,25 +599,96 @@ class ImageSpectrumVisualizer:
                 (frame_spectrum.min(), frame_spectrum.max()),
                 (0, 100)
             )
+            yield spectrum_normalized[indices]
 
-            # Select evenly spaced frequency bins
-            indices = np.linspace(0, len(spectrum_normalized) - 1, self.num_bars, dtype=int)
-            magnitudes = spectrum_normalized[indices]
+    def encoder_frame(self, frame, has_alpha):
+        """
+        Convert a generated BGRA frame for the encoder
 
-            # Generate frame
-            frame = self.generate_frame(magnitudes)
+        The modes draw straight alpha (full image color, faded through the alpha
+        channel), which is what the alpha encoders expect, so such frames are
+        passed on unchanged. Without alpha support the frame is composited over black.
+        """
+        if has_alpha:
+            return frame
+        alpha = frame[:, :, 3:4] / 255.0
+        return (frame[:, :, :3] * alpha).astype(np.uint8)
+
+    def create_visualization(self):
+        """Main function to create the complete visualization"""
+        profiler = StageProfiler(enabled=self.profile_path is not None)
+
+        # Load audio
+        with profiler.stage('analysis'):
+            db_spectrum, total_frames = self.load_audio()
 
-            # Convert BGRA to BGR for video writing (some codecs don't support alpha in VideoWriter)
-            # We'll composite over black background
-            bgr_frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-            alpha = frame[:, :, 3:4] / 255.0
-            bgr_frame = frame[:, :, :3] * alpha + bgr_frame * (1 - alpha)
-            bgr_frame = bgr_frame.astype(np.uint8)
+        # Validate output file extension
+        output_ext = Path(self.output_path).suffix.lower()
+        if output_ext not in ['.mov', '.webm', '.mp4', '.avi']:
+            raise ValueError(f"Output file must be a video file (.mov, .webm, .mp4, or .avi), got: {output_ext}")
+
+        # .mov/.webm keep the BGRA frames' alpha plane; .mp4/.avi have no alpha support
+        if output_ext in ['.mov', '.webm']:
+            profile = alpha_profile_for(self.output_path)
+        else:
+            profile = 'h264'
+
+        try:
+            if not profile_supported(profile):
+                print(f"Warning: {profile} encoder not available, writing H.264 without transparency")
+                profile = 'h264'
 
-            out.write(bgr_frame)
+            # Frames are streamed to ffmpeg, which also muxes in the audio
+            encoder = FFmpegWriter(
+                self.output_path,
+                self.width,
+                self.height,
+                self.fps,
+                audio_path=self.audio_path,
+                profile=profile
+            )
+        except FileNotFoundError:
+            print("Error: ffmpeg not found. Please install ffmpeg:")
+            print("  brew install ffmpeg")
+            raise
+
+        print(f"Using {profile} codec")
+        print(f"Rendering {total_frames} frames...")
+
+        # Bars are computed ahead on a prefetch thread; frames are converted and encoded
+        # on a writer thread while the next one draws (see render_pipeline)
+        prepare = None if encoder.has_alpha else lambda frame: self.encoder_frame(frame, False)
+        out = PipelinedWriter(encoder, prepare=prepare, profiler=profiler)
+        with profiler.stage('bands'):
+            band_frames = prefetch(self.band_frames(db_spectrum, total_frames), profiler=profiler)
+
+        try:
+            # Process each frame
+            for frame_idx in range(total_frames):
+                if frame_idx % 30 == 0:
+                    progress = (frame_idx / total_frames) * 100
+                    print(f"Progress: {progress:.1f}% ({frame_idx}/{total_frames} frames)")
+
+                with profiler.stage('wait'):
+                    magnitudes = next(band_frames)
+
+                # Generate frame (a fresh array, owned by the writer once queued)
+                with profiler.stage('draw'):
+                    frame = self.generate_frame(magnitudes)
+
+                with profiler.stage('queue'):
+                    out.write(frame)
+
+            with profiler.stage('finalize'):
+                out.release()
+        except Exception:
+            out.abort()
+            raise
+        finally:
+            band_frames.close()
 
-        out.release()
         print(f"\nVisualization complete! Saved to {self.output_path}")
+        profiler.finish(self.profile_path)
 
 
 def main():
@@ -692,6 +729,10 @@ Modes:
                        help='Number of frequency bars (default: 120)')
     parser.add_argument('--smoothing', type=float, default=0.7,
                        help='Smoothing factor 0-1 (default: 0.7)')
+    parser.add_argument('--profile', type=str, default=None, metavar='TRACE_JSON',
+                       help='Write a Chrome trace of per-stage render timings and print a summary')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Seed for random elements; same audio, image, mode and seed give the same video (default: 0)')
 
     args = parser.parse_args()
 
@@ -714,7 +755,9 @@ Modes:
         fps=args.fps,
         num_bars=args.num_bars,
         smoothing=args.smoothing,
-        mode=args.mode
+        mode=args.mode,
+        profile_path=args.profile,
+        seed=args.seed
     )
 
     visualizer.create_visualization()
@@ -38,15 +38,22 @@ Examples:
 import sys
 import numpy as np
 import cv2
-import librosa
 import argparse
 from pathlib import Path
 
+from audio_analysis import (load_spectrum, band_weights, bar_track, video_frame_indices,
+                            StreamingSpectrum)
+from render_pipeline import PipelinedWriter, prefetch
+from render_profiler import StageProfiler
+from ffmpeg_writer import (FFmpegWriter, profile_supported, alpha_output_path, alpha_profile_for,
+                           attach_alpha)
+
 
 class LineSpectrumVisualizer:
     def __init__(self, audio_path, output_path, width=1920, height=1080,
                  fps=30, num_bars=60, color=(255, 255, 255),
-                 bar_spacing=10, smoothing=0.7, mode=1):
+                 bar_spacing=10, smoothing=0.7, mode=1, streaming=False,
+                 profile_path=None):
         """
         Initialize the line spectrum visualizer
 
@@ -61,6 +68,8 @@ class LineSpectrumVisualizer:
             bar_spacing: Spacing between bars in pixels
             smoothing: Smoothing factor (0-1) for animation
             mode: Visualization mode (1-10)
+            streaming: Analyze audio in blocks with bounded memory (for multi-hour files)
+            profile_path: Write a Chrome trace of per-stage render timings here (default: off)
         """
         self.audio_path = audio_path
         self.output_path = output_path
@@ -71,6 +80,8 @@ class LineSpectrumVisualizer:
         self.color = color
         self.bar_spacing = bar_spacing
         self.smoothing = smoothing
+        self.streaming = streaming
+        self.profile_path = profile_path
         self.mode = mode
 
         # Calculate bar width based on available width and spacing
@@ -92,70 +103,35 @@ class LineSpectrumVisualizer:
         self.glitch_offsets = None
 
     def load_audio(self):
-        """Load and process audio file"""
+        """Load and process audio file (spectrogram comes from the shared analysis cache)"""
         print(f"Loading audio from: {self.audio_path}")
 
-        # Load audio file
-        y, sr = librosa.load(self.audio_path, sr=None)
-        self.sample_rate = sr
-        self.duration = librosa.get_duration(y=y, sr=sr)
-
-        print(f"Audio loaded: {self.duration:.2f}s, Sample rate: {sr}Hz")
-
-        # Calculate STFT (Short-Time Fourier Transform)
-        hop_length = int(sr / self.fps)
-        n_fft = 2048
-
-        stft = librosa.stft(y, n_fft=n_fft, hop_length=hop_length)
-        self.magnitude = np.abs(stft)
-
-        # Convert to dB scale for better visualization
-        self.magnitude_db = librosa.amplitude_to_db(self.magnitude, ref=np.max)
+        if self.streaming:
+            # Block-wise analysis; bar frames are produced on demand while rendering
+            analysis = StreamingSpectrum(self.audio_path, self.fps)
+        else:
+            analysis = load_spectrum(self.audio_path, self.fps)
+            # 0-1 normalized dB spectrogram (read-only memory map on a cache hit)
+            self.magnitude_norm = analysis.spectrogram
+        self.analysis = analysis
+        self.sample_rate = analysis.sample_rate
+        self.duration = analysis.duration
 
-        # Normalize to 0-1 range
-        self.magnitude_norm = (self.magnitude_db - self.magnitude_db.min()) / \
-                              (self.magnitude_db.max() - self.magnitude_db.min())
+        print(f"Audio loaded: {self.duration:.2f}s, Sample rate: {self.sample_rate}Hz")
 
-        self.num_frames = self.magnitude_norm.shape[1]
+        self.num_frames = analysis.num_frames
         print(f"Processed {self.num_frames} frames")
 
-        return y, sr
+        return analysis
 
     def get_frequency_bands(self, frame_idx):
         """Extract frequency bands for a specific frame"""
         if frame_idx >= self.num_frames:
             frame_idx = self.num_frames - 1
 
-        # Get magnitude for this frame
-        frame_magnitudes = self.magnitude_norm[:, frame_idx]
-
-        # Use logarithmic spacing for more perceptually accurate frequency distribution
-        total_freqs = len(frame_magnitudes)
-
-        # Only use the lower 60% of frequencies (where most music energy is)
-        useful_freqs = int(total_freqs * 0.6)
-
-        bar_magnitudes = []
-        for i in range(self.num_bars):
-            # Logarithmic distribution: more bars for lower frequencies
-            t = i / self.num_bars
-            # Exponential mapping to focus on lower frequencies
-            freq_pos = int(useful_freqs * (t ** 1.5))
-
-            # Get a small window around this frequency
-            window_size = max(1, useful_freqs // (self.num_bars * 2))
-            start_idx = max(0, freq_pos - window_size // 2)
-            end_idx = min(useful_freqs, freq_pos + window_size // 2)
-
-            # Average the frequencies in this window
-            if start_idx < end_idx:
-                avg_magnitude = np.mean(frame_magnitudes[start_idx:end_idx])
-            else:
-                avg_magnitude = frame_magnitudes[freq_pos] if freq_pos < len(frame_magnitudes) else 0
-
-            bar_magnitudes.append(avg_magnitude)
-
-        bar_magnitudes = np.array(bar_magnitudes)
+        # Log-spaced windows over the lower 60% of bins (see audio_analysis.band_weights)
+        weights = band_weights(self.magnitude_norm.shape[0], self.num_bars)
+        bar_magnitudes = weights @ self.magnitude_norm[:weights.shape[1], frame_idx]
 
         # Apply smoothing between frames
         if self.prev_magnitudes is not None:
@@ -166,6 +142,13 @@ class LineSpectrumVisualizer:
 
         return bar_magnitudes
 
+    def get_band_track(self, total_frames):
+        """Smoothed bar magnitudes for every video frame (one matmul + smoothing pass)"""
+        if self.streaming:
+            return self.analysis.bar_frames(self.num_bars, self.smoothing, total_frames)
+        indices = video_frame_indices(self.num_frames, total_frames)
+        return bar_track(self.magnitude_norm, self.num_bars, indices, self.smoothing)
+
     def draw_mode_1_classic_bars(self, frame, magnitudes):
         """Mode 1: Premium vertical bars with glassmorphism"""
         for i, magnitude in enumerate(magnitudes):
@@ -602,118 +585,93 @@ class LineSpectrumVisualizer:
     def generate_video(self):
         """Generate the final video with transparent background"""
         print(f"Generating video: {self.output_path}")
+        profiler = StageProfiler(enabled=self.profile_path is not None)
 
         # Load audio
-        self.load_audio()
+        with profiler.stage('analysis'):
+            self.load_audio()
 
-        # Create temporary video without audio
-        temp_no_audio = str(Path(self.output_path).with_suffix('')) + '_temp_no_audio.mp4'
+        # Output to .mov (ProRes 4444) unless .webm (VP9 alpha) was requested
+        final_output = alpha_output_path(self.output_path)
 
-        # Use mp4v codec for temporary file
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-
-        # Create video writer
-        video_writer = cv2.VideoWriter(
-            temp_no_audio,
-            fourcc,
-            self.fps,
-            (self.width, self.height),
-            True
-        )
-
-        if not video_writer.isOpened():
-            raise RuntimeError("Failed to open video writer")
-
-        # Generate frames
-        total_frames = int(self.duration * self.fps)
-
-        for frame_idx in range(total_frames):
-            # Create BGR frame (3 channels) - black background
-            frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-
-            # Get frequency data for this frame
-            audio_frame_idx = int(frame_idx * self.num_frames / total_frames)
-            magnitudes = self.get_frequency_bands(audio_frame_idx)
-
-            # Draw spectrum on the frame
-            frame = self.draw_spectrum(frame, magnitudes)
-
-            # Write frame to video
-            video_writer.write(frame)
-
-            # Progress indicator
-            if (frame_idx + 1) % 30 == 0 or frame_idx == total_frames - 1:
-                progress = (frame_idx + 1) / total_frames * 100
-                print(f"Progress: {progress:.1f}% ({frame_idx + 1}/{total_frames} frames)")
-
-        video_writer.release()
-        print(f"\nVideo generation complete (silent): {temp_no_audio}")
-
-        # Use ffmpeg to add audio and transparency
-        print("Adding audio and transparency...")
-        import subprocess
+        # Frames carry their own alpha plane, so the encoder needs no keying stage:
+        # - ProRes 4444 / VP9 alpha straight from BGRA frames
+        # - Audio added in the same encode pass
+        profile = alpha_profile_for(final_output)
 
         try:
-            # Output to .mov with transparency
-            final_output = str(Path(self.output_path).with_suffix('.mov'))
-
-            # Use ffmpeg to add audio and convert black to transparent
-            result = subprocess.run([
-                'ffmpeg', '-y',
-                '-i', temp_no_audio,
-                '-i', self.audio_path,
-                '-filter_complex',
-                '[0:v]colorkey=0x000000:0.01:0.1[ckout];[ckout]format=yuva420p[video]',
-                '-map', '[video]',
-                '-map', '1:a',
-                '-c:v', 'prores_ks',
-                '-profile:v', '4444',
-                '-c:a', 'aac',
-                '-shortest',
-                final_output
-            ], capture_output=True, text=True)
-
-            # Clean up temp file
-            Path(temp_no_audio).unlink()
-
-            if result.returncode == 0:
-                self.output_path = final_output
-                print(f"✓ Video with transparency and audio created successfully")
-                print(f"✓ Output: {final_output}")
-            else:
+            if not profile_supported(profile):
+                # Fallback: just add audio without transparency
                 print(f"Warning: Could not create transparent video. Creating standard video instead.")
-                print(f"FFmpeg error: {result.stderr}")
-
-                # Fallback: just add audio
-                result = subprocess.run([
-                    'ffmpeg', '-y',
-                    '-i', temp_no_audio,
-                    '-i', self.audio_path,
-                    '-c:v', 'copy',
-                    '-c:a', 'aac',
-                    '-shortest',
-                    final_output
-                ], capture_output=True, text=True)
-
-                Path(temp_no_audio).unlink()
-
-                if result.returncode == 0:
-                    print(f"✓ Standard video created: {final_output}")
-                else:
-                    print(f"Error: Could not create video")
-
+                profile = 'h264'
+
+            # Raw frames are piped straight into ffmpeg - no temp file, no second encode
+            encoder = FFmpegWriter(
+                final_output,
+                self.width,
+                self.height,
+                self.fps,
+                audio_path=self.audio_path,
+                profile=profile
+            )
         except FileNotFoundError:
             print("Error: ffmpeg not found. Please install ffmpeg:")
             print("  brew install ffmpeg")
-            Path(temp_no_audio).unlink()
             raise
+
+        # Frames get their alpha plane and are encoded on a writer thread while the next
+        # frame draws (see render_pipeline). The black canvas becomes transparent through
+        # a real alpha plane (no colorkey).
+        video_writer = PipelinedWriter(encoder, prepare=attach_alpha if encoder.has_alpha else None,
+                                       profiler=profiler)
+
+        # Generate frames
+        total_frames = int(self.duration * self.fps)
+        with profiler.stage('bands'):
+            band_frames = prefetch(self.get_band_track(total_frames), profiler=profiler)
+
+        try:
+            for frame_idx in range(total_frames):
+                # Create BGR frame (3 channels) - black background, fresh per frame since
+                # the writer thread owns every written frame
+                frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+                # Get frequency data for this frame
+                with profiler.stage('wait'):
+                    magnitudes = next(band_frames)
+
+                # Draw spectrum on the frame
+                with profiler.stage('draw'):
+                    frame = self.draw_spectrum(frame, magnitudes)
+
+                # Blocks only while the encoder is `depth` frames behind
+                with profiler.stage('queue'):
+                    video_writer.write(frame)
+
+                # Progress indicator
+                if (frame_idx + 1) % 30 == 0 or frame_idx == total_frames - 1:
+                    progress = (frame_idx + 1) / total_frames * 100
+                    print(f"Progress: {progress:.1f}% ({frame_idx + 1}/{total_frames} frames)")
+
+            print("Finalizing video...")
+            with profiler.stage('finalize'):
+                video_writer.release()
         except Exception as e:
             print(f"Error: Could not process video: {e}")
-            if Path(temp_no_audio).exists():
-                Path(temp_no_audio).unlink()
+            video_writer.abort()
             raise
+        finally:
+            band_frames.close()
+
+        self.output_path = final_output
+        if video_writer.has_alpha:
+            print(f"✓ Video with transparency and audio created successfully")
+        else:
+            print(f"✓ Standard video created: {final_output}")
+        print(f"✓ Output: {final_output}")
 
         print(f"Duration: {self.duration:.2f}s, Resolution: {self.width}x{self.height}, FPS: {self.fps}")
+        profiler.finish(self.profile_path)
 
 
 def main():
@@ -747,6 +705,10 @@ Examples:
     parser.add_argument('--num-bars', type=int, default=60, help='Number of frequency bars (default: 60)')
     parser.add_argument('--bar-spacing', type=int, default=10, help='Spacing between bars (default: 10)')
     parser.add_argument('--smoothing', type=float, default=0.7, help='Smoothing factor 0-1 (default: 0.7)')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Analyze audio in blocks with bounded memory (for multi-hour mixes)')
+    parser.add_argument('--profile', type=str, default=None, metavar='TRACE_JSON',
+                        help='Write a Chrome trace of per-stage render timings and print a summary')
 
     args = parser.parse_args()
 
@@ -784,7 +746,9 @@ Examples:
         color=color_bgr,
         bar_spacing=args.bar_spacing,
         smoothing=args.smoothing,
-        mode=args.mode
+        mode=args.mode,
+        streaming=args.streaming,
+        profile_path=args.profile
     )
 
     # Generate video
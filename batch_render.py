@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Batch Renderer
+Renders many modes of one audio clip inside a process pool
+
+Replaces launching `python <script> ... --mode N` once per mode. The clip is
+analyzed once up front (shared spectrogram cache), and each worker process keeps
+its imports, the mode registry and the analysis in memory across every mode it
+renders. Each render reports success/failure and timing.
+
+Creative modes keep their state apart, so with --group N a worker draws N modes
+in one pass over the clip: the features are computed once per frame and every
+mode writes its own video.
+
+Examples:
+  # All creative modes 1-300 as 480x480 previews
+  python batch_render.py clip.wav previews/ --script audio_spectrum_creative --modes 1-300 --preview
+
+  # Same, 10 modes per pass over the clip
+  python batch_render.py clip.wav previews/ --modes 1-300 --preview --group 10
+
+  # A few line modes on 4 workers
+  python batch_render.py clip.wav out/ --script audio_spectrum_lines --modes 1,3,5 --workers 4
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import importlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import cv2
+
+from audio_analysis import load_spectrum, iter_frame_features
+from ffmpeg_writer import FFmpegWriter, attach_alpha
+from render_pipeline import PipelinedWriter, prefetch
+
+
+# Script key -> (module, visualizer class, constructor defaults that match the script's CLI)
+VISUALIZERS = {
+    'audio_spectrum': ('audio_spectrum', 'CircularSpectrumVisualizer', {}),
+    'audio_spectrum_lines': ('audio_spectrum_lines', 'LineSpectrumVisualizer',
+                             {'color': (220, 225, 230)}),
+    'audio_spectrum_creative': ('audio_spectrum_creative', 'CreativeSpectrumVisualizer', {}),
+}
+
+
+class RenderJob:
+    """One mode of one visualizer rendered to one output file"""
+
+    def __init__(self, script_key, mode, output_path, options=None):
+        """
+        Args:
+            script_key: Key into VISUALIZERS
+            mode: Mode number
+            output_path: Output video path
+            options: Extra visualizer constructor arguments (width, height, ...)
+        """
+        if script_key not in VISUALIZERS:
+            raise ValueError(f"Unknown visualizer: {script_key}")
+        self.script_key = script_key
+        self.mode = mode
+        self.output_path = str(output_path)
+        self.options = options or {}
+
+
+class RenderResult:
+    """Outcome of a RenderJob"""
+
+    def __init__(self, job, ok, seconds, error=None, log=''):
+        self.job = job
+        self.ok = ok
+        self.seconds = seconds
+        self.error = error
+        self.log = log
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f'failed: {self.error}'
+        return f"<RenderResult {self.job.script_key} mode {self.job.mode} {status} ({self.seconds:.1f}s)>"
+
+
+def _init_worker(preview):
+    """Per-process setup: imports and env are paid once per worker, not per mode"""
+    if preview:
+        os.environ['AS_PREVIEW'] = '1'
+    # One OpenCV thread per worker; the pool provides the parallelism
+    cv2.setNumThreads(1)
+    for module_name, _, _ in VISUALIZERS.values():
+        importlib.import_module(module_name)
+
+
+def render_job(audio_path, job, fps=30):
+    """
+    Render a single job in the current process
+
+    Visualizer output is captured; on failure the tail of it is kept in the result.
+
+    Returns:
+        RenderResult
+    """
+    module_name, class_name, defaults = VISUALIZERS[job.script_key]
+    visualizer_class = getattr(importlib.import_module(module_name), class_name)
+
+    log = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(log):
+            options = {**defaults, **job.options}
+            visualizer = visualizer_class(audio_path, job.output_path, fps=fps,
+                                          mode=job.mode, **options)
+            visualizer.generate_video()
+    except Exception as e:
+        traceback.print_exc(file=log)
+        return RenderResult(job, False, time.perf_counter() - start,
+                            error=f"{type(e).__name__}: {e}", log=log.getvalue()[-2000:])
+    return RenderResult(job, True, time.perf_counter() - start)
+
+
+def render_group(audio_path, jobs, fps=30):
+    """
+    Render several creative jobs with the same options in one pass of the current process
+
+    The audio is loaded and the features computed once; on every frame each mode
+    draws from the same features into its own encoder. Modes keep their state apart
+    (modes.base.ModeState), so the output of each matches a render on its own, and
+    a mode that fails is dropped without affecting the others.
+
+    Returns:
+        list of RenderResult in job order
+    """
+    module_name, class_name, defaults = VISUALIZERS['audio_spectrum_creative']
+    visualizer_class = getattr(importlib.import_module(module_name), class_name)
+    options = {**defaults, **jobs[0].options}
+
+    logs = [io.StringIO() for _ in jobs]
+    seconds = [0.0] * len(jobs)
+    errors = [None] * len(jobs)
+    writers = [None] * len(jobs)
+
+    def fail(i, e):
+        traceback.print_exc(file=logs[i])
+        errors[i] = f"{type(e).__name__}: {e}"
+        if writers[i] is not None:
+            writers[i].abort()
+            writers[i] = None
+
+    start = time.perf_counter()
+    shared_log = io.StringIO()
+    try:
+        with redirect_stdout(shared_log):
+            visualizer = visualizer_class(audio_path, jobs[0].output_path, fps=fps, mode=jobs[0].mode, **options)
+            visualizer.load_audio()
+            total_frames = int(visualizer.duration * visualizer.fps)
+            feature_frames = prefetch(iter_frame_features(visualizer.get_band_blocks(total_frames)))
+    except Exception as e:
+        traceback.print_exc(file=shared_log)
+        return [RenderResult(job, False, time.perf_counter() - start, error=f"{type(e).__name__}: {e}",
+                             log=shared_log.getvalue()[-2000:]) for job in jobs]
+    shared_seconds = time.perf_counter() - start
+
+    for i, job in enumerate(jobs):
+        try:
+            with redirect_stdout(logs[i]):
+                final_output, profile = visualizer.output_target(job.output_path)
+                encoder = FFmpegWriter(final_output, visualizer.width, visualizer.height, visualizer.fps,
+                                       audio_path=audio_path, profile=profile)
+                writers[i] = PipelinedWriter(encoder, prepare=attach_alpha if encoder.has_alpha else None)
+        except Exception as e:
+            fail(i, e)
+
+    try:
+        for features in feature_frames:
+            visualizer.features = features
+            visualizer.frame_counter += 1
+            for i, job in enumerate(jobs):
+                if writers[i] is None:
+                    continue
+                job_start = time.perf_counter()
+                try:
+                    with redirect_stdout(logs[i]):
+                        frame = np.zeros((visualizer.height, visualizer.width, 3), dtype=np.uint8)
+                        writers[i].write(visualizer.draw_mode(job.mode, frame, features.magnitudes))
+                except Exception as e:
+                    fail(i, e)
+                seconds[i] += time.perf_counter() - job_start
+    except BaseException:
+        for writer in writers:
+            if writer is not None:
+                writer.abort()
+        raise
+    finally:
+        feature_frames.close()
+
+    results = []
+    for i, job in enumerate(jobs):
+        if writers[i] is not None:
+            job_start = time.perf_counter()
+            try:
+                writers[i].release()
+            except Exception as e:
+                fail(i, e)
+            seconds[i] += time.perf_counter() - job_start
+        job_seconds = seconds[i] + shared_seconds / len(jobs)
+        if errors[i] is None:
+            results.append(RenderResult(job, True, job_seconds))
+        else:
+            results.append(RenderResult(job, False, job_seconds, error=errors[i], log=logs[i].getvalue()[-2000:]))
+    return results
+
+
+def render_jobs(audio_path, jobs, fps=30):
+    """Render a unit of work in the current process: one job alone, or a group of creative jobs"""
+    if len(jobs) == 1:
+        return [render_job(audio_path, jobs[0], fps)]
+    return render_group(audio_path, jobs, fps)
+
+
+def plan_groups(jobs, group=1):
+    """
+    Split job indices into units of work
+
+    Creative jobs with the same options are grouped up to `group` per unit (drawn
+    in one pass by render_group); every other job is a unit of its own.
+    """
+    if group <= 1:
+        return [[i] for i in range(len(jobs))]
+    units = []
+    shared = {}
+    for i, job in enumerate(jobs):
+        if job.script_key == 'audio_spectrum_creative':
+            shared.setdefault(repr(sorted(job.options.items())), []).append(i)
+        else:
+            units.append([i])
+    for indices in shared.values():
+        units.extend(indices[start:start + group] for start in range(0, len(indices), group))
+    return sorted(units)
+
+
+def render_batch(audio_path, jobs, fps=30, workers=None, preview=False, on_result=None, group=1):
+    """
+    Render many jobs over one audio clip in a process pool
+
+    Args:
+        audio_path: Audio file shared by all jobs
+        jobs: Iterable of RenderJob
+        fps: Frames per second
+        workers: Worker processes (default: CPU count)
+        preview: Use the fast preview encode path (AS_PREVIEW=1)
+        on_result: Optional callback called with each RenderResult as it finishes
+        group: Creative modes with the same options drawn together in one pass
+            (shared analysis and features, see render_group)
+
+    Returns:
+        list of RenderResult in job order
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+
+    # Analyze once so every worker finds the spectrogram in the cache
+    load_spectrum(audio_path, fps)
+
+    units = plan_groups(jobs, group)
+    workers = min(workers or os.cpu_count() or 1, len(units))
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(preview,)) as pool:
+        futures = {pool.submit(render_jobs, audio_path, [jobs[i] for i in unit], fps): unit
+                   for unit in units}
+        for future in as_completed(futures):
+            unit = futures[future]
+            try:
+                unit_results = future.result()
+            except Exception as e:
+                # Worker died (crash, OOM kill) rather than the render raising
+                unit_results = [RenderResult(jobs[i], False, 0.0, error=f"{type(e).__name__}: {e}")
+                                for i in unit]
+            for i, result in zip(unit, unit_results):
+                results[i] = result
+                if on_result is not None:
+                    on_result(result)
+    return results
+
+
+def print_summary(results, wall_seconds):
+    """Print totals, failures and the slowest renders"""
+    ok = [r for r in results if r.ok]
+    failed = [r for r in results if not r.ok]
+    render_seconds = sum(r.seconds for r in results)
+
+    print(f"\nRendered {len(ok)}/{len(results)} in {wall_seconds:.1f}s "
+          f"({render_seconds:.1f}s of render time)")
+    for r in failed:
+        print(f"  ✗ {r.job.script_key} mode {r.job.mode}: {r.error}")
+    for r in sorted(ok, key=lambda r: r.seconds, reverse=True)[:5]:
+        print(f"  slowest: {r.job.script_key} mode {r.job.mode} ({r.seconds:.1f}s)")
+
+
+def parse_modes(spec):
+    """Parse a mode list like '1-10,15,20-22'"""
+    modes = []
+    for part in spec.split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            modes.extend(range(int(first), int(last) + 1))
+        elif part:
+            modes.append(int(part))
+    return modes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Render many visualizer modes of one audio clip in parallel',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('input', help='Input audio file')
+    parser.add_argument('output_dir', help='Directory for the rendered videos')
+    parser.add_argument('--script', choices=sorted(VISUALIZERS), default='audio_spectrum_creative',
+                        help='Visualizer to render (default: audio_spectrum_creative)')
+    parser.add_argument('--modes', type=str, default='1-10', help="Modes to render, e.g. '1-10,15' (default: 1-10)")
+    parser.add_argument('--width', type=int, default=480, help='Video width (default: 480)')
+    parser.add_argument('--height', type=int, default=480, help='Video height (default: 480)')
+    parser.add_argument('--fps', type=int, default=30, help='Frames per second (default: 30)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--preview', action='store_true', help='Fast preview encode (AS_PREVIEW=1)')
+    parser.add_argument('--group', type=int, default=1,
+                        help='Creative modes drawn together per worker pass, sharing the analysis (default: 1)')
+
+    args = parser.parse_args()
+
+    if not Path(args.input).exists():
+        print(f"Error: Input file not found: {args.input}")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs = [
+        RenderJob(args.script, mode, output_dir / f"{args.script}_mode_{mode:03d}.mov",
+                  {'width': args.width, 'height': args.height})
+        for mode in parse_modes(args.modes)
+    ]
+
+    def report(result):
+        mark = '✓' if result.ok else '✗'
+        print(f"  {mark} mode {result.job.mode} ({result.seconds:.1f}s)")
+
+    start = time.perf_counter()
+    results = render_batch(args.input, jobs, fps=args.fps, workers=args.workers,
+                           preview=args.preview, on_result=report, group=args.group)
+    print_summary(results, time.perf_counter() - start)
+
+    if not all(r.ok for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
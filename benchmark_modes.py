@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Mode Performance Benchmark
+Times every creative mode on a deterministic synthetic spectrum
+
+Each mode is driven through the mode registry (get_mode_method) at one or more
+resolutions and measured for ms/frame percentiles, peak RSS and growth of the
+visualizer state. Results are written as JSON; passing a previous run as
+--baseline flags modes that got slower than the threshold.
+
+Every mode runs in a fresh worker process, so peak RSS and state belong to that
+mode alone and one mode's leftovers never slow down the next.
+
+Examples:
+  # Everything at 480x480, 60 frames per mode
+  python benchmark_modes.py --output bench.json
+
+  # A range of modes at all three sizes, compared with an earlier run
+  python benchmark_modes.py --modes 1-100 --resolutions 480,720,1080p \\
+      --output bench_new.json --baseline bench.json --threshold 0.2
+"""
+import gc
+import sys
+import json
+import time
+import resource
+import argparse
+import platform
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import cv2
+
+
+# Resolution presets (name -> width, height)
+RESOLUTIONS = {
+    '480': (480, 480),
+    '720': (720, 720),
+    '1080p': (1920, 1080),
+}
+
+# Percentiles reported for ms/frame
+PERCENTILES = (50, 95, 99)
+
+
+def synthetic_magnitudes(num_frames, num_bars=120, fps=30, seed=0):
+    """
+    Deterministic (num_frames, num_bars) bar stream that behaves like music
+
+    Falling spectral tilt, a 120 BPM kick in the bass, a slower swell in the mids
+    and noisy highs, all in 0-1 and smoothed like the real band track.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(num_frames)[:, None] / fps
+    position = np.arange(num_bars)[None, :] / num_bars
+
+    tilt = 0.8 - 0.5 * position
+    kick = np.exp(-((t * 2) % 1.0) * 8) * np.clip(1 - position * 4, 0, 1)
+    swell = 0.2 * (1 + np.sin(2 * np.pi * 0.25 * t)) * np.exp(-((position - 0.5) ** 2) / 0.05)
+    noise = 0.15 * rng.random((num_frames, num_bars)) * position
+
+    bars = np.clip(tilt * 0.6 + kick * 0.4 + swell + noise, 0, 1)
+    for i in range(1, num_frames):
+        bars[i] = 0.7 * bars[i - 1] + 0.3 * bars[i]
+    return bars.astype(np.float32)
+
+
+def state_size(obj, depth=0, seen=None):
+    """Approximate bytes held by an object graph (arrays, containers, scalars)"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or depth > 6:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(state_size(v, depth + 1, seen) for v in obj.values())
+    elif isinstance(obj, (list, tuple, set, frozenset)) or type(obj).__name__ == 'deque':
+        size += sum(state_size(v, depth + 1, seen) for v in obj)
+    elif hasattr(obj, '__dict__') and depth > 0:
+        size += state_size(vars(obj), depth + 1, seen)
+    return size
+
+
+def visualizer_state_size(visualizer):
+    """Bytes of mutable state on the visualizer and its modes (ignores modules and bound methods)"""
+    total = 0
+    seen = set()
+    namespaces = [vars(visualizer)] + [vars(mode.state) for mode in visualizer.mode_instances.values()]
+    for namespace in namespaces:
+        for name, value in namespace.items():
+            if callable(value) or type(value).__name__ == 'module' or name == 'mode_instances':
+                continue
+            total += state_size(value, 1, seen)
+    return total
+
+
+def benchmark_mode(mode, width, height, frames=60, warmup=5, seed=0):
+    """
+    Benchmark one mode at one resolution in the current process
+
+    Returns:
+        dict with timing percentiles, peak RSS and state growth (or 'error')
+    """
+    from audio_spectrum_creative import CreativeSpectrumVisualizer
+    from audio_analysis import FeatureTracker
+    from modes import get_mode_method
+
+    cv2.setNumThreads(1)
+
+    visualizer = CreativeSpectrumVisualizer(None, None, width=width, height=height, mode=mode, seed=seed)
+    if get_mode_method(mode, visualizer) is None:
+        return {'error': 'mode not found'}
+
+    bars = synthetic_magnitudes(warmup + frames, visualizer.num_bars, visualizer.fps, seed)
+    features = list(FeatureTracker().process(bars))
+
+    timings = []
+    state_start = None
+    try:
+        for i, frame_features in enumerate(features):
+            if i == warmup:
+                gc.collect()
+                state_start = visualizer_state_size(visualizer)
+
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
+            visualizer.features = frame_features
+
+            start = time.perf_counter()
+            visualizer.draw_spectrum(frame, frame_features.magnitudes)
+            elapsed = time.perf_counter() - start
+
+            if i >= warmup:
+                timings.append(elapsed * 1000)
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}", 'frames_ok': len(timings)}
+
+    state_end = visualizer_state_size(visualizer)
+    timings = np.array(timings)
+    result = {f'p{p}_ms': round(float(np.percentile(timings, p)), 3) for p in PERCENTILES}
+    result.update({
+        'mean_ms': round(float(timings.mean()), 3),
+        'max_ms': round(float(timings.max()), 3),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'state_start_kb': round(state_start / 1024, 1),
+        'state_end_kb': round(state_end / 1024, 1),
+        'state_growth_kb_per_frame': round((state_end - state_start) / 1024 / frames, 3),
+    })
+    return result
+
+
+def run_benchmarks(modes, resolutions, frames=60, warmup=5, seed=0, workers=1, on_result=None):
+    """
+    Benchmark modes x resolutions, one fresh worker process per measurement
+
+    Returns:
+        dict: resolution name -> {mode number (str) -> result dict}
+    """
+    tasks = [(res, mode) for res in resolutions for mode in modes]
+    results = {res: {} for res in resolutions}
+
+    # max_tasks_per_child=1: peak RSS and module-level state are per mode
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        futures = [
+            (res, mode, pool.submit(benchmark_mode, mode, *RESOLUTIONS[res], frames, warmup, seed))
+            for res, mode in tasks
+        ]
+        for res, mode, future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'error': f"worker died: {type(e).__name__}: {e}"}
+            results[res][str(mode)] = result
+            if on_result is not None:
+                on_result(res, mode, result)
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold=0.2, metric='p50_ms'):
+    """
+    Find modes whose metric grew by more than threshold (fraction) over the baseline
+
+    Returns:
+        list of (resolution, mode, old, new, change) sorted by change, worst first
+    """
+    regressions = []
+    for res, modes in results.items():
+        old_modes = baseline.get('results', {}).get(res, {})
+        for mode, result in modes.items():
+            old = old_modes.get(mode, {})
+            if metric not in result or metric not in old or old[metric] <= 0:
+                continue
+            change = result[metric] / old[metric] - 1
+            if change > threshold:
+                regressions.append((res, int(mode), old[metric], result[metric], change))
+    return sorted(regressions, key=lambda r: r[4], reverse=True)
+
+
+def print_summary(results, budget_ms=None):
+    """Per-resolution slowest modes, errors and how many fit in a frame budget"""
+    for res, modes in results.items():
+        ok = {m: r for m, r in modes.items() if 'error' not in r}
+        errors = {m: r for m, r in modes.items() if 'error' in r}
+        print(f"\n{res} ({RESOLUTIONS[res][0]}x{RESOLUTIONS[res][1]}): "
+              f"{len(ok)} measured, {len(errors)} failed")
+
+        slowest = sorted(ok.items(), key=lambda item: item[1]['p95_ms'], reverse=True)[:10]
+        if slowest:
+            print(f"  {'mode':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'RSS MB':>8} {'state KB/f':>11}")
+        for mode, r in slowest:
+            print(f"  {mode:>6} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+                  f"{r['peak_rss_mb']:>8.1f} {r['state_growth_kb_per_frame']:>11.3f}")
+
+        growing = [m for m, r in ok.items() if r['state_growth_kb_per_frame'] > 1.0]
+        if growing:
+            print(f"  ⚠ State grows >1 KB/frame: modes {', '.join(sorted(growing, key=int))}")
+        if budget_ms is not None:
+            fits = sum(1 for r in ok.values() if r['p95_ms'] <= budget_ms)
+            print(f"  {fits}/{len(ok)} modes render within {budget_ms:.1f} ms/frame at p95")
+        for mode, r in sorted(errors.items(), key=lambda item: int(item[0])):
+            print(f"  ✗ mode {mode}: {r['error']}")
+
+
+def main():
+    from batch_render import parse_modes
+    from modes import get_all_modes
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark creative visualizer modes',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--modes', type=str, default=None, help="Modes to run, e.g. '1-50,99' (default: all)")
+    parser.add_argument('--resolutions', type=str, default='480',
+                        help=f"Comma-separated presets from {', '.join(RESOLUTIONS)} (default: 480)")
+    parser.add_argument('--frames', type=int, default=60, help='Timed frames per mode (default: 60)')
+    parser.add_argument('--warmup', type=int, default=5, help='Untimed warmup frames (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic spectrum (default: 0)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parallel worker processes (default: 1; more adds timing noise)')
+    parser.add_argument('--output', type=str, default='bench_output.json', help='JSON output path')
+    parser.add_argument('--baseline', type=str, default=None, help='Earlier JSON output to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative p50 slowdown that counts as a regression (default: 0.2)')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='Report how many modes fit this per-frame budget at p95')
+
+    args = parser.parse_args()
+
+    resolutions = [r.strip() for r in args.resolutions.split(',')]
+    for res in resolutions:
+        if res not in RESOLUTIONS:
+            print(f"Error: Unknown resolution '{res}' (choose from {', '.join(RESOLUTIONS)})")
+            sys.exit(1)
+    modes = parse_modes(args.modes) if args.modes else get_all_modes()
+
+    total = len(modes) * len(resolutions)
+    done = 0
+
+    def report(res, mode, result):
+        nonlocal done
+        done += 1
+        if 'error' in result:
+            print(f"[{done}/{total}] {res} mode {mode}: ✗ {result['error']}")
+        else:
+            print(f"[{done}/{total}] {res} mode {mode}: p50 {result['p50_ms']:.2f} ms, "
+                  f"p95 {result['p95_ms']:.2f} ms")
+
+    start = time.perf_counter()
+    results = run_benchmarks(modes, resolutions, args.frames, args.warmup, args.seed,
+                             args.workers, on_result=report)
+
+    output = {
+        'meta': {
+            'frames': args.frames,
+            'warmup': args.warmup,
+            'seed': args.seed,
+            'resolutions': {res: RESOLUTIONS[res] for res in resolutions},
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'opencv': cv2.__version__,
+            'machine': platform.machine(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'wall_seconds': round(time.perf_counter() - start, 1),
+        },
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(output, indent=2))
+    print(f"\n✓ Wrote {args.output}")
+
+    print_summary(results, args.budget_ms)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠ {len(regressions)} regression(s) over {args.threshold:.0%} (p50):")
+            for res, mode, old, new, change in regressions:
+                print(f"  {res} mode {mode}: {old:.2f} -> {new:.2f} ms (+{change:.0%})")
+            sys.exit(1)
+        print(f"\n✓ No regressions over {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,8 @@ gallery page to browse and play them quickly.
 - Discovers modes dynamically (by scanning source files) with safe fallbacks
   for classic/lines scripts.
 - Creates a 4s preview audio slice to speed up generation.
+- Renders all missing previews in one process pool (batch_render.py), so the
+  clip is analyzed once and imports are paid once per worker.
 - Renders previews to catalog/video_previews/*.webm (480x480) for fast browsing.
 - Writes catalog/index.html that auto-loads all generated previews.
 """
@@ -19,7 +21,8 @@ import time
 import shlex
 import subprocess
 from pathlib import Path
-import os
+
+from batch_render import RenderJob, render_batch, print_summary
 
 
 # Configuration
@@ -164,6 +167,14 @@ SCRIPTS = {
     'audio_spectrum_creative': Path('audio_spectrum_creative.py'),
 }
 
+# Preview render size per script. audio_spectrum's CLI resolves .mov outputs to its
+# hd preset and ignores --width/--height, so its previews have always been 1920x1080.
+PREVIEW_SIZES = {
+    'audio_spectrum': (1920, 1080),
+    'audio_spectrum_lines': (480, 480),
+    'audio_spectrum_creative': (480, 480),
+}
+
 # Fallback modes when discovery fails
 FALLBACK_MODES = {
     'audio_spectrum': list(range(1, 11)),
@@ -266,32 +277,37 @@ def parse_mode_names(script_path: Path) -> dict[int, str]:
     return result
 
 
-def generate_preview(script_path: Path, mode: int, preview_audio: str) -> str | None:
-    out_name = f"{script_path.stem}_mode_{mode:03d}.mov"
-    output_video = PREVIEWS_DIR / out_name
-    if output_video.exists():
-        print(f"  ⚠ Exists, skip: {out_name}")
-        return str(output_video)
+def generate_previews(all_modes: dict[str, list[int]], preview_audio: str) -> list:
+    """Render every missing preview in one process pool (see batch_render.py)."""
+    jobs = []
+    for key, modes in all_modes.items():
+        width, height = PREVIEW_SIZES[key]
+        for mode in modes:
+            output_video = PREVIEWS_DIR / f"{SCRIPTS[key].stem}_mode_{mode:03d}.mov"
+            if output_video.exists():
+                print(f"  ⚠ Exists, skip: {output_video.name}")
+                continue
+            jobs.append(RenderJob(key, mode, output_video, {'width': width, 'height': height}))
 
-    cmd = [
-        'python', str(script_path),
-        preview_audio,
-        str(output_video),
-        '--mode', str(mode),
-        '--width', '480',
-        '--height', '480'
-    ]
-    print(f"  ▶ Generating {out_name}")
-    env = os.environ.copy()
-    env['AS_PREVIEW'] = '1'  # force fast preview path
-    res = run(cmd, env=env)
-    if res.returncode == 0 and output_video.exists():
-        print(f"  ✓ Generated: {out_name}")
-        return str(output_video)
-    print(f"  ✗ Failed: {out_name}")
-    if res.stderr:
-        print(res.stderr[:400])
-    return None
+    print(f"\nRendering {len(jobs)} previews...")
+    done = 0
+
+    def report(result) -> None:
+        nonlocal done
+        done += 1
+        name = Path(result.job.output_path).name
+        if result.ok:
+            print(f"  [{done}/{len(jobs)}] ✓ Generated: {name} ({result.seconds:.1f}s)")
+        else:
+            print(f"  [{done}/{len(jobs)}] ✗ Failed: {name}: {result.error}")
+            if result.log:
+                print(result.log[-400:])
+
+    start = time.perf_counter()
+    # AS_PREVIEW forces the fast preview path
+    results = render_batch(preview_audio, jobs, preview=True, on_result=report)
+    print_summary(results, time.perf_counter() - start)
+    return results
 
 
 def scan_generated_previews() -> dict[str, list[dict]]:
@@ -778,16 +794,9 @@ def main() -> None:
         sys.exit(1)
 
     # Generate previews
-    total = sum(len(v) for v in all_modes.values())
-    done = 0
     for key, path in SCRIPTS.items():
-        modes = all_modes[key]
-        print(f"\n-- {path.name}: {len(modes)} modes")
-        for m in modes:
-            done += 1
-            print(f"[{done}/{total}] {path.name} mode {m}")
-            generate_preview(path, m, preview_audio)
-            time.sleep(0.1)
+        print(f"-- {path.name}: {len(all_modes[key])} modes")
+    generate_previews(all_modes, preview_audio)
 
     # Build HTML from generated previews
     previews = scan_generated_previews()
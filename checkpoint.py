@@ -0,0 +1,245 @@
+"""
+Render Checkpoints
+Snapshot/restore of mode state so a long creative render can resume after a crash
+
+A snapshot holds everything a mode carries from one frame to the next: the state
+of each mode drawn so far (modes.base.ModeState: particle pools, histories,
+angles), prev_magnitudes and frame_counter. The render context (size, fps, audio
+analysis, caches) is not part of it; it is rebuilt from the constructor arguments
+and load_audio(). Neither are the random numbers: each frame's stream is derived
+from the render and the frame number (render_random.frame_rng). Snapshots are
+zlib-compressed pickles; their size grows with the mode's state.
+
+render_checkpointed() writes the video as one part file per N frames and saves a
+snapshot at every part boundary. When the render dies, running it again with the
+same checkpoint directory restores the last snapshot, keeps the finished parts and
+continues from there; at the end the parts are joined losslessly with the audio
+(ffmpeg concat demuxer, stream copy).
+
+    visualizer = CreativeSpectrumVisualizer('mix.wav', 'out.mov', mode=12)
+    render_checkpointed(visualizer, 'out.ckpt', every=900)
+
+Snapshots are pickles: only load checkpoints this tool wrote.
+"""
+import os
+import json
+import zlib
+import pickle
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+from audio_analysis import iter_frame_features
+from ffmpeg_writer import FFmpegWriter, attach_alpha, concat_videos
+from modes import get_mode_instance
+from render_pipeline import PipelinedWriter, prefetch
+from render_profiler import StageProfiler
+
+
+SNAPSHOT_VERSION = 1
+
+# Default checkpoint interval: 30 seconds at 30 fps
+DEFAULT_CHECKPOINT_EVERY = 900
+
+# Visualizer attributes that are render context or caches, not mode state
+CONTEXT_ATTRIBUTES = frozenset({
+    'audio_path', 'output_path', 'width', 'height', 'fps', 'num_bars', 'smoothing',
+    'streaming', 'profile_path', 'mode', 'seed', 'center_x', 'center_y', 'max_radius',
+    'analysis', 'magnitude_norm', 'sample_rate', 'duration', 'num_frames', 'audio_hash',
+    'features', 'layer_cache', 'rng', 'mode_instances',
+})
+
+
+def snapshot(visualizer):
+    """
+    Serialize the mode state of a visualizer
+
+    Args:
+        visualizer: CreativeSpectrumVisualizer between two frames
+
+    Returns:
+        Compressed snapshot bytes (see restore)
+    """
+    state = {name: value for name, value in vars(visualizer).items() if name not in CONTEXT_ATTRIBUTES}
+    payload = {
+        'version': SNAPSHOT_VERSION,
+        'mode': visualizer.mode,
+        'size': (visualizer.width, visualizer.height),
+        'state': state,
+        'modes': {number: vars(mode.state) for number, mode in visualizer.mode_instances.items()},
+    }
+    return zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def restore(visualizer, data):
+    """
+    Load snapshot bytes into a visualizer built with the same mode and size
+
+    Returns:
+        frame_counter of the snapshot (frames drawn before it was taken)
+    """
+    payload = pickle.loads(zlib.decompress(data))
+    if payload.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {payload.get('version')}")
+    if payload['mode'] != visualizer.mode or tuple(payload['size']) != (visualizer.width, visualizer.height):
+        raise ValueError(f"Snapshot of mode {payload['mode']} at {payload['size'][0]}x{payload['size'][1]} "
+                         f"does not fit mode {visualizer.mode} at {visualizer.width}x{visualizer.height}")
+
+    vars(visualizer).update(payload['state'])
+    for number, mode_state in payload['modes'].items():
+        mode = get_mode_instance(number, visualizer)
+        if mode is None:
+            raise ValueError(f"Snapshot holds state of unknown mode {number}")
+        mode.reset_state()
+        vars(mode.state).update(mode_state)
+    return visualizer.frame_counter
+
+
+def _write_atomic(path, data):
+    """Write a file so a crash leaves either the old or the new content"""
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def save_snapshot(visualizer, path):
+    """Write a snapshot of the visualizer's mode state to a file"""
+    _write_atomic(path, snapshot(visualizer))
+
+
+def load_snapshot(visualizer, path):
+    """Restore the visualizer's mode state from a snapshot file; returns its frame_counter"""
+    return restore(visualizer, Path(path).read_bytes())
+
+
+def _frame_files(checkpoint_dir, pattern):
+    """{start frame: path} of the checkpoint files matching a glob like 'state_*.ckpt'"""
+    return {int(path.stem.split('_')[1]): path for path in Path(checkpoint_dir).glob(pattern)}
+
+
+def render_checkpointed(visualizer, checkpoint_dir, every=DEFAULT_CHECKPOINT_EVERY, on_checkpoint=None):
+    """
+    Render a creative visualization with periodic checkpoints, resuming if possible
+
+    Args:
+        visualizer: CreativeSpectrumVisualizer (audio not loaded yet)
+        checkpoint_dir: Directory for part files and snapshots; reusing it after a
+            failed run resumes from the last checkpoint
+        every: Frames per part file / between snapshots
+        on_checkpoint: Optional callback called with the frame number after each snapshot
+
+    Returns:
+        Final output path
+    """
+    if every < 1:
+        raise ValueError(f"Checkpoint interval must be >= 1 frame, got {every}")
+    print(f"Generating video: {visualizer.output_path} (checkpoints in {checkpoint_dir})")
+    profiler = StageProfiler(enabled=visualizer.profile_path is not None)
+
+    with profiler.stage('analysis'):
+        visualizer.load_audio()
+    final_output, profile = visualizer.output_target()
+    total_frames = int(visualizer.duration * visualizer.fps)
+    if total_frames == 0:
+        raise ValueError(f"{visualizer.audio_path} is shorter than one frame at {visualizer.fps} fps")
+
+    checkpoint_dir = Path(checkpoint_dir)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    suffix = Path(final_output).suffix
+
+    # The manifest ties the directory to one render: resuming with other settings
+    # would splice frames of two different videos
+    manifest = {
+        'mode': visualizer.mode, 'width': visualizer.width, 'height': visualizer.height,
+        'fps': visualizer.fps, 'num_bars': visualizer.num_bars, 'smoothing': visualizer.smoothing,
+        'seed': visualizer.seed, 'audio_hash': visualizer.audio_hash, 'total_frames': total_frames,
+        'profile': profile,
+    }
+    manifest_path = checkpoint_dir / 'manifest.json'
+    if manifest_path.exists():
+        if json.loads(manifest_path.read_text()) != manifest:
+            raise ValueError(f"Checkpoints in {checkpoint_dir} belong to a different render")
+    else:
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode())
+
+    # Resume from the last snapshot; parts at or after it may be incomplete
+    start = 0
+    states = _frame_files(checkpoint_dir, 'state_*.ckpt')
+    if states:
+        start = load_snapshot(visualizer, states[max(states)])
+        print(f"Resuming from frame {start}/{total_frames}")
+    for part_start, path in _frame_files(checkpoint_dir, f'part_*{suffix}').items():
+        if part_start >= start:
+            path.unlink()
+
+    def open_part(part_start):
+        encoder = FFmpegWriter(checkpoint_dir / f"part_{part_start:08d}{suffix}",
+                               visualizer.width, visualizer.height, visualizer.fps, profile=profile)
+        return PipelinedWriter(encoder, prepare=attach_alpha if encoder.has_alpha else None,
+                               profiler=profiler)
+
+    # Features depend on every earlier frame (flux, beat tracking): compute from frame 0
+    with profiler.stage('bands'):
+        features = iter_frame_features(visualizer.get_band_blocks(total_frames))
+        feature_frames = prefetch(islice(features, start, None), profiler=profiler)
+
+    video_writer = None
+    try:
+        for frame_idx in range(start, total_frames):
+            if video_writer is None:
+                video_writer = open_part(frame_idx)
+            elif frame_idx % every == 0:
+                # The snapshot is only taken once every frame before it is on disk
+                with profiler.stage('checkpoint'):
+                    video_writer, part = None, video_writer
+                    part.release()
+                    save_snapshot(visualizer, checkpoint_dir / f"state_{frame_idx:08d}.ckpt")
+                    for state_frame, path in _frame_files(checkpoint_dir, 'state_*.ckpt').items():
+                        if state_frame < frame_idx:
+                            path.unlink()
+                if on_checkpoint is not None:
+                    on_checkpoint(frame_idx)
+                video_writer = open_part(frame_idx)
+
+            frame = np.zeros((visualizer.height, visualizer.width, 3), dtype=np.uint8)
+            with profiler.stage('wait'):
+                visualizer.features = next(feature_frames)
+            with profiler.stage('draw'):
+                frame = visualizer.draw_spectrum(frame, visualizer.features.magnitudes)
+            with profiler.stage('queue'):
+                video_writer.write(frame)
+
+            if (frame_idx + 1) % 30 == 0 or frame_idx == total_frames - 1:
+                progress = (frame_idx + 1) / total_frames * 100
+                print(f"Progress: {progress:.1f}% ({frame_idx + 1}/{total_frames} frames)")
+
+        print("Finalizing video...")
+        with profiler.stage('finalize'):
+            video_writer, part = None, video_writer
+            if part is not None:
+                part.release()
+            parts = _frame_files(checkpoint_dir, f'part_*{suffix}')
+            concat_videos([parts[part_start] for part_start in sorted(parts)], final_output,
+                          audio_path=visualizer.audio_path, profile=profile)
+    except BaseException:
+        # Finished parts and the last snapshot stay behind for the next run
+        if video_writer is not None:
+            video_writer.abort()
+        raise
+    finally:
+        feature_frames.close()
+
+    for path in checkpoint_dir.iterdir():
+        if path.name == 'manifest.json' or path.name.startswith(('part_', 'state_')):
+            path.unlink()
+    try:
+        checkpoint_dir.rmdir()
+    except OSError:
+        pass
+
+    visualizer.output_path = final_output
+    print(f"✓ Output: {final_output}")
+    profiler.finish(visualizer.profile_path)
+    return final_output
@@ -0,0 +1,128 @@
+"""
+Color Lookup Tables
+HSV <-> BGR conversion without a cv2.cvtColor call per color
+
+Converting one color with cv2.cvtColor means building a 1x1 image and paying the
+OpenCV call overhead (a few microseconds) - thousands of times per frame in the
+mode loops. Here:
+
+- HSV -> BGR is a lookup into a (180, 256, 256, 3) table generated by OpenCV
+  itself (~35 MB), so results are identical. Each hue's 256 x 256 plane is
+  filled the first time that hue is used, so short renders pay only for the
+  hues they touch
+- BGR -> HSV uses OpenCV's fixed-point 8-bit formula (exact for every color)
+
+Scalar helpers accept what np.array(..., dtype=np.uint8) accepts; values outside
+the table (hue >= 180, negative, NaN) fall back to cv2.cvtColor, so the output is
+always the same as the 1x1-image path. The *_array functions convert whole arrays.
+"""
+import numpy as np
+import cv2
+
+
+# OpenCV's 8-bit BGR2HSV fixed-point constants (hsv_shift, sdiv_table, hdiv_table180)
+_SHIFT = 12
+_HALF = 1 << (_SHIFT - 1)
+_SDIV = [0] + [int(np.round((255 << _SHIFT) / i)) for i in range(1, 256)]
+_HDIV = [0] + [int(np.round((180 << _SHIFT) / (6.0 * i))) for i in range(1, 256)]
+_SDIV_ARRAY = np.array(_SDIV, dtype=np.int64)
+_HDIV_ARRAY = np.array(_HDIV, dtype=np.int64)
+
+
+# HSV -> BGR table, filled one hue plane (256 x 256 colors) at a time on first use
+_lut = np.empty((180, 256, 256, 3), dtype=np.uint8)
+_lut_ready = np.zeros(180, dtype=bool)
+# Read-only view handed out to callers
+_lut_view = _lut.view()
+_lut_view.setflags(write=False)
+_SV_PLANE = np.stack(np.meshgrid(np.arange(256, dtype=np.uint8), np.arange(256, dtype=np.uint8),
+                                 indexing='ij'), axis=-1).reshape(-1, 2)
+
+
+def _fill_hues(hues):
+    """Generate the table planes for the given hues with OpenCV"""
+    for h in hues:
+        hsv = np.empty((len(_SV_PLANE), 1, 3), dtype=np.uint8)
+        hsv[:, 0, 0] = h
+        hsv[:, 0, 1:] = _SV_PLANE
+        # One pixel per row: OpenCV's SIMD path for wide rows rounds differently from
+        # the scalar path a 1x1 image takes, and the table must match the 1x1 calls
+        _lut[h] = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR).reshape(256, 256, 3)
+        _lut_ready[h] = True
+
+
+def hsv_lut():
+    """Complete read-only (180, 256, 256, 3) uint8 table: [h, s, v] -> BGR"""
+    _fill_hues(np.flatnonzero(~_lut_ready))
+    return _lut_view
+
+
+def hsv_pixel(h, s, v):
+    """
+    BGR uint8 array of shape (3,) for one OpenCV HSV color (hue 0-179)
+
+    Same result as cv2.cvtColor(np.array([[[h, s, v]]], dtype=np.uint8),
+    cv2.COLOR_HSV2BGR)[0][0]. The returned array is a read-only view.
+    """
+    if 0 <= h < 180 and 0 <= s < 256 and 0 <= v < 256:
+        h = int(h)
+        if not _lut_ready[h]:
+            _fill_hues([h])
+        return _lut_view[h, int(s), int(v)]
+    return cv2.cvtColor(np.array([[[h, s, v]]], dtype=np.uint8), cv2.COLOR_HSV2BGR)[0][0]
+
+
+def hsv_to_bgr(h, s, v):
+    """Convert one OpenCV HSV color to a BGR tuple of ints"""
+    return tuple(hsv_pixel(h, s, v).tolist())
+
+
+def hsv_to_bgr_array(h, s, v):
+    """
+    Convert arrays of HSV components (broadcast together) to BGR
+
+    Args:
+        h, s, v: Scalars or arrays of hue (0-179), saturation and value (0-255)
+
+    Returns:
+        uint8 array of shape broadcast(h, s, v).shape + (3,)
+    """
+    h, s, v = np.broadcast_arrays(*(np.asarray(c).astype(np.uint8) for c in (h, s, v)))
+    if np.all(h < 180):
+        _fill_hues(np.flatnonzero(~_lut_ready & (np.bincount(h.ravel(), minlength=180) > 0)))
+        return _lut_view[h, s, v]
+    hsv = np.stack([h, s, v], axis=-1).reshape(-1, 1, 3)
+    return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR).reshape(h.shape + (3,))
+
+
+def bgr_to_hsv(b, g, r):
+    """Convert one BGR color to an OpenCV HSV tuple of ints (same as cv2.COLOR_BGR2HSV)"""
+    if not (0 <= b < 256 and 0 <= g < 256 and 0 <= r < 256):
+        return tuple(cv2.cvtColor(np.uint8([[[b, g, r]]]), cv2.COLOR_BGR2HSV)[0][0].tolist())
+    b, g, r = int(b), int(g), int(r)
+    v = max(b, g, r)
+    diff = v - min(b, g, r)
+    s = (diff * _SDIV[v] + _HALF) >> _SHIFT
+    if v == r:
+        h = g - b
+    elif v == g:
+        h = b - r + 2 * diff
+    else:
+        h = r - g + 4 * diff
+    h = (h * _HDIV[diff] + _HALF) >> _SHIFT
+    if h < 0:
+        h += 180
+    return h, s, v
+
+
+def bgr_to_hsv_array(bgr):
+    """Convert a (..., 3) uint8 BGR array to OpenCV HSV (same as cv2.COLOR_BGR2HSV)"""
+    bgr = np.asarray(bgr).astype(np.int64)
+    b, g, r = bgr[..., 0], bgr[..., 1], bgr[..., 2]
+    v = np.maximum(np.maximum(b, g), r)
+    diff = v - np.minimum(np.minimum(b, g), r)
+    s = (diff * _SDIV_ARRAY[v] + _HALF) >> _SHIFT
+    h = np.where(v == r, g - b, np.where(v == g, b - r + 2 * diff, r - g + 4 * diff))
+    h = (h * _HDIV_ARRAY[diff] + _HALF) >> _SHIFT
+    h = np.where(h < 0, h + 180, h)
+    return np.stack([h, s, v], axis=-1).astype(np.uint8)
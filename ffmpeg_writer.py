@@ -0,0 +1,249 @@
+"""
+Streaming FFmpeg Video Writer
+Pipes raw frames straight into a single ffmpeg encode, muxing audio in the same pass
+
+Replaces the old two-pass flow (cv2.VideoWriter mp4v temp file, then a second
+ffmpeg decode/filter/encode). Frames are written as rawvideo over stdin, so the
+only lossy step is the final encode and nothing touches the temp disk.
+
+Transparency comes from a real alpha plane on the frames (pix_fmt 'bgra'),
+not from keying black pixels out in ffmpeg.
+"""
+import subprocess
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import cv2
+
+
+# Encoder argument presets
+CODEC_PROFILES = {
+    # ProRes 4444 - supports alpha, default for .mov outputs
+    'prores_4444': ['-c:v', 'prores_ks', '-profile:v', '4444', '-pix_fmt', 'yuva444p10le'],
+    # VP9 with alpha - for .webm outputs
+    'vp9_alpha': ['-c:v', 'libvpx-vp9', '-pix_fmt', 'yuva420p', '-b:v', '0', '-crf', '30',
+                  '-auto-alt-ref', '0'],
+    # H.264 - fast previews and the non-transparent fallback
+    'h264': ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23', '-pix_fmt', 'yuv420p'],
+}
+
+# Encoder each profile depends on (checked against `ffmpeg -encoders`)
+PROFILE_ENCODERS = {
+    'prores_4444': 'prores_ks',
+    'vp9_alpha': 'libvpx-vp9',
+    'h264': 'libx264',
+}
+
+# Profiles that carry an alpha channel
+ALPHA_PROFILES = {'prores_4444', 'vp9_alpha'}
+
+# Audio codec per profile (WebM cannot hold AAC)
+AUDIO_CODECS = {
+    'vp9_alpha': 'libopus',
+}
+
+_encoder_cache = None
+
+
+def available_encoders():
+    """Return the set of video encoder names the local ffmpeg supports"""
+    global _encoder_cache
+    if _encoder_cache is None:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True)
+        encoders = set()
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            # Encoder lines look like: " V....D prores_ks   Apple ProRes ..."
+            if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] == 'V':
+                encoders.add(parts[1])
+        _encoder_cache = encoders
+    return _encoder_cache
+
+
+def profile_supported(profile):
+    """Check whether ffmpeg has the encoder a codec profile needs"""
+    return PROFILE_ENCODERS[profile] in available_encoders()
+
+
+def alpha_output_path(output_path):
+    """Pick the transparent container for an output path (.webm stays VP9, anything else .mov)"""
+    path = Path(output_path)
+    if path.suffix.lower() == '.webm':
+        return str(path)
+    return str(path.with_suffix('.mov'))
+
+
+def alpha_profile_for(output_path):
+    """Alpha-capable codec profile matching the output container"""
+    if Path(output_path).suffix.lower() == '.webm':
+        return 'vp9_alpha'
+    return 'prores_4444'
+
+
+def attach_alpha(frame):
+    """
+    Build a BGRA frame with a real alpha plane from a frame drawn on a black canvas
+
+    The black canvas is treated as fully transparent and everything drawn on it as
+    premultiplied color, so alpha is the drawn coverage (max channel). Anti-aliased
+    edges and glow falloff become partial alpha; no pixel is keyed out by threshold,
+    and compositing the result over black reproduces the rendered frame exactly.
+    """
+    b, g, r = cv2.split(frame)
+    alpha = cv2.max(cv2.max(b, g), r)
+    color = cv2.divide(frame, cv2.merge([alpha, alpha, alpha]), scale=255)
+    return cv2.merge([*cv2.split(color), alpha])
+
+
+def opaque_alpha(frame):
+    """BGRA frame with a fully opaque alpha plane (solid backgrounds)"""
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA)
+
+
+def concat_videos(video_paths, output_path, audio_path=None, profile='h264'):
+    """
+    Join video files encoded with the same profile, without re-encoding
+
+    Uses ffmpeg's concat demuxer with stream copy, so the joined video is
+    bit-for-bit the parts' packets; the audio is muxed in the same pass.
+
+    Args:
+        video_paths: Parts in playback order (same size, fps and codec profile)
+        output_path: Joined output path
+        audio_path: Optional audio file muxed over the whole video
+        profile: Codec profile the parts were encoded with (picks the audio codec)
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as listing:
+        for path in video_paths:
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            listing.write(f"file '{escaped}'\n")
+    try:
+        cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0', '-i', listing.name]
+        if audio_path is not None:
+            cmd += ['-i', str(audio_path), '-map', '0:v', '-map', '1:a']
+        cmd += ['-c:v', 'copy']
+        if audio_path is not None:
+            cmd += ['-c:a', AUDIO_CODECS.get(profile, 'aac'), '-shortest']
+        cmd.append(str(output_path))
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg concat failed ({result.returncode}): "
+                               f"{result.stderr.decode(errors='replace').strip()}")
+    finally:
+        Path(listing.name).unlink(missing_ok=True)
+    return str(output_path)
+
+
+class FFmpegWriter:
+    """cv2.VideoWriter-style writer that streams raw frames to an ffmpeg subprocess"""
+
+    def __init__(self, output_path, width, height, fps, audio_path=None,
+                 profile='prores_4444', video_filter=None, pix_fmt=None):
+        """
+        Start the ffmpeg encoder process
+
+        Args:
+            output_path: Final output video path
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frames per second
+            audio_path: Optional audio file muxed in the same pass
+            profile: Key into CODEC_PROFILES
+            video_filter: Optional ffmpeg -vf filter chain
+            pix_fmt: Raw input pixel format ('bgr24' or 'bgra').
+                     Defaults to 'bgra' for alpha profiles, 'bgr24' otherwise.
+        """
+        if pix_fmt is None:
+            pix_fmt = 'bgra' if profile in ALPHA_PROFILES else 'bgr24'
+
+        self.output_path = str(output_path)
+        self.profile = profile
+        self.has_alpha = pix_fmt == 'bgra'
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.channels = 4 if self.has_alpha else 3
+        self.frames_written = 0
+
+        cmd = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo',
+            '-pix_fmt', pix_fmt,
+            '-s', f'{width}x{height}',
+            '-r', str(fps),
+            '-i', '-',
+        ]
+        if audio_path is not None:
+            cmd += ['-i', str(audio_path)]
+
+        cmd += ['-map', '0:v']
+        if audio_path is not None:
+            cmd += ['-map', '1:a']
+
+        if video_filter:
+            cmd += ['-vf', video_filter]
+
+        cmd += CODEC_PROFILES[profile]
+
+        if audio_path is not None:
+            cmd += ['-c:a', AUDIO_CODECS.get(profile, 'aac'), '-shortest']
+
+        cmd.append(self.output_path)
+        self.command = cmd
+
+        # stderr goes to a temp file so a chatty ffmpeg can never block the pipe
+        self._stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=self._stderr
+        )
+
+    def isOpened(self):
+        """True while the encoder process is accepting frames"""
+        return self.process is not None and self.process.poll() is None
+
+    def write(self, frame):
+        """Send one frame to the encoder"""
+        if frame.shape != (self.height, self.width, self.channels):
+            raise ValueError(
+                f"Frame shape {frame.shape} does not match writer "
+                f"({self.height}, {self.width}, {self.channels})"
+            )
+        try:
+            self.process.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+        except BrokenPipeError:
+            raise RuntimeError(f"ffmpeg exited early: {self._read_stderr()}")
+        self.frames_written += 1
+
+    def release(self):
+        """Flush the pipe and wait for ffmpeg to finish the file"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self.process.wait()
+        self.process = None
+        try:
+            if returncode != 0:
+                raise RuntimeError(f"ffmpeg failed ({returncode}): {self._read_stderr()}")
+        finally:
+            self._stderr.close()
+
+    def abort(self):
+        """Kill the encoder and remove the partial output"""
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+            self.process = None
+        self._stderr.close()
+        Path(self.output_path).unlink(missing_ok=True)
+
+    def _read_stderr(self):
+        self._stderr.seek(0)
+        return self._stderr.read().decode(errors='replace').strip()
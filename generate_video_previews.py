@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 import time
 
+from batch_render import RenderJob, render_batch, print_summary
+
 # Configuration
 AUDIO_FILE = 'turkish-national-anthem.wav'  # Relative path for deployment
 PREVIEWS_DIR = 'catalog/video_previews'  # Relative path for deployment
@@ -17,15 +19,19 @@ PREVIEWS_DIR = 'catalog/video_previews'  # Relative path for deployment
 SCRIPTS = {
     'audio_spectrum': {
         'script': 'audio_spectrum.py',
-        'modes': list(range(1, 11))
+        'modes': list(range(1, 11)),
+        # Its CLI resolves .mov outputs to the hd preset and ignored --width/--height
+        'size': (1920, 1080)
     },
     'audio_spectrum_lines': {
         'script': 'audio_spectrum_lines.py',
-        'modes': list(range(1, 11))
+        'modes': list(range(1, 11)),
+        'size': (480, 480)
     },
     'audio_spectrum_creative': {
         'script': 'audio_spectrum_creative.py',
-        'modes': list(range(1, 101))  # NOW 100 MODES!
+        'modes': list(range(1, 101)),  # NOW 100 MODES!
+        'size': (480, 480)
     }
 }
 
@@ -51,39 +57,6 @@ def create_preview_audio():
     return str(temp_audio)
 
 
-def generate_preview_video(script_name, mode_num, preview_audio, output_dir):
-    """Generate a 4-second preview video with small file size (480x480)"""
-    output_video = output_dir / f"{Path(script_name).stem}_mode_{mode_num:03d}.mov"
-
-    # Skip if already exists
-    if output_video.exists():
-        print(f"  ⚠ Preview already exists, skipping: {output_video.name}")
-        return str(output_video)
-
-    # Use smaller dimensions (480x480) for much smaller file sizes
-    cmd = [
-        'python',
-        script_name,
-        preview_audio,
-        str(output_video),
-        '--mode', str(mode_num),
-        '--width', '480',
-        '--height', '480'
-    ]
-
-    print(f"  Generating preview: {output_video.name}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode == 0 and output_video.exists():
-        print(f"  ✓ Generated: {output_video.name}")
-        return str(output_video)
-    else:
-        print(f"  ✗ Failed to generate: {output_video.name}")
-        if result.stderr:
-            print(f"    Error: {result.stderr[:200]}")
-        return None
-
-
 def main():
     print("=" * 80)
     print("AUDIO SPECTRUM VIDEO PREVIEW GENERATOR")
@@ -113,32 +86,37 @@ def main():
     print(f"Total modes to process: {total_modes}")
     print()
 
-    current = 0
-    generated = 0
+    jobs = []
     skipped = 0
-
-    # Process each script
     for script_key, script_info in SCRIPTS.items():
-        script_name = script_info['script']
-        modes = script_info['modes']
-
-        print(f"\n{'='*80}")
-        print(f"Processing: {script_name} ({len(modes)} modes)")
-        print(f"{'='*80}\n")
-
-        for mode_num in modes:
-            current += 1
-            print(f"[{current}/{total_modes}] Mode {mode_num}")
+        for mode_num in script_info['modes']:
+            output_video = previews_dir / f"{Path(script_info['script']).stem}_mode_{mode_num:03d}.mov"
+            # Skip if already exists
+            if output_video.exists():
+                print(f"  ⚠ Preview already exists, skipping: {output_video.name}")
+                skipped += 1
+                continue
+            # Use smaller dimensions (480x480) for much smaller file sizes
+            width, height = script_info['size']
+            jobs.append(RenderJob(script_key, mode_num, output_video, {'width': width, 'height': height}))
 
-            result = generate_preview_video(script_name, mode_num, preview_audio, previews_dir)
-
-            if result:
-                if "already exists" not in result:
-                    generated += 1
-                else:
-                    skipped += 1
+    current = 0
 
-            time.sleep(0.2)  # Small delay
+    def report(result):
+        nonlocal current
+        current += 1
+        name = Path(result.job.output_path).name
+        if result.ok:
+            print(f"[{current}/{len(jobs)}] ✓ Generated: {name}")
+        else:
+            print(f"[{current}/{len(jobs)}] ✗ Failed to generate: {name}")
+            print(f"    Error: {result.error[:200]}")
+
+    # All modes of all scripts render in one process pool over the shared analysis
+    start = time.perf_counter()
+    results = render_batch(preview_audio, jobs, on_result=report)
+    print_summary(results, time.perf_counter() - start)
+    generated = sum(1 for r in results if r.ok)
 
     print("\n" + "=" * 80)
     print("VIDEO PREVIEW GENERATION COMPLETE!")
@@ -1,89 +1,189 @@
 """
 Mode Registry and Auto-Loader for Audio Spectrum Visualizations
-Automatically discovers and loads all visualization modes
+Discovers visualization modes without importing them
+
+A manifest mapping mode number -> (module, class, method) is built by parsing the
+mode_*.py files and cached in __pycache__, refreshed per file when its mtime or
+size changes. A render imports only the one module its mode lives in.
 """
 from pathlib import Path
+import ast
 import importlib
-import inspect
-
-
-# Mode registry - maps mode number to (class_instance, method_name)
-_mode_registry = {}
-_mode_classes = {}
+import json
+
+
+MANIFEST_VERSION = 1
+
+_modes_dir = Path(__file__).parent
+_manifest_path = _modes_dir / '__pycache__' / 'mode_manifest.json'
+
+# Mode manifest - maps mode number to (module_name, class_name, method_name)
+_manifest = None
+# Visualizer get_mode_method() binds to when none is given (the last registered one)
+_visualizer = None
+
+
+def _scan_mode_file(mode_file):
+    """Find Modes* classes and their draw_mode_N_* methods by parsing the source"""
+    tree = ast.parse(mode_file.read_text(), filename=str(mode_file))
+    classes = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name.startswith('Modes'):
+            classes[node.name] = sorted(
+                item.name for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and item.name.startswith('draw_mode_')
+            )
+    return classes
+
+
+def _load_manifest():
+    """Build the mode manifest, reusing cached scans of unchanged files"""
+    try:
+        cached = json.loads(_manifest_path.read_text())
+        if cached.get('version') != MANIFEST_VERSION:
+            cached = {}
+    except (OSError, ValueError):
+        cached = {}
+    cached_files = cached.get('files', {})
+
+    files = {}
+    changed = False
+    for mode_file in sorted(_modes_dir.glob("mode_*.py")):
+        stat = mode_file.stat()
+        entry = cached_files.get(mode_file.name)
+        if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            try:
+                classes = _scan_mode_file(mode_file)
+            except (OSError, SyntaxError) as e:
+                print(f"Warning: Could not load {mode_file.name}: {e}")
+                continue
+            entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'classes': classes}
+            changed = True
+        files[mode_file.name] = entry
+
+    if changed or set(files) != set(cached_files):
+        try:
+            _manifest_path.parent.mkdir(exist_ok=True)
+            tmp_path = _manifest_path.with_suffix(f'.{id(files)}.tmp')
+            tmp_path.write_text(json.dumps({'version': MANIFEST_VERSION, 'files': files}))
+            tmp_path.replace(_manifest_path)
+        except OSError:
+            pass
+
+    # Same precedence as importing everything: files, then classes, then methods
+    # in sorted order, later definitions of a mode number win
+    manifest = {}
+    for file_name, entry in files.items():
+        module_name = f"modes.{Path(file_name).stem}"
+        for class_name in sorted(entry['classes']):
+            for method_name in entry['classes'][class_name]:
+                parts = method_name.split('_')
+                if len(parts) >= 3 and parts[2].isdigit():
+                    manifest[int(parts[2])] = (module_name, class_name, method_name)
+    return manifest
+
+
+def get_manifest():
+    """Mode number -> (module_name, class_name, method_name), built once per process"""
+    global _manifest
+    if _manifest is None:
+        _manifest = _load_manifest()
+    return _manifest
 
 
 def register_modes(visualizer):
     """
-    Discover and register all mode classes
+    Register the visualizer that mode classes are bound to
+
+    Mode modules are imported lazily by get_mode_method(). The visualizer keeps
+    its own mode instances (visualizer.mode_instances), so several visualizers
+    can live in one process.
 
     Args:
         visualizer: The CreativeSpectrumVisualizer instance
 
     Returns:
-        dict: Registry mapping mode numbers to their draw methods
+        dict: Manifest mapping mode numbers to (module, class, method)
     """
-    global _mode_registry, _mode_classes
-
-    # Get all mode files in this directory
-    modes_dir = Path(__file__).parent
-    mode_files = sorted(modes_dir.glob("mode_*.py"))
-
-    for mode_file in mode_files:
-        # Import the module
-        module_name = f"modes.{mode_file.stem}"
-        try:
-            module = importlib.import_module(module_name)
-
-            # Find all mode classes in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if name.startswith('Modes') and name != 'BaseModeVisualizer':
-                    # Instantiate the mode class
-                    mode_instance = obj(visualizer)
-                    _mode_classes[name] = mode_instance
+    global _visualizer
+    _visualizer = visualizer
+    visualizer.mode_instances = {}
+    return get_manifest()
 
-                    # Register all draw_mode_XXX methods
-                    for method_name in dir(mode_instance):
-                        if method_name.startswith('draw_mode_'):
-                            # Extract mode number from method name
-                            parts = method_name.split('_')
-                            if len(parts) >= 3 and parts[2].isdigit():
-                                mode_num = int(parts[2])
-                                method = getattr(mode_instance, method_name)
-                                _mode_registry[mode_num] = method
 
-        except Exception as e:
-            print(f"Warning: Could not load {mode_file.name}: {e}")
+def get_mode_instance(mode_number, visualizer=None):
+    """
+    Get the mode object drawing a mode number, created on first use
 
-    return _mode_registry
+    Every mode number gets its own instance of its class and so its own state
+    (modes.base.ModeState), while sharing the visualizer's render context.
 
+    Args:
+        mode_number: The mode number to retrieve
+        visualizer: Visualizer the mode draws for (default: the last registered one)
 
-def get_mode_method(mode_number):
+    Returns:
+        BaseModeVisualizer instance, or None if not found
+    """
+    if visualizer is None:
+        visualizer = _visualizer
+    if visualizer is None:
+        return None
+    instances = visualizer.mode_instances
+    instance = instances.get(mode_number)
+    if instance is not None:
+        return instance
+
+    location = get_manifest().get(mode_number)
+    if location is None:
+        return None
+    module_name, class_name, method_name = location
+
+    try:
+        module = importlib.import_module(module_name)
+        instance = getattr(module, class_name)(visualizer)
+    except Exception as e:
+        print(f"Warning: Could not load {module_name}: {e}")
+        return None
+
+    instances[mode_number] = instance
+    return instance
+
+
+def get_mode_method(mode_number, visualizer=None):
     """
     Get the draw method for a specific mode number
 
     Args:
         mode_number: The mode number to retrieve
+        visualizer: Visualizer the mode draws for (default: the last registered one)
 
     Returns:
         The draw method for that mode, or None if not found
     """
-    return _mode_registry.get(mode_number)
+    instance = get_mode_instance(mode_number, visualizer)
+    if instance is None:
+        return None
+    return getattr(instance, get_manifest()[mode_number][2])
 
 
 def get_all_modes():
     """Get all registered mode numbers"""
-    return sorted(_mode_registry.keys())
+    return sorted(get_manifest())
 
 
 def get_mode_count():
     """Get total number of registered modes"""
-    return len(_mode_registry)
+    return len(get_manifest())
 
 
 # Export public API
 __all__ = [
     'register_modes',
     'get_mode_method',
+    'get_mode_instance',
     'get_all_modes',
     'get_mode_count',
+    'get_manifest',
 ]
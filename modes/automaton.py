@@ -0,0 +1,120 @@
+"""
+Cellular Automaton Engine
+Vectorized Life-like automata on toroidal grids
+
+A generation is one neighbor count (sum of the eight wrapped shifts of the grid)
+followed by a rule-table lookup, table[alive, neighbors], so any Life-like rule
+("B3/S23", "B36/S23", ...) runs at the same cost:
+
+    rule = parse_rule('B3/S23')
+    grid = step(grid, rule)
+    paint_cells(frame, grid, cell_width, cell_height, (100, 255, 100))
+"""
+import numpy as np
+import cv2
+
+
+def life_rule(birth=(3,), survive=(2, 3)):
+    """
+    Build a rule table for a Life-like automaton
+
+    Args:
+        birth: Neighbor counts that bring a dead cell to life
+        survive: Neighbor counts that keep a live cell alive
+
+    Returns:
+        (2, 9) bool array: table[alive, neighbors] -> alive in the next generation
+    """
+    table = np.zeros((2, 9), dtype=bool)
+    table[0, [n for n in birth if 0 <= n <= 8]] = True
+    table[1, [n for n in survive if 0 <= n <= 8]] = True
+    return table
+
+
+def parse_rule(rule):
+    """Rule table from B/S notation, e.g. 'B3/S23' for Conway's Game of Life"""
+    birth, survive = (), ()
+    for part in rule.upper().split('/'):
+        digits = tuple(int(c) for c in part[1:])
+        if part.startswith('B'):
+            birth = digits
+        elif part.startswith('S'):
+            survive = digits
+        else:
+            raise ValueError(f"Invalid rule {rule!r}: expected B<digits>/S<digits>")
+    return life_rule(birth, survive)
+
+
+CONWAY = parse_rule('B3/S23')
+
+
+def neighbor_counts(grid):
+    """Number of live cells among the eight wrapped neighbors of every cell"""
+    alive = np.asarray(grid) != 0
+    padded = np.pad(alive.astype(np.uint8), 1, mode='wrap')
+    h, w = alive.shape
+    counts = np.zeros((h, w), dtype=np.uint8)
+    for dy in range(3):
+        for dx in range(3):
+            if dy != 1 or dx != 1:
+                counts += padded[dy:dy + h, dx:dx + w]
+    return counts
+
+
+def step(grid, rule=CONWAY, counts=None):
+    """
+    Advance the grid one generation
+
+    Args:
+        grid: 2D array, nonzero = alive
+        rule: (2, 9) table from life_rule / parse_rule
+        counts: Precomputed neighbor_counts(grid), if the caller needs them too
+
+    Returns:
+        New grid with the same dtype (1 = alive, 0 = dead)
+    """
+    grid = np.asarray(grid)
+    if counts is None:
+        counts = neighbor_counts(grid)
+    return rule[(grid != 0).astype(np.intp), counts].astype(grid.dtype)
+
+
+def cell_mask(grid, cell_width, cell_height, grow=0):
+    """
+    Upscale a grid to a pixel mask (cell (x, y) covers x * cell_width ... )
+
+    Args:
+        grid: 2D array, nonzero = alive
+        cell_width, cell_height: Cell size in pixels
+        grow: Extend every cell this many pixels right and down (a cell drawn with
+            cv2.rectangle up to the next cell's corner is one pixel larger)
+
+    Returns:
+        uint8 mask (1 = live cell) of shape
+        (rows * cell_height + grow, cols * cell_width + grow)
+    """
+    rows, cols = np.shape(grid)
+    cells = (np.asarray(grid) != 0).astype(np.uint8)
+    mask = cv2.resize(cells, (cols * cell_width, rows * cell_height),
+                      interpolation=cv2.INTER_NEAREST)
+    if grow:
+        grown = np.zeros((mask.shape[0] + grow, mask.shape[1] + grow), dtype=np.uint8)
+        for shift in range(grow + 1):
+            grown[:mask.shape[0], shift:shift + mask.shape[1]] |= mask
+        rows_only = grown.copy()
+        for shift in range(1, grow + 1):
+            grown[shift:, :] |= rows_only[:-shift, :]
+        mask = grown
+    return mask
+
+
+def paint_cells(frame, grid, cell_width, cell_height, color, grow=0):
+    """Fill the live cells of a grid on the frame with one color (clipped to the frame)"""
+    mask = cell_mask(grid, cell_width, cell_height, grow)
+    h = min(mask.shape[0], frame.shape[0])
+    w = min(mask.shape[1], frame.shape[1])
+    # Solid color layer (saturated like the cv2 drawing calls), copied through the mask
+    color = np.clip(np.asarray(color), 0, 255).astype(np.uint8)
+    layer = np.frombuffer(color.tobytes() * (h * w), dtype=np.uint8).reshape(h, w, 3)
+    cv2.copyTo(layer, mask[:h, :w], frame[:h, :w])
+    return frame
@@ -2,9 +2,30 @@
 Base class for audio spectrum visualization modes
 Provides shared functionality and state management
 """
+import copy
+from types import SimpleNamespace
+
 import numpy as np
 import cv2
 
+import color_lut
+
+
+class ModeState(SimpleNamespace):
+    """
+    State one mode keeps between frames (particles, histories, phases)
+
+    Each mode instance owns one, so modes never see each other's state; the render
+    context (size, center, fps, features) stays on the shared visualizer.
+    """
+
+    def reset(self):
+        """Drop all state; the next frame starts from the defaults again"""
+        self.__dict__.clear()
+
+
+_MISSING = object()
+
 
 class BaseModeVisualizer:
     """Base class for all visualization modes"""
@@ -17,40 +38,342 @@ class BaseModeVisualizer:
             visualizer: Reference to CreativeSpectrumVisualizer instance
         """
         object.__setattr__(self, 'viz', visualizer)
+        object.__setattr__(self, 'state', ModeState())
+        # name -> initial value of well-known state attributes (copied on first use)
+        object.__setattr__(self, 'state_defaults', getattr(visualizer, 'mode_state_defaults', {}))
 
     def __getattr__(self, name):
-        """Proxy attribute access to the visualizer"""
+        """
+        Mode state first, created from its default on first use, then the
+        visualizer's render context and helpers
+        """
+        state = self.state.__dict__
+        value = state.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        default = self.state_defaults.get(name, _MISSING)
+        if default is not _MISSING:
+            value = state[name] = copy.deepcopy(default)
+            return value
         try:
             return getattr(self.viz, name)
         except AttributeError:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __setattr__(self, name, value):
-        """Proxy attribute setting to the visualizer"""
-        if name == 'viz':
-            object.__setattr__(self, name, value)
-        else:
-            setattr(self.viz, name, value)
+        """Attribute writes are mode state; the shared visualizer is never modified"""
+        self.state.__dict__[name] = value
+
+    def reset_state(self):
+        """Reset hook: forget this mode's state (override to seed a fresh start)"""
+        self.state.reset()
+
+    @property
+    def rng(self):
+        """
+        numpy Generator for this frame's random numbers
+
+        Seeded from the audio, mode, user seed and frame number (see render_random),
+        so every frame is reproducible; use it instead of np.random / random.
+        """
+        return self.viz.rng
 
     # Helper methods for common operations
+    # When called with the current frame's bars these are lookups into the
+    # feature track computed once per song (viz.features); otherwise they reduce.
+    def _frame_features(self, magnitudes):
+        features = self.viz.__dict__.get('features')
+        if features is not None and magnitudes is features.magnitudes:
+            return features
+        return None
+
     def get_bass(self, magnitudes):
         """Get bass frequencies (lower 25%)"""
+        features = self._frame_features(magnitudes)
+        if features is not None:
+            return features.bass
         return float(np.mean(magnitudes[:len(magnitudes)//4]))
 
     def get_mids(self, magnitudes):
         """Get mid frequencies (25-75%)"""
+        features = self._frame_features(magnitudes)
+        if features is not None:
+            return features.mids
         return float(np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4]))
 
     def get_highs(self, magnitudes):
         """Get high frequencies (upper 25%)"""
+        features = self._frame_features(magnitudes)
+        if features is not None:
+            return features.highs
         return float(np.mean(magnitudes[3*len(magnitudes)//4:]))
 
     def get_energy(self, magnitudes):
         """Get overall energy level"""
+        features = self._frame_features(magnitudes)
+        if features is not None:
+            return features.energy
         return float(np.mean(magnitudes))
 
     def hsv_to_bgr(self, h, s, v):
         """Convert HSV color to BGR tuple"""
-        color_hsv = np.array([[[h, s, v]]], dtype=np.uint8)
-        color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-        return tuple(int(c) for c in color_bgr)
+        return color_lut.hsv_to_bgr(h, s, v)
+
+    def cached_layer(self, name, key, render):
+        """
+        Static layer drawn by render(canvas), rasterized again only when key changes
+
+        Call .composite(frame) on the result where the content belongs in the
+        drawing order (see modes.layers).
+
+        Args:
+            name: Layer name, unique per visualizer
+            key: Hashable parameters the content depends on (frame size is implied)
+            render: Function drawing the content onto the canvas it gets
+        """
+        return self.viz.layer_cache.get(name, key, (self.height, self.width, 3), render)
+
+
+_disc_cache = {}
+
+
+def _disc_offsets(radius):
+    """(dy, dx) offsets of the pixels a filled LINE_8 cv2.circle of this radius covers"""
+    offsets = _disc_cache.get(radius)
+    if offsets is None:
+        size = 2 * radius + 3
+        stamp = np.zeros((size, size), dtype=np.uint8)
+        cv2.circle(stamp, (radius + 1, radius + 1), radius, 1, -1, lineType=cv2.LINE_8)
+        dy, dx = np.nonzero(stamp)
+        offsets = _disc_cache[radius] = (dy - radius - 1, dx - radius - 1)
+    return offsets
+
+
+def draw_circles(frame, x, y, radius, color, thickness=-1, line_type=cv2.LINE_AA):
+    """
+    Draw many circles in one call (in array order, so later circles paint over earlier ones)
+
+    Filled LINE_8 circles of one radius on a BGR uint8 frame are stamped with a single
+    scatter; everything else (antialiased edges blend with the pixels underneath, so
+    overlaps depend on drawing order) is one cv2.circle call per circle.
+
+    Args:
+        frame: Frame to draw on
+        x, y: Center coordinates (truncated to int)
+        radius: Radius per circle or one radius for all
+        color: (N, 3) colors or one BGR color for all
+        thickness: Thickness per circle or one for all (-1 = filled)
+    """
+    x = np.asarray(x).astype(np.int64)
+    n = len(x)
+    if n == 0:
+        return frame
+    y = np.asarray(y).astype(np.int64)
+    radius = np.broadcast_to(np.asarray(radius).astype(np.int64), (n,))
+    color = np.broadcast_to(np.asarray(color).astype(np.int64), (n, 3))
+    thickness = np.broadcast_to(np.asarray(thickness).astype(np.int64), (n,))
+
+    if (line_type == cv2.LINE_8 and frame.dtype == np.uint8 and frame.ndim == 3 and frame.shape[2] == 3
+            and radius[0] >= 0 and (radius == radius[0]).all() and (thickness < 0).all()):
+        dy, dx = _disc_offsets(int(radius[0]))
+        py = (y[:, None] + dy).ravel()
+        px = (x[:, None] + dx).ravel()
+        owner = np.repeat(np.arange(n), len(dy))
+        inside = (py >= 0) & (py < frame.shape[0]) & (px >= 0) & (px < frame.shape[1])
+        pixels = (py * frame.shape[1] + px)[inside]
+        # Where circles overlap the last one wins, as with sequential drawing
+        pixels, last = np.unique(pixels[::-1], return_index=True)
+        owner = owner[inside][::-1][last]
+        frame[pixels // frame.shape[1], pixels % frame.shape[1]] = np.clip(color[owner], 0, 255)
+        return frame
+
+    for cx, cy, r, c, t in zip(x.tolist(), y.tolist(), radius.tolist(), color.tolist(), thickness.tolist()):
+        cv2.circle(frame, (cx, cy), r, c, t, lineType=line_type)
+    return frame
+
+
+class ParticleSystem:
+    """
+    Struct-of-arrays particle pool shared by particle-based modes
+
+    Every attribute (x, y, vx, vy, life, size, plus any extra fields) is one
+    preallocated float64 array and color is an (N, 3) int array; the live particles
+    are the first `count` rows. Reading `particles.x` gives a view of the live rows
+    and assigning to it writes them, so updates are whole-array expressions:
+
+        particles.spawn(x=xs, y=ys, vx=vxs, vy=vys, color=colors)
+        particles.integrate()
+        particles.apply_force(ay=0.05)
+        particles.age(0.01)
+        particles.cull()
+        particles.draw(frame)
+
+    Killing compacts the live rows in place and keeps their order, so drawing
+    order matches the spawn order like the old lists of dicts.
+    """
+
+    FIELDS = ('x', 'y', 'vx', 'vy', 'life', 'size')
+
+    def __init__(self, capacity=1024, extra_fields=()):
+        """
+        Args:
+            capacity: Initial number of preallocated slots (doubles when full)
+            extra_fields: Names of additional per-particle float fields
+        """
+        fields = self.FIELDS + tuple(extra_fields)
+        object.__setattr__(self, '_data', {name: np.zeros(capacity) for name in fields})
+        self._color = np.zeros((capacity, 3), dtype=np.int64)
+        self.fields = fields
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self._color)
+
+    @property
+    def color(self):
+        """(count, 3) BGR colors of the live particles"""
+        return self._color[:self.count]
+
+    def __getattr__(self, name):
+        """Live rows of a particle field"""
+        data = self.__dict__.get('_data')
+        if data is not None and name in data:
+            return data[name][:self.count]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        """Assigning a particle field (or color) writes its live rows"""
+        if name in self._data:
+            self._data[name][:self.count] = value
+        elif name == 'color':
+            self._color[:self.count] = value
+        else:
+            object.__setattr__(self, name, value)
+
+    def _reserve(self, total):
+        """Grow every array to hold at least total particles"""
+        if total <= self.capacity:
+            return
+        capacity = max(total, 2 * self.capacity)
+        for name, values in self._data.items():
+            grown = np.zeros(capacity)
+            grown[:self.count] = values[:self.count]
+            self._data[name] = grown
+        color = np.zeros((capacity, 3), dtype=np.int64)
+        color[:self.count] = self._color[:self.count]
+        self._color = color
+
+    def spawn(self, n=None, color=(255, 255, 255), **values):
+        """
+        Append particles; field values are scalars or arrays broadcast to n
+
+        Unset fields default to 0, except life which defaults to 1.
+
+        Returns:
+            slice of the new particles' rows
+        """
+        if n is None:
+            sizes = [np.size(v) for v in values.values()]
+            if np.ndim(color) == 2:
+                sizes.append(len(color))
+            n = max(sizes, default=1)
+        if n == 0:
+            return slice(self.count, self.count)
+        start = self.count
+        self._reserve(start + n)
+        new = slice(start, start + n)
+        for name, data in self._data.items():
+            data[new] = values.pop(name, 1.0 if name == 'life' else 0.0)
+        if values:
+            raise TypeError(f"Unknown particle fields: {', '.join(values)}")
+        self._color[new] = color
+        self.count = start + n
+        return new
+
+    def integrate(self, dt=1.0):
+        """Move every particle by its velocity"""
+        n = self.count
+        self._data['x'][:n] += self._data['vx'][:n] * dt
+        self._data['y'][:n] += self._data['vy'][:n] * dt
+
+    def apply_force(self, ax=0.0, ay=0.0):
+        """Accelerate every particle (scalars or per-particle arrays)"""
+        n = self.count
+        self._data['vx'][:n] += ax
+        self._data['vy'][:n] += ay
+
+    def age(self, rate):
+        """Reduce life by rate"""
+        self._data['life'][:self.count] -= rate
+
+    def bounce(self, x_min, y_min, x_max, y_max, restitution=1.0):
+        """Reflect particles off a box, clamping them inside it"""
+        n = self.count
+        for pos, vel, low, high in (('x', 'vx', x_min, x_max), ('y', 'vy', y_min, y_max)):
+            p, v = self._data[pos][:n], self._data[vel][:n]
+            hit = (p < low) | (p > high)
+            v[hit] *= -restitution
+            np.clip(p, low, high, out=p)
+
+    def kill(self, mask):
+        """Remove particles where mask is True (live order is preserved)"""
+        keep = ~np.asarray(mask, dtype=bool)
+        alive = int(keep.sum())
+        if alive == self.count:
+            return
+        n = self.count
+        for data in self._data.values():
+            data[:alive] = data[:n][keep]
+        self._color[:alive] = self._color[:n][keep]
+        self.count = alive
+
+    def cull(self, bounds=None, margin=0.0):
+        """
+        Kill particles with life <= 0, and optionally those outside bounds
+
+        Args:
+            bounds: (x_min, y_min, x_max, y_max) box, or None to keep off-screen particles
+            margin: Extra distance outside the box before a particle is killed
+        """
+        dead = self.life <= 0
+        if bounds is not None:
+            x_min, y_min, x_max, y_max = bounds
+            x, y = self.x, self.y
+            dead |= (x < x_min - margin) | (x > x_max + margin) | (y < y_min - margin) | (y > y_max + margin)
+        self.kill(dead)
+
+    def clear(self):
+        """Remove all particles (capacity is kept)"""
+        self.count = 0
+
+    def draw(self, frame, radius=None, color=None, thickness=-1, line_type=cv2.LINE_AA):
+        """Draw every particle as a circle (radius defaults to size, color to the particle color)"""
+        return draw_circles(frame, self.x, self.y,
+                            self.size if radius is None else radius,
+                            self.color if color is None else color,
+                            thickness, line_type)
+
+    def splat(self, frame, color=None, additive=False):
+        """
+        Draw every particle as a single pixel in one vectorized pass
+
+        Meant for very large counts where per-particle circles are too slow.
+        With additive=True overlapping particles add up (saturating at 255).
+        """
+        x = self.x.astype(np.int64)
+        y = self.y.astype(np.int64)
+        on = (x >= 0) & (x < frame.shape[1]) & (y >= 0) & (y < frame.shape[0])
+        color = self.color if color is None else np.broadcast_to(color, (self.count, 3))
+        x, y, color = x[on], y[on], np.asarray(color)[on]
+        if additive:
+            acc = frame.astype(np.int32)
+            np.add.at(acc, (y, x), color)
+            np.clip(acc, 0, 255, out=acc)
+            frame[:] = acc
+        else:
+            frame[y, x] = color
+        return frame
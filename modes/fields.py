@@ -0,0 +1,117 @@
+"""
+Procedural Field Evaluation
+Whole-frame math fields for shader-style modes
+
+Shader-style modes evaluate an expression at sample points every `step` pixels.
+Instead of looping over the points in Python, a mode asks for the sample grid
+(built once per resolution and step), evaluates its expression on the whole grid
+with NumPy, turns the values into colors (e.g. through color_lut) and paints the
+result back at frame resolution:
+
+    x, y = sample_grid(width, height, step=4)
+    values = np.sin(x * 0.01 + t) + np.cos(y * 0.01 - t)
+    paint_blocks(frame, colors_from(values), step=4)
+
+Lower internal resolutions are just larger steps.
+"""
+import numpy as np
+import cv2
+
+
+# (width, height, step) -> read-only (x, y) sample coordinates
+_grid_cache = {}
+# (step, radius) -> dot stamp
+_stamp_cache = {}
+
+
+def sample_grid(width, height, step=1):
+    """
+    Pixel coordinates of the sample points 0, step, 2 * step, ... of a frame
+
+    Args:
+        width, height: Frame size
+        step: Distance between sample points in pixels
+
+    Returns:
+        (x, y): int64 arrays of shape (1, nx) and (ny, 1) that broadcast to the
+        (ny, nx) sample grid. They are cached and read-only.
+    """
+    key = (width, height, step)
+    grid = _grid_cache.get(key)
+    if grid is None:
+        x = np.arange(0, width, step, dtype=np.int64)[None, :]
+        y = np.arange(0, height, step, dtype=np.int64)[:, None]
+        x.setflags(write=False)
+        y.setflags(write=False)
+        grid = _grid_cache[key] = (x, y)
+    return grid
+
+
+def _as_image(colors):
+    """Clip field colors to uint8 (like the cv2 drawing calls saturate)"""
+    colors = np.asarray(colors)
+    if colors.dtype != np.uint8:
+        colors = np.clip(colors, 0, 255).astype(np.uint8)
+    return colors
+
+
+def upscale(colors, step):
+    """Repeat every sample into a step x step block (nearest-neighbor upscale)"""
+    colors = _as_image(colors)
+    ny, nx = colors.shape[:2]
+    return cv2.resize(colors, (nx * step, ny * step), interpolation=cv2.INTER_NEAREST)
+
+
+def paint_blocks(frame, colors, step):
+    """
+    Fill the block right/below every sample point with its color
+
+    Args:
+        frame: Frame to draw on
+        colors: (ny, nx, 3) or (ny, nx) colors of the sample_grid points
+        step: Sample spacing the colors were evaluated at
+    """
+    blocks = upscale(colors, step)
+    h, w = frame.shape[:2]
+    if blocks.ndim == 2:
+        blocks = blocks[:, :, None]
+    frame[:h, :w] = blocks[:h, :w]
+    return frame
+
+
+def _dot_stamp(step, radius):
+    """One step x step tile holding a filled cv2.circle centered at step // 2"""
+    key = (step, radius)
+    stamp = _stamp_cache.get(key)
+    if stamp is None:
+        stamp = np.zeros((step, step), dtype=np.uint8)
+        cv2.circle(stamp, (step // 2, step // 2), radius, 1, -1)
+        _stamp_cache[key] = stamp
+    return stamp
+
+
+def paint_dots(frame, colors, step, radius):
+    """
+    Draw a filled circle at every sample point, colored by the field
+
+    Same pixels as cv2.circle(frame, (x, y), radius, color, -1) per point, as
+    long as the dots do not overlap (2 * radius < step).
+
+    Args:
+        frame: Frame to draw on
+        colors: (ny, nx, 3) colors of the sample_grid points
+        step: Sample spacing the colors were evaluated at
+        radius: Dot radius in pixels
+    """
+    if 2 * radius >= step:
+        raise ValueError(f"Dots of radius {radius} overlap at step {step}")
+    blocks = upscale(colors, step)
+    ny, nx = np.shape(colors)[:2]
+    mask = np.tile(_dot_stamp(step, radius), (ny, nx))
+
+    # Block (i, j) is centered on its sample point, so it starts half a step earlier
+    half = step // 2
+    h = min(frame.shape[0], ny * step - half)
+    w = min(frame.shape[1], nx * step - half)
+    cv2.copyTo(blocks[half:half + h, half:half + w], mask[half:half + h, half:half + w], frame[:h, :w])
+    return frame
@@ -0,0 +1,140 @@
+"""
+Flocking Engine
+Vectorized boids (cohesion / separation / alignment) for swarm modes
+
+Neighbors come from a uniform grid (spatial hash) with cells one neighbor radius
+wide, so each boid only checks the 3 x 3 cells around it instead of every other
+boid. All rules are evaluated for the whole flock as array operations on a
+ParticleSystem's x, y, vx, vy fields:
+
+    boids = ParticleSystem()
+    boids.spawn(x=xs, y=ys, vx=vxs, vy=vys)
+    flock_step(boids, cohesion=0.01, separation=0.5, alignment=0.05,
+               max_speed=5, width=w, height=h)
+"""
+import numpy as np
+
+
+# (dx, dy) offsets of the 3 x 3 block of grid cells around a boid's cell
+_CELL_OFFSETS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+
+
+def neighbor_pairs(x, y, radius):
+    """
+    Find all ordered pairs of points closer than radius
+
+    Args:
+        x, y: Point coordinates
+        radius: Neighbor distance
+
+    Returns:
+        (i, j, dx, dy, dist) arrays, one entry per pair with i != j, where
+        dx, dy = p[j] - p[i] and dist is their Euclidean distance
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    empty = np.zeros(0, dtype=np.int64)
+    if n < 2:
+        return empty, empty, np.zeros(0), np.zeros(0), np.zeros(0)
+
+    # Cell keys with a one-cell border so every neighboring key is valid
+    cx = np.floor(x / radius).astype(np.int64)
+    cy = np.floor(y / radius).astype(np.int64)
+    cx -= cx.min() - 1
+    cy -= cy.min() - 1
+    columns = int(cx.max()) + 2
+    keys = cy * columns + cx
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    rows, cols = [], []
+    for ox, oy in _CELL_OFFSETS:
+        neighbor_keys = keys + (oy * columns + ox)
+        start = np.searchsorted(sorted_keys, neighbor_keys, side='left')
+        counts = np.searchsorted(sorted_keys, neighbor_keys, side='right') - start
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        # Expand each boid's [start, start + count) range of the sorted order
+        firsts = np.cumsum(counts) - counts
+        within = np.arange(total) - np.repeat(firsts, counts)
+        rows.append(np.repeat(np.arange(n), counts))
+        cols.append(order[np.repeat(start, counts) + within])
+
+    i = np.concatenate(rows)
+    j = np.concatenate(cols)
+    dx = x[j] - x[i]
+    dy = y[j] - y[i]
+    dist = np.sqrt(dx * dx + dy * dy)
+    keep = (i != j) & (dist < radius)
+    return i[keep], j[keep], dx[keep], dy[keep], dist[keep]
+
+
+def flock_forces(x, y, vx, vy, neighbor_radius=100.0, separation_radius=30.0):
+    """
+    Per-boid steering terms of the classic boids rules
+
+    Distances are softened by 0.1 (as in the original per-boid loop), so a boid
+    counts as a neighbor when dist + 0.1 < neighbor_radius.
+
+    Args:
+        x, y, vx, vy: Boid positions and velocities
+        neighbor_radius: Range of cohesion and alignment
+        separation_radius: Range of separation
+
+    Returns:
+        (cohesion, separation, alignment): each an (N, 2) array. Cohesion is the
+        mean offset to the neighbors, alignment their mean velocity and separation
+        the sum of unit vectors pointing away from close boids
+    """
+    n = len(x)
+    i, j, dx, dy, dist = neighbor_pairs(x, y, neighbor_radius)
+    dist = dist + 0.1
+    near = dist < neighbor_radius
+    i, j, dx, dy, dist = i[near], j[near], dx[near], dy[near], dist[near]
+
+    neighbors = np.maximum(np.bincount(i, minlength=n), 1)
+    cohesion = np.stack([np.bincount(i, dx, n), np.bincount(i, dy, n)], axis=1) / neighbors[:, None]
+    alignment = np.stack([np.bincount(i, vx[j], n), np.bincount(i, vy[j], n)], axis=1) / neighbors[:, None]
+
+    close = dist < separation_radius
+    ci = i[close]
+    separation = -np.stack([np.bincount(ci, dx[close] / dist[close], n),
+                            np.bincount(ci, dy[close] / dist[close], n)], axis=1)
+    return cohesion, separation, alignment
+
+
+def flock_step(boids, cohesion, separation, alignment, max_speed, width, height,
+               neighbor_radius=100.0, separation_radius=30.0):
+    """
+    Advance a flock one frame: steer, clamp speed, move and wrap around the frame
+
+    All boids steer from the same snapshot of the flock (the rules are applied
+    simultaneously rather than boid by boid).
+
+    Args:
+        boids: ParticleSystem holding the flock
+        cohesion, separation, alignment: Rule weights
+        max_speed: Speed limit in pixels per frame
+        width, height: Wrap-around bounds
+        neighbor_radius: Range of cohesion and alignment
+        separation_radius: Range of separation
+    """
+    if len(boids) == 0:
+        return boids
+    pull, push, heading = flock_forces(boids.x, boids.y, boids.vx, boids.vy,
+                                       neighbor_radius, separation_radius)
+    steer = pull * cohesion + push * separation + heading * alignment
+    vx = boids.vx + steer[:, 0]
+    vy = boids.vy + steer[:, 1]
+
+    speed = np.sqrt(vx * vx + vy * vy)
+    scale = np.where(speed > max_speed, max_speed / np.maximum(speed, 1e-12), 1.0)
+    boids.vx = vx * scale
+    boids.vy = vy * scale
+
+    boids.x = (boids.x + boids.vx) % width
+    boids.y = (boids.y + boids.vy) % height
+    return boids
@@ -0,0 +1,100 @@
+"""
+Layer Cache and Compositor
+Static content rasterized once per render instead of once per frame
+
+Many modes draw the same chrome every frame (a cassette shell, a monitor grid,
+a HUD ring) under or over their moving parts. A mode declares such content as a
+named layer keyed by everything it depends on; the layer is rasterized when the
+key changes and otherwise only composited:
+
+    self.cached_layer('monitor', (width, height), draw_monitor).composite(frame)
+    draw_waveform(frame)
+
+Layers are drawn with the ordinary cv2 calls. Rendering the content once on
+black and once on white recovers its coverage (alpha), so anti-aliased edges
+blend onto whatever is below; on a black frame compositing gives exactly the
+pixels drawing directly would.
+"""
+import numpy as np
+import cv2
+
+
+class Layer:
+    """One rasterized layer: premultiplied color and coverage of its bounding box"""
+
+    def __init__(self, on_black, on_white):
+        """
+        Args:
+            on_black: The content drawn on a black canvas
+            on_white: The same content drawn on a white canvas
+        """
+        # A pixel at coverage a of color c is c * a on black and c * a + 255 * (1 - a)
+        # on white; the difference is what shows through
+        keep = (on_white.astype(np.int16) - on_black).max(axis=2).clip(0, 255).astype(np.uint8)
+        touched = keep < 255
+        rows = np.flatnonzero(touched.any(axis=1))
+        cols = np.flatnonzero(touched.any(axis=0))
+        self.shape = on_black.shape
+        if len(rows) == 0:
+            # Nothing drawn (or all of it off the canvas): compositing is a no-op
+            self.rows = self.cols = slice(0, 0)
+            self.color = self.keep = np.zeros((0, 0, 3), dtype=np.uint8)
+            self.opaque = None
+            return
+        self.rows = slice(rows[0], rows[-1] + 1)
+        self.cols = slice(cols[0], cols[-1] + 1)
+        keep = keep[self.rows, self.cols]
+        self.color = np.ascontiguousarray(on_black[self.rows, self.cols])
+        # Fully opaque layers (no anti-aliased or partial pixels) are a masked copy
+        self.opaque = (keep == 0).astype(np.uint8) if np.all((keep == 0) | (keep == 255)) else None
+        self.keep = cv2.cvtColor(keep, cv2.COLOR_GRAY2BGR)
+
+    def composite(self, frame):
+        """Blend the layer over the frame ("over" with premultiplied color)"""
+        if frame.shape != self.shape:
+            raise ValueError(f"Layer of shape {self.shape} composited on a frame of shape {frame.shape}")
+        region = frame[self.rows, self.cols]
+        if region.size == 0:
+            return frame
+        if self.opaque is not None:
+            cv2.copyTo(self.color, self.opaque, region)
+        else:
+            region[:] = cv2.add(cv2.multiply(region, self.keep, scale=1 / 255), self.color)
+        return frame
+
+
+def rasterize(shape, render):
+    """Layer of the content render(canvas) draws on a canvas of the given shape"""
+    on_black = np.zeros(shape, dtype=np.uint8)
+    on_white = np.full(shape, 255, dtype=np.uint8)
+    render(on_black)
+    render(on_white)
+    return Layer(on_black, on_white)
+
+
+class LayerCache:
+    """Named layers of one visualizer, each re-rasterized only when its key changes"""
+
+    def __init__(self):
+        # name -> (key, Layer)
+        self._layers = {}
+
+    def get(self, name, key, shape, render):
+        """
+        Cached layer `name`, rasterized by render(canvas) when key or shape changed
+
+        Args:
+            name: Layer name (one cached layer per name)
+            key: Hashable parameters the layer's content depends on
+            shape: (height, width, 3) frame shape
+            render: Function drawing the content onto the canvas it gets
+        """
+        key = (key, tuple(shape))
+        cached = self._layers.get(name)
+        if cached is None or cached[0] != key:
+            cached = self._layers[name] = (key, rasterize(shape, render))
+        return cached[1]
+
+    def clear(self):
+        """Drop all layers (they are rasterized again on next use)"""
+        self._layers.clear()
@@ -0,0 +1,128 @@
+"""
+Metaball Rendering
+Implicit-surface blobs for lava-lamp style modes
+
+Each ball adds a smooth potential around its center that is 1 (the surface
+threshold) at the ball's radius and falls to 0 at twice the radius, so a lone
+ball's surface is its circle and nearby balls merge into one blob. Potentials
+and potential-weighted ball colors are summed on a coarse sample grid for all
+(ball, grid point) pairs inside the balls' reach at once, shaded there and
+upsampled to the frame bilinearly:
+
+    render_metaballs(frame, xs, ys, radii, colors, step=4, glow=0.3)
+"""
+import numpy as np
+import cv2
+
+from . import fields
+
+
+# Reach of a ball's potential, in ball radii
+REACH = 2.0
+# Normalizes the falloff (1 - d^2 / reach^2)^2 to 1 at the ball's radius
+_SURFACE = (1 - 1 / REACH ** 2) ** 2
+
+
+def potential(width, height, ball_x, ball_y, ball_radius, colors=None, step=4):
+    """
+    Sum the ball potentials on a frame's sample grid
+
+    Args:
+        width, height: Frame size
+        ball_x, ball_y, ball_radius: Per-ball centers and radii in pixels
+        colors: Optional (N, 3) ball colors (or one color) to blend by potential
+        step: Sample spacing; points sit at the centers of step x step blocks
+
+    Returns:
+        (field, weighted): the (ny, nx) summed potential and, when colors are
+        given, the potential-weighted color sum of shape (ny, nx, 3) (else None)
+    """
+    gx, gy = fields.sample_grid(width, height, step)
+    nx, ny = gx.shape[1], gy.shape[0]
+    offset = (step - 1) / 2
+    ball_x, ball_y, ball_radius = (np.asarray(v, dtype=np.float64).ravel() for v in (ball_x, ball_y, ball_radius))
+    reach = ball_radius * REACH
+
+    # Grid window [x0, x1] x [y0, y1] each ball can reach
+    x0 = np.clip(np.ceil((ball_x - reach - offset) / step), 0, nx).astype(np.int64)
+    x1 = np.clip(np.floor((ball_x + reach - offset) / step) + 1, 0, nx).astype(np.int64)
+    y0 = np.clip(np.ceil((ball_y - reach - offset) / step), 0, ny).astype(np.int64)
+    y1 = np.clip(np.floor((ball_y + reach - offset) / step) + 1, 0, ny).astype(np.int64)
+    cols = np.maximum(x1 - x0, 0)
+    counts = cols * np.maximum(y1 - y0, 0)
+
+    # One entry per (ball, grid point in its window)
+    ball = np.repeat(np.arange(len(ball_x)), counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    ix = x0[ball] + within % np.maximum(cols[ball], 1)
+    iy = y0[ball] + within // np.maximum(cols[ball], 1)
+    dx = ix * step + offset - ball_x[ball]
+    dy = iy * step + offset - ball_y[ball]
+    falloff = np.maximum(1 - (dx * dx + dy * dy) / (reach[ball] ** 2), 0)
+    p = falloff * falloff / _SURFACE
+
+    cell = iy * nx + ix
+    field = np.bincount(cell, p, ny * nx).reshape(ny, nx)
+    weighted = None
+    if colors is not None:
+        colors = np.broadcast_to(np.asarray(colors, dtype=np.float64), (len(ball_x), 3))
+        weighted = np.stack([np.bincount(cell, p * colors[ball, c], ny * nx) for c in range(3)],
+                            axis=-1).reshape(ny, nx, 3)
+    return field, weighted
+
+
+def render_metaballs(frame, ball_x, ball_y, ball_radius, colors, step=4,
+                     edge=0.3, glow=0.0, outline=None):
+    """
+    Draw merging blobs over the frame
+
+    Args:
+        frame: Frame to draw on
+        ball_x, ball_y, ball_radius: Per-ball centers and radii in pixels
+        colors: (N, 3) BGR ball colors or one color for all; where blobs merge
+            the colors blend by potential
+        step: Sample spacing of the internal grid (higher = faster, softer)
+        edge: Width of the anti-aliased ramp just outside the surface, in potential
+        glow: Opacity of the halo outside the surface (0 = none), fading out at
+            the balls' reach
+        outline: BGR color of a 1px contour around the blobs, or None
+    """
+    if len(np.atleast_1d(ball_x)) == 0:
+        return frame
+    height, width = frame.shape[:2]
+    field, weighted = potential(width, height, ball_x, ball_y, ball_radius, colors, step)
+
+    alpha = np.clip((field - 1) / edge + 1, 0, 1)
+    if glow:
+        alpha = np.maximum(alpha, glow * np.minimum(field, 1))
+    rows = np.flatnonzero(alpha.any(axis=1))
+    cols = np.flatnonzero(alpha.any(axis=0))
+    if len(rows) == 0:
+        return frame
+
+    # Only upscale and blend the blobs' bounding box (plus one empty cell of margin
+    # for the bilinear upscale)
+    r0, r1 = max(rows[0] - 1, 0), min(rows[-1] + 2, len(alpha))
+    c0, c1 = max(cols[0] - 1, 0), min(cols[-1] + 2, alpha.shape[1])
+    alpha = np.clip(alpha[r0:r1, c0:c1] * 255 + 0.5, 0, 255).astype(np.uint8)
+    color = weighted[r0:r1, c0:c1] / np.maximum(field[r0:r1, c0:c1], 1e-12)[:, :, None]
+    color = np.clip(color + 0.5, 0, 255).astype(np.uint8)
+
+    size = ((c1 - c0) * step, (r1 - r0) * step)
+    y0, x0 = r0 * step, c0 * step
+    region = frame[y0:y0 + size[1], x0:x0 + size[0]]
+    h, w = region.shape[:2]
+    alpha = cv2.resize(alpha, size, interpolation=cv2.INTER_LINEAR)[:h, :w]
+    color = cv2.resize(color, size, interpolation=cv2.INTER_LINEAR)[:h, :w]
+
+    # 8-bit "over" blend: color * alpha + region * (1 - alpha)
+    alpha3 = cv2.cvtColor(alpha, cv2.COLOR_GRAY2BGR)
+    blended = cv2.add(cv2.multiply(color, alpha3, scale=1 / 255),
+                      cv2.multiply(region, cv2.bitwise_not(alpha3), scale=1 / 255))
+    region[:] = blended
+
+    if outline is not None:
+        inside = (alpha >= 128).astype(np.uint8)
+        contour = inside - cv2.erode(inside, np.ones((3, 3), dtype=np.uint8))
+        region[contour > 0] = outline
+    return frame
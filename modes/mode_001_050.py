@@ -2,10 +2,17 @@
 Audio Spectrum Visualization Modes 1-50
 Auto-generated from audio_spectrum_creative.py
 """
-from .base import BaseModeVisualizer
+from .base import BaseModeVisualizer, draw_circles
+from . import metaballs
 import numpy as np
 import cv2
 
+from color_lut import hsv_pixel, hsv_to_bgr_array
+
+
+# Neon rain colors: cyan, magenta, pink (BGR)
+NEON_RAIN_COLORS = np.array([(255, 255, 0), (255, 0, 255), (255, 100, 200)])
+
 
 class Modes001_050(BaseModeVisualizer):
     """Visualization modes 1 through 50"""
@@ -18,7 +25,7 @@ class Modes001_050(BaseModeVisualizer):
     def draw_mode_1_vinyl_grooves(self, frame, magnitudes):
         """Mode 1: Rotating vinyl record grooves"""
         # Update rotation
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         self.rotation_angle += 0.5 + avg_magnitude * 2
 
         # Draw concentric grooves that pulse with music
@@ -41,8 +48,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = 30 + magnitude * 20  # Amber to gold range
             saturation = 180 + int(magnitude * 75)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             # Thickness varies with magnitude
@@ -74,63 +80,57 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_2_neon_rain(self, frame, magnitudes):
         """Mode 2: Neon droplets cascading down (cyberpunk lofi)"""
-        # Spawn new rain particles based on magnitudes
-        for i, magnitude in enumerate(magnitudes):
-            if magnitude > 0.3 and np.random.random() < magnitude * 0.3:
-                x = int((i / len(magnitudes)) * self.width)
-                y = 0
-                speed = 3 + magnitude * 15
-                size = 2 + int(magnitude * 8)
+        rain = self.rain_system
+        magnitudes = np.asarray(magnitudes)
 
+        # Spawn new rain particles based on magnitudes
+        spawn = np.flatnonzero((magnitudes > 0.3) & (self.rng.random(len(magnitudes)) < magnitudes * 0.3))
+        if len(spawn):
+            magnitude = magnitudes[spawn]
+            rain.spawn(
+                x=((spawn / len(magnitudes)) * self.width).astype(int),
+                y=0,
+                vy=3 + magnitude * 15,
+                size=2 + (magnitude * 8).astype(int),
+                trail=(magnitude * 50).astype(int),
                 # Neon colors (cyan, magenta, pink)
-                color_choice = i % 3
-                if color_choice == 0:
-                    color = (255, 255, 0)  # Cyan
-                elif color_choice == 1:
-                    color = (255, 0, 255)  # Magenta
-                else:
-                    color = (255, 100, 200)  # Pink
-
-                self.rain_particles.append({
-                    'x': x, 'y': y, 'speed': speed,
-                    'size': size, 'color': color,
-                    'trail_length': int(magnitude * 50)
-                })
-
-        # Update and draw rain particles
-        new_particles = []
-        for particle in self.rain_particles:
-            particle['y'] += particle['speed']
-
-            # Keep if still on screen
-            if particle['y'] < self.height + 20:
-                # Draw particle with trail
-                trail_length = particle['trail_length']
-                for t in range(trail_length):
-                    trail_y = int(particle['y'] - t * 2)
-                    if trail_y >= 0:
-                        alpha = 1.0 - (t / trail_length)
-                        trail_color = tuple(int(c * alpha) for c in particle['color'])
-                        cv2.circle(frame, (particle['x'], trail_y),
-                                 max(1, particle['size'] - t // 3),
-                                 trail_color, -1, lineType=cv2.LINE_AA)
-
-                # Glow effect
-                cv2.circle(frame, (particle['x'], int(particle['y'])),
-                          particle['size'] + 3,
-                          tuple(int(c * 0.3) for c in particle['color']),
-                          1, lineType=cv2.LINE_AA)
-
-                new_particles.append(particle)
-
-        self.rain_particles = new_particles
+                color=NEON_RAIN_COLORS[spawn % 3]
+            )
+
+        # Fall, keeping drops still on screen
+        rain.integrate()
+        rain.kill(rain.y >= self.height + 20)
+
+        # Each drop draws its fading trail (one circle per step, head first) then a glow ring.
+        # All circles are laid out drop by drop so they paint in the same order as before.
+        trail = rain.trail.astype(int)
+        steps = trail + 1
+        drop = np.repeat(np.arange(len(rain)), steps)
+        t = np.arange(len(drop)) - np.repeat(np.cumsum(steps) - steps, steps)
+        glow = t == trail[drop]
+
+        y = rain.y[drop]
+        size = rain.size.astype(int)[drop]
+        trail_y = np.where(glow, y, y - t * 2).astype(int)
+        alpha = np.where(glow, 0.3, 1.0 - t / np.maximum(trail[drop], 1))
+        visible = glow | (trail_y >= 0)
+
+        draw_circles(
+            frame,
+            rain.x[drop][visible],
+            trail_y[visible],
+            np.where(glow, size + 3, np.maximum(1, size - t // 3))[visible],
+            (rain.color[drop] * alpha[:, None]).astype(int)[visible],
+            np.where(glow, 1, -1)[visible]
+        )
 
         return frame
 
 
     def draw_mode_3_jazzy_fireworks(self, frame, magnitudes):
         """Mode 3: Bursting particles from center (jazz energy) - ENHANCED VERSION"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
+        fireworks = self.firework_system
 
         # MUCH MORE AGGRESSIVE spawning - spawn constantly and much more particles
         # Spawn from center constantly
@@ -138,26 +138,22 @@ class Modes001_050(BaseModeVisualizer):
             # Base particles - always spawn a lot
             num_particles = int(150 + avg_magnitude * 250)  # Way more particles (150-400)
 
-            for i in range(num_particles):
-                angle = np.random.random() * 2 * np.pi
-                # Higher speeds to fill entire screen
-                speed = 5 + np.random.random() * 15 * (avg_magnitude + 0.5)
-
-                # Rainbow colors for jazz energy
-                hue = np.random.randint(0, 180)
-                color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-                color = tuple(int(c) for c in color_bgr)
+            angle = self.rng.random(num_particles) * 2 * np.pi
+            # Higher speeds to fill entire screen
+            speed = 5 + self.rng.random(num_particles) * 15 * (avg_magnitude + 0.5)
 
-                self.firework_particles.append({
-                    'x': self.center_x,
-                    'y': self.center_y,
-                    'vx': np.cos(angle) * speed,
-                    'vy': np.sin(angle) * speed,
-                    'color': color,
-                    'life': 1.0,  # Longer life
-                    'size': 4 + int(avg_magnitude * 8)  # Bigger particles
-                })
+            # Rainbow colors for jazz energy
+            hue = self.rng.integers(0, 180, num_particles)
+
+            fireworks.spawn(
+                x=self.center_x,
+                y=self.center_y,
+                vx=np.cos(angle) * speed,
+                vy=np.sin(angle) * speed,
+                color=hsv_to_bgr_array(hue, 255, 255),
+                life=1.0,  # Longer life
+                size=4 + int(avg_magnitude * 8)  # Bigger particles
+            )
 
         # Also spawn random secondary bursts from different positions
         if avg_magnitude > 0.5 and self.frame_counter % 5 == 0:
@@ -168,58 +164,50 @@ class Modes001_050(BaseModeVisualizer):
                 burst_x = self.center_x + int(np.cos(burst_angle) * burst_distance)
                 burst_y = self.center_y + int(np.sin(burst_angle) * burst_distance)
 
-                for i in range(50):
-                    angle = np.random.random() * 2 * np.pi
-                    speed = 3 + np.random.random() * 10
+                angle = self.rng.random(50) * 2 * np.pi
+                speed = 3 + self.rng.random(50) * 10
+                hue = self.rng.integers(0, 180, 50)
 
-                    hue = np.random.randint(0, 180)
-                    color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-                    color = tuple(int(c) for c in color_bgr)
+                fireworks.spawn(
+                    x=burst_x,
+                    y=burst_y,
+                    vx=np.cos(angle) * speed,
+                    vy=np.sin(angle) * speed,
+                    color=hsv_to_bgr_array(hue, 255, 255),
+                    life=0.8,
+                    size=3 + int(avg_magnitude * 6)
+                )
 
-                    self.firework_particles.append({
-                        'x': burst_x,
-                        'y': burst_y,
-                        'vx': np.cos(angle) * speed,
-                        'vy': np.sin(angle) * speed,
-                        'color': color,
-                        'life': 0.8,
-                        'size': 3 + int(avg_magnitude * 6)
-                    })
-
-        # Update and draw particles
-        new_particles = []
-        for particle in self.firework_particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 0.008  # Slower decay so particles live longer and fill screen
-
-            # Very slight gravity
-            particle['vy'] += 0.05
-
-            if particle['life'] > 0:
-                alpha = particle['life']
-                particle_color = tuple(int(c * alpha) for c in particle['color'])
-                size = max(1, int(particle['size'] * alpha))
-
-                # Main particle - bigger and brighter
-                cv2.circle(frame, (int(particle['x']), int(particle['y'])),
-                          size, particle_color, -1, lineType=cv2.LINE_AA)
-
-                # Multi-layer glow for more visibility
-                if alpha > 0.3:
-                    # Outer glow
-                    cv2.circle(frame, (int(particle['x']), int(particle['y'])),
-                              size + 4, tuple(int(c * 0.3 * alpha) for c in particle_color),
-                              1, lineType=cv2.LINE_AA)
-                    # Inner bright glow
-                    cv2.circle(frame, (int(particle['x']), int(particle['y'])),
-                              size + 2, tuple(int(c * 0.6 * alpha) for c in particle_color),
-                              -1, lineType=cv2.LINE_AA)
-
-                new_particles.append(particle)
-
-        self.firework_particles = new_particles
+        # Update particles
+        fireworks.integrate()
+        fireworks.age(0.008)  # Slower decay so particles live longer and fill screen
+        fireworks.apply_force(ay=0.05)  # Very slight gravity
+
+        # Drop dead particles, and ones fully past the sides or bottom: with no sideways
+        # force and gravity pulling down they never come back into view
+        margin = fireworks.size + 4
+        fireworks.kill((fireworks.life <= 0) |
+                       (fireworks.x < -margin) | (fireworks.x > self.width + margin) |
+                       (fireworks.y > self.height + margin))
+
+        # Each particle: main dot, then (while bright) an outer glow ring and inner glow.
+        # Layers are (particle, layer) rows flattened in particle order, like the old loop.
+        alpha = fireworks.life[:, None]
+        particle_color = (fireworks.color * alpha).astype(int)
+        size = np.maximum(1, (fireworks.size * fireworks.life).astype(int))
+        bright = fireworks.life > 0.3
+        layers = np.stack([np.ones_like(bright), bright, bright], axis=1)
+
+        draw_circles(
+            frame,
+            np.repeat(fireworks.x, 3)[layers.ravel()],
+            np.repeat(fireworks.y, 3)[layers.ravel()],
+            np.stack([size, size + 4, size + 2], axis=1)[layers],
+            np.stack([particle_color,
+                      (particle_color * 0.3 * alpha).astype(int),
+                      (particle_color * 0.6 * alpha).astype(int)], axis=1)[layers],
+            np.tile([-1, 1, -1], (len(size), 1))[layers]
+        )
 
         return frame
 
@@ -227,7 +215,7 @@ class Modes001_050(BaseModeVisualizer):
     def draw_mode_4_retro_cassette(self, frame, magnitudes):
         """Mode 4: VU meters and cassette tape animation - REALISTIC VERSION"""
         # Update cassette reel rotation
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         self.cassette_reel_angle += 3 + avg_magnitude * 10
 
         # REALISTIC CASSETTE DIMENSIONS (wider, more authentic)
@@ -236,63 +224,141 @@ class Modes001_050(BaseModeVisualizer):
         cassette_x = self.center_x - cassette_width // 2
         cassette_y = self.center_y - cassette_height // 2
 
-        # === CASSETTE BODY ===
-        # Main outer shell (beige/tan plastic)
-        cv2.rectangle(frame, (cassette_x, cassette_y),
-                     (cassette_x + cassette_width, cassette_y + cassette_height),
-                     (140, 130, 110), -1, lineType=cv2.LINE_AA)
-
-        # Border/edge
-        cv2.rectangle(frame, (cassette_x, cassette_y),
-                     (cassette_x + cassette_width, cassette_y + cassette_height),
-                     (100, 90, 70), 3, lineType=cv2.LINE_AA)
-
-        # === LABEL AREA (top section) ===
         label_height = int(cassette_height * 0.25)
-        cv2.rectangle(frame, (cassette_x + 20, cassette_y + 15),
-                     (cassette_x + cassette_width - 20, cassette_y + label_height),
-                     (220, 210, 200), -1, lineType=cv2.LINE_AA)
-        cv2.rectangle(frame, (cassette_x + 20, cassette_y + 15),
-                     (cassette_x + cassette_width - 20, cassette_y + label_height),
-                     (180, 170, 160), 1, lineType=cv2.LINE_AA)
-
-        # === WINDOW AREA (where you see the tape) ===
         window_y = cassette_y + label_height + 25
         window_height = int(cassette_height * 0.45)
         window_margin = 40
 
-        # Dark transparent window
-        cv2.rectangle(frame, (cassette_x + window_margin, window_y),
-                     (cassette_x + cassette_width - window_margin, window_y + window_height),
-                     (30, 25, 20), -1, lineType=cv2.LINE_AA)
-        cv2.rectangle(frame, (cassette_x + window_margin, window_y),
-                     (cassette_x + cassette_width - window_margin, window_y + window_height),
-                     (80, 70, 60), 2, lineType=cv2.LINE_AA)
-
-        # === TAPE REELS (much more detailed) ===
         reel_y = window_y + window_height // 2
         reel_outer_radius = 55
         reel_inner_radius = 15
+        tape_radius = int(reel_outer_radius * 0.85)
         left_reel_x = cassette_x + cassette_width // 3
         right_reel_x = cassette_x + 2 * cassette_width // 3
 
+        vu_y = cassette_y + cassette_height + 100
+        vu_width = cassette_width - 200
+        vu_height = 35
+        vu_x = self.center_x - vu_width // 2
+        num_segments = 40
+        segment_width = vu_width // num_segments
+
+        def draw_shell(canvas):
+            """Everything but the spokes and VU segments (the parts that never move)"""
+            # === CASSETTE BODY ===
+            # Main outer shell (beige/tan plastic)
+            cv2.rectangle(canvas, (cassette_x, cassette_y),
+                         (cassette_x + cassette_width, cassette_y + cassette_height),
+                         (140, 130, 110), -1, lineType=cv2.LINE_AA)
+
+            # Border/edge
+            cv2.rectangle(canvas, (cassette_x, cassette_y),
+                         (cassette_x + cassette_width, cassette_y + cassette_height),
+                         (100, 90, 70), 3, lineType=cv2.LINE_AA)
+
+            # === LABEL AREA (top section) ===
+            cv2.rectangle(canvas, (cassette_x + 20, cassette_y + 15),
+                         (cassette_x + cassette_width - 20, cassette_y + label_height),
+                         (220, 210, 200), -1, lineType=cv2.LINE_AA)
+            cv2.rectangle(canvas, (cassette_x + 20, cassette_y + 15),
+                         (cassette_x + cassette_width - 20, cassette_y + label_height),
+                         (180, 170, 160), 1, lineType=cv2.LINE_AA)
+
+            # === WINDOW AREA (where you see the tape) ===
+            # Dark transparent window
+            cv2.rectangle(canvas, (cassette_x + window_margin, window_y),
+                         (cassette_x + cassette_width - window_margin, window_y + window_height),
+                         (30, 25, 20), -1, lineType=cv2.LINE_AA)
+            cv2.rectangle(canvas, (cassette_x + window_margin, window_y),
+                         (cassette_x + cassette_width - window_margin, window_y + window_height),
+                         (80, 70, 60), 2, lineType=cv2.LINE_AA)
+
+            # === TAPE REELS (much more detailed) ===
+            for reel_x in [left_reel_x, right_reel_x]:
+                # Outer reel edge (dark)
+                cv2.circle(canvas, (reel_x, reel_y), reel_outer_radius,
+                          (50, 45, 40), 2, lineType=cv2.LINE_AA)
+
+                # Tape on reel (brown/black magnetic tape)
+                cv2.circle(canvas, (reel_x, reel_y), tape_radius,
+                          (20, 15, 10), -1, lineType=cv2.LINE_AA)
+
+                # Center hub (beige plastic)
+                cv2.circle(canvas, (reel_x, reel_y), reel_inner_radius,
+                          (140, 130, 110), -1, lineType=cv2.LINE_AA)
+                cv2.circle(canvas, (reel_x, reel_y), reel_inner_radius,
+                          (100, 90, 70), 1, lineType=cv2.LINE_AA)
+
+                # Center dot (inside the spokes' inner radius)
+                cv2.circle(canvas, (reel_x, reel_y), 4, (60, 50, 40), -1, lineType=cv2.LINE_AA)
+
+            # === TAPE BETWEEN REELS (visible magnetic tape) ===
+            tape_top_y = reel_y - reel_outer_radius + 5
+            tape_bottom_y = reel_y + reel_outer_radius - 5
+            tape_thickness = 8
+
+            # Top tape section
+            cv2.rectangle(canvas, (left_reel_x + reel_outer_radius - 5, tape_top_y - tape_thickness),
+                         (right_reel_x - reel_outer_radius + 5, tape_top_y),
+                         (15, 10, 8), -1, lineType=cv2.LINE_AA)
+
+            # Bottom tape section
+            cv2.rectangle(canvas, (left_reel_x + reel_outer_radius - 5, tape_bottom_y),
+                         (right_reel_x - reel_outer_radius + 5, tape_bottom_y + tape_thickness),
+                         (15, 10, 8), -1, lineType=cv2.LINE_AA)
+
+            # === CASSETTE SCREWS (4 corners) ===
+            screw_positions = [
+                (cassette_x + 25, cassette_y + 25),
+                (cassette_x + cassette_width - 25, cassette_y + 25),
+                (cassette_x + 25, cassette_y + cassette_height - 25),
+                (cassette_x + cassette_width - 25, cassette_y + cassette_height - 25)
+            ]
+
+            for screw_x, screw_y in screw_positions:
+                cv2.circle(canvas, (screw_x, screw_y), 6, (80, 70, 60), -1, lineType=cv2.LINE_AA)
+                cv2.circle(canvas, (screw_x, screw_y), 6, (60, 50, 40), 1, lineType=cv2.LINE_AA)
+                # Screw cross
+                cv2.line(canvas, (screw_x - 3, screw_y), (screw_x + 3, screw_y),
+                        (40, 30, 25), 1, lineType=cv2.LINE_AA)
+                cv2.line(canvas, (screw_x, screw_y - 3), (screw_x, screw_y + 3),
+                        (40, 30, 25), 1, lineType=cv2.LINE_AA)
+
+            # === BOTTOM GRIP NOTCHES (authentic detail) ===
+            notch_width = 30
+            notch_height = 8
+            notch_spacing = 15
+            notch_y = cassette_y + cassette_height - notch_height - 5
+
+            for i in range(5):
+                notch_x = cassette_x + cassette_width // 2 - 2 * notch_width - 2 * notch_spacing + i * (notch_width + notch_spacing)
+                cv2.rectangle(canvas, (notch_x, notch_y),
+                             (notch_x + notch_width, notch_y + notch_height),
+                             (90, 80, 60), -1, lineType=cv2.LINE_AA)
+
+            # === VU METER FRAMES AND CHANNEL LABELS (L/R) ===
+            for channel in range(2):
+                channel_y = vu_y + channel * 60
+                frame_padding = 5
+                cv2.rectangle(canvas,
+                             (vu_x - frame_padding, channel_y - frame_padding),
+                             (vu_x + vu_width + frame_padding, channel_y + vu_height + frame_padding),
+                             (100, 90, 70), -1, lineType=cv2.LINE_AA)
+                cv2.rectangle(canvas,
+                             (vu_x - frame_padding, channel_y - frame_padding),
+                             (vu_x + vu_width + frame_padding, channel_y + vu_height + frame_padding),
+                             (70, 60, 50), 2, lineType=cv2.LINE_AA)
+
+                label = "L" if channel == 0 else "R"
+                cv2.putText(canvas, label, (vu_x - 35, channel_y + vu_height - 10),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (150, 140, 120), 2, cv2.LINE_AA)
+
+        # Static cassette and meter chrome, rasterized once per geometry
+        self.cached_layer('retro_cassette', (cassette_x, cassette_y, cassette_width, cassette_height),
+                          draw_shell).composite(frame)
+
+        # Rotating spokes (6 spokes for realism)
         for reel_x in [left_reel_x, right_reel_x]:
-            # Outer reel edge (dark)
-            cv2.circle(frame, (reel_x, reel_y), reel_outer_radius,
-                      (50, 45, 40), 2, lineType=cv2.LINE_AA)
-
-            # Tape on reel (brown/black magnetic tape)
-            tape_radius = int(reel_outer_radius * 0.85)
-            cv2.circle(frame, (reel_x, reel_y), tape_radius,
-                      (20, 15, 10), -1, lineType=cv2.LINE_AA)
-
-            # Center hub (beige plastic)
-            cv2.circle(frame, (reel_x, reel_y), reel_inner_radius,
-                      (140, 130, 110), -1, lineType=cv2.LINE_AA)
-            cv2.circle(frame, (reel_x, reel_y), reel_inner_radius,
-                      (100, 90, 70), 1, lineType=cv2.LINE_AA)
-
-            # Rotating spokes (6 spokes for realism)
             for spoke in range(6):
                 angle = np.deg2rad(self.cassette_reel_angle + spoke * 60)
                 x1 = int(reel_x + reel_inner_radius * np.cos(angle))
@@ -301,77 +367,10 @@ class Modes001_050(BaseModeVisualizer):
                 y2 = int(reel_y + tape_radius * 0.9 * np.sin(angle))
                 cv2.line(frame, (x1, y1), (x2, y2), (80, 70, 60), 2, lineType=cv2.LINE_AA)
 
-            # Center dot
-            cv2.circle(frame, (reel_x, reel_y), 4, (60, 50, 40), -1, lineType=cv2.LINE_AA)
-
-        # === TAPE BETWEEN REELS (visible magnetic tape) ===
-        tape_top_y = reel_y - reel_outer_radius + 5
-        tape_bottom_y = reel_y + reel_outer_radius - 5
-        tape_thickness = 8
-
-        # Top tape section
-        cv2.rectangle(frame, (left_reel_x + reel_outer_radius - 5, tape_top_y - tape_thickness),
-                     (right_reel_x - reel_outer_radius + 5, tape_top_y),
-                     (15, 10, 8), -1, lineType=cv2.LINE_AA)
-
-        # Bottom tape section
-        cv2.rectangle(frame, (left_reel_x + reel_outer_radius - 5, tape_bottom_y),
-                     (right_reel_x - reel_outer_radius + 5, tape_bottom_y + tape_thickness),
-                     (15, 10, 8), -1, lineType=cv2.LINE_AA)
-
-        # === CASSETTE SCREWS (4 corners) ===
-        screw_positions = [
-            (cassette_x + 25, cassette_y + 25),
-            (cassette_x + cassette_width - 25, cassette_y + 25),
-            (cassette_x + 25, cassette_y + cassette_height - 25),
-            (cassette_x + cassette_width - 25, cassette_y + cassette_height - 25)
-        ]
-
-        for screw_x, screw_y in screw_positions:
-            cv2.circle(frame, (screw_x, screw_y), 6, (80, 70, 60), -1, lineType=cv2.LINE_AA)
-            cv2.circle(frame, (screw_x, screw_y), 6, (60, 50, 40), 1, lineType=cv2.LINE_AA)
-            # Screw cross
-            cv2.line(frame, (screw_x - 3, screw_y), (screw_x + 3, screw_y),
-                    (40, 30, 25), 1, lineType=cv2.LINE_AA)
-            cv2.line(frame, (screw_x, screw_y - 3), (screw_x, screw_y + 3),
-                    (40, 30, 25), 1, lineType=cv2.LINE_AA)
-
-        # === BOTTOM GRIP NOTCHES (authentic detail) ===
-        notch_width = 30
-        notch_height = 8
-        notch_spacing = 15
-        notch_y = cassette_y + cassette_height - notch_height - 5
-
-        for i in range(5):
-            notch_x = cassette_x + cassette_width // 2 - 2 * notch_width - 2 * notch_spacing + i * (notch_width + notch_spacing)
-            cv2.rectangle(frame, (notch_x, notch_y),
-                         (notch_x + notch_width, notch_y + notch_height),
-                         (90, 80, 60), -1, lineType=cv2.LINE_AA)
-
         # === VINTAGE VU METERS (below cassette) ===
-        vu_y = cassette_y + cassette_height + 100
-        vu_width = cassette_width - 200
-        vu_height = 35
-        vu_x = self.center_x - vu_width // 2
-
-        # Left and right channel VU meters
-        num_segments = 40
-        segment_width = vu_width // num_segments
-
         for channel in range(2):
             channel_y = vu_y + channel * 60
 
-            # VU meter background/frame
-            frame_padding = 5
-            cv2.rectangle(frame,
-                         (vu_x - frame_padding, channel_y - frame_padding),
-                         (vu_x + vu_width + frame_padding, channel_y + vu_height + frame_padding),
-                         (100, 90, 70), -1, lineType=cv2.LINE_AA)
-            cv2.rectangle(frame,
-                         (vu_x - frame_padding, channel_y - frame_padding),
-                         (vu_x + vu_width + frame_padding, channel_y + vu_height + frame_padding),
-                         (70, 60, 50), 2, lineType=cv2.LINE_AA)
-
             # Get magnitude for this channel (split frequencies)
             if channel == 0:
                 channel_mag = np.mean(magnitudes[:len(magnitudes)//2])
@@ -406,11 +405,6 @@ class Modes001_050(BaseModeVisualizer):
                                 (seg_x + segment_width - 2, channel_y + vu_height - 2),
                                 dim_color, -1, lineType=cv2.LINE_AA)
 
-            # Channel label (L/R)
-            label = "L" if channel == 0 else "R"
-            cv2.putText(frame, label, (vu_x - 35, channel_y + vu_height - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (150, 140, 120), 2, cv2.LINE_AA)
-
         return frame
 
 
@@ -440,7 +434,7 @@ class Modes001_050(BaseModeVisualizer):
         points = np.array(points, dtype=np.int32)
 
         # Draw multiple layers for depth and glow
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Outer glow layers (purple to pink gradient)
         for layer in range(5, 0, -1):
@@ -463,8 +457,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = 140 + layer * 5 + int(avg_magnitude * 20)  # Purple-pink range
             saturation = 200 + int(avg_magnitude * 55)
             value = 100 + int(avg_magnitude * 100) - layer * 15
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             alpha = 0.3 / layer
@@ -476,8 +469,7 @@ class Modes001_050(BaseModeVisualizer):
         hue = 150 + int(avg_magnitude * 30)
         saturation = 220 + int(avg_magnitude * 35)
         value = 180 + int(avg_magnitude * 75)
-        color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-        color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+        color_bgr = hsv_pixel(hue, saturation, value)
         main_color = tuple(int(c) for c in color_bgr)
 
         cv2.fillPoly(frame, [points], main_color, lineType=cv2.LINE_AA)
@@ -520,8 +512,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = (petal_idx * 15 + self.frame_counter) % 180
             saturation = 100 + int(magnitude * 100)
             value = 200 + int(magnitude * 55)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             petal_color = tuple(int(c) for c in color_bgr)
 
             # Draw petal as rotated ellipse
@@ -539,7 +530,7 @@ class Modes001_050(BaseModeVisualizer):
                        angle_deg, 0, 360, (255, 255, 255), 1, lineType=cv2.LINE_AA)
 
         # Draw flower center
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         center_radius = int(30 + avg_magnitude * 50)
         cv2.circle(frame, (self.center_x, self.center_y), center_radius,
                   (50, 200, 255), -1, lineType=cv2.LINE_AA)
@@ -620,8 +611,8 @@ class Modes001_050(BaseModeVisualizer):
                 magnitude = magnitudes[i]
                 if magnitude > 0.3:
                     # Random spawn position
-                    x = np.random.randint(0, self.width)
-                    y = np.random.randint(self.height // 3, 2 * self.height // 3)
+                    x = self.rng.integers(0, self.width)
+                    y = self.rng.integers(self.height // 3, 2 * self.height // 3)
 
                     # Pixel block size
                     pixel_size = 8 if magnitude < 0.6 else 12
@@ -638,8 +629,8 @@ class Modes001_050(BaseModeVisualizer):
 
                     self.pixel_clouds.append({
                         'x': x, 'y': y,
-                        'vx': np.random.uniform(-1, 1),
-                        'vy': np.random.uniform(-0.5, -2),  # Float upward
+                        'vx': self.rng.uniform(-1, 1),
+                        'vy': self.rng.uniform(-0.5, -2),  # Float upward
                         'size': pixel_size,
                         'color': color,
                         'life': 1.0
@@ -722,7 +713,7 @@ class Modes001_050(BaseModeVisualizer):
                     line_color, 3, lineType=cv2.LINE_AA)
 
         # Reflective highlights (white streaks)
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         if avg_magnitude > 0.5:
             for streak in range(5):
                 streak_x = int((streak / 5) * self.width)
@@ -738,25 +729,25 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_10_cosmic_dust(self, frame, magnitudes):
         """Mode 10: Swirling galaxy particles with trails (ambient lofi)"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn cosmic particles
         if self.frame_counter % 2 == 0:
             for i in range(int(avg_magnitude * 20 + 10)):
                 # Random angle for spiral
-                angle = np.random.random() * 2 * np.pi
-                distance = np.random.random() * self.max_radius * 0.3
+                angle = self.rng.random() * 2 * np.pi
+                distance = self.rng.random() * self.max_radius * 0.3
 
                 x = self.center_x + distance * np.cos(angle)
                 y = self.center_y + distance * np.sin(angle)
 
                 # Orbital velocity (perpendicular to radius)
-                orbital_speed = 0.5 + np.random.random() * 2
+                orbital_speed = 0.5 + self.rng.random() * 2
                 vx = -np.sin(angle) * orbital_speed
                 vy = np.cos(angle) * orbital_speed
 
                 # Colors: deep space (blues, purples, whites)
-                color_choice = np.random.random()
+                color_choice = self.rng.random()
                 if color_choice < 0.3:
                     color = (255, 200, 100)  # White-gold
                 elif color_choice < 0.6:
@@ -769,7 +760,7 @@ class Modes001_050(BaseModeVisualizer):
                     'vx': vx, 'vy': vy,
                     'color': color,
                     'life': 1.0,
-                    'size': 1 + int(np.random.random() * 3),
+                    'size': 1 + int(self.rng.random() * 3),
                     'trail': []
                 })
 
@@ -863,8 +854,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = int((string_idx / num_strings) * 180)
                 saturation = 200 + int(avg_mag * 55)
                 value = 150 + int(avg_mag * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw glowing string
@@ -877,62 +867,55 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_12_lava_lamp(self, frame, magnitudes):
         """Mode 12: Rising and morphing lava lamp blobs"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn new blobs
         if self.frame_counter % 20 == 0 or (avg_magnitude > 0.6 and self.frame_counter % 10 == 0):
-            blob_x = np.random.randint(int(self.width * 0.2), int(self.width * 0.8))
+            blob_x = self.rng.integers(int(self.width * 0.2), int(self.width * 0.8))
             blob_y = self.height + 50
             blob_size = 40 + int(avg_magnitude * 80)
 
             # Warm lava colors (red, orange, yellow)
-            hue = np.random.randint(0, 30)
+            hue = self.rng.integers(0, 30)
             self.lava_blobs.append({
                 'x': blob_x,
                 'y': blob_y,
                 'size': blob_size,
-                'speed': 0.5 + np.random.random() * 1.5,
-                'wobble': np.random.random() * 2 * np.pi,
+                'speed': 0.5 + self.rng.random() * 1.5,
+                'wobble': self.rng.random() * 2 * np.pi,
                 'hue': hue,
                 'life': 1.0
             })
 
-        # Update and draw blobs
+        # Update blobs
         new_blobs = []
         for blob in self.lava_blobs:
             blob['y'] -= blob['speed']
             blob['wobble'] += 0.05
             blob['life'] -= 0.002
 
-            # Horizontal wobble
-            wobble_x = np.sin(blob['wobble']) * 30
-            x = int(blob['x'] + wobble_x)
-            y = int(blob['y'])
-
-            if blob['life'] > 0 and y > -100:
-                # Size varies with wobble
-                current_size = int(blob['size'] * (1 + np.sin(blob['wobble'] * 2) * 0.2))
+            if blob['life'] > 0 and int(blob['y']) > -100:
+                new_blobs.append(blob)
 
-                # Draw blob with multiple layers for depth
-                for layer in range(3, 0, -1):
-                    layer_size = int(current_size * (1 + layer * 0.2))
-                    alpha = blob['life'] * (0.3 / layer)
+        self.lava_blobs = new_blobs
+        if not new_blobs:
+            return frame
 
-                    saturation = 200 + int(alpha * 55)
-                    value = 150 + int(alpha * 105)
-                    color_hsv = np.array([[[blob['hue'], saturation, value]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-                    color = tuple(int(c * alpha) for c in color_bgr)
+        # Horizontal wobble; size varies with wobble
+        wobble = np.array([blob['wobble'] for blob in new_blobs])
+        x = np.array([blob['x'] for blob in new_blobs]) + np.sin(wobble) * 30
+        y = np.array([blob['y'] for blob in new_blobs])
+        size = np.array([blob['size'] for blob in new_blobs]) * (1 + np.sin(wobble * 2) * 0.2)
+        life = np.array([blob['life'] for blob in new_blobs])
+        hue = np.array([blob['hue'] for blob in new_blobs])
 
-                    cv2.circle(frame, (x, y), layer_size, color, -1, lineType=cv2.LINE_AA)
+        # Glowing bodies that merge as they pass each other, fading with life
+        colors = hsv_to_bgr_array(hue, 200 + np.trunc(life * 55), 150 + np.trunc(life * 105)) * life[:, None]
+        metaballs.render_metaballs(frame, x, y, size * 1.2, colors, glow=0.3)
 
-                # Bright core
-                core_color = (100, 180, 255)
-                cv2.circle(frame, (x, y), int(current_size * 0.6), core_color, -1, lineType=cv2.LINE_AA)
+        # Bright cores
+        metaballs.render_metaballs(frame, x, y, size * 0.6, (100, 180, 255))
 
-                new_blobs.append(blob)
-
-        self.lava_blobs = new_blobs
         return frame
 
 
@@ -983,8 +966,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = 90 + int(mag * 50)
             saturation = 200 + int(mag * 55)
             value = 150 + int(mag * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             cv2.line(frame, tuple(p1), tuple(p2), color, 2, lineType=cv2.LINE_AA)
@@ -1007,7 +989,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_14_lightning_strikes(self, frame, magnitudes):
         """Mode 14: Electric lightning bolts connecting peaks - AGGRESSIVE VERSION"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Find peaks in magnitudes - MUCH LOWER THRESHOLD
         peaks = []
@@ -1020,7 +1002,7 @@ class Modes001_050(BaseModeVisualizer):
         # Generate lightning between peaks - MUCH MORE SENSITIVE
         if avg_magnitude > 0.15 and len(peaks) >= 2:  # Lowered from 0.4 to 0.15
             for i in range(0, len(peaks) - 1):
-                if np.random.random() < 0.8:  # Increased from 0.3 to 0.8 (80% chance)
+                if self.rng.random() < 0.8:  # Increased from 0.3 to 0.8 (80% chance)
                     start = peaks[i]
                     end = peaks[i + 1]
 
@@ -1034,8 +1016,8 @@ class Modes001_050(BaseModeVisualizer):
                         base_y = int(start[1] + (end[1] - start[1]) * t)
 
                         # Add randomness
-                        offset_x = np.random.randint(-30, 30)
-                        offset_y = np.random.randint(-30, 30)
+                        offset_x = self.rng.integers(-30, 30)
+                        offset_y = self.rng.integers(-30, 30)
 
                         lightning_points.append([base_x + offset_x, base_y + offset_y])
 
@@ -1060,7 +1042,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_15_morphing_geometry(self, frame, magnitudes):
         """Mode 15: 3D wireframe shapes that morph"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Calculate vertices for a morphing polyhedron
         num_vertices = 8
@@ -1108,8 +1090,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = int((edge_idx / len(edge_pairs)) * 180 + self.frame_counter) % 180
                 saturation = 220
                 value = 200 + int(avg_magnitude * 55)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 cv2.line(frame, p1, p2, color, 3, lineType=cv2.LINE_AA)
@@ -1124,20 +1105,20 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_16_ink_drops(self, frame, magnitudes):
         """Mode 16: Organic ink dispersing in water"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn ink drops
         if avg_magnitude > 0.4 and self.frame_counter % 15 == 0:
-            drop_x = np.random.randint(int(self.width * 0.3), int(self.width * 0.7))
-            drop_y = np.random.randint(int(self.height * 0.3), int(self.height * 0.7))
+            drop_x = self.rng.integers(int(self.width * 0.3), int(self.width * 0.7))
+            drop_y = self.rng.integers(int(self.height * 0.3), int(self.height * 0.7))
 
             # Spawn many particles for each drop
             for i in range(int(avg_magnitude * 150 + 50)):
-                angle = np.random.random() * 2 * np.pi
-                speed = np.random.random() * 3
+                angle = self.rng.random() * 2 * np.pi
+                speed = self.rng.random() * 3
 
                 # Ink colors (black, dark blue, purple)
-                color_choice = np.random.random()
+                color_choice = self.rng.random()
                 if color_choice < 0.4:
                     color = (180, 120, 80)  # Dark blue
                 elif color_choice < 0.7:
@@ -1152,7 +1133,7 @@ class Modes001_050(BaseModeVisualizer):
                     'vy': np.sin(angle) * speed,
                     'color': color,
                     'life': 1.0,
-                    'size': 2 + int(np.random.random() * 6)
+                    'size': 2 + int(self.rng.random() * 6)
                 })
 
         # Update and draw ink particles
@@ -1222,10 +1203,9 @@ class Modes001_050(BaseModeVisualizer):
 
                 # Aurora colors (green, blue, purple gradient)
                 hue = int(100 + ribbon_idx * 15 + self.frame_counter * 0.5) % 180
-                saturation = 180 + int(np.mean(magnitudes) * 75)
-                value = 120 + int(np.mean(magnitudes) * 100)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                saturation = 180 + int(self.get_energy(magnitudes) * 75)
+                value = 120 + int(self.get_energy(magnitudes) * 100)
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c * 0.6) for c in color_bgr)
 
                 # Draw semi-transparent ribbon
@@ -1240,7 +1220,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_18_fractal_bloom(self, frame, magnitudes):
         """Mode 18: Self-similar fractal patterns"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Draw multiple layers of fractals from center
         num_layers = 6
@@ -1276,8 +1256,7 @@ class Modes001_050(BaseModeVisualizer):
                     hue = int((layer / num_layers) * 180 + magnitude * 40)
                     saturation = 200 + int(magnitude * 55)
                     value = 150 + int(magnitude * 105)
-                    color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color_bgr = hsv_pixel(hue, saturation, value)
                     color = tuple(int(c) for c in color_bgr)
 
                     thickness = max(1, 4 - layer)
@@ -1294,24 +1273,24 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_19_plasma_storm(self, frame, magnitudes):
         """Mode 19: Swirling plasma vortex with tendrils"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn plasma tendrils
         if self.frame_counter % 3 == 0:
             for i in range(int(avg_magnitude * 5 + 2)):
-                angle = np.random.random() * 2 * np.pi
-                distance = np.random.random() * 50
+                angle = self.rng.random() * 2 * np.pi
+                distance = self.rng.random() * 50
 
                 tendril_x = self.center_x + np.cos(angle) * distance
                 tendril_y = self.center_y + np.sin(angle) * distance
 
                 # Spiral outward velocity
-                speed = 2 + np.random.random() * 4
+                speed = 2 + self.rng.random() * 4
                 vx = np.cos(angle) * speed
                 vy = np.sin(angle) * speed
 
                 # Plasma colors (purple, cyan, magenta)
-                hue = np.random.choice([130, 160, 90])
+                hue = self.rng.choice([130, 160, 90])
 
                 self.plasma_tendrils.append({
                     'x': tendril_x,
@@ -1359,8 +1338,7 @@ class Modes001_050(BaseModeVisualizer):
 
                         saturation = 220
                         value = int(150 + trail_alpha * 105)
-                        color_hsv = np.array([[[tendril['hue'], saturation, value]]], dtype=np.uint8)
-                        color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                        color_bgr = hsv_pixel(tendril['hue'], saturation, value)
                         color = tuple(int(c * trail_alpha) for c in color_bgr)
 
                         thickness = max(1, int(3 * trail_alpha))
@@ -1382,28 +1360,28 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_20_crystal_growth(self, frame, magnitudes):
         """Mode 20: Geometric crystals forming and shattering - AGGRESSIVE VERSION"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn crystals MUCH MORE FREQUENTLY on any audio activity
         if avg_magnitude > 0.15 and self.frame_counter % 3 == 0:  # Lowered from 0.5 to 0.15, every 3 frames instead of 10
             num_crystals = 5 + int(avg_magnitude * 8)  # 5-13 crystals (was fixed at 3)
             for i in range(num_crystals):
                 # Spawn across entire screen
-                crystal_x = self.center_x + np.random.randint(-400, 400)
-                crystal_y = self.center_y + np.random.randint(-300, 300)
+                crystal_x = self.center_x + self.rng.integers(-400, 400)
+                crystal_y = self.center_y + self.rng.integers(-300, 300)
 
-                num_sides = np.random.choice([5, 6, 7, 8, 10, 12])  # More variety
+                num_sides = self.rng.choice([5, 6, 7, 8, 10, 12])  # More variety
                 size = 30 + int(avg_magnitude * 80)  # Larger crystals
 
                 # Crystal colors (ice blue, white, cyan, purple)
-                hue = np.random.choice([90, 100, 110, 120, 130])  # More color variety
+                hue = self.rng.choice([90, 100, 110, 120, 130])  # More color variety
 
                 self.crystals.append({
                     'x': crystal_x,
                     'y': crystal_y,
                     'size': size,
                     'sides': num_sides,
-                    'rotation': np.random.random() * 360,
+                    'rotation': self.rng.random() * 360,
                     'growth': 0.0,
                     'hue': hue,
                     'life': 1.0
@@ -1432,8 +1410,7 @@ class Modes001_050(BaseModeVisualizer):
                 # Color with transparency effect
                 saturation = 150 + int(crystal['life'] * 105)
                 value = 200 + int(crystal['life'] * 55)
-                color_hsv = np.array([[[crystal['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(crystal['hue'], saturation, value)
                 color = tuple(int(c * crystal['life']) for c in color_bgr)
 
                 # Draw crystal
@@ -1452,7 +1429,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_21_gravitational_lens(self, frame, magnitudes):
         """Mode 21: Spacetime warping and bending light"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Create grid of light sources that get warped by "gravity"
         grid_size = 40
@@ -1492,13 +1469,13 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_22_magnetic_fields(self, frame, magnitudes):
         """Mode 22: Iron filing patterns flowing with music"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn magnetic particles
         if self.frame_counter % 2 == 0:
             for i in range(int(avg_magnitude * 30 + 10)):
-                particle_x = np.random.randint(0, self.width)
-                particle_y = np.random.randint(0, self.height)
+                particle_x = self.rng.integers(0, self.width)
+                particle_y = self.rng.integers(0, self.height)
 
                 self.magnetic_particles.append({
                     'x': particle_x,
@@ -1557,7 +1534,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_23_tribal_drums(self, frame, magnitudes):
         """Mode 23: Concentric shockwaves with ethnic patterns"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Generate shockwaves on strong beats
         if avg_magnitude > 0.5 and self.frame_counter % 8 == 0:
@@ -1583,8 +1560,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = 10 + int(wave['magnitude'] * 20)
                 saturation = 200 + int(wave['magnitude'] * 55)
                 value = 150 + int(wave['magnitude'] * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c * alpha) for c in color_bgr)
 
                 cv2.circle(frame, (self.center_x, self.center_y),
@@ -1619,9 +1595,9 @@ class Modes001_050(BaseModeVisualizer):
             for i in range(40):
                 self.cityscape_buildings.append({
                     'x': i * 50,
-                    'width': 40 + np.random.randint(0, 30),
-                    'base_height': 100 + np.random.randint(0, 300),
-                    'windows': np.random.randint(3, 8)
+                    'width': 40 + self.rng.integers(0, 30),
+                    'base_height': 100 + self.rng.integers(0, 300),
+                    'windows': self.rng.integers(3, 8)
                 })
 
         # Scroll buildings
@@ -1629,8 +1605,8 @@ class Modes001_050(BaseModeVisualizer):
             building['x'] -= 2
             if building['x'] < -50:
                 building['x'] = self.width + 50
-                building['width'] = 40 + np.random.randint(0, 30)
-                building['base_height'] = 100 + np.random.randint(0, 300)
+                building['width'] = 40 + self.rng.integers(0, 30)
+                building['base_height'] = 100 + self.rng.integers(0, 300)
 
         # Draw buildings
         for i, building in enumerate(self.cityscape_buildings):
@@ -1645,8 +1621,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = (i * 30 + self.frame_counter) % 180
             saturation = 220 + int(magnitude * 35)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             # Draw building
@@ -1671,7 +1646,7 @@ class Modes001_050(BaseModeVisualizer):
     def draw_mode_25_heartbeat_monitor(self, frame, magnitudes):
         """Mode 25: Medical monitor with vital signs"""
         # Add current average magnitude to history
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         self.heartbeat_history.append(avg_magnitude)
         if len(self.heartbeat_history) > 200:
             self.heartbeat_history.pop(0)
@@ -1682,23 +1657,28 @@ class Modes001_050(BaseModeVisualizer):
         monitor_width = self.width - 100
         monitor_height = 300
 
-        # Dark monitor background
-        cv2.rectangle(frame, (monitor_x, monitor_y),
-                     (monitor_x + monitor_width, monitor_y + monitor_height),
-                     (20, 30, 20), -1, lineType=cv2.LINE_AA)
-        cv2.rectangle(frame, (monitor_x, monitor_y),
-                     (monitor_x + monitor_width, monitor_y + monitor_height),
-                     (0, 150, 0), 2, lineType=cv2.LINE_AA)
-
-        # Draw grid
-        for i in range(0, monitor_width, 30):
-            cv2.line(frame, (monitor_x + i, monitor_y),
-                    (monitor_x + i, monitor_y + monitor_height),
-                    (0, 50, 0), 1, lineType=cv2.LINE_AA)
-        for i in range(0, monitor_height, 30):
-            cv2.line(frame, (monitor_x, monitor_y + i),
-                    (monitor_x + monitor_width, monitor_y + i),
-                    (0, 50, 0), 1, lineType=cv2.LINE_AA)
+        def draw_monitor(canvas):
+            # Dark monitor background
+            cv2.rectangle(canvas, (monitor_x, monitor_y),
+                         (monitor_x + monitor_width, monitor_y + monitor_height),
+                         (20, 30, 20), -1, lineType=cv2.LINE_AA)
+            cv2.rectangle(canvas, (monitor_x, monitor_y),
+                         (monitor_x + monitor_width, monitor_y + monitor_height),
+                         (0, 150, 0), 2, lineType=cv2.LINE_AA)
+
+            # Draw grid
+            for i in range(0, monitor_width, 30):
+                cv2.line(canvas, (monitor_x + i, monitor_y),
+                        (monitor_x + i, monitor_y + monitor_height),
+                        (0, 50, 0), 1, lineType=cv2.LINE_AA)
+            for i in range(0, monitor_height, 30):
+                cv2.line(canvas, (monitor_x, monitor_y + i),
+                        (monitor_x + monitor_width, monitor_y + i),
+                        (0, 50, 0), 1, lineType=cv2.LINE_AA)
+
+        # Monitor and grid are static: rasterized once per geometry
+        self.cached_layer('heartbeat_monitor', (monitor_x, monitor_y, monitor_width, monitor_height),
+                          draw_monitor).composite(frame)
 
         # Draw heartbeat waveform
         if len(self.heartbeat_history) > 1:
@@ -1728,22 +1708,22 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_26_ocean_depths(self, frame, magnitudes):
         """Mode 26: Deep sea bioluminescent creatures"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn bioluminescent creatures
         if self.frame_counter % 10 == 0 and avg_magnitude > 0.3:
-            creature_x = np.random.randint(0, self.width)
-            creature_y = np.random.randint(0, self.height)
+            creature_x = self.rng.integers(0, self.width)
+            creature_y = self.rng.integers(0, self.height)
 
             self.bioluminescent_creatures.append({
                 'x': creature_x,
                 'y': creature_y,
-                'vx': np.random.uniform(-2, 2),
-                'vy': np.random.uniform(-1, 1),
+                'vx': self.rng.uniform(-2, 2),
+                'vy': self.rng.uniform(-1, 1),
                 'size': 10 + int(avg_magnitude * 30),
                 'tentacles': 5 + int(avg_magnitude * 10),
                 'life': 1.0,
-                'phase': np.random.random() * 2 * np.pi
+                'phase': self.rng.random() * 2 * np.pi
             })
 
         # Update and draw creatures
@@ -1790,22 +1770,22 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_27_fire_dance(self, frame, magnitudes):
         """Mode 27: Realistic flames dancing to rhythm"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn fire particles from bottom
         if self.frame_counter % 2 == 0:
             num_particles = int(20 + avg_magnitude * 50)
             for i in range(num_particles):
-                fire_x = self.center_x + np.random.randint(-150, 150)
+                fire_x = self.center_x + self.rng.integers(-150, 150)
                 fire_y = self.height - 50
 
                 self.fire_particles.append({
                     'x': fire_x,
                     'y': fire_y,
-                    'vx': np.random.uniform(-1, 1),
-                    'vy': -3 - np.random.random() * avg_magnitude * 8,
+                    'vx': self.rng.uniform(-1, 1),
+                    'vy': -3 - self.rng.random() * avg_magnitude * 8,
                     'life': 1.0,
-                    'size': 3 + int(np.random.random() * 8)
+                    'size': 3 + int(self.rng.random() * 8)
                 })
 
         # Update and draw fire
@@ -1814,7 +1794,7 @@ class Modes001_050(BaseModeVisualizer):
             particle['x'] += particle['vx']
             particle['y'] += particle['vy']
             particle['vy'] += 0.1  # Slight upward curve
-            particle['vx'] += np.random.uniform(-0.2, 0.2)
+            particle['vx'] += self.rng.uniform(-0.2, 0.2)
             particle['life'] -= 0.015
 
             if particle['life'] > 0 and particle['y'] > 0:
@@ -1851,15 +1831,15 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_28_particle_collider(self, frame, magnitudes):
         """Mode 28: High-energy physics collision visualization"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Create particle collision on strong beats
         if avg_magnitude > 0.6 and self.frame_counter % 15 == 0:
             # Spawn particles from collision at center
             num_particles = int(50 + avg_magnitude * 100)
             for i in range(num_particles):
-                angle = np.random.random() * 2 * np.pi
-                speed = 5 + np.random.random() * 15
+                angle = self.rng.random() * 2 * np.pi
+                speed = 5 + self.rng.random() * 15
 
                 self.collision_particles.append({
                     'x': self.center_x,
@@ -1867,7 +1847,7 @@ class Modes001_050(BaseModeVisualizer):
                     'vx': np.cos(angle) * speed,
                     'vy': np.sin(angle) * speed,
                     'life': 1.0,
-                    'charge': np.random.choice([-1, 1]),
+                    'charge': self.rng.choice([-1, 1]),
                     'trail': []
                 })
 
@@ -1919,7 +1899,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_29_rainbow_prism(self, frame, magnitudes):
         """Mode 29: Light refraction through rotating prism"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         self.prism_rotation += 1 + avg_magnitude * 3
 
         # Draw prism (triangle) at center
@@ -1959,8 +1939,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = int((i / num_beams) * 180)
                 saturation = 255
                 value = 200 + int(magnitude * 55)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw beam with glow
@@ -1976,7 +1955,7 @@ class Modes001_050(BaseModeVisualizer):
     def draw_mode_30_seismic_waves(self, frame, magnitudes):
         """Mode 30: Earthquake seismograph readings"""
         # Add current magnitudes to seismic history
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         self.seismic_readings.append(magnitudes.copy())
         if len(self.seismic_readings) > 150:
             self.seismic_readings.pop(0)
@@ -2040,7 +2019,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_31_origami_unfold(self, frame, magnitudes):
         """Mode 31: Paper folding and unfolding geometrically"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Create origami crane-like shape that unfolds with music
         num_segments = 8
@@ -2074,8 +2053,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = int(seg_idx * 22.5) % 180
             saturation = int(magnitude * 150)
             value = 220 + int(magnitude * 35)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             cv2.fillPoly(frame, [points], color, lineType=cv2.LINE_AA)
@@ -2086,17 +2064,17 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_32_storm_clouds(self, frame, magnitudes):
         """Mode 32: Thunder and lightning in swirling clouds"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn storm particles
         if self.frame_counter % 3 == 0:
             for i in range(int(avg_magnitude * 20 + 10)):
                 self.storm_particles.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height // 2),
-                    'vx': np.random.uniform(-2, 2),
-                    'vy': np.random.uniform(0.5, 2),
-                    'size': 15 + int(np.random.random() * 40),
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height // 2),
+                    'vx': self.rng.uniform(-2, 2),
+                    'vy': self.rng.uniform(0.5, 2),
+                    'size': 15 + int(self.rng.random() * 40),
                     'life': 1.0
                 })
 
@@ -2120,9 +2098,9 @@ class Modes001_050(BaseModeVisualizer):
         self.storm_particles = new_particles
 
         # Lightning strikes on strong beats
-        if avg_magnitude > 0.7 and np.random.random() < 0.3:
+        if avg_magnitude > 0.7 and self.rng.random() < 0.3:
             # Random lightning bolt
-            strike_x = np.random.randint(100, self.width - 100)
+            strike_x = self.rng.integers(100, self.width - 100)
             strike_y_start = 50
             strike_y_end = self.height - 50
 
@@ -2130,7 +2108,7 @@ class Modes001_050(BaseModeVisualizer):
             lightning_points = [[strike_x, strike_y_start]]
             current_x = strike_x
             for y in range(strike_y_start, strike_y_end, 40):
-                current_x += np.random.randint(-50, 50)
+                current_x += self.rng.integers(-50, 50)
                 lightning_points.append([current_x, y])
             lightning_points.append([current_x, strike_y_end])
 
@@ -2150,10 +2128,10 @@ class Modes001_050(BaseModeVisualizer):
             for i in range(50):
                 self.matrix_columns.append({
                     'x': i * (self.width // 50),
-                    'y': np.random.randint(-500, 0),
-                    'speed': 5 + np.random.randint(0, 15),
-                    'length': 10 + np.random.randint(0, 30),
-                    'chars': [np.random.choice(['0', '1']) for _ in range(40)]
+                    'y': self.rng.integers(-500, 0),
+                    'speed': 5 + self.rng.integers(0, 15),
+                    'length': 10 + self.rng.integers(0, 30),
+                    'chars': [self.rng.choice(['0', '1']) for _ in range(40)]
                 })
 
         # Update and draw columns
@@ -2166,7 +2144,7 @@ class Modes001_050(BaseModeVisualizer):
 
             if column['y'] > self.height + 100:
                 column['y'] = -500
-                column['chars'] = [np.random.choice(['0', '1']) for _ in range(40)]
+                column['chars'] = [self.rng.choice(['0', '1']) for _ in range(40)]
 
             # Draw characters
             for char_idx in range(column['length']):
@@ -2186,12 +2164,12 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_34_kaleidoscope(self, frame, magnitudes):
         """Mode 34: Symmetric mirrored patterns"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         self.kaleidoscope_rotation += 0.5 + avg_magnitude * 2
 
-        # Number of symmetry sections
-        num_sections = 8
-        section_angle = 360 / num_sections
+        # 8 symmetry sections composed from one drawn wedge
+        kaleido = self.kaleidoscope_sections
+        section_angle = np.rad2deg(kaleido.wedge)
 
         # Create base pattern in one section
         pattern_elements = []
@@ -2209,32 +2187,32 @@ class Modes001_050(BaseModeVisualizer):
                     'hue': int((i / 20) * 180)
                 })
 
-        # Mirror pattern across all sections
-        for section in range(num_sections):
-            section_rotation = section * section_angle + self.kaleidoscope_rotation
-
+        # Reaches the outer ring of the largest elements
+        canvas = kaleido.canvas(380)
+        center_x, center_y = kaleido.center
+        for rotation in kaleido.copies(np.deg2rad(self.kaleidoscope_rotation)):
             for elem in pattern_elements:
-                total_angle = section_rotation + elem['angle']
-                x = int(self.center_x + np.cos(np.deg2rad(total_angle)) * elem['radius'])
-                y = int(self.center_y + np.sin(np.deg2rad(total_angle)) * elem['radius'])
+                total_angle = rotation + np.deg2rad(elem['angle'])
+                x = int(center_x + np.cos(total_angle) * elem['radius'])
+                y = int(center_y + np.sin(total_angle) * elem['radius'])
 
                 # Color
-                saturation = 255
-                value = 255
-                color_hsv = np.array([[[elem['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(elem['hue'], 255, 255)
                 color = tuple(int(c) for c in color_bgr)
 
-                cv2.circle(frame, (x, y), elem['size'], color, -1, lineType=cv2.LINE_AA)
-                cv2.circle(frame, (x, y), elem['size'] + 3,
+                cv2.circle(canvas, (x, y), elem['size'], color, -1, lineType=cv2.LINE_AA)
+                cv2.circle(canvas, (x, y), elem['size'] + 3,
                           tuple(int(c * 0.5) for c in color), 1, lineType=cv2.LINE_AA)
 
+        # Mirror pattern across all sections
+        kaleido.compose(frame, (self.center_x, self.center_y))
+
         return frame
 
 
     def draw_mode_35_laser_show(self, frame, magnitudes):
         """Mode 35: Concert laser beams and spotlights"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Update laser beams based on frequencies
         self.laser_beams = []
@@ -2261,8 +2239,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = (i * 30 + self.frame_counter) % 180
                 saturation = 255
                 value = 200 + int(magnitude * 55)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 self.laser_beams.append({
@@ -2297,18 +2274,18 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_36_sandstorm(self, frame, magnitudes):
         """Mode 36: Desert sand particles in wind vortex"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn sand particles
         if self.frame_counter % 2 == 0:
             for i in range(int(30 + avg_magnitude * 70)):
                 self.sand_particles.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
-                    'vx': np.random.uniform(-5, 5),
-                    'vy': np.random.uniform(-3, 3),
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
+                    'vx': self.rng.uniform(-5, 5),
+                    'vy': self.rng.uniform(-3, 3),
                     'life': 1.0,
-                    'size': 1 + int(np.random.random() * 3)
+                    'size': 1 + int(self.rng.random() * 3)
                 })
 
         # Vortex center moves with music
@@ -2372,13 +2349,13 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_37_ice_shatter(self, frame, magnitudes):
         """Mode 37: Cracking and breaking ice surface"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Create crack on strong beats
         if avg_magnitude > 0.6 and self.frame_counter % 20 == 0:
             # Start crack from random point
-            crack_start_x = np.random.randint(200, self.width - 200)
-            crack_start_y = np.random.randint(200, self.height - 200)
+            crack_start_x = self.rng.integers(200, self.width - 200)
+            crack_start_y = self.rng.integers(200, self.height - 200)
 
             crack = {
                 'segments': [[crack_start_x, crack_start_y]],
@@ -2389,15 +2366,15 @@ class Modes001_050(BaseModeVisualizer):
             # Generate crack segments
             current_x, current_y = crack_start_x, crack_start_y
             for seg in range(10):
-                angle = np.random.uniform(0, 2 * np.pi)
-                length = 30 + np.random.random() * 60
+                angle = self.rng.uniform(0, 2 * np.pi)
+                length = 30 + self.rng.random() * 60
                 current_x += int(np.cos(angle) * length)
                 current_y += int(np.sin(angle) * length)
                 crack['segments'].append([current_x, current_y])
 
                 # Random branches
-                if np.random.random() < 0.4:
-                    branch_angle = angle + np.random.uniform(-np.pi/2, np.pi/2)
+                if self.rng.random() < 0.4:
+                    branch_angle = angle + self.rng.uniform(-np.pi/2, np.pi/2)
                     branch_x = current_x
                     branch_y = current_y
                     branch_points = [[branch_x, branch_y]]
@@ -2436,8 +2413,8 @@ class Modes001_050(BaseModeVisualizer):
 
         # Ice surface shimmer
         for i in range(20):
-            shimmer_x = np.random.randint(0, self.width)
-            shimmer_y = np.random.randint(0, self.height)
+            shimmer_x = self.rng.integers(0, self.width)
+            shimmer_y = self.rng.integers(0, self.height)
             cv2.circle(frame, (shimmer_x, shimmer_y), 2,
                       (220, 240, 255), -1, lineType=cv2.LINE_AA)
 
@@ -2446,18 +2423,18 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_38_cellular_division(self, frame, magnitudes):
         """Mode 38: Organic cells splitting and multiplying"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Initialize cells if empty
         if len(self.cells) == 0:
             for i in range(5):
                 self.cells.append({
-                    'x': np.random.randint(100, self.width - 100),
-                    'y': np.random.randint(100, self.height - 100),
-                    'size': 40 + np.random.randint(0, 40),
+                    'x': self.rng.integers(100, self.width - 100),
+                    'y': self.rng.integers(100, self.height - 100),
+                    'size': 40 + self.rng.integers(0, 40),
                     'life': 1.0,
                     'division_timer': 0,
-                    'hue': np.random.randint(0, 180)
+                    'hue': self.rng.integers(0, 180)
                 })
 
         # Update cells
@@ -2470,7 +2447,7 @@ class Modes001_050(BaseModeVisualizer):
             if cell['division_timer'] > 100 and cell['life'] > 0.5 and len(self.cells) < 20:
                 # Create two daughter cells
                 for i in range(2):
-                    angle = np.random.random() * 2 * np.pi
+                    angle = self.rng.random() * 2 * np.pi
                     offset = 30
                     new_cells.append({
                         'x': cell['x'] + np.cos(angle) * offset,
@@ -2478,7 +2455,7 @@ class Modes001_050(BaseModeVisualizer):
                         'size': cell['size'] * 0.7,
                         'life': 1.0,
                         'division_timer': 0,
-                        'hue': (cell['hue'] + np.random.randint(-10, 10)) % 180
+                        'hue': (cell['hue'] + self.rng.integers(-10, 10)) % 180
                     })
                 cell['life'] = 0  # Parent cell dies
 
@@ -2490,8 +2467,7 @@ class Modes001_050(BaseModeVisualizer):
                 # Cell color
                 saturation = 180 + int(cell['life'] * 75)
                 value = 150 + int(cell['life'] * 105)
-                color_hsv = np.array([[[cell['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(cell['hue'], saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw cell
@@ -2539,8 +2515,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = (tube_idx * 25 + self.frame_counter) % 180
                 saturation = 255
                 value = 180 + int(magnitude * 75)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Tube thickness based on magnitude
@@ -2558,7 +2533,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_40_cosmic_strings(self, frame, magnitudes):
         """Mode 40: Universe-scale energy strings vibrating"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Draw cosmic string network
         num_strings = 6
@@ -2601,8 +2576,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = 120 + int(magnitude * 40)
             saturation = 200 + int(magnitude * 55)
             value = 180 + int(magnitude * 75)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             # Draw string with energy glow
@@ -2616,22 +2590,22 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_41_paint_splatter(self, frame, magnitudes):
         """Mode 41: Jackson Pollock drip painting style"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Create paint splatters on strong beats
         if avg_magnitude > 0.4 and self.frame_counter % 5 == 0:
             for i in range(int(avg_magnitude * 15 + 5)):
-                splatter_x = np.random.randint(0, self.width)
-                splatter_y = np.random.randint(0, self.height)
+                splatter_x = self.rng.integers(0, self.width)
+                splatter_y = self.rng.integers(0, self.height)
 
                 # Paint drips from splatter point
                 num_drips = int(10 + avg_magnitude * 30)
                 for drip in range(num_drips):
-                    angle = np.random.random() * 2 * np.pi
-                    speed = np.random.random() * 8
+                    angle = self.rng.random() * 2 * np.pi
+                    speed = self.rng.random() * 8
 
                     # Random vibrant colors
-                    hue = np.random.randint(0, 180)
+                    hue = self.rng.integers(0, 180)
 
                     self.paint_splatters.append({
                         'x': splatter_x,
@@ -2640,7 +2614,7 @@ class Modes001_050(BaseModeVisualizer):
                         'vy': np.sin(angle) * speed + 2,  # Gravity
                         'hue': hue,
                         'life': 1.0,
-                        'size': 2 + int(np.random.random() * 6),
+                        'size': 2 + int(self.rng.random() * 6),
                         'trail': []
                     })
 
@@ -2661,8 +2635,7 @@ class Modes001_050(BaseModeVisualizer):
 
                 saturation = 220 + int(alpha * 35)
                 value = 180 + int(alpha * 75)
-                color_hsv = np.array([[[paint['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(paint['hue'], saturation, value)
                 color = tuple(int(c * alpha) for c in color_bgr)
 
                 # Draw trail
@@ -2681,18 +2654,18 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_42_quantum_foam(self, frame, magnitudes):
         """Mode 42: Bubbling spacetime at quantum scale"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn quantum bubbles
         if self.frame_counter % 2 == 0:
             for i in range(int(avg_magnitude * 25 + 10)):
                 self.quantum_bubbles.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
-                    'size': 5 + int(np.random.random() * 25),
-                    'growth': np.random.uniform(0.5, 1.5),
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
+                    'size': 5 + int(self.rng.random() * 25),
+                    'growth': self.rng.uniform(0.5, 1.5),
                     'life': 1.0,
-                    'phase': np.random.random() * 2 * np.pi
+                    'phase': self.rng.random() * 2 * np.pi
                 })
 
         # Update bubbles
@@ -2709,8 +2682,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = int((bubble['phase'] * 30 + self.frame_counter) % 180)
                 saturation = 200 + int(alpha * 55)
                 value = 150 + int(alpha * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c * alpha * 0.6) for c in color_bgr)
 
                 # Draw bubble
@@ -2730,7 +2702,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_43_aztec_sun(self, frame, magnitudes):
         """Mode 43: Ancient Aztec calendar rotating and glowing"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         self.aztec_rotation += 0.5 + avg_magnitude * 2
 
         # Draw Aztec sun stone layers
@@ -2762,8 +2734,7 @@ class Modes001_050(BaseModeVisualizer):
             hue = 15 + int(avg_magnitude * 15)
             saturation = 180 + int(avg_magnitude * 75)
             value = 150 + int(avg_magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color_bgr = hsv_pixel(hue, saturation, value)
             color = tuple(int(c) for c in color_bgr)
 
             cv2.circle(frame, (self.center_x, self.center_y), radius,
@@ -2825,8 +2796,7 @@ class Modes001_050(BaseModeVisualizer):
                     hue = (fiber_idx * 30) % 180
                     saturation = 255
                     value = 200 + int(magnitude * 55)
-                    color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                    color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color_bgr = hsv_pixel(hue, saturation, value)
                     color = tuple(int(c) for c in color_bgr)
 
                     # Draw light pulse
@@ -2843,20 +2813,20 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_45_tornado_funnel(self, frame, magnitudes):
         """Mode 45: Swirling debris in tornado vortex"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn debris
         if self.frame_counter % 2 == 0:
             for i in range(int(avg_magnitude * 40 + 20)):
                 self.tornado_debris.append({
-                    'x': self.center_x + np.random.randint(-100, 100),
+                    'x': self.center_x + self.rng.integers(-100, 100),
                     'y': self.height,
-                    'angle': np.random.random() * 2 * np.pi,
+                    'angle': self.rng.random() * 2 * np.pi,
                     'height': 0,
-                    'rotation_speed': np.random.uniform(0.1, 0.3),
-                    'radius': 50 + np.random.random() * 200,
+                    'rotation_speed': self.rng.uniform(0.1, 0.3),
+                    'radius': 50 + self.rng.random() * 200,
                     'life': 1.0,
-                    'size': 3 + int(np.random.random() * 8)
+                    'size': 3 + int(self.rng.random() * 8)
                 })
 
         # Update debris
@@ -2909,16 +2879,16 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_46_hologram_glitch(self, frame, magnitudes):
         """Mode 46: Futuristic holographic projection errors"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Draw holographic grid
         grid_spacing = 50
         for x in range(0, self.width, grid_spacing):
             for y in range(0, self.height, grid_spacing):
                 # Glitch offset based on magnitude
-                if avg_magnitude > 0.5 and np.random.random() < avg_magnitude * 0.3:
-                    offset_x = np.random.randint(-20, 20)
-                    offset_y = np.random.randint(-20, 20)
+                if avg_magnitude > 0.5 and self.rng.random() < avg_magnitude * 0.3:
+                    offset_x = self.rng.integers(-20, 20)
+                    offset_y = self.rng.integers(-20, 20)
                 else:
                     offset_x = offset_y = 0
 
@@ -2933,8 +2903,8 @@ class Modes001_050(BaseModeVisualizer):
             bar_height = int(magnitude * self.height * 0.6)
 
             # Random glitch displacement
-            if avg_magnitude > 0.6 and np.random.random() < 0.2:
-                glitch_offset = np.random.randint(-30, 30)
+            if avg_magnitude > 0.6 and self.rng.random() < 0.2:
+                glitch_offset = self.rng.integers(-30, 30)
                 rgb_split = 15
             else:
                 glitch_offset = 0
@@ -2963,15 +2933,15 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_47_starfield_warp(self, frame, magnitudes):
         """Mode 47: Stars streaking during hyperspace jump"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn stars
         if len(self.stars) < 200:
             for i in range(5):
                 self.stars.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
-                    'z': np.random.uniform(0.1, 1.0),
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
+                    'z': self.rng.uniform(0.1, 1.0),
                     'trail': []
                 })
 
@@ -2998,9 +2968,9 @@ class Modes001_050(BaseModeVisualizer):
 
             # Reset if off screen
             if star['x'] < -100 or star['x'] > self.width + 100 or star['y'] < -100 or star['y'] > self.height + 100:
-                star['x'] = self.center_x + np.random.randint(-50, 50)
-                star['y'] = self.center_y + np.random.randint(-50, 50)
-                star['z'] = np.random.uniform(0.1, 1.0)
+                star['x'] = self.center_x + self.rng.integers(-50, 50)
+                star['y'] = self.center_y + self.rng.integers(-50, 50)
+                star['z'] = self.rng.uniform(0.1, 1.0)
                 star['trail'] = []
             else:
                 # Draw star trail (motion blur)
@@ -3029,7 +2999,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_48_mandala_growth(self, frame, magnitudes):
         """Mode 48: Sacred geometry mandala forming"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Draw mandala layers from center outward
         num_layers = 10
@@ -3059,8 +3029,7 @@ class Modes001_050(BaseModeVisualizer):
                 hue = int((layer_idx * 20 + elem_idx * 10 + self.frame_counter * 0.5) % 180)
                 saturation = 200 + int(layer_mag * 55)
                 value = 150 + int(layer_mag * 105)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(hue, saturation, value)
                 color = tuple(int(c) for c in color_bgr)
 
                 # Draw petal/element
@@ -3082,7 +3051,7 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_49_neon_sign_flicker(self, frame, magnitudes):
         """Mode 49: Vintage neon signs buzzing on/off"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Draw neon text that flickers
         signs = [
@@ -3099,8 +3068,8 @@ class Modes001_050(BaseModeVisualizer):
             # Flicker effect
             if magnitude > 0.7:
                 flicker = 1.0
-            elif np.random.random() < 0.1:
-                flicker = np.random.uniform(0.3, 1.0)
+            elif self.rng.random() < 0.1:
+                flicker = self.rng.uniform(0.3, 1.0)
             else:
                 flicker = 0.8 + magnitude * 0.2
 
@@ -3108,8 +3077,7 @@ class Modes001_050(BaseModeVisualizer):
                 # Neon color
                 saturation = 255
                 value = int(200 * flicker + magnitude * 55)
-                color_hsv = np.array([[[sign['hue'], saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(sign['hue'], saturation, value)
                 color = tuple(int(c * flicker) for c in color_bgr)
 
                 # Calculate text position (centered)
@@ -3131,13 +3099,13 @@ class Modes001_050(BaseModeVisualizer):
 
     def draw_mode_50_black_hole(self, frame, magnitudes):
         """Mode 50: Event horizon with gravitational lensing"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Spawn particles around black hole
         if self.frame_counter % 2 == 0:
             for i in range(int(avg_magnitude * 30 + 15)):
-                angle = np.random.random() * 2 * np.pi
-                distance = 400 + np.random.random() * 200
+                angle = self.rng.random() * 2 * np.pi
+                distance = 400 + self.rng.random() * 200
 
                 self.black_hole_particles.append({
                     'x': self.center_x + np.cos(angle) * distance,
@@ -3145,7 +3113,7 @@ class Modes001_050(BaseModeVisualizer):
                     'vx': 0,
                     'vy': 0,
                     'life': 1.0,
-                    'hue': int(np.random.random() * 180)
+                    'hue': int(self.rng.random() * 180)
                 })
 
         # Update particles (gravitational pull)
@@ -3185,8 +3153,7 @@ class Modes001_050(BaseModeVisualizer):
 
                 saturation = 220 + int(proximity * 35)
                 value = 150 + int(proximity * 105)
-                color_hsv = np.array([[[final_hue, saturation, value]]], dtype=np.uint8)
-                color_bgr = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color_bgr = hsv_pixel(final_hue, saturation, value)
                 color = tuple(int(c * alpha) for c in color_bgr)
 
                 # Size based on distance (gravitational lensing)
@@ -3,9 +3,13 @@ Audio Spectrum Visualization Modes 51-100
 Auto-generated from audio_spectrum_creative.py
 """
 from .base import BaseModeVisualizer
+from . import automaton, fields, metaballs, voronoi
+from .flocking import flock_step
 import numpy as np
 import cv2
 
+from color_lut import hsv_pixel, hsv_to_bgr_array
+
 
 class Modes051_100(BaseModeVisualizer):
     """Visualization modes 51 through 100"""
@@ -17,9 +21,9 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_51_fractal_tree(self, frame, magnitudes):
         """Mode 51: Generative tree that grows - branches on bass, blooms on treble"""
-        avg_magnitude = np.mean(magnitudes)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        avg_magnitude = self.get_energy(magnitudes)
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Main trunk sway
         trunk_sway = int(np.sin(self.frame_counter * 0.1 + avg_magnitude) * 20)
@@ -32,7 +36,7 @@ class Modes051_100(BaseModeVisualizer):
 
         # Spawn branches on bass hits
         if bass > 0.3 and self.frame_counter % 8 == 0:
-            angle = -np.pi/2 + (np.random.random() - 0.5) * np.pi/3
+            angle = -np.pi/2 + (self.rng.random() - 0.5) * np.pi/3
             self.fractal_tree_branches.append({
                 'x': trunk_top[0], 'y': trunk_top[1],
                 'angle': angle, 'length': 40 + bass * 60,
@@ -54,8 +58,7 @@ class Modes051_100(BaseModeVisualizer):
                 # Bloom flowers on treble
                 if treble > 0.4 and branch['generation'] > 0:
                     bloom_size = int(3 + treble * 10)
-                    bloom_color_hsv = np.array([[[int(treble * 180), 255, 255]]], dtype=np.uint8)
-                    bloom_color = cv2.cvtColor(bloom_color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    bloom_color = hsv_pixel(int(treble * 180), 255, 255)
                     cv2.circle(frame, (end_x, end_y), bloom_size, tuple(map(int, bloom_color * alpha)), -1, lineType=cv2.LINE_AA)
 
                 branch['life'] -= 0.003
@@ -84,8 +87,7 @@ class Modes051_100(BaseModeVisualizer):
             hue = int((i / num_blocks) * 180)
             saturation = 180 + int(magnitude * 75)
             value = 100 + int(magnitude * 155)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw building
             cv2.rectangle(frame, (x_left, base_y), (x_right, top_y), tuple(map(int, color)), -1)
@@ -104,14 +106,14 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_53_gravity_well(self, frame, magnitudes):
         """Mode 53: Particles pulled toward pulsing bass center, pushed by treble shockwaves"""
-        avg_magnitude = np.mean(magnitudes)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        avg_magnitude = self.get_energy(magnitudes)
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Spawn particles at edges
         if self.frame_counter % 2 == 0:
             for _ in range(int(treble * 20 + 5)):
-                angle = np.random.random() * 2 * np.pi
+                angle = self.rng.random() * 2 * np.pi
                 edge_dist = min(self.width, self.height) // 2
                 self.gravity_well_particles.append({
                     'x': self.center_x + np.cos(angle) * edge_dist,
@@ -146,8 +148,7 @@ class Modes051_100(BaseModeVisualizer):
             p['y'] += p['vy']
 
             if dist > well_radius and 0 < p['x'] < self.width and 0 < p['y'] < self.height:
-                color_hsv = np.array([[[p['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(p['hue'], 255, 255)
                 cv2.circle(frame, (int(p['x']), int(p['y'])), 3, tuple(map(int, color)), -1)
                 new_particles.append(p)
 
@@ -158,54 +159,45 @@ class Modes051_100(BaseModeVisualizer):
     def draw_mode_54_metaball_fluid(self, frame, magnitudes):
         """Mode 54: Lava lamp metaballs - size pulses with frequency amplitude"""
         num_balls = min(len(magnitudes), 15)
+        balls = self.metaball_system
 
         # Update or create metaballs
-        while len(self.metaballs) < num_balls:
-            self.metaballs.append({
-                'x': np.random.random() * self.width,
-                'y': np.random.random() * self.height,
-                'vx': (np.random.random() - 0.5) * 4,
-                'vy': (np.random.random() - 0.5) * 4,
-                'base_radius': 40 + np.random.random() * 40
-            })
-
-        avg_magnitude = np.mean(magnitudes)
-
-        # Draw metaballs with glow
-        for i, ball in enumerate(self.metaballs[:num_balls]):
-            magnitude = magnitudes[i] if i < len(magnitudes) else avg_magnitude
-            radius = int(ball['base_radius'] * (0.7 + magnitude * 0.8))
-
-            # Update position with fluid-like motion
-            ball['x'] += ball['vx']
-            ball['y'] += ball['vy']
-
-            # Bounce off walls
-            if ball['x'] < radius or ball['x'] > self.width - radius:
-                ball['vx'] *= -1
-            if ball['y'] < radius or ball['y'] > self.height - radius:
-                ball['vy'] *= -1
-
-            # Color based on frequency
-            hue = int((i / num_balls) * 180)
-            saturation = 200 + int(magnitude * 55)
-            value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-
-            # Draw with gradient
-            for r in range(radius, 0, -5):
-                alpha = r / radius
-                cv2.circle(frame, (int(ball['x']), int(ball['y'])), r,
-                          tuple(int(c * alpha) for c in color), -1, lineType=cv2.LINE_AA)
+        missing = num_balls - len(balls)
+        if missing > 0:
+            start = self.rng.random((missing, 5))
+            balls.spawn(x=start[:, 0] * self.width, y=start[:, 1] * self.height,
+                        vx=(start[:, 2] - 0.5) * 4, vy=(start[:, 3] - 0.5) * 4,
+                        base_radius=40 + start[:, 4] * 40)
+
+        magnitude = np.asarray(magnitudes[:num_balls], dtype=np.float64)
+        radius = np.trunc(balls.base_radius[:num_balls] * (0.7 + magnitude * 0.8))
+
+        # Update position with fluid-like motion
+        x, y = balls.x[:num_balls], balls.y[:num_balls]
+        vx, vy = balls.vx[:num_balls], balls.vy[:num_balls]
+        x += vx
+        y += vy
+
+        # Bounce off walls
+        vx[(x < radius) | (x > self.width - radius)] *= -1
+        vy[(y < radius) | (y > self.height - radius)] *= -1
+
+        # Color based on frequency
+        hue = np.trunc(np.arange(num_balls) / num_balls * 180)
+        saturation = 200 + np.trunc(magnitude * 55)
+        value = 150 + np.trunc(magnitude * 105)
+        colors = hsv_to_bgr_array(hue, saturation, value)
+
+        # Balls that come close merge into one blob
+        metaballs.render_metaballs(frame, x, y, radius, colors, step=8, glow=0.35)
 
         return frame
 
 
     def draw_mode_55_aurora_borealis(self, frame, magnitudes):
         """Mode 55: Northern lights curtains - low freq shapes, high freq shimmer"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         num_curtains = 5
         curtain_points = 60
@@ -233,8 +225,7 @@ class Modes051_100(BaseModeVisualizer):
             hue = 60 + curtain_idx * 15
             saturation = 180 + int(treble * 75)
             value = 120 + int(bass * 135)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw curtain with thickness
             if len(points) > 1:
@@ -268,8 +259,7 @@ class Modes051_100(BaseModeVisualizer):
                 hue = int((pane_idx / len(magnitudes)) * 180)
                 saturation = 255
                 value = int(80 + magnitude * 175)  # Glow intensity
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, value)
 
                 # Draw pane
                 cv2.rectangle(frame, (x1, y1), (x2, y2), tuple(map(int, color)), -1)
@@ -293,20 +283,20 @@ class Modes051_100(BaseModeVisualizer):
             num_nodes = 20
             for _ in range(num_nodes):
                 self.nerve_nodes.append({
-                    'x': np.random.randint(100, self.width - 100),
-                    'y': np.random.randint(100, self.height - 100),
+                    'x': self.rng.integers(100, self.width - 100),
+                    'y': self.rng.integers(100, self.height - 100),
                     'pulse': 0, 'connections': []
                 })
             # Create connections
             for i, node in enumerate(self.nerve_nodes):
-                num_connections = np.random.randint(2, 5)
+                num_connections = self.rng.integers(2, 5)
                 for _ in range(num_connections):
-                    target = np.random.randint(0, len(self.nerve_nodes))
+                    target = self.rng.integers(0, len(self.nerve_nodes))
                     if target != i:
                         node['connections'].append(target)
 
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Update node pulses with bass
         for i, node in enumerate(self.nerve_nodes):
@@ -336,8 +326,8 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_58_glitch_artifact(self, frame, magnitudes):
         """Mode 58: Clean bars corrupted by glitch effects on transients"""
-        avg_magnitude = np.mean(magnitudes)
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        avg_magnitude = self.get_energy(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Draw clean bars first
         bar_width = self.width // len(magnitudes)
@@ -355,8 +345,8 @@ class Modes051_100(BaseModeVisualizer):
 
             # Pixel sorting effect
             for _ in range(glitch_intensity):
-                y_slice = np.random.randint(0, self.height - 50)
-                slice_height = np.random.randint(10, 50)
+                y_slice = self.rng.integers(0, self.height - 50)
+                slice_height = self.rng.integers(10, 50)
                 row = frame[y_slice:y_slice + slice_height, :]
                 sorted_row = np.sort(row.view('i8'), axis=1).view(row.dtype)
                 frame[y_slice:y_slice + slice_height, :] = sorted_row
@@ -371,7 +361,7 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_59_warp_tunnel(self, frame, magnitudes):
         """Mode 59: Hyperspace tunnel of rings - radius pulses with frequency"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         num_rings = 30
 
         for i in range(num_rings):
@@ -390,8 +380,7 @@ class Modes051_100(BaseModeVisualizer):
             hue = int((depth + self.frame_counter * 0.01) * 180) % 180
             saturation = 200 + int(magnitude * 55)
             value = int(150 * (1 - depth) + magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw ring
             thickness = int(2 + magnitude * 8)
@@ -406,48 +395,31 @@ class Modes051_100(BaseModeVisualizer):
         cell_width = self.width // grid_size
         cell_height = self.height // grid_size
 
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Initialize grid
         if len(self.cellular_automaton) == 0:
-            self.cellular_automaton = np.random.randint(0, 2, (grid_size, grid_size))
+            self.cellular_automaton = self.rng.integers(0, 2, (grid_size, grid_size))
 
         # Audio modulates birth/survival - low freq spawns, high freq increases survival
         if self.frame_counter % 3 == 0:
-            new_grid = self.cellular_automaton.copy()
-
-            for y in range(grid_size):
-                for x in range(grid_size):
-                    # Count neighbors
-                    neighbors = 0
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dy == 0 and dx == 0:
-                                continue
-                            ny, nx = (y + dy) % grid_size, (x + dx) % grid_size
-                            neighbors += self.cellular_automaton[ny, nx]
-
-                    # Modified rules based on audio
-                    if self.cellular_automaton[y, x] == 1:
-                        # Survival: 2-3 neighbors (+ treble increases tolerance)
-                        if neighbors < 2 - int(treble) or neighbors > 3 + int(treble * 2):
-                            new_grid[y, x] = 0
-                    else:
-                        # Birth: 3 neighbors (bass spawns new cells randomly)
-                        if neighbors == 3 or (bass > 0.6 and np.random.random() < bass * 0.1):
-                            new_grid[y, x] = 1
+            grid = self.cellular_automaton
+            counts = automaton.neighbor_counts(grid)
+            # Survival: 2-3 neighbors (+ treble increases tolerance)
+            rule = automaton.life_rule(birth=(3,), survive=range(2 - int(treble), 4 + int(treble * 2)))
+            new_grid = automaton.step(grid, rule, counts)
+
+            # Birth: bass spawns new cells randomly
+            if bass > 0.6:
+                candidates = np.flatnonzero((grid == 0) & (counts != 3))
+                spawned = candidates[self.rng.random(len(candidates)) < bass * 0.1]
+                new_grid.flat[spawned] = 1
 
             self.cellular_automaton = new_grid
 
         # Draw grid
-        for y in range(grid_size):
-            for x in range(grid_size):
-                if self.cellular_automaton[y, x] == 1:
-                    x1 = x * cell_width
-                    y1 = y * cell_height
-                    color = (100, 255, 100)
-                    cv2.rectangle(frame, (x1, y1), (x1 + cell_width - 1, y1 + cell_height - 1), color, -1)
+        automaton.paint_cells(frame, self.cellular_automaton, cell_width, cell_height, (100, 255, 100))
 
         return frame
 
@@ -537,9 +509,9 @@ class Modes051_100(BaseModeVisualizer):
     def draw_mode_64_string_art(self, frame, magnitudes):
         """Mode 64: Points on circle with lines between - modulated by frequencies"""
         num_points = min(len(magnitudes), 36)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Calculate point positions (modulated by low freq)
         points = []
@@ -556,14 +528,13 @@ class Modes051_100(BaseModeVisualizer):
         # Draw lines between points (mids and treble control count and color)
         num_lines = int(mids * 50 + treble * 100)
         for _ in range(num_lines):
-            idx1 = np.random.randint(0, len(points))
-            idx2 = np.random.randint(0, len(points))
+            idx1 = self.rng.integers(0, len(points))
+            idx2 = self.rng.integers(0, len(points))
 
             if idx1 != idx2:
                 hue = int(treble * 180)
                 alpha = 0.3
-                color_hsv = np.array([[[hue, 200, int(255 * alpha)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, int(255 * alpha))
                 cv2.line(frame, points[idx1], points[idx2], tuple(map(int, color)), 1, lineType=cv2.LINE_AA)
 
         # Draw points
@@ -575,95 +546,82 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_65_fire_embers(self, frame, magnitudes):
         """Mode 65: Central fire with sparks flying on treble hits"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Central fire (low-mid frequencies)
         fire_height = int(bass * 300 + 100)
         fire_width = 150
 
         for i in range(20):
-            flame_x = int(self.center_x + (np.random.random() - 0.5) * fire_width)
-            flame_y = int(self.height - 100 - np.random.random() * fire_height)
+            flame_x = int(self.center_x + (self.rng.random() - 0.5) * fire_width)
+            flame_y = int(self.height - 100 - self.rng.random() * fire_height)
             flame_size = int(20 + bass * 30)
 
             # Fire color gradient
-            hue = int(10 + np.random.random() * 20)  # Orange-yellow
+            hue = int(10 + self.rng.random() * 20)  # Orange-yellow
             saturation = 255
-            value = 200 + int(np.random.random() * 55)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            value = 200 + int(self.rng.random() * 55)
+            color = hsv_pixel(hue, saturation, value)
 
             cv2.circle(frame, (flame_x, flame_y), flame_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
         # Emit sparks/embers on treble hits
+        embers = self.ember_system
         if treble > 0.5:
-            for _ in range(int(treble * 30)):
-                self.ember_particles.append({
-                    'x': self.center_x + (np.random.random() - 0.5) * 100,
-                    'y': self.height - 150,
-                    'vx': (np.random.random() - 0.5) * 8,
-                    'vy': -np.random.random() * 15 - 5,
-                    'life': 1.0
-                })
+            count = int(treble * 30)
+            embers.spawn(
+                x=self.center_x + (self.rng.random(count) - 0.5) * 100,
+                y=self.height - 150,
+                vx=(self.rng.random(count) - 0.5) * 8,
+                vy=-self.rng.random(count) * 15 - 5,
+                life=1.0
+            )
 
         # Update and draw embers
-        new_embers = []
-        for ember in self.ember_particles:
-            ember['x'] += ember['vx']
-            ember['y'] += ember['vy']
-            ember['vy'] += 0.5  # Gravity
-            ember['life'] -= 0.015
-
-            if ember['life'] > 0 and ember['y'] < self.height:
-                alpha = ember['life']
-                color = (int(100 * alpha), int(150 * alpha), int(255 * alpha))
-                cv2.circle(frame, (int(ember['x']), int(ember['y'])), 3, color, -1, lineType=cv2.LINE_AA)
-                new_embers.append(ember)
-
-        self.ember_particles = new_embers
+        embers.integrate()
+        embers.apply_force(ay=0.5)  # Gravity
+        embers.age(0.015)
+        embers.kill((embers.life <= 0) | (embers.y >= self.height))
+
+        color = (np.array([100, 150, 255]) * embers.life[:, None]).astype(int)
+        embers.draw(frame, radius=3, color=color)
         return frame
 
 
     def draw_mode_66_radial_kaleidoscope(self, frame, magnitudes):
         """Mode 66: Radial kaleidoscope with mirrored segments"""
-        num_segments = 8
-        avg_magnitude = np.mean(magnitudes)
-
-        # Create one segment
-        segment_angle = 2 * np.pi / num_segments
+        # 8 segments composed from one drawn wedge
+        kaleido = self.radial_kaleidoscope
+        segment_angle = kaleido.wedge
 
-        # Draw particles in one segment
-        for i, magnitude in enumerate(magnitudes[:30]):
-            if magnitude > 0.2:
-                angle = (i / 30) * segment_angle
-                distance = 100 + magnitude * 300
+        # Draw particles in one segment (reaching the largest particle's edge)
+        canvas = kaleido.canvas(422)
+        center_x, center_y = kaleido.center
+        for rotation in kaleido.copies(self.frame_counter * 0.02):
+            for i, magnitude in enumerate(magnitudes[:30]):
+                if magnitude > 0.2:
+                    angle = (i / 30) * segment_angle
+                    distance = 100 + magnitude * 300
 
-                x = int(self.center_x + np.cos(angle) * distance)
-                y = int(self.center_y + np.sin(angle) * distance)
+                    hue = int((i / 30) * 180)
+                    color = hsv_pixel(hue, 255, int(255 * magnitude))
 
-                hue = int((i / 30) * 180)
-                color_hsv = np.array([[[hue, 255, int(255 * magnitude)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-
-                # Draw in all mirrored segments
-                for seg in range(num_segments):
-                    seg_angle = seg * segment_angle + self.frame_counter * 0.02
-                    rot_x = int(self.center_x + np.cos(angle + seg_angle) * distance)
-                    rot_y = int(self.center_y + np.sin(angle + seg_angle) * distance)
+                    rot_x = int(center_x + np.cos(angle + rotation) * distance)
+                    rot_y = int(center_y + np.sin(angle + rotation) * distance)
 
                     size = int(5 + magnitude * 15)
-                    cv2.circle(frame, (rot_x, rot_y), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
+                    cv2.circle(canvas, (rot_x, rot_y), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
-        # Pulsing zoom
-        zoom = 1 + avg_magnitude * 0.3
+        # Repeat the segment all around
+        kaleido.compose(frame, (self.center_x, self.center_y))
 
         return frame
 
 
     def draw_mode_67_pulsing_jellyfish(self, frame, magnitudes):
         """Mode 67: Translucent jellyfish - bell pulses with bass, tentacles are waveforms"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         # Jellyfish bell (pulses with bass)
         bell_radius = int(80 + bass * 70)
@@ -700,9 +658,9 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_68_orbital_system(self, frame, magnitudes):
         """Mode 68: Central sun with orbiting planets (mid-freq) and moons (treble)"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         mids = magnitudes[len(magnitudes)//4:3*len(magnitudes)//4]
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        treble = self.get_highs(magnitudes)
 
         # Central sun pulses
         sun_radius = int(40 + avg_magnitude * 40)
@@ -722,8 +680,7 @@ class Modes051_100(BaseModeVisualizer):
 
             # Planet color
             hue = int((i / num_planets) * 180)
-            color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 255)
 
             cv2.circle(frame, (planet_x, planet_y), planet_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -779,7 +736,7 @@ class Modes051_100(BaseModeVisualizer):
             cv2.line(frame, vertices_2d[start], vertices_2d[end], color, 2, lineType=cv2.LINE_AA)
 
         # Draw bars on front face
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
         face_center = ((vertices_2d[0][0] + vertices_2d[2][0]) // 2,
                       (vertices_2d[0][1] + vertices_2d[2][1]) // 2)
         bar_length = int(30 + avg_magnitude * 50)
@@ -790,18 +747,18 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_70_typographic_flow(self, frame, magnitudes):
         """Mode 70: Floating words with size based on bass, waviness on treble"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Spawn new words
         if self.frame_counter % 30 == 0:
             words = ['MUSIC', 'FLOW', 'VIBE', 'SOUND', 'WAVE', 'PULSE', 'RHYTHM']
-            word = np.random.choice(words)
+            word = self.rng.choice(words)
             font_scale = 1.0 + bass * 2.0
 
             self.typography_words.append({
                 'word': word,
-                'x': np.random.randint(100, self.width - 200),
+                'x': self.rng.integers(100, self.width - 200),
                 'y': self.height + 50,
                 'vy': -2 - bass * 3,
                 'font_scale': font_scale,
@@ -853,7 +810,7 @@ class Modes051_100(BaseModeVisualizer):
             if magnitude > 0.4:
                 # Radial distance based on frequency (low=center, high=edge)
                 distance = int((i / len(magnitudes)) * self.max_radius)
-                angle = sweep_angle + (np.random.random() - 0.5) * 0.5
+                angle = sweep_angle + (self.rng.random() - 0.5) * 0.5
 
                 blip_x = int(self.center_x + np.cos(angle) * distance)
                 blip_y = int(self.center_y + np.sin(angle) * distance)
@@ -921,15 +878,15 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_73_lightning_cloud(self, frame, magnitudes):
         """Mode 73: Storm cloud that rumbles with bass, lightning on treble"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Cloud shape (top of screen, expanding with bass)
         cloud_height = int(150 + bass * 100)
 
         for i in range(20):
-            cloud_x = int(np.random.random() * self.width)
-            cloud_y = int(np.random.random() * cloud_height)
+            cloud_x = int(self.rng.random() * self.width)
+            cloud_y = int(self.rng.random() * cloud_height)
             cloud_size = int(30 + bass * 50)
 
             alpha = 0.3
@@ -939,7 +896,7 @@ class Modes051_100(BaseModeVisualizer):
         # Lightning bolts on strong treble
         if treble > 0.65:
             # Generate lightning bolt path
-            start_x = np.random.randint(self.width // 4, 3 * self.width // 4)
+            start_x = self.rng.integers(self.width // 4, 3 * self.width // 4)
             start_y = cloud_height
 
             x, y = start_x, start_y
@@ -947,8 +904,8 @@ class Modes051_100(BaseModeVisualizer):
 
             # Jagged lightning path
             for _ in range(int(5 + treble * 10)):
-                x += int((np.random.random() - 0.5) * 80)
-                y += int(40 + np.random.random() * 60)
+                x += int((self.rng.random() - 0.5) * 80)
+                y += int(40 + self.rng.random() * 60)
                 points.append((x, y))
 
             # Draw lightning
@@ -997,8 +954,7 @@ class Modes051_100(BaseModeVisualizer):
 
             # Draw ball
             ball_size = int(10 + magnitude * 20)
-            color_hsv = np.array([[[ball['color_hue'], 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(ball['color_hue'], 255, 255)
 
             cv2.circle(frame, (int(ball['x']), int(ball['y'])), ball_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -1007,13 +963,13 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_75_liquid_ink(self, frame, magnitudes):
         """Mode 75: Ink drops falling into water - bass=dark blooms, treble=bright splatters"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Bass hits create large ink blooms
         if bass > 0.4 and self.frame_counter % 15 == 0:
             self.ink_blooms.append({
-                'x': np.random.randint(200, self.width - 200),
+                'x': self.rng.integers(200, self.width - 200),
                 'y': 100,
                 'radius': 10,
                 'max_radius': 150 + bass * 200,
@@ -1025,8 +981,8 @@ class Modes051_100(BaseModeVisualizer):
         if treble > 0.5:
             for _ in range(int(treble * 10)):
                 self.ink_blooms.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
                     'radius': 5,
                     'max_radius': 20 + treble * 40,
                     'life': 1.0,
@@ -1041,8 +997,7 @@ class Modes051_100(BaseModeVisualizer):
 
             if bloom['life'] > 0 and bloom['radius'] < bloom['max_radius']:
                 alpha = bloom['life']
-                color_hsv = np.array([[[bloom['hue'], 200, int(255 * alpha)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(bloom['hue'], 200, int(255 * alpha))
 
                 cv2.circle(frame, (int(bloom['x']), int(bloom['y'])), int(bloom['radius']),
                           tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
@@ -1091,9 +1046,9 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_77_ai_latent_walk(self, frame, magnitudes):
         """Mode 77: Abstract latent space visualization (simulated)"""
-        avg_magnitude = np.mean(magnitudes)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        avg_magnitude = self.get_energy(magnitudes)
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Simulate latent walk with morphing shapes
         self.latent_morph_state += avg_magnitude * 0.1
@@ -1114,8 +1069,7 @@ class Modes051_100(BaseModeVisualizer):
             hue = int((self.latent_morph_state * 50 + i * 12) % 180)
             saturation = 180 + int(treble * 75)
             value = 150 + int(avg_magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw with transparency effect
             cv2.circle(frame, (x, y), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -1125,7 +1079,7 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_78_pixel_storm(self, frame, magnitudes):
         """Mode 78: Blizzard of 8-bit pixels - wind direction from stereo, speed from volume"""
-        avg_magnitude = np.mean(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Stereo pan (L/R balance)
         left_power = np.mean(magnitudes[:len(magnitudes)//2])
@@ -1140,9 +1094,9 @@ class Modes051_100(BaseModeVisualizer):
                 hue = int((dominant_freq_idx / len(magnitudes)) * 180)
 
                 self.pixel_storm.append({
-                    'x': np.random.random() * self.width,
+                    'x': self.rng.random() * self.width,
                     'y': 0,
-                    'vx': wind_direction + (np.random.random() - 0.5) * 3,
+                    'vx': wind_direction + (self.rng.random() - 0.5) * 3,
                     'vy': 3 + avg_magnitude * 5,
                     'hue': hue,
                     'life': 1.0
@@ -1156,8 +1110,7 @@ class Modes051_100(BaseModeVisualizer):
             pixel['life'] -= 0.01
 
             if pixel['life'] > 0 and 0 < pixel['y'] < self.height:
-                color_hsv = np.array([[[pixel['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(pixel['hue'], 255, 255)
 
                 # 8-bit pixel (small rectangle)
                 pixel_size = 4
@@ -1173,8 +1126,8 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_79_growing_vine(self, frame, magnitudes):
         """Mode 79: Vine grows across screen, sprouts leaves on beats"""
-        avg_magnitude = np.mean(magnitudes)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        avg_magnitude = self.get_energy(magnitudes)
+        bass = self.get_bass(magnitudes)
 
         # Grow vine if not complete
         if len(self.vine_segments) < 200:
@@ -1183,7 +1136,7 @@ class Modes051_100(BaseModeVisualizer):
             else:
                 last = self.vine_segments[-1]
                 # Vine meanders
-                angle = -np.pi/6 + (np.random.random() - 0.5) * np.pi/4
+                angle = -np.pi/6 + (self.rng.random() - 0.5) * np.pi/4
                 new_x = last['x'] + np.cos(angle) * 15
                 new_y = last['y'] + np.sin(angle) * 15
 
@@ -1194,8 +1147,8 @@ class Modes051_100(BaseModeVisualizer):
                     if bass > 0.5:
                         leaf_size = int(10 + bass * 30)
                         self.vine_segments[-1]['leaves'].append({
-                            'offset_x': (np.random.random() - 0.5) * 20,
-                            'offset_y': (np.random.random() - 0.5) * 20,
+                            'offset_x': (self.rng.random() - 0.5) * 20,
+                            'offset_y': (self.rng.random() - 0.5) * 20,
                             'size': leaf_size
                         })
 
@@ -1217,8 +1170,8 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_80_haunted_faces(self, frame, magnitudes):
         """Mode 80: Ghostly faces fade in/out with mid-range (vocals), eyes glow on bass"""
-        mid_range = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        mid_range = self.get_mids(magnitudes)
+        bass = self.get_bass(magnitudes)
 
         # Face opacity controlled by mid-range (vocals)
         self.haunted_face_alpha = mid_range
@@ -1252,8 +1205,8 @@ class Modes051_100(BaseModeVisualizer):
         if len(self.constellation_stars) == 0:
             for i in range(len(magnitudes)):
                 self.constellation_stars.append({
-                    'x': np.random.randint(50, self.width - 50),
-                    'y': np.random.randint(50, self.height - 50),
+                    'x': self.rng.integers(50, self.width - 50),
+                    'y': self.rng.integers(50, self.height - 50),
                     'shining': False,
                     'freq_idx': i
                 })
@@ -1290,8 +1243,8 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_82_matrix_rain(self, frame, magnitudes):
         """Mode 82: Matrix-style falling characters - speed from volume, brightness from treble"""
-        avg_magnitude = np.mean(magnitudes)
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        avg_magnitude = self.get_energy(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Initialize columns
         if len(self.matrix_rain) == 0:
@@ -1299,8 +1252,8 @@ class Modes051_100(BaseModeVisualizer):
             for i in range(num_columns):
                 self.matrix_rain.append({
                     'x': int((i / num_columns) * self.width),
-                    'y': np.random.randint(-100, 0),
-                    'speed': 3 + np.random.random() * 5,
+                    'y': self.rng.integers(-100, 0),
+                    'speed': 3 + self.rng.random() * 5,
                     'chars': []
                 })
 
@@ -1321,7 +1274,7 @@ class Modes051_100(BaseModeVisualizer):
                     brightness = int(150 - i * 8 + treble * 105)
                     brightness = max(50, min(255, brightness))
 
-                    char = chr(np.random.randint(33, 127))
+                    char = chr(self.rng.integers(33, 127))
                     cv2.putText(frame, char, (column['x'], char_y), cv2.FONT_HERSHEY_SIMPLEX,
                               0.5, (50, brightness, 50), 1, lineType=cv2.LINE_AA)
 
@@ -1330,7 +1283,7 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_83_voxel_world(self, frame, magnitudes):
         """Mode 83: 3D voxel grid with audio shockwave"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         # Shockwave emanates from center
         shockwave_radius = int((self.frame_counter % 100) * (1 + bass) * 5)
@@ -1393,40 +1346,36 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_85_audio_reactive_shader(self, frame, magnitudes):
         """Mode 85: Full-screen procedural shader effect"""
-        avg_magnitude = np.mean(magnitudes)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        avg_magnitude = self.get_energy(magnitudes)
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         self.shader_time += 0.05 + avg_magnitude * 0.1
 
-        # Generate procedural pattern (simplified Perlin-like noise)
-        for y in range(0, self.height, 4):
-            for x in range(0, self.width, 4):
-                # UV coordinates
-                u = x / self.width
-                v = y / self.height
-
-                # Noise pattern
-                noise_val = np.sin(u * 10 + self.shader_time + bass * 5) * np.cos(v * 10 + self.shader_time)
-                noise_val += np.sin(np.sqrt(u*u + v*v) * 20 - self.shader_time * 2) * treble
+        # Generate procedural pattern (simplified Perlin-like noise) on a 4px grid
+        x, y = fields.sample_grid(self.width, self.height, 4)
+        # UV coordinates
+        u = x / self.width
+        v = y / self.height
 
-                # Color mapping (clamp to valid uint8 range)
-                hue = np.clip(int((noise_val * 0.5 + 0.5) * 180), 0, 179)
-                saturation = np.clip(200 + int(treble * 55), 0, 255)
-                value = np.clip(int((noise_val * 0.5 + 0.5) * 200 + bass * 55), 0, 255)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+        # Noise pattern
+        noise_val = np.sin(u * 10 + self.shader_time + bass * 5) * np.cos(v * 10 + self.shader_time)
+        noise_val = noise_val + np.sin(np.sqrt(u*u + v*v) * 20 - self.shader_time * 2) * treble
 
-                cv2.rectangle(frame, (x, y), (x+4, y+4), tuple(map(int, color)), -1)
+        # Color mapping (clamp to valid uint8 range)
+        hue = np.clip(np.trunc((noise_val * 0.5 + 0.5) * 180), 0, 179)
+        saturation = np.clip(200 + int(treble * 55), 0, 255)
+        value = np.clip(np.trunc((noise_val * 0.5 + 0.5) * 200 + bass * 55), 0, 255)
+        fields.paint_blocks(frame, hsv_to_bgr_array(hue, saturation, value), 4)
 
         return frame
 
 
     def draw_mode_86_spirograph(self, frame, magnitudes):
         """Mode 86: Spirograph pattern - radii controlled by frequencies"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Spirograph parameters modulated by audio
         R = 150 + bass * 100  # Outer wheel radius
@@ -1447,8 +1396,7 @@ class Modes051_100(BaseModeVisualizer):
 
             # Color based on treble
             hue = int(treble * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
 
             cv2.polylines(frame, [points], False, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
@@ -1468,8 +1416,7 @@ class Modes051_100(BaseModeVisualizer):
             hue = int((i / num_rings) * 180)
             saturation = 200 + int(magnitude * 55)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Ring thickness
             thickness = int(2 + magnitude * 10)
@@ -1481,9 +1428,9 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_88_audio_driven_doodles(self, frame, magnitudes):
         """Mode 88: Generative doodle bot - bass=90° turns, treble=shakiness"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Initialize path
         if len(self.doodle_path) == 0:
@@ -1499,8 +1446,8 @@ class Modes051_100(BaseModeVisualizer):
         # Move forward
         step_size = 5 + mids * 5
         shakiness = treble * 10
-        new_x = current['x'] + np.cos(current['angle']) * step_size + (np.random.random() - 0.5) * shakiness
-        new_y = current['y'] + np.sin(current['angle']) * step_size + (np.random.random() - 0.5) * shakiness
+        new_x = current['x'] + np.cos(current['angle']) * step_size + (self.rng.random() - 0.5) * shakiness
+        new_y = current['y'] + np.sin(current['angle']) * step_size + (self.rng.random() - 0.5) * shakiness
 
         # Keep in bounds
         new_x = np.clip(new_x, 50, self.width - 50)
@@ -1520,8 +1467,7 @@ class Modes051_100(BaseModeVisualizer):
             # Color based on mids
             hue = int(mids * 180)
             alpha = (i / len(self.doodle_path))
-            color_hsv = np.array([[[hue, 200, int(255 * alpha)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, int(255 * alpha))
 
             cv2.line(frame, (int(p1['x']), int(p1['y'])), (int(p2['x']), int(p2['y'])),
                     tuple(map(int, color)), 3, lineType=cv2.LINE_AA)
@@ -1531,91 +1477,66 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_89_firework_show(self, frame, magnitudes):
         """Mode 89: Bass launches rockets, they explode at peak with mid-range color"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Launch rockets on bass hits
         if bass > 0.55 and self.frame_counter % 10 == 0:
-            self.firework_rockets.append({
-                'x': np.random.randint(self.width // 4, 3 * self.width // 4),
+            self.show_rockets.append({
+                'x': self.rng.integers(self.width // 4, 3 * self.width // 4),
                 'y': self.height - 50,
-                'vy': -10 - bass * 8,
-                'exploded': False,
-                'particles': []
+                'vy': -10 - bass * 8
             })
 
-        # Update rockets
-        new_rockets = []
-        for rocket in self.firework_rockets:
-            if not rocket['exploded']:
-                rocket['y'] += rocket['vy']
-                rocket['vy'] += 0.3  # Gravity
-
-                # Draw rocket trail
-                cv2.circle(frame, (int(rocket['x']), int(rocket['y'])), 5, (200, 200, 255), -1, lineType=cv2.LINE_AA)
-
-                # Explode at peak
-                if rocket['vy'] > 0:
-                    rocket['exploded'] = True
-                    # Create particle burst
-                    for _ in range(int(50 + mids * 100)):
-                        angle = np.random.random() * 2 * np.pi
-                        speed = 2 + np.random.random() * 8
-                        rocket['particles'].append({
-                            'x': rocket['x'],
-                            'y': rocket['y'],
-                            'vx': np.cos(angle) * speed,
-                            'vy': np.sin(angle) * speed,
-                            'life': 1.0
-                        })
-
-            # Update explosion particles
-            if rocket['exploded']:
-                new_particles = []
-                for particle in rocket['particles']:
-                    particle['x'] += particle['vx']
-                    particle['y'] += particle['vy']
-                    particle['vy'] += 0.2  # Gravity
-                    particle['life'] -= 0.015
-
-                    if particle['life'] > 0:
-                        # Color from mids
-                        hue = int(mids * 180)
-                        alpha = particle['life']
-                        color_hsv = np.array([[[hue, 255, int(255 * alpha)]]], dtype=np.uint8)
-                        color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-
-                        size = int(2 + treble * 6)
-                        cv2.circle(frame, (int(particle['x']), int(particle['y'])), size,
-                                  tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
-                        new_particles.append(particle)
-
-                rocket['particles'] = new_particles
-                if len(rocket['particles']) > 0:
-                    new_rockets.append(rocket)
-
+        # Update rockets; each explodes into sparks at its peak
+        sparks = self.show_sparks
+        climbing = []
+        for rocket in self.show_rockets:
+            rocket['y'] += rocket['vy']
+            rocket['vy'] += 0.3  # Gravity
+
+            # Draw rocket trail
+            cv2.circle(frame, (int(rocket['x']), int(rocket['y'])), 5, (200, 200, 255), -1, lineType=cv2.LINE_AA)
+
+            # Explode at peak
+            if rocket['vy'] > 0:
+                count = int(50 + mids * 100)
+                angle = self.rng.random(count) * 2 * np.pi
+                speed = 2 + self.rng.random(count) * 8
+                sparks.spawn(x=rocket['x'], y=rocket['y'],
+                             vx=np.cos(angle) * speed, vy=np.sin(angle) * speed, life=1.0)
             else:
-                new_rockets.append(rocket)
-
-        self.firework_rockets = new_rockets[:20]
+                climbing.append(rocket)
+        self.show_rockets = climbing[:20]
+
+        # Update explosion particles
+        sparks.integrate()
+        sparks.apply_force(ay=0.2)  # Gravity
+        sparks.age(0.015)
+        sparks.cull()
+
+        # Color from mids, fading with life
+        hue = int(mids * 180)
+        color = hsv_to_bgr_array(hue, 255, (255 * sparks.life).astype(int))
+        sparks.draw(frame, radius=int(2 + treble * 6), color=color)
         return frame
 
 
     def draw_mode_90_microscopic_view(self, frame, magnitudes):
         """Mode 90: Cells jiggle and divide based on frequency"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        avg_magnitude = np.mean(magnitudes)
+        bass = self.get_bass(magnitudes)
+        avg_magnitude = self.get_energy(magnitudes)
 
         # Initialize cells
         if len(self.microscopic_cells) == 0:
             for i in range(10):
                 self.microscopic_cells.append({
-                    'x': np.random.random() * self.width,
-                    'y': np.random.random() * self.height,
-                    'radius': 30 + np.random.random() * 30,
-                    'vx': (np.random.random() - 0.5) * 2,
-                    'vy': (np.random.random() - 0.5) * 2,
+                    'x': self.rng.random() * self.width,
+                    'y': self.rng.random() * self.height,
+                    'radius': 30 + self.rng.random() * 30,
+                    'vx': (self.rng.random() - 0.5) * 2,
+                    'vy': (self.rng.random() - 0.5) * 2,
                     'freq_idx': i % len(magnitudes)
                 })
 
@@ -1626,8 +1547,8 @@ class Modes051_100(BaseModeVisualizer):
             magnitude = magnitudes[freq_idx]
 
             # Jiggle (agitation from overall volume)
-            jiggle_x = (np.random.random() - 0.5) * avg_magnitude * 10
-            jiggle_y = (np.random.random() - 0.5) * avg_magnitude * 10
+            jiggle_x = (self.rng.random() - 0.5) * avg_magnitude * 10
+            jiggle_y = (self.rng.random() - 0.5) * avg_magnitude * 10
 
             cell['x'] += cell['vx'] + jiggle_x
             cell['y'] += cell['vy'] + jiggle_y
@@ -1639,7 +1560,7 @@ class Modes051_100(BaseModeVisualizer):
                 cell['vy'] *= -1
 
             # Divide when amplitude is high
-            if magnitude > 0.7 and len(new_cells) < 50 and np.random.random() < 0.05:
+            if magnitude > 0.7 and len(new_cells) < 50 and self.rng.random() < 0.05:
                 # Create daughter cell
                 new_cells.append({
                     'x': cell['x'] + 20,
@@ -1655,8 +1576,7 @@ class Modes051_100(BaseModeVisualizer):
             hue = int((freq_idx / len(magnitudes)) * 180)
             saturation = 200 + int(magnitude * 55)
             value = 150 + int(magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             cv2.circle(frame, (int(cell['x']), int(cell['y'])), int(cell['radius']),
                       tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -1671,8 +1591,8 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_91_burning_paper(self, frame, magnitudes):
         """Mode 91: Spectrum bars as flames, embers on high freq, paper curls on bass"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Draw flame bars
         bar_width = self.width // len(magnitudes)
@@ -1692,19 +1612,18 @@ class Modes051_100(BaseModeVisualizer):
                     hue = 10 + layer * 5  # Yellow to red
                     saturation = 255
                     value = 200 - layer * 40
-                    color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                    color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                    color = hsv_pixel(hue, saturation, value)
 
                     # Flickering width
-                    flicker = int((np.random.random() - 0.5) * 5)
+                    flicker = int((self.rng.random() - 0.5) * 5)
                     cv2.rectangle(frame, (x + flicker, y), (x + bar_width - 2 + flicker, y_base),
                                 tuple(map(int, color)), -1)
 
         # Embers on treble
         if treble > 0.5:
             for _ in range(int(treble * 20)):
-                ember_x = np.random.randint(0, self.width)
-                ember_y = self.height - 50 - np.random.randint(0, 100)
+                ember_x = self.rng.integers(0, self.width)
+                ember_y = self.height - 50 - self.rng.integers(0, 100)
                 cv2.circle(frame, (ember_x, ember_y), 2, (100, 150, 255), -1)
 
         # Paper curl effect on bass (darken corners)
@@ -1721,87 +1640,31 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_92_swarm_intelligence(self, frame, magnitudes):
         """Mode 92: Boid flocking - cohesion/separation modulated by audio"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
+        boids = self.swarm_flock
 
         # Initialize boids
-        if len(self.swarm_boids) == 0:
-            for _ in range(40):
-                self.swarm_boids.append({
-                    'x': np.random.random() * self.width,
-                    'y': np.random.random() * self.height,
-                    'vx': (np.random.random() - 0.5) * 4,
-                    'vy': (np.random.random() - 0.5) * 4
-                })
+        if len(boids) == 0:
+            start = self.rng.random((40, 4))
+            boids.spawn(x=start[:, 0] * self.width, y=start[:, 1] * self.height,
+                        vx=(start[:, 2] - 0.5) * 4, vy=(start[:, 3] - 0.5) * 4)
 
         # Boid rules modulated by audio
         cohesion_factor = 0.01 * (1 - bass)  # Bass scatters
         separation_factor = 0.5 + treble * 1.5  # Treble aligns
         alignment_factor = 0.05 + treble * 0.1
-
-        for boid in self.swarm_boids:
-            # Calculate forces
-            cohesion_x, cohesion_y = 0, 0
-            separation_x, separation_y = 0, 0
-            alignment_vx, alignment_vy = 0, 0
-            neighbors = 0
-
-            for other in self.swarm_boids:
-                if other is boid:
-                    continue
-
-                dx = other['x'] - boid['x']
-                dy = other['y'] - boid['y']
-                dist = np.sqrt(dx**2 + dy**2) + 0.1
-
-                if dist < 100:
-                    # Cohesion
-                    cohesion_x += dx
-                    cohesion_y += dy
-
-                    # Alignment
-                    alignment_vx += other['vx']
-                    alignment_vy += other['vy']
-
-                    neighbors += 1
-
-                if dist < 30:
-                    # Separation
-                    separation_x -= dx / dist
-                    separation_y -= dy / dist
-
-            if neighbors > 0:
-                cohesion_x /= neighbors
-                cohesion_y /= neighbors
-                alignment_vx /= neighbors
-                alignment_vy /= neighbors
-
-            # Apply forces
-            boid['vx'] += cohesion_x * cohesion_factor + separation_x * separation_factor + alignment_vx * alignment_factor
-            boid['vy'] += cohesion_y * cohesion_factor + separation_y * separation_factor + alignment_vy * alignment_factor
-
-            # Limit speed
-            speed = np.sqrt(boid['vx']**2 + boid['vy']**2)
-            max_speed = 5 + treble * 5
-            if speed > max_speed:
-                boid['vx'] = (boid['vx'] / speed) * max_speed
-                boid['vy'] = (boid['vy'] / speed) * max_speed
-
-            # Update position
-            boid['x'] += boid['vx']
-            boid['y'] += boid['vy']
-
-            # Wrap around
-            boid['x'] = boid['x'] % self.width
-            boid['y'] = boid['y'] % self.height
-
-            # Draw boid
-            cv2.circle(frame, (int(boid['x']), int(boid['y'])), 5, (100, 200, 255), -1, lineType=cv2.LINE_AA)
-
-            # Draw velocity direction
-            end_x = int(boid['x'] + boid['vx'] * 3)
-            end_y = int(boid['y'] + boid['vy'] * 3)
-            cv2.line(frame, (int(boid['x']), int(boid['y'])), (end_x, end_y), (150, 220, 255), 1, lineType=cv2.LINE_AA)
+        flock_step(boids, cohesion_factor, separation_factor, alignment_factor,
+                   max_speed=5 + treble * 5, width=self.width, height=self.height)
+
+        # Draw boids with their velocity direction
+        xs = boids.x.astype(np.int64).tolist()
+        ys = boids.y.astype(np.int64).tolist()
+        end_xs = (boids.x + boids.vx * 3).astype(np.int64).tolist()
+        end_ys = (boids.y + boids.vy * 3).astype(np.int64).tolist()
+        for x, y, end_x, end_y in zip(xs, ys, end_xs, end_ys):
+            cv2.circle(frame, (x, y), 5, (100, 200, 255), -1, lineType=cv2.LINE_AA)
+            cv2.line(frame, (x, y), (end_x, end_y), (150, 220, 255), 1, lineType=cv2.LINE_AA)
 
         return frame
 
@@ -1838,8 +1701,7 @@ class Modes051_100(BaseModeVisualizer):
             # Draw bob
             bob_size = int(5 + magnitude * 15)
             hue = int((i / num_pendulums) * 180)
-            color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 255)
 
             cv2.circle(frame, (x_end, y_end), bob_size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -1848,7 +1710,7 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_94_retro_scanlines(self, frame, magnitudes):
         """Mode 94: Waveform on old CRT with scanlines and static"""
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        treble = self.get_highs(magnitudes)
 
         # Draw waveform
         points = []
@@ -1861,17 +1723,20 @@ class Modes051_100(BaseModeVisualizer):
             points_np = np.array(points, dtype=np.int32)
             cv2.polylines(frame, [points_np], False, (100, 255, 100), 3, lineType=cv2.LINE_AA)
 
-        # Scanlines
-        for y in range(0, self.height, 4):
-            cv2.line(frame, (0, y), (self.width, y), (0, 0, 0), 1)
+        # Scanlines (a static black mask over the waveform)
+        def draw_scanlines(canvas):
+            for y in range(0, self.height, 4):
+                cv2.line(canvas, (0, y), (self.width, y), (0, 0, 0), 1)
+
+        self.cached_layer('retro_scanlines', 4, draw_scanlines).composite(frame)
 
         # Static/noise increases with treble
         if treble > 0.3:
             noise_intensity = int(treble * 50)
             for _ in range(noise_intensity):
-                x = np.random.randint(0, self.width)
-                y = np.random.randint(0, self.height)
-                brightness = np.random.randint(100, 255)
+                x = self.rng.integers(0, self.width)
+                y = self.rng.integers(0, self.height)
+                brightness = self.rng.integers(100, 255)
                 cv2.circle(frame, (x, y), 1, (brightness, brightness, brightness), -1)
 
         # CRT flicker
@@ -1904,13 +1769,12 @@ class Modes051_100(BaseModeVisualizer):
         # Draw filled polygon
         if len(vertices) > 2:
             pts = np.array(vertices, dtype=np.int32)
-            avg_magnitude = np.mean(magnitudes)
+            avg_magnitude = self.get_energy(magnitudes)
 
             hue = int(self.frame_counter * 2 % 180)
             saturation = 200 + int(avg_magnitude * 55)
             value = 150 + int(avg_magnitude * 105)
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             cv2.fillPoly(frame, [pts], tuple(map(int, color)), lineType=cv2.LINE_AA)
             cv2.polylines(frame, [pts], True, (255, 255, 255), 3, lineType=cv2.LINE_AA)
@@ -1920,8 +1784,8 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_96_chromatic_orb(self, frame, magnitudes):
         """Mode 96: 3D sphere with chromatic shader and moving light source"""
-        avg_magnitude = np.mean(magnitudes)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        avg_magnitude = self.get_energy(magnitudes)
+        bass = self.get_bass(magnitudes)
 
         # Light source moves with stereo pan
         left = np.mean(magnitudes[:len(magnitudes)//2])
@@ -1950,8 +1814,7 @@ class Modes051_100(BaseModeVisualizer):
                 hue = int((angle / (2 * np.pi) + radius_factor + self.frame_counter * 0.01) * 180) % 180
                 saturation = 200 + int(avg_magnitude * 55)
                 value = int(brightness)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, value)
 
                 cv2.circle(frame, (x, y), 3, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
 
@@ -1985,47 +1848,38 @@ class Modes051_100(BaseModeVisualizer):
     def draw_mode_98_voronoi_tessellation(self, frame, magnitudes):
         """Mode 98: Voronoi diagram with cells pulsing and seed points moving"""
         num_seeds = min(len(magnitudes), 20)
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         # Update seed positions (moved by low frequencies)
         if len(self.voronoi_seeds) == 0:
             for _ in range(num_seeds):
                 self.voronoi_seeds.append({
-                    'x': np.random.random() * self.width,
-                    'y': np.random.random() * self.height
+                    'x': self.rng.random() * self.width,
+                    'y': self.rng.random() * self.height
                 })
 
         for i, seed in enumerate(self.voronoi_seeds[:num_seeds]):
             magnitude = magnitudes[i] if i < len(magnitudes) else 0
             # Seeds move slightly
-            seed['x'] += (np.random.random() - 0.5) * bass * 5
-            seed['y'] += (np.random.random() - 0.5) * bass * 5
+            seed['x'] += (self.rng.random() - 0.5) * bass * 5
+            seed['y'] += (self.rng.random() - 0.5) * bass * 5
             # Keep in bounds
             seed['x'] = np.clip(seed['x'], 0, self.width)
             seed['y'] = np.clip(seed['y'], 0, self.height)
 
         # Draw Voronoi cells (simplified - sample points)
-        for y in range(0, self.height, 5):
-            for x in range(0, self.width, 5):
-                # Find closest seed
-                min_dist = float('inf')
-                closest_idx = 0
-
-                for i, seed in enumerate(self.voronoi_seeds[:num_seeds]):
-                    dist = (x - seed['x'])**2 + (y - seed['y'])**2
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_idx = i
-
-                # Color based on closest seed and its magnitude
-                magnitude = magnitudes[closest_idx] if closest_idx < len(magnitudes) else 0
-                hue = int((closest_idx / num_seeds) * 180)
-                saturation = 200 + int(magnitude * 55)
-                value = 100 + int(magnitude * 155)
-                color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-
-                cv2.rectangle(frame, (x, y), (x+5, y+5), tuple(map(int, color)), -1)
+        seeds = self.voronoi_seeds[:num_seeds]
+        labels, _ = voronoi.voronoi_labels(self.width, self.height,
+                                           [seed['x'] for seed in seeds], [seed['y'] for seed in seeds], 5)
+
+        # Color based on closest seed and its magnitude
+        seed_idx = np.arange(len(seeds))
+        magnitude = np.asarray(magnitudes[:len(seeds)])
+        hue = np.trunc((seed_idx / num_seeds) * 180)
+        saturation = 200 + np.trunc(magnitude * 55)
+        value = 100 + np.trunc(magnitude * 155)
+        seed_colors = hsv_to_bgr_array(hue, saturation, value)
+        fields.paint_blocks(frame, seed_colors[labels], 5)
 
         # Draw seed points
         for seed in self.voronoi_seeds[:num_seeds]:
@@ -2036,8 +1890,8 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_99_shattering_glass(self, frame, magnitudes):
         """Mode 99: Glass pane with cracks appearing on beats"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Glass pane (semi-transparent overlay)
         overlay = frame.copy()
@@ -2047,13 +1901,13 @@ class Modes051_100(BaseModeVisualizer):
 
         # Create cracks on strong beats
         if bass > 0.65 and len(self.glass_cracks) < 50:
-            crack_center = (self.center_x + int((np.random.random() - 0.5) * 200),
-                          self.center_y + int((np.random.random() - 0.5) * 200))
+            crack_center = (self.center_x + int((self.rng.random() - 0.5) * 200),
+                          self.center_y + int((self.rng.random() - 0.5) * 200))
 
             # Radiating crack lines
             num_lines = int(4 + bass * 8)
             for _ in range(num_lines):
-                angle = np.random.random() * 2 * np.pi
+                angle = self.rng.random() * 2 * np.pi
                 length = 50 + bass * 150
 
                 end_x = int(crack_center[0] + np.cos(angle) * length)
@@ -2072,8 +1926,8 @@ class Modes051_100(BaseModeVisualizer):
 
         # Screen shake on impact
         if bass > 0.7:
-            shake_x = int((np.random.random() - 0.5) * bass * 20)
-            shake_y = int((np.random.random() - 0.5) * bass * 20)
+            shake_x = int((self.rng.random() - 0.5) * bass * 20)
+            shake_y = int((self.rng.random() - 0.5) * bass * 20)
             M = np.float32([[1, 0, shake_x], [0, 1, shake_y]])
             frame = cv2.warpAffine(frame, M, (self.width, self.height))
 
@@ -2082,21 +1936,17 @@ class Modes051_100(BaseModeVisualizer):
 
     def draw_mode_100_sunrise_sunset(self, frame, magnitudes):
         """Mode 100: Gradient sky with pulsing sun and glittering stars"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
-        # Sky gradient (color mapped to mid-range)
+        # Sky gradient (color mapped to mid-range): one color per row, stretched across
         sky_hue = int(20 + mids * 100)  # Blue to orange
-        for y in range(self.height):
-            gradient_factor = y / self.height
-            saturation = int(200 - gradient_factor * 100)
-            value = int(255 - gradient_factor * 100)
-
-            color_hsv = np.array([[[sky_hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
-
-            cv2.line(frame, (0, y), (self.width, y), tuple(map(int, color)), 1)
+        gradient_factor = np.arange(self.height) / self.height
+        saturation = (200 - gradient_factor * 100).astype(np.int64)
+        value = (255 - gradient_factor * 100).astype(np.int64)
+        sky = hsv_to_bgr_array(sky_hue, saturation, value)[:, None, :]
+        frame[:] = cv2.resize(sky, (self.width, self.height), interpolation=cv2.INTER_NEAREST)
 
         # Sun/Moon (pulses with bass)
         self.sun_position = int(self.height * 0.3 + np.sin(self.frame_counter * 0.02) * 50)
@@ -2111,8 +1961,8 @@ class Modes051_100(BaseModeVisualizer):
         if mids < 0.3:
             num_stars = int(treble * 50 + 10)
             for _ in range(num_stars):
-                star_x = np.random.randint(0, self.width)
-                star_y = np.random.randint(0, self.height // 2)
+                star_x = self.rng.integers(0, self.width)
+                star_y = self.rng.integers(0, self.height // 2)
                 brightness = int(200 + treble * 55)
 
                 cv2.circle(frame, (star_x, star_y), 2, (brightness, brightness, brightness), -1, lineType=cv2.LINE_AA)
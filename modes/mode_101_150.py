@@ -3,9 +3,12 @@ Audio Spectrum Visualization Modes 101-150
 Auto-generated from audio_spectrum_creative.py
 """
 from .base import BaseModeVisualizer
+from . import automaton
 import numpy as np
 import cv2
 
+from color_lut import hsv_pixel
+
 
 class Modes101_150(BaseModeVisualizer):
     """Visualization modes 101 through 150"""
@@ -17,16 +20,16 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_101_neural_pulse(self, frame, magnitudes):
         """Mode 101: Neural network with pulsing nodes and lighting connections"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Initialize neural network nodes
         if len(self.neural_nodes) == 0:
             for i in range(30):
                 self.neural_nodes.append({
-                    'x': np.random.randint(100, self.width - 100),
-                    'y': np.random.randint(100, self.height - 100),
+                    'x': self.rng.integers(100, self.width - 100),
+                    'y': self.rng.integers(100, self.height - 100),
                     'layer': i % 3,  # 3 layers
                     'active': 0
                 })
@@ -57,8 +60,7 @@ class Modes101_150(BaseModeVisualizer):
             hue = int(140 + node['layer'] * 30)  # Purple to cyan
             intensity = int(200 + node['active'] * 55)
 
-            color_hsv = np.array([[[hue, 255, intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, intensity)
 
             cv2.circle(frame, (node['x'], node['y']), radius, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
             cv2.circle(frame, (node['x'], node['y']), radius + 3, (255, 255, 255), 1, lineType=cv2.LINE_AA)
@@ -68,16 +70,16 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_102_liquid_mercury(self, frame, magnitudes):
         """Mode 102: Metallic liquid that ripples with physics"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Spawn mercury droplets on high treble
         if treble > 0.5 and self.frame_counter % 3 == 0:
             self.liquid_mercury_particles.append({
-                'x': np.random.randint(100, self.width - 100),
+                'x': self.rng.integers(100, self.width - 100),
                 'y': 100,
-                'vx': np.random.uniform(-2, 2),
+                'vx': self.rng.uniform(-2, 2),
                 'vy': 0,
                 'radius': int(10 + treble * 20)
             })
@@ -120,8 +122,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_103_cosmic_strings(self, frame, magnitudes):
         """Mode 103: Vibrating strings in space like guitar strings"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Initialize strings
         if len(self.cosmic_strings) == 0:
@@ -152,8 +154,7 @@ class Modes101_150(BaseModeVisualizer):
             hue = 30  # Gold
             intensity = int(200 + string['magnitude'] * 55)
 
-            color_hsv = np.array([[[hue, 200, intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, intensity)
 
             cv2.polylines(frame, [points], False, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
@@ -165,15 +166,15 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_104_particle_swarm(self, frame, magnitudes):
         """Mode 104: Thousands of particles forming shapes"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Spawn particles
         if len(self.particle_swarm) < 1000:
             for _ in range(10):
-                angle = np.random.random() * 2 * np.pi
-                distance = np.random.random() * 200
+                angle = self.rng.random() * 2 * np.pi
+                distance = self.rng.random() * 200
                 self.particle_swarm.append({
                     'x': self.center_x + np.cos(angle) * distance,
                     'y': self.center_y + np.sin(angle) * distance,
@@ -217,8 +218,7 @@ class Modes101_150(BaseModeVisualizer):
             velocity = np.sqrt(particle['vx']**2 + particle['vy']**2)
             hue = int(120 - min(velocity * 50, 120))  # Blue to red
 
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
 
             # Draw trail
             if len(particle['trail']) > 1:
@@ -233,8 +233,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_105_crystal_lattice(self, frame, magnitudes):
         """Mode 105: 3D crystal structure with pulsing nodes"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
 
         # Initialize crystal lattice nodes
         if len(self.crystal_lattice_nodes) == 0:
@@ -279,8 +279,7 @@ class Modes101_150(BaseModeVisualizer):
             radius = int(5 + node['magnitude'] * 15)
             hue = int((z_rot + 300) / 600 * 180)  # Rainbow based on depth
 
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
 
             cv2.circle(frame, (x_2d, y_2d), radius, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
             cv2.circle(frame, (x_2d, y_2d), radius + 2, (255, 255, 255), 1, lineType=cv2.LINE_AA)
@@ -304,9 +303,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_106_aurora_waves(self, frame, magnitudes):
         """Mode 106: Aurora borealis flowing curtains"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Multiple aurora curtains
         num_curtains = 5
@@ -323,8 +322,7 @@ class Modes101_150(BaseModeVisualizer):
                 hue = int(60 + mids * 60 + curtain_idx * 20)  # Green to purple to blue
                 saturation = int(200 + treble * 55)
 
-                color_hsv = np.array([[[hue, saturation, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, saturation, 255)
 
                 # Draw vertical curtain strands
                 for y_offset in range(0, 200, 10):
@@ -335,8 +333,8 @@ class Modes101_150(BaseModeVisualizer):
                                   tuple(int(c * alpha) for c in color), -1, lineType=cv2.LINE_AA)
 
                 # Sparkle effects on treble
-                if treble > 0.6 and np.random.random() < treble:
-                    sparkle_y = int(y_base + wave1 + np.random.randint(0, 100))
+                if treble > 0.6 and self.rng.random() < treble:
+                    sparkle_y = int(y_base + wave1 + self.rng.integers(0, 100))
                     if 0 <= sparkle_y < self.height:
                         cv2.circle(frame, (x, sparkle_y), 3, (255, 255, 255), -1)
 
@@ -345,9 +343,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_107_dna_helix(self, frame, magnitudes):
         """Mode 107: Rotating DNA double helix with pulsing base pairs"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Rotation speed increases with amplitude
         self.dna_helix_rotation += 0.02 + bass * 0.05
@@ -399,9 +397,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_108_fractal_bloom(self, frame, magnitudes):
         """Mode 108: Fractal flower blooming and contracting"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Number of fractal iterations based on treble
         iterations = int(3 + treble * 4)
@@ -416,8 +414,7 @@ class Modes101_150(BaseModeVisualizer):
             saturation = int(200 + mids * 55)
             value = int(200 + bass * 55)
 
-            color_hsv = np.array([[[hue, saturation, value]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, saturation, value)
 
             # Draw petal
             petal_points = []
@@ -446,9 +443,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_109_circuit_board(self, frame, magnitudes):
         """Mode 109: Electronic circuit with flowing electricity"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Green PCB background
         frame[:] = (20, 50, 20)
@@ -457,7 +454,7 @@ class Modes101_150(BaseModeVisualizer):
         if len(self.circuit_board_traces) == 0:
             for i in range(20):
                 self.circuit_board_traces.append({
-                    'points': [(np.random.randint(0, self.width), np.random.randint(0, self.height))
+                    'points': [(self.rng.integers(0, self.width), self.rng.integers(0, self.height))
                               for _ in range(10)],
                     'active': 0,
                     'freq_idx': i
@@ -491,8 +488,8 @@ class Modes101_150(BaseModeVisualizer):
         # Spark effects on high treble
         if treble > 0.7:
             for _ in range(int(treble * 10)):
-                sx = np.random.randint(0, self.width)
-                sy = np.random.randint(0, self.height)
+                sx = self.rng.integers(0, self.width)
+                sy = self.rng.integers(0, self.height)
                 cv2.circle(frame, (sx, sy), 2, (255, 200, 100), -1)
 
         return frame
@@ -500,17 +497,17 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_110_quantum_field(self, frame, magnitudes):
         """Mode 110: Quantum probability field with wave function collapse"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Spawn quantum particles
         if len(self.quantum_field_particles) < 500:
             for _ in range(5):
                 self.quantum_field_particles.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
-                    'state': np.random.random(),  # Quantum state
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
+                    'state': self.rng.random(),  # Quantum state
                     'collapsed': False
                 })
 
@@ -520,7 +517,7 @@ class Modes101_150(BaseModeVisualizer):
         # Update and draw particles
         for particle in self.quantum_field_particles:
             # Quantum fluctuation
-            particle['state'] += (np.random.random() - 0.5) * 0.1
+            particle['state'] += (self.rng.random() - 0.5) * 0.1
             particle['state'] = max(0, min(1, particle['state']))
 
             # Collapse on high amplitude
@@ -548,8 +545,7 @@ class Modes101_150(BaseModeVisualizer):
                 intensity = int(100 + particle['state'] * 155)
                 radius = 2
 
-            color_hsv = np.array([[[hue, 255, intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, intensity)
 
             if 0 <= draw_x < self.width and 0 <= draw_y < self.height:
                 cv2.circle(frame, (draw_x, draw_y), radius, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -558,8 +554,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_111_origami_unfold(self, frame, magnitudes):
         """Mode 111: Geometric origami folding rhythmically"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         fold_amount = bass * 0.8 + 0.2
         num_segments = 8
@@ -574,8 +570,7 @@ class Modes101_150(BaseModeVisualizer):
             y2 = int(self.center_y + np.sin(angle + 0.5) * size * 0.7)
             
             hue = int((i / num_segments) * 180)
-            color_hsv = np.array([[[hue, int(200 + mids * 55), 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, int(200 + mids * 55), 255)
             
             points = np.array([[self.center_x, self.center_y], [x1, y1], [x2, y2]], dtype=np.int32)
             cv2.fillPoly(frame, [points], tuple(map(int, color)), lineType=cv2.LINE_AA)
@@ -586,15 +581,15 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_112_galaxy_spiral(self, frame, magnitudes):
         """Mode 112: Spiral galaxy with pulsing stars"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if len(self.galaxy_spiral_stars) < 500:
             for _ in range(10):
-                angle = np.random.random() * 2 * np.pi
-                distance = np.random.random() * 300
-                self.galaxy_spiral_stars.append({'angle': angle, 'distance': distance, 'brightness': np.random.random()})
+                angle = self.rng.random() * 2 * np.pi
+                distance = self.rng.random() * 300
+                self.galaxy_spiral_stars.append({'angle': angle, 'distance': distance, 'brightness': self.rng.random()})
         
         spiral_tightness = 0.3 + bass * 0.2
         rotation = self.frame_counter * 0.01
@@ -606,8 +601,7 @@ class Modes101_150(BaseModeVisualizer):
             
             brightness = int((star['brightness'] + mids) * 127.5)
             hue = int(140 - star['distance'] / 3)
-            color_hsv = np.array([[[hue, 255, brightness]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, brightness)
             
             if 0 <= x < self.width and 0 <= y < self.height:
                 size = 1 if star['distance'] > 200 else 2
@@ -637,8 +631,7 @@ class Modes101_150(BaseModeVisualizer):
                 points.append([x, int(band['y'] + wave)])
             
             hue = int(i * 18)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             pts = np.array(points, dtype=np.int32)
             cv2.polylines(frame, [pts], False, tuple(map(int, color)), 3, lineType=cv2.LINE_AA)
@@ -648,31 +641,30 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_114_ink_diffusion(self, frame, magnitudes):
         """Mode 114: Ink diffusing in water"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if bass > 0.6 and self.frame_counter % 10 == 0:
             self.ink_diffusion_particles.append({
                 'x': self.center_x,
                 'y': self.center_y,
-                'vx': np.random.uniform(-5, 5),
-                'vy': np.random.uniform(-5, 5),
+                'vx': self.rng.uniform(-5, 5),
+                'vy': self.rng.uniform(-5, 5),
                 'life': 100,
-                'hue': int(np.random.random() * 40 + 120)
+                'hue': int(self.rng.random() * 40 + 120)
             })
         
         for particle in self.ink_diffusion_particles[:]:
-            particle['x'] += particle['vx'] + np.random.uniform(-treble * 2, treble * 2)
-            particle['y'] += particle['vy'] + np.random.uniform(-treble * 2, treble * 2)
+            particle['x'] += particle['vx'] + self.rng.uniform(-treble * 2, treble * 2)
+            particle['y'] += particle['vy'] + self.rng.uniform(-treble * 2, treble * 2)
             particle['vx'] *= 0.98
             particle['vy'] *= 0.98
             particle['life'] -= 1
             
             if particle['life'] > 0:
                 alpha = particle['life'] / 100
-                color_hsv = np.array([[[particle['hue'], 255, int(200 * alpha)]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(particle['hue'], 255, int(200 * alpha))
                 
                 size = int((1 - alpha) * 30 + 5)
                 cv2.circle(frame, (int(particle['x']), int(particle['y'])), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -683,8 +675,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_115_geometric_kaleidoscope(self, frame, magnitudes):
         """Mode 115: Rotating kaleidoscope with morphing shapes"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         self.geo_kaleidoscope_rotation += 0.02 + mids * 0.05
         num_segments = 8
@@ -704,8 +696,7 @@ class Modes101_150(BaseModeVisualizer):
                     points.append([x, y])
                 
                 hue = int((seg * 22.5 + layer * 60) % 180)
-                color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, 255)
                 
                 pts = np.array(points, dtype=np.int32)
                 cv2.polylines(frame, [pts], True, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
@@ -715,13 +706,13 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_116_lightning_storm(self, frame, magnitudes):
         """Mode 116: Lightning bolts with branching"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         frame[:] = (30, 30, 40)
         
-        if bass > 0.7 and np.random.random() < 0.3:
-            start_x = np.random.randint(100, self.width - 100)
+        if bass > 0.7 and self.rng.random() < 0.3:
+            start_x = self.rng.integers(100, self.width - 100)
             self.lightning_bolts.append({'x': start_x, 'y': 0, 'life': 5, 'branches': []})
         
         for bolt in self.lightning_bolts[:]:
@@ -733,14 +724,14 @@ class Modes101_150(BaseModeVisualizer):
                 
                 for seg in range(segments):
                     next_y = prev_y + self.height // segments
-                    next_x = prev_x + np.random.randint(-30, 30)
+                    next_x = prev_x + self.rng.integers(-30, 30)
                     
                     cv2.line(frame, (prev_x, prev_y), (next_x, next_y), (255, 255, 200), 2, lineType=cv2.LINE_AA)
                     cv2.line(frame, (prev_x, prev_y), (next_x, next_y), (150, 150, 255), 1, lineType=cv2.LINE_AA)
                     
-                    if treble > 0.5 and np.random.random() < 0.2:
-                        branch_x = next_x + np.random.randint(-80, 80)
-                        branch_y = next_y + np.random.randint(20, 60)
+                    if treble > 0.5 and self.rng.random() < 0.2:
+                        branch_x = next_x + self.rng.integers(-80, 80)
+                        branch_y = next_y + self.rng.integers(20, 60)
                         cv2.line(frame, (next_x, next_y), (branch_x, branch_y), (200, 200, 255), 1, lineType=cv2.LINE_AA)
                     
                     prev_x, prev_y = next_x, next_y
@@ -751,16 +742,16 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_117_cellular_growth(self, frame, magnitudes):
         """Mode 117: Biological cell division and growth"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if len(self.cellular_growth_cells) == 0:
             self.cellular_growth_cells.append({'x': self.center_x, 'y': self.center_y, 'size': 50, 'gen': 0})
         
         if bass > 0.7 and len(self.cellular_growth_cells) < 50:
             for cell in list(self.cellular_growth_cells):
-                if np.random.random() < 0.1:
-                    angle = np.random.random() * 2 * np.pi
+                if self.rng.random() < 0.1:
+                    angle = self.rng.random() * 2 * np.pi
                     new_x = cell['x'] + np.cos(angle) * cell['size']
                     new_y = cell['y'] + np.sin(angle) * cell['size']
                     self.cellular_growth_cells.append({'x': new_x, 'y': new_y, 'size': 30, 'gen': cell['gen'] + 1})
@@ -769,8 +760,7 @@ class Modes101_150(BaseModeVisualizer):
             cell['size'] = 20 + bass * 30
             
             hue = int(60 + cell['gen'] * 20) % 180
-            color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 255)
             
             cv2.circle(frame, (int(cell['x']), int(cell['y'])), int(cell['size']), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
             cv2.circle(frame, (int(cell['x']), int(cell['y'])), int(cell['size'] * 0.5), tuple(map(int, color * 0.7)), -1, lineType=cv2.LINE_AA)
@@ -780,8 +770,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_118_sound_ribbons(self, frame, magnitudes):
         """Mode 118: 3D ribbons twisting through space"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         num_ribbons = 5
         for ribbon_idx in range(num_ribbons):
@@ -795,8 +785,7 @@ class Modes101_150(BaseModeVisualizer):
                 points.append([x, y])
             
             hue = int(ribbon_idx * 36) % 180
-            color_hsv = np.array([[[hue, 255, int(200 + mids * 55)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(200 + mids * 55))
             
             pts = np.array(points, dtype=np.int32)
             cv2.polylines(frame, [pts], False, tuple(map(int, color)), int(8 + bass * 10), lineType=cv2.LINE_AA)
@@ -806,14 +795,14 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_119_matrix_rain(self, frame, magnitudes):
         """Mode 119: Matrix code rain"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         frame[:] = (0, 0, 0)
         
         if len(self.matrix_rain_columns) == 0:
             for x in range(0, self.width, 20):
-                self.matrix_rain_columns.append({'x': x, 'y': np.random.randint(-100, 0), 'speed': 5 + np.random.randint(0, 10)})
+                self.matrix_rain_columns.append({'x': x, 'y': self.rng.integers(-100, 0), 'speed': 5 + self.rng.integers(0, 10)})
         
         for col in self.matrix_rain_columns:
             col['speed'] = 5 + bass * 10
@@ -831,23 +820,23 @@ class Modes101_150(BaseModeVisualizer):
                     else:
                         color = (0, brightness, 0)
                     
-                    char = chr(33 + np.random.randint(0, 94))
+                    char = chr(33 + self.rng.integers(0, 94))
                     cv2.putText(frame, char, (col['x'], y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
         
         if treble > 0.7:
             for _ in range(int(treble * 5)):
-                x = np.random.randint(0, self.width)
-                y = np.random.randint(0, self.height)
-                cv2.putText(frame, chr(33 + np.random.randint(0, 94)), (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                x = self.rng.integers(0, self.width)
+                y = self.rng.integers(0, self.height)
+                cv2.putText(frame, chr(33 + self.rng.integers(0, 94)), (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         
         return frame
 
 
     def draw_mode_120_fire_mandala(self, frame, magnitudes):
         """Mode 120: Circular mandala made of flames"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         num_flames = int(20 + treble * 30)
         
@@ -879,15 +868,14 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_121_tessellation_shift(self, frame, magnitudes):
         """Mode 121: Escher-style morphing tessellations"""
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        mids = self.get_mids(magnitudes)
         
         tile_size = int(40 + mids * 20)
         for y in range(0, self.height, tile_size):
             for x in range(0, self.width, tile_size):
                 shift = int(self.frame_counter * mids) % 3
                 hue = int((x + y) / 10 + self.frame_counter) % 180
-                color_hsv = np.array([[[hue, 200, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, 255)
                 
                 if shift == 0:
                     cv2.rectangle(frame, (x, y), (x + tile_size, y + tile_size), tuple(map(int, color)), -1)
@@ -904,9 +892,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_122_seismic_waves(self, frame, magnitudes):
         """Mode 122: Seismograph readings with P-waves and S-waves"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         for wave_idx in range(3):
             y_pos = 100 + wave_idx * (self.height - 200) // 3
@@ -931,9 +919,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_123_neon_city(self, frame, magnitudes):
         """Mode 123: Cyberpunk city with pulsing lights"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         frame[:] = (80, 40, 80)
         
@@ -941,7 +929,7 @@ class Modes101_150(BaseModeVisualizer):
             for i in range(15):
                 self.neon_city_buildings.append({
                     'x': i * self.width // 15,
-                    'base_height': np.random.randint(100, 400),
+                    'base_height': self.rng.integers(100, 400),
                     'width': self.width // 16
                 })
         
@@ -952,8 +940,8 @@ class Modes101_150(BaseModeVisualizer):
             
             num_windows = int(height / 20)
             for win_y in range(num_windows):
-                if np.random.random() < mids:
-                    win_color = (255, 100, 255) if np.random.random() < 0.5 else (100, 255, 255)
+                if self.rng.random() < mids:
+                    win_color = (255, 100, 255) if self.rng.random() < 0.5 else (100, 255, 255)
                     win_actual_y = self.height - height + win_y * 20
                     cv2.rectangle(frame, (building['x'] + 2, win_actual_y + 2),
                                 (building['x'] + building['width'] - 2, win_actual_y + 15),
@@ -964,8 +952,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_124_magnetic_field(self, frame, magnitudes):
         """Mode 124: Magnetic field lines with particle clustering"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         pole_n = (self.width // 3, self.center_y)
         pole_s = (2 * self.width // 3, self.center_y)
@@ -992,14 +980,14 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_125_bubble_fusion(self, frame, magnitudes):
         """Mode 125: Bubbles that float, merge, and pop"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if bass > 0.5 and len(self.bubble_fusion_bubbles) < 30:
             self.bubble_fusion_bubbles.append({
-                'x': self.center_x + np.random.randint(-100, 100),
+                'x': self.center_x + self.rng.integers(-100, 100),
                 'y': self.height - 50,
-                'vx': np.random.uniform(-1, 1),
+                'vx': self.rng.uniform(-1, 1),
                 'vy': -2 - bass * 3,
                 'radius': int(20 + bass * 40)
             })
@@ -1015,8 +1003,7 @@ class Modes101_150(BaseModeVisualizer):
                 continue
             
             hue = int((bubble['y'] / self.height) * 180)
-            color_hsv = np.array([[[hue, 100, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 100, 255)
             
             cv2.circle(frame, (int(bubble['x']), int(bubble['y'])), bubble['radius'], tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
             cv2.circle(frame, (int(bubble['x'] - bubble['radius'] // 3), int(bubble['y'] - bubble['radius'] // 3)),
@@ -1027,7 +1014,7 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_126_tribal_drums(self, frame, magnitudes):
         """Mode 126: Tribal patterns pulsing like drum skins"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
         
         num_rings = int(5 + bass * 10)
         for ring in range(num_rings):
@@ -1056,17 +1043,17 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_127_glass_shatter(self, frame, magnitudes):
         """Mode 127: Glass forming and shattering"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if bass > 0.7 and len(self.glass_shatter_fragments) == 0:
             for _ in range(30):
                 self.glass_shatter_fragments.append({
-                    'x': self.center_x + np.random.randint(-200, 200),
-                    'y': self.center_y + np.random.randint(-200, 200),
-                    'vx': np.random.uniform(-5, 5),
-                    'vy': np.random.uniform(-5, 5),
-                    'size': np.random.randint(20, 50),
+                    'x': self.center_x + self.rng.integers(-200, 200),
+                    'y': self.center_y + self.rng.integers(-200, 200),
+                    'vx': self.rng.uniform(-5, 5),
+                    'vy': self.rng.uniform(-5, 5),
+                    'size': self.rng.integers(20, 50),
                     'life': 30
                 })
         
@@ -1102,18 +1089,18 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_128_bioluminescence(self, frame, magnitudes):
         """Mode 128: Deep ocean bioluminescent creatures"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         frame[:] = (20, 10, 0)
         
         if len(self.bioluminescent_creatures) < 20:
             self.bioluminescent_creatures.append({
-                'x': np.random.randint(0, self.width),
-                'y': np.random.randint(0, self.height),
-                'phase': np.random.random() * 2 * np.pi,
-                'speed': np.random.uniform(0.5, 2)
+                'x': self.rng.integers(0, self.width),
+                'y': self.rng.integers(0, self.height),
+                'phase': self.rng.random() * 2 * np.pi,
+                'speed': self.rng.uniform(0.5, 2)
             })
         
         for creature in self.bioluminescent_creatures:
@@ -1128,8 +1115,7 @@ class Modes101_150(BaseModeVisualizer):
             glow_intensity = int(150 + np.sin(self.frame_counter * 0.1 + creature['phase']) * 50 + bass * 55)
             
             hue = int(90 + mids * 60)
-            color_hsv = np.array([[[hue, 255, glow_intensity]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, glow_intensity)
             
             size = int(15 + bass * 20)
             cv2.circle(frame, (int(creature['x']), int(creature['y'])), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -1140,8 +1126,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_129_sound_architecture(self, frame, magnitudes):
         """Mode 129: Impossible architecture constructing/deconstructing"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         build_progress = bass
         
@@ -1169,9 +1155,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_130_plasma_ball(self, frame, magnitudes):
         """Mode 130: Plasma globe with electrical tendrils"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         center_radius = int(60 + bass * 40)
         cv2.circle(frame, (self.center_x, self.center_y), center_radius, (100, 50, 100), -1, lineType=cv2.LINE_AA)
@@ -1184,7 +1170,7 @@ class Modes101_150(BaseModeVisualizer):
             segments = 20
             
             for seg in range(segments):
-                next_angle = angle + np.random.uniform(-0.5, 0.5)
+                next_angle = angle + self.rng.uniform(-0.5, 0.5)
                 distance = center_radius + seg * 15
                 
                 next_x = int(self.center_x + np.cos(next_angle) * distance)
@@ -1192,8 +1178,7 @@ class Modes101_150(BaseModeVisualizer):
                 
                 hue = int(120 + seg * 5)
                 intensity = int(255 - seg * 10)
-                color_hsv = np.array([[[hue, 255, intensity]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, intensity)
                 
                 cv2.line(frame, (current_x, current_y), (next_x, next_y), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
                 
@@ -1204,8 +1189,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_131_sand_mandala(self, frame, magnitudes):
         """Mode 131: Tibetan sand mandala forming grain by grain"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         num_sections = 8
         for section in range(num_sections):
@@ -1230,9 +1215,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_132_laser_show(self, frame, magnitudes):
         """Mode 132: Concert laser beams sweeping and bouncing"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         frame[:] = (10, 10, 10)
         
@@ -1259,18 +1244,18 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_133_coral_reef(self, frame, magnitudes):
         """Mode 133: Growing coral reef with swaying polyps"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         frame[:] = (100, 50, 20)
         
         if len(self.coral_reef_polyps) < 30:
             self.coral_reef_polyps.append({
-                'x': np.random.randint(50, self.width - 50),
-                'y': self.height - np.random.randint(50, 200),
-                'height': np.random.randint(40, 100),
-                'hue': np.random.randint(0, 180),
-                'phase': np.random.random() * 2 * np.pi
+                'x': self.rng.integers(50, self.width - 50),
+                'y': self.height - self.rng.integers(50, 200),
+                'height': self.rng.integers(40, 100),
+                'hue': self.rng.integers(0, 180),
+                'phase': self.rng.random() * 2 * np.pi
             })
         
         for coral in self.coral_reef_polyps:
@@ -1282,8 +1267,7 @@ class Modes101_150(BaseModeVisualizer):
                 
                 size = int(5 + (coral['height'] - h) / coral['height'] * 15 * (1 + bass * 0.3))
                 
-                color_hsv = np.array([[[coral['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(coral['hue'], 255, 255)
                 
                 if 0 <= x < self.width and 0 <= y < self.height:
                     cv2.circle(frame, (x, y), size, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -1293,8 +1277,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_134_wireframe_morph(self, frame, magnitudes):
         """Mode 134: 3D wireframe objects morphing between shapes"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         shape_type = int(self.frame_counter * 0.01) % 4
         angle = self.frame_counter * 0.03
@@ -1339,8 +1323,7 @@ class Modes101_150(BaseModeVisualizer):
         for i, v1 in enumerate(vertices_2d):
             for v2 in vertices_2d[i+1:i+5]:
                 hue = int(100 + mids * 80)
-                color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, 255)
                 
                 cv2.line(frame, v1, v2, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
         
@@ -1349,17 +1332,17 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_135_sound_garden(self, frame, magnitudes):
         """Mode 135: Abstract garden with blooming flowers"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if len(self.sound_garden_plants) < 15:
             self.sound_garden_plants.append({
-                'x': np.random.randint(100, self.width - 100),
+                'x': self.rng.integers(100, self.width - 100),
                 'y': self.height - 50,
-                'height': np.random.randint(80, 200),
+                'height': self.rng.integers(80, 200),
                 'bloom_size': 0,
-                'hue': np.random.randint(0, 180)
+                'hue': self.rng.integers(0, 180)
             })
         
         for plant in self.sound_garden_plants:
@@ -1376,8 +1359,7 @@ class Modes101_150(BaseModeVisualizer):
                 petal_x = int(bloom_x + np.cos(angle) * plant['bloom_size'])
                 petal_y = int(bloom_y + np.sin(angle) * plant['bloom_size'])
                 
-                color_hsv = np.array([[[plant['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(plant['hue'], 255, 255)
                 
                 cv2.circle(frame, (petal_x, petal_y), int(plant['bloom_size'] * 0.5),
                           tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
@@ -1390,9 +1372,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_136_hologram_glitch(self, frame, magnitudes):
         """Mode 136: Glitching holographic interface"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         frame[:] = (10, 10, 10)
         
@@ -1402,11 +1384,11 @@ class Modes101_150(BaseModeVisualizer):
             panel_w = 100
             panel_h = 150
             
-            if treble > 0.7 and np.random.random() < 0.3:
-                glitch_offset = np.random.randint(-20, 20)
+            if treble > 0.7 and self.rng.random() < 0.3:
+                glitch_offset = self.rng.integers(-20, 20)
                 panel_x += glitch_offset
                 
-                r_offset = np.random.randint(-5, 5)
+                r_offset = self.rng.integers(-5, 5)
                 cv2.rectangle(frame, (panel_x + r_offset, panel_y), (panel_x + panel_w + r_offset, panel_y + panel_h), (255, 0, 0), 1)
                 cv2.rectangle(frame, (panel_x - r_offset, panel_y), (panel_x + panel_w - r_offset, panel_y + panel_h), (0, 255, 255), 1)
             else:
@@ -1418,7 +1400,7 @@ class Modes101_150(BaseModeVisualizer):
         
         if treble > 0.6:
             for _ in range(int(treble * 20)):
-                scan_y = np.random.randint(0, self.height)
+                scan_y = self.rng.integers(0, self.height)
                 cv2.line(frame, (0, scan_y), (self.width, scan_y), (100, 255, 255), 1)
         
         return frame
@@ -1426,8 +1408,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_137_pendulum_wave(self, frame, magnitudes):
         """Mode 137: Multiple pendulums creating wave patterns"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         num_pendulums = 20
         for i in range(num_pendulums):
@@ -1443,8 +1425,7 @@ class Modes101_150(BaseModeVisualizer):
             cv2.line(frame, (x, 100), (bob_x, bob_y), (200, 200, 200), 1, lineType=cv2.LINE_AA)
             
             hue = int((i / num_pendulums) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             cv2.circle(frame, (bob_x, bob_y), 10, tuple(map(int, color)), -1, lineType=cv2.LINE_AA)
         
@@ -1453,9 +1434,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_138_volcano_eruption(self, frame, magnitudes):
         """Mode 138: Volcano erupting with lava and ash"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         volcano_base = [(self.center_x - 200, self.height), (self.center_x + 200, self.height), (self.center_x, self.height - 200)]
         pts = np.array(volcano_base, dtype=np.int32)
@@ -1464,9 +1445,9 @@ class Modes101_150(BaseModeVisualizer):
         if bass > 0.6:
             for _ in range(int(bass * 20)):
                 self.volcano_lava_particles.append({
-                    'x': self.center_x + np.random.randint(-20, 20),
+                    'x': self.center_x + self.rng.integers(-20, 20),
                     'y': self.height - 200,
-                    'vx': np.random.uniform(-3, 3),
+                    'vx': self.rng.uniform(-3, 3),
                     'vy': -8 - bass * 5,
                     'life': 60
                 })
@@ -1493,8 +1474,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_139_butterfly_effect(self, frame, magnitudes):
         """Mode 139: Chaos theory Lorenz attractor"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         sigma, rho, beta = 10.0, 28.0, 8.0/3.0
         dt = 0.01
@@ -1527,8 +1508,7 @@ class Modes101_150(BaseModeVisualizer):
             py2 = int(self.center_y + z2 * 10)
             
             hue = int((i / len(self.butterfly_attractor_trail)) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             if 0 <= px1 < self.width and 0 <= py1 < self.height and 0 <= px2 < self.width and 0 <= py2 < self.height:
                 cv2.line(frame, (px1, py1), (px2, py2), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
@@ -1538,16 +1518,15 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_140_silk_weaving(self, frame, magnitudes):
         """Mode 140: Silk threads weaving patterns"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         grid_size = 20
         for i in range(0, self.width, grid_size):
             vertical_offset = int(np.sin(i * 0.05 + self.frame_counter * 0.1) * 30 * bass)
             
             hue = int((i / self.width) * 180)
-            color_hsv = np.array([[[hue, int(150 + mids * 105), 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, int(150 + mids * 105), 255)
             
             cv2.line(frame, (i, vertical_offset), (i, self.height + vertical_offset), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
         
@@ -1555,8 +1534,7 @@ class Modes101_150(BaseModeVisualizer):
             horizontal_offset = int(np.sin(j * 0.05 + self.frame_counter * 0.1) * 30 * mids)
             
             hue = int(60 + (j / self.height) * 120)
-            color_hsv = np.array([[[hue, int(150 + bass * 105), 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, int(150 + bass * 105), 255)
             
             cv2.line(frame, (horizontal_offset, j), (self.width + horizontal_offset, j), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
         
@@ -1565,8 +1543,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_141_clock_gears(self, frame, magnitudes):
         """Mode 141: Interlocking clockwork gears turning"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         gears = [
             {'x': self.width // 3, 'y': self.center_y, 'radius': 80, 'teeth': 12, 'speed': 1},
@@ -1595,15 +1573,15 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_142_smoke_signals(self, frame, magnitudes):
         """Mode 142: Rising smoke plumes forming patterns"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if self.frame_counter % 3 == 0:
             self.smoke_signal_particles.append({
-                'x': self.center_x + np.random.randint(-50, 50),
+                'x': self.center_x + self.rng.integers(-50, 50),
                 'y': self.height - 100,
-                'vx': np.random.uniform(-1, 1),
+                'vx': self.rng.uniform(-1, 1),
                 'vy': -2 - mids * 2,
                 'size': 10,
                 'life': 100
@@ -1631,8 +1609,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_143_stained_glass(self, frame, magnitudes):
         """Mode 143: Glowing stained glass window"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         pane_size = 80
         for y in range(0, self.height, pane_size):
@@ -1640,8 +1618,7 @@ class Modes101_150(BaseModeVisualizer):
                 hue = int((x + y) / 10) % 180
                 brightness = int(150 + bass * 105)
                 
-                color_hsv = np.array([[[hue, 200, brightness]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, brightness)
                 
                 cv2.rectangle(frame, (x, y), (x + pane_size, y + pane_size), tuple(map(int, color)), -1)
                 cv2.rectangle(frame, (x, y), (x + pane_size, y + pane_size), (30, 30, 30), 4)
@@ -1655,9 +1632,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_144_string_theory(self, frame, magnitudes):
         """Mode 144: Theoretical strings vibrating in multiple dimensions"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         num_strings = 30
         for string_idx in range(num_strings):
@@ -1676,8 +1653,7 @@ class Modes101_150(BaseModeVisualizer):
             
             hue = int((string_idx / num_strings) * 180)
             alpha = 0.3 + treble * 0.7
-            color_hsv = np.array([[[hue, 255, int(255 * alpha)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(255 * alpha))
             
             pts = np.array(points, dtype=np.int32)
             cv2.polylines(frame, [pts], False, tuple(map(int, color)), 1, lineType=cv2.LINE_AA)
@@ -1687,8 +1663,8 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_145_paper_craft(self, frame, magnitudes):
         """Mode 145: Paper cutouts folding into 3D shapes"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         fold_progress = (np.sin(self.frame_counter * 0.05) + 1) / 2 * bass
         
@@ -1715,9 +1691,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_146_northern_lights(self, frame, magnitudes):
         """Mode 146: Realistic aurora borealis dancing"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         frame[:] = (20, 20, 40)
         
@@ -1733,8 +1709,7 @@ class Modes101_150(BaseModeVisualizer):
                 
                 hue = int(60 + mids * 60 + band * 10)
                 brightness = int(200 + treble * 55)
-                color_hsv = np.array([[[hue, 200, brightness]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 200, brightness)
                 
                 for y_offset in range(40):
                     alpha = 1.0 - (y_offset / 40)
@@ -1742,8 +1717,8 @@ class Modes101_150(BaseModeVisualizer):
                         cv2.circle(frame, (x, y + y_offset), 5, tuple(int(c * alpha) for c in color), -1, lineType=cv2.LINE_AA)
         
         for _ in range(50):
-            sx = np.random.randint(0, self.width)
-            sy = np.random.randint(0, self.height // 2)
+            sx = self.rng.integers(0, self.width)
+            sy = self.rng.integers(0, self.height // 2)
             cv2.circle(frame, (sx, sy), 1, (255, 255, 255), -1)
         
         return frame
@@ -1751,56 +1726,37 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_147_cellular_automata(self, frame, magnitudes):
         """Mode 147: Conway's Game of Life with audio triggers"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         cell_size = 10
         grid_w = self.width // cell_size
         grid_h = self.height // cell_size
         
         if len(self.cellular_automata_grid) == 0:
-            self.cellular_automata_grid = [[np.random.randint(0, 2) for _ in range(grid_w)] for _ in range(grid_h)]
+            self.cellular_automata_grid = self.rng.integers(0, 2, (grid_h, grid_w))
         
         if self.frame_counter % 5 == 0:
-            new_grid = [[0 for _ in range(grid_w)] for _ in range(grid_h)]
-            
-            for y in range(grid_h):
-                for x in range(grid_w):
-                    neighbors = 0
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dy == 0 and dx == 0:
-                                continue
-                            ny, nx = (y + dy) % grid_h, (x + dx) % grid_w
-                            neighbors += self.cellular_automata_grid[ny][nx]
-                    
-                    if self.cellular_automata_grid[y][x] == 1:
-                        new_grid[y][x] = 1 if neighbors in [2, 3] else 0
-                    else:
-                        new_grid[y][x] = 1 if neighbors == 3 else 0
+            new_grid = automaton.step(self.cellular_automata_grid, automaton.CONWAY)
             
             if bass > 0.7:
-                for _ in range(int(bass * 50)):
-                    rx, ry = np.random.randint(0, grid_w), np.random.randint(0, grid_h)
-                    new_grid[ry][rx] = 1
+                seeds = self.rng.integers(0, [grid_w, grid_h], (int(bass * 50), 2))
+                new_grid[seeds[:, 1], seeds[:, 0]] = 1
             
             self.cellular_automata_grid = new_grid
         
-        for y in range(grid_h):
-            for x in range(grid_w):
-                if self.cellular_automata_grid[y][x] == 1:
-                    color = (0, int(200 + mids * 55), 0)
-                    cv2.rectangle(frame, (x * cell_size, y * cell_size),
-                                ((x + 1) * cell_size, (y + 1) * cell_size), color, -1)
+        # Cells are drawn up to the next cell's corner, one pixel wider than cell_size
+        automaton.paint_cells(frame, self.cellular_automata_grid, cell_size, cell_size,
+                              (0, int(200 + mids * 55), 0), grow=1)
         
         return frame
 
 
     def draw_mode_148_dragon_curve(self, frame, magnitudes):
         """Mode 148: Fractal dragon curve growing"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         
         iterations = int(3 + bass * 8)
         
@@ -1830,8 +1786,7 @@ class Modes101_150(BaseModeVisualizer):
         
         for i in range(1, len(points)):
             hue = int((i / len(points)) * 180)
-            color_hsv = np.array([[[hue, 255, int(200 + mids * 55)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(200 + mids * 55))
             
             if (0 <= points[i-1][0] < self.width and 0 <= points[i-1][1] < self.height and
                 0 <= points[i][0] < self.width and 0 <= points[i][1] < self.height):
@@ -1842,13 +1797,13 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_149_rain_circles(self, frame, magnitudes):
         """Mode 149: Concentric circles like raindrops"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         if treble > 0.5 and self.frame_counter % 10 == 0:
             self.rain_circle_ripples.append({
-                'x': np.random.randint(0, self.width),
-                'y': np.random.randint(0, self.height),
+                'x': self.rng.integers(0, self.width),
+                'y': self.rng.integers(0, self.height),
                 'radius': 0,
                 'life': 60
             })
@@ -1870,9 +1825,9 @@ class Modes101_150(BaseModeVisualizer):
 
     def draw_mode_150_fourier_epicycles(self, frame, magnitudes):
         """Mode 150: Rotating circles tracing Fourier series"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
         
         num_circles = int(5 + treble * 10)
         
@@ -1888,8 +1843,7 @@ class Modes101_150(BaseModeVisualizer):
             next_y = y + int(np.sin(angle) * radius)
             
             hue = int((i / num_circles) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             
             cv2.circle(frame, (x, y), radius, tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
             cv2.line(frame, (x, y), (next_x, next_y), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
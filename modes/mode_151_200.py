@@ -2,10 +2,12 @@
 Audio Spectrum Visualization Modes 151-200
 Auto-generated from audio_spectrum_creative.py
 """
-from .base import BaseModeVisualizer
+from .base import BaseModeVisualizer, draw_circles
 import numpy as np
 import cv2
 
+from color_lut import hsv_pixel
+
 
 class Modes151_200(BaseModeVisualizer):
     """Visualization modes 151 through 200"""
@@ -17,9 +19,9 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_151_neon_halo_burst(self, frame, magnitudes):
         """Mode 151: Circular ring whose radius pulses with kick; emits radial spikes on snare"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
         mids = np.mean(magnitudes[len(magnitudes)//4:len(magnitudes)//2])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        treble = self.get_highs(magnitudes)
 
         # Main pulsing ring
         ring_radius = int(150 + bass * 200)
@@ -47,8 +49,8 @@ class Modes151_200(BaseModeVisualizer):
         if treble > 0.5:
             spark_count = int(treble * 30)
             for _ in range(spark_count):
-                angle = np.random.random() * 2 * np.pi
-                dist = ring_radius + np.random.randint(-30, 30)
+                angle = self.rng.random() * 2 * np.pi
+                dist = ring_radius + self.rng.integers(-30, 30)
                 sx = int(self.center_x + np.cos(angle) * dist)
                 sy = int(self.center_y + np.sin(angle) * dist)
                 cv2.circle(frame, (sx, sy), 2, (255, 255, 200), -1)
@@ -58,9 +60,9 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_152_twin_orbiters(self, frame, magnitudes):
         """Mode 152: Two dots orbit a center with elastic distance; trails draw lissajous figure"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Orbit parameters
         orbit_radius = 150 + bass * 100
@@ -95,7 +97,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_153_bar_spiral_galaxy(self, frame, magnitudes):
         """Mode 153: Bars arranged in a spiral. Each bar length follows its band"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         self.bar_spiral_rotation += 0.02 + bass * 0.05
 
@@ -114,8 +116,7 @@ class Modes151_200(BaseModeVisualizer):
             y1 = int(y + np.sin(angle_perp) * bar_length)
 
             hue = int((i / num_bars) * 180)
-            color_hsv = np.array([[[hue, 255, int(200 + magnitude * 55)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, int(200 + magnitude * 55))
 
             cv2.line(frame, (x, y), (x1, y1), tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
@@ -124,8 +125,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_154_ribbon_wave(self, frame, magnitudes):
         """Mode 154: Wide ribbon undulates like cloth; bass lifts amplitude"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         segments = 80
         points_top = []
@@ -135,7 +136,7 @@ class Modes151_200(BaseModeVisualizer):
             x = int(i * self.width / segments)
             amplitude = int(50 + bass * 100)
             wave = np.sin(i * 0.3 + self.frame_counter * 0.1) * amplitude
-            edge_jitter = np.random.randint(-int(treble * 10), int(treble * 10) + 1)
+            edge_jitter = self.rng.integers(-int(treble * 10), int(treble * 10) + 1)
 
             y_top = int(self.center_y - 30 + wave + edge_jitter)
             y_bottom = int(self.center_y + 30 + wave - edge_jitter)
@@ -159,7 +160,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_155_voxel_city(self, frame, magnitudes):
         """Mode 155: 3D grid of extruded cubes like skyline; building heights react per frequency"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         grid_size = 8
         gap = 15
@@ -197,8 +198,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_156_sunburst_dial(self, frame, magnitudes):
         """Mode 156: 360° radial meter with ticks; ticks bend outward on mids"""
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         tick_count = 60
         inner_radius = 120
@@ -229,8 +230,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_157_waterline_oscilloscope(self, frame, magnitudes):
         """Mode 157: Horizontal waveform floats like water surface"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Generate waveform points
         points = []
@@ -248,7 +249,7 @@ class Modes151_200(BaseModeVisualizer):
         # Spawn foam particles on highs
         if treble > 0.5 and self.frame_counter % 2 == 0:
             for _ in range(int(treble * 5)):
-                idx = np.random.randint(0, len(points))
+                idx = self.rng.integers(0, len(points))
                 px, py = points[idx]
                 self.waterline_surface.append({'x': px, 'y': py, 'life': 20})
 
@@ -267,8 +268,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_158_laser_tunnel(self, frame, magnitudes):
         """Mode 158: Perspective tunnel of rings; ring scale follows kick"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         ring_count = 15
         hue_shift = int(treble * 180)
@@ -279,8 +280,7 @@ class Modes151_200(BaseModeVisualizer):
             thickness = max(1, int(5 * (1 - z)))
 
             hue = (hue_shift + i * 12) % 180
-            color_hsv = np.array([[[hue, 255, 200]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 200)
 
             cv2.circle(frame, (self.center_x, self.center_y), scale, tuple(map(int, color)), thickness, lineType=cv2.LINE_AA)
 
@@ -289,15 +289,15 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_159_vector_field_sprites(self, frame, magnitudes):
         """Mode 159: Thousands of particles follow a noise flow; velocity multiplies on mids"""
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         # Initialize particles
         if len(self.vector_field_particles) < 300:
             for _ in range(300 - len(self.vector_field_particles)):
                 self.vector_field_particles.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
                     'trail': []
                 })
 
@@ -329,7 +329,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_160_orbit_rings_meter(self, frame, magnitudes):
         """Mode 160: Nested orbits with dots; each ring maps to a band"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         ring_count = min(10, len(magnitudes) // 12)
 
@@ -350,8 +350,7 @@ class Modes151_200(BaseModeVisualizer):
 
             # Draw dot
             hue = int((i / ring_count) * 180)
-            color_hsv = np.array([[[hue, 255, 255]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, 255)
             cv2.circle(frame, (x, y), dot_size, tuple(map(int, color)), -1)
 
         return frame
@@ -359,7 +358,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_161_stitch_bars(self, frame, magnitudes):
         """Mode 161: Stacked micro-bars like embroidered stitches"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         rows = 8
         cols = min(60, len(magnitudes))
@@ -385,9 +384,9 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_162_aurora_curtain(self, frame, magnitudes):
         """Mode 162: Vertical curtains waving; bass widens curtain"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         curtain_count = 5
 
@@ -403,8 +402,7 @@ class Modes151_200(BaseModeVisualizer):
 
             # Draw curtain
             hue = int((c / curtain_count) * 180)
-            color_hsv = np.array([[[hue, 200, 200]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 200, 200)
 
             for i in range(1, len(points)):
                 cv2.line(frame, points[i-1], points[i], tuple(map(int, color)), 3, lineType=cv2.LINE_AA)
@@ -412,8 +410,8 @@ class Modes151_200(BaseModeVisualizer):
         # Star-like flickers
         if treble > 0.6:
             for _ in range(int(treble * 10)):
-                sx = np.random.randint(0, self.width)
-                sy = np.random.randint(0, self.height)
+                sx = self.rng.integers(0, self.width)
+                sy = self.rng.integers(0, self.height)
                 cv2.circle(frame, (sx, sy), 2, (255, 255, 200), -1)
 
         return frame
@@ -421,7 +419,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_163_helix_bars_3d(self, frame, magnitudes):
         """Mode 163: Two helical rails of bars spinning"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         self.helix_bars_state += 0.05 + bass * 0.1
 
@@ -451,7 +449,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_164_polygon_heartbeat(self, frame, magnitudes):
         """Mode 164: Regular polygon in the center inflates on kicks"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         sides = 6
         scale = 100 + int(bass * 150)
@@ -492,15 +490,15 @@ class Modes151_200(BaseModeVisualizer):
 
         # Check for peaks
         for i, mag in enumerate(magnitudes):
-            if mag > peak_threshold and np.random.random() < 0.1:
+            if mag > peak_threshold and self.rng.random() < 0.1:
                 # Spawn confetti
                 hue = int((i / len(magnitudes)) * 180)
                 for _ in range(20):
                     self.confetti_particles.append({
-                        'x': self.center_x + np.random.randint(-50, 50),
-                        'y': self.center_y + np.random.randint(-50, 50),
-                        'vx': np.random.uniform(-5, 5),
-                        'vy': np.random.uniform(-10, -2),
+                        'x': self.center_x + self.rng.integers(-50, 50),
+                        'y': self.center_y + self.rng.integers(-50, 50),
+                        'vx': self.rng.uniform(-5, 5),
+                        'vy': self.rng.uniform(-10, -2),
                         'hue': hue,
                         'life': 60
                     })
@@ -514,8 +512,7 @@ class Modes151_200(BaseModeVisualizer):
             particle['life'] -= 1
 
             if particle['life'] > 0:
-                color_hsv = np.array([[[particle['hue'], 255, 255]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(particle['hue'], 255, 255)
                 cv2.circle(frame, (int(particle['x']), int(particle['y'])), 3, tuple(map(int, color)), -1)
 
         self.confetti_particles = [p for p in self.confetti_particles if p['life'] > 0 and 0 <= p['y'] < self.height]
@@ -525,7 +522,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_166_wireframe_dome(self, frame, magnitudes):
         """Mode 166: Hemispherical mesh; vertices displace along normals"""
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        treble = self.get_highs(magnitudes)
 
         segments = 12
 
@@ -566,8 +563,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_167_pulse_dashes(self, frame, magnitudes):
         """Mode 167: Circular dashed stroke; dash length oscillates with mids"""
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         dash_count = 60
         radius = 200
@@ -595,7 +592,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_168_terrain_sweep(self, frame, magnitudes):
         """Mode 168: Scrolling heightmap like synthwave hills"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         row_count = 15
 
@@ -625,8 +622,7 @@ class Modes151_200(BaseModeVisualizer):
             # Draw line
             for i in range(1, len(points)):
                 hue = int((height / 1.0) * 180)
-                color_hsv = np.array([[[hue, 255, 200]]], dtype=np.uint8)
-                color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+                color = hsv_pixel(hue, 255, 200)
                 cv2.line(frame, points[i-1], points[i], tuple(map(int, color)), 2, lineType=cv2.LINE_AA)
 
         return frame
@@ -634,7 +630,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_169_chromatic_bars_mirror(self, frame, magnitudes):
         """Mode 169: Mirrored bars with central symmetry; hue rotates"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         hue_offset = (self.frame_counter * 2) % 180
         bar_count = min(60, len(magnitudes))
@@ -658,8 +654,7 @@ class Modes151_200(BaseModeVisualizer):
             x_right = self.center_x + i * (bar_width + gap)
 
             hue = (hue_offset + i * 3) % 180
-            color_hsv = np.array([[[hue, 255, min(255, 200 + flash_add)]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            color = hsv_pixel(hue, 255, min(255, 200 + flash_add))
 
             # Left bar
             cv2.rectangle(frame, (x_left, self.center_y - height), (x_left + bar_width, self.center_y), tuple(map(int, color)), -1)
@@ -671,7 +666,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_170_bubble_choir(self, frame, magnitudes):
         """Mode 170: Bubbles rise; size from band energy; pop on snare"""
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
+        mids = self.get_mids(magnitudes)
 
         # Spawn bubbles
         if self.frame_counter % 5 == 0:
@@ -679,7 +674,7 @@ class Modes151_200(BaseModeVisualizer):
                 magnitude = magnitudes[i]
                 if magnitude > 0.3:
                     self.bubble_choir_bubbles.append({
-                        'x': np.random.randint(50, self.width - 50),
+                        'x': self.rng.integers(50, self.width - 50),
                         'y': self.height - 50,
                         'size': int(10 + magnitude * 40),
                         'vy': -2 - magnitude * 2,
@@ -717,7 +712,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_171_starfield_quantizer(self, frame, magnitudes):
         """Mode 171: Stars quantized to a grid; cell brightness follows local band"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
+        bass = self.get_bass(magnitudes)
 
         grid_size = 16
         cell_width = self.width // grid_size
@@ -746,8 +741,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_172_dna_ladder(self, frame, magnitudes):
         """Mode 172: Two sinusoid strands; rung length follows mids"""
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         strand_spacing = 100
         amplitude = 50
@@ -786,9 +781,9 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_173_arc_meter_trio(self, frame, magnitudes):
         """Mode 173: Three concentric arcs for lows/mids/highs"""
-        bass = np.mean(magnitudes[:len(magnitudes)//4])
-        mids = np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4])
-        treble = np.mean(magnitudes[3*len(magnitudes)//4:])
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
+        treble = self.get_highs(magnitudes)
 
         values = [bass, mids, treble]
         colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255)]
@@ -880,8 +875,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_176_event_horizon_lattice(self, frame, magnitudes):
         """Mode 176: Event Horizon Lattice - warped grid bends toward a black hole; streaks on transients"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        bass = self.get_bass(magnitudes)
+        highs = self.get_highs(magnitudes)
         warp_strength = 0.3 + bass * 1.2
 
         rows = 16
@@ -932,18 +927,18 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_177_comet_conveyor(self, frame, magnitudes):
         """Mode 177: Comet Conveyor - endless belt carries comets; tails shear on treble"""
-        energy = float(np.mean(magnitudes))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        energy = self.get_energy(magnitudes)
+        highs = self.get_highs(magnitudes)
 
         belt_y = int(self.center_y + np.sin(self.frame_counter * 0.03) * 30)
         cv2.line(frame, (0, belt_y), (self.width, belt_y), (80, 80, 80), 2, lineType=cv2.LINE_AA)
 
         # Spawn
-        if len(self.comet_conveyor_belt) < 40 and np.random.random() < 0.3:
-            band_idx = np.random.randint(0, len(magnitudes))
+        if len(self.comet_conveyor_belt) < 40 and self.rng.random() < 0.3:
+            band_idx = self.rng.integers(0, len(magnitudes))
             self.comet_conveyor_belt.append({
                 'x': -20,
-                'y': belt_y + np.random.randint(-20, 20),
+                'y': belt_y + self.rng.integers(-20, 20),
                 'vx': 4 + energy * 8,
                 'size': int(4 + magnitudes[band_idx] * 18),
                 'shear': highs * 20
@@ -966,26 +961,26 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_178_quantum_foam_micro(self, frame, magnitudes):
         """Mode 178: Quantum Foam Micro - foamy micro-bubbles pop; cascades on peaks"""
-        energy = float(np.mean(magnitudes))
+        energy = self.get_energy(magnitudes)
         peak = np.max(magnitudes) > 0.8
 
         # Spawn bubbles
         if len(self.foam_bubbles) < 200:
             for _ in range(3):
                 self.foam_bubbles.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
-                    'r': np.random.randint(1, 5),
-                    'life': np.random.randint(20, 80)
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
+                    'r': self.rng.integers(1, 5),
+                    'life': self.rng.integers(20, 80)
                 })
 
         for b in self.foam_bubbles[:]:
             b['life'] -= 1
-            b['r'] = max(1, b['r'] + (np.random.random() - 0.5) * 0.5)
-            if peak and np.random.random() < 0.2 and len(self.foam_bubbles) < 300:
+            b['r'] = max(1, b['r'] + (self.rng.random() - 0.5) * 0.5)
+            if peak and self.rng.random() < 0.2 and len(self.foam_bubbles) < 300:
                 # cascade: spawn smaller around (with limit check)
                 for _ in range(2):  # Reduced from 3 to 2
-                    self.foam_bubbles.append({'x': b['x']+np.random.randint(-6,6), 'y': b['y']+np.random.randint(-6,6), 'r': 1, 'life': 20})
+                    self.foam_bubbles.append({'x': b['x']+self.rng.integers(-6,6), 'y': b['y']+self.rng.integers(-6,6), 'r': 1, 'life': 20})
             color = int(120 + energy * 135)
             cv2.circle(frame, (int(b['x']), int(b['y'])), int(b['r']), (color, color, 255), 1, lineType=cv2.LINE_AA)
             if b['life'] <= 0:
@@ -995,7 +990,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_179_aurora_crown(self, frame, magnitudes):
         """Mode 179: Aurora Crown - polar aurora dome overhead; ribbons brighten by mids"""
-        mids = float(np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4]))
+        mids = self.get_mids(magnitudes)
         ribbon_count = 8
         for i in range(ribbon_count):
             angle = (i / ribbon_count) * 2 * np.pi
@@ -1009,16 +1004,16 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_180_asteroid_excavator(self, frame, magnitudes):
         """Mode 180: Asteroid Excavator - drill depth increases with bass; debris size follows highs"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        bass = self.get_bass(magnitudes)
+        highs = self.get_highs(magnitudes)
         center = (self.center_x, self.center_y)
         cv2.circle(frame, center, 180, (60, 60, 60), -1)
         depth = int(bass * 120)
         cv2.line(frame, (self.center_x - 200, self.center_y - 100), (self.center_x - 40 - depth, self.center_y), (200, 200, 220), 3)
         # debris
         for _ in range(int(5 + highs * 25)):
-            dx = np.random.randint(-180, -40)
-            dy = np.random.randint(-10, 10)
+            dx = self.rng.integers(-180, -40)
+            dy = self.rng.integers(-10, 10)
             size = max(1, int(2 + highs * 6))
             cv2.circle(frame, (self.center_x + dx, self.center_y + dy), size, (180, 180, 180), -1)
         return frame
@@ -1026,7 +1021,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_181_hyperloop_spectrotrain(self, frame, magnitudes):
         """Mode 181: Hyperloop Spectrotrain - car length scales to energy; station lights strobe"""
-        energy = float(np.mean(magnitudes))
+        energy = self.get_energy(magnitudes)
         y = self.center_y
         cv2.line(frame, (0, y+30), (self.width, y+30), (100,100,100), 4)
         car_count = 6
@@ -1037,7 +1032,7 @@ class Modes151_200(BaseModeVisualizer):
             cv2.rectangle(frame, (cx, y-20), (cx+w, y+20), (180, 200, 255), -1)
             for k in range(4):
                 cv2.rectangle(frame, (cx+5+k*int(w/4), y-12), (cx+5+k*int(w/4)+10, y-2), (255, 255, 150), -1)
-        if np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4]) > 0.65:
+        if self.get_mids(magnitudes) > 0.65:
             for sx in range(0, self.width, 60):
                 cv2.circle(frame, (sx, y-40), 6, (255, 255, 200), -1)
         return frame
@@ -1074,11 +1069,10 @@ class Modes151_200(BaseModeVisualizer):
         dominant_idx = int(np.argmax(magnitudes))
         hue = int((dominant_idx / max(1, len(magnitudes)-1)) * 180)
         for _ in range(120):
-            x = np.random.randint(0, self.center_x)
-            y = np.random.randint(0, self.height)
-            jitter = int(np.random.randn()*6)
-            color_hsv = np.array([[[hue, 180, 200]]], dtype=np.uint8)
-            color = cv2.cvtColor(color_hsv, cv2.COLOR_HSV2BGR)[0][0]
+            x = self.rng.integers(0, self.center_x)
+            y = self.rng.integers(0, self.height)
+            jitter = int(self.rng.standard_normal()*6)
+            color = hsv_pixel(hue, 180, 200)
             cv2.circle(frame, (x, y+jitter), 3, tuple(map(int, color)), -1)
             cv2.circle(frame, (self.width-x, y+jitter), 3, tuple(map(int, color)), -1)
         return frame
@@ -1086,7 +1080,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_184_satellite_telemetry_rings(self, frame, magnitudes):
         """Mode 184: Satellite Telemetry Rings - rippling rings with dashed spectrum"""
-        energy = float(np.mean(magnitudes))
+        energy = self.get_energy(magnitudes)
         ring_count = 5
         for i in range(ring_count):
             radius = int(60 + i*40 + (self.frame_counter*3 + i*15) % 40)
@@ -1102,14 +1096,14 @@ class Modes151_200(BaseModeVisualizer):
                 y2 = int(self.center_y + np.sin(ang)*(radius+int(h*25)))
                 cv2.line(frame, (x1,y1), (x2,y2), (120,120,200), 1, lineType=cv2.LINE_AA)
         if energy < 0.15 and self.frame_counter % 6 == 0:
-            cv2.circle(frame, (np.random.randint(0,self.width), np.random.randint(0,self.height)), 2, (255,120,120), -1)
+            cv2.circle(frame, (self.rng.integers(0,self.width), self.rng.integers(0,self.height)), 2, (255,120,120), -1)
         return frame
 
 
     def draw_mode_185_wormhole_origami(self, frame, magnitudes):
         """Mode 185: Wormhole Origami - sheet folds into portal; depth by bass"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        folds = 10 + int(np.mean(magnitudes[3*len(magnitudes)//4:]) * 10)
+        bass = self.get_bass(magnitudes)
+        folds = 10 + int(self.get_highs(magnitudes) * 10)
         for i in range(folds):
             t = i/folds
             angle = t*np.pi
@@ -1120,8 +1114,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_186_holographic_jellyfish(self, frame, magnitudes):
         """Mode 186: Holographic Jellyfish - bell pulsates with lows; tentacles sparkle with highs"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        bass = self.get_bass(magnitudes)
+        highs = self.get_highs(magnitudes)
         r = int(60 + bass*120)
         cv2.circle(frame, (self.center_x,self.center_y-60), r, (200,200,255), 2)
         for t in range(20):
@@ -1134,13 +1128,13 @@ class Modes151_200(BaseModeVisualizer):
                 ny = int(ty + k*14)
                 cv2.circle(frame,(nx,ny),1,(255,255,180),-1)
         for _ in range(int(highs*30)):
-            cv2.circle(frame,(np.random.randint(self.center_x-r,self.center_x+r),np.random.randint(self.center_y-60,self.center_y+r)),1,(255,255,200),-1)
+            cv2.circle(frame,(self.rng.integers(self.center_x-r,self.center_x+r),self.rng.integers(self.center_y-60,self.center_y+r)),1,(255,255,200),-1)
         return frame
 
 
     def draw_mode_187_moon_quarry_crane(self, frame, magnitudes):
         """Mode 187: Moon Quarry Crane - bins heights equal band magnitude; dust on kicks"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         bins = min(24, len(magnitudes))
         gap = self.width // (bins+2)
         for i in range(bins):
@@ -1149,7 +1143,7 @@ class Modes151_200(BaseModeVisualizer):
             cv2.rectangle(frame,(x,self.center_y-h),(x+10,self.center_y),(180,180,220),-1)
         if bass>0.65:
             for _ in range(40):
-                cv2.circle(frame,(np.random.randint(0,self.width), self.center_y-np.random.randint(0,80)),1,(220,220,220),-1)
+                cv2.circle(frame,(self.rng.integers(0,self.width), self.center_y-self.rng.integers(0,80)),1,(220,220,220),-1)
         return frame
 
 
@@ -1172,7 +1166,7 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_189_cryo_crystal_garden(self, frame, magnitudes):
         """Mode 189: Cryo Crystal Garden - crystals grow per frequency slice; flare on treble"""
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        highs = self.get_highs(magnitudes)
         slices = 18
         for i in range(slices):
             idx = min(int(i * len(magnitudes)/slices), len(magnitudes)-1)
@@ -1208,8 +1202,8 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_191_lunar_tide_pool(self, frame, magnitudes):
         """Mode 191: Lunar Tide Pool - water level by bass; caustics sharpen with highs"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        bass = self.get_bass(magnitudes)
+        highs = self.get_highs(magnitudes)
         level = int(self.center_y + 80 - bass*150)
         cv2.rectangle(frame,(0,level),(self.width,self.height),(120,160,220),-1)
         for x in range(0,self.width,10):
@@ -1233,18 +1227,21 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_193_satellite_swarm_flocking(self, frame, magnitudes):
         """Mode 193: Satellite Swarm Flocking - simple flock; thrust bursts on kick"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        if len(self.satellites_swarm) < 40:
-            for _ in range(40 - len(self.satellites_swarm)):
-                self.satellites_swarm.append({'x':np.random.randint(0,self.width),'y':np.random.randint(0,self.height),'vx':np.random.uniform(-1,1),'vy':np.random.uniform(-1,1)})
-        for s in self.satellites_swarm:
-            s['vx'] += (np.random.random()-0.5)*0.2
-            s['vy'] += (np.random.random()-0.5)*0.2
-            if bass>0.6:
-                s['vx'] *= 1.1; s['vy'] *= 1.1
-            s['x'] = (s['x'] + s['vx'])%self.width
-            s['y'] = (s['y'] + s['vy'])%self.height
-            cv2.circle(frame,(int(s['x']),int(s['y'])),2,(200,200,255),-1)
+        bass = self.get_bass(magnitudes)
+        swarm = self.satellite_system
+        missing = 40 - len(swarm)
+        if missing > 0:
+            swarm.spawn(x=self.rng.integers(0, self.width, missing), y=self.rng.integers(0, self.height, missing),
+                        vx=self.rng.uniform(-1, 1, missing), vy=self.rng.uniform(-1, 1, missing))
+        jitter = (self.rng.random((len(swarm), 2)) - 0.5) * 0.2
+        swarm.vx += jitter[:, 0]
+        swarm.vy += jitter[:, 1]
+        if bass > 0.6:
+            swarm.vx *= 1.1
+            swarm.vy *= 1.1
+        swarm.x = (swarm.x + swarm.vx) % self.width
+        swarm.y = (swarm.y + swarm.vy) % self.height
+        draw_circles(frame, swarm.x, swarm.y, 2, (200, 200, 255), line_type=cv2.LINE_8)
         return frame
 
 
@@ -1267,18 +1264,18 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_195_zero_g_paint_spheres(self, frame, magnitudes):
         """Mode 195: Zero-G Paint Spheres - spheres merge on peaks and split on highs"""
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        highs = self.get_highs(magnitudes)
         peak = np.max(magnitudes) > 0.85
         if len(self.paint_spheres) < 12:
             for _ in range(12 - len(self.paint_spheres)):
-                self.paint_spheres.append({'x':np.random.randint(100,self.width-100),'y':np.random.randint(100,self.height-100),'r':np.random.randint(10,30)})
+                self.paint_spheres.append({'x':self.rng.integers(100,self.width-100),'y':self.rng.integers(100,self.height-100),'r':self.rng.integers(10,30)})
         if peak and len(self.paint_spheres)>1:
             a = self.paint_spheres.pop(); b = self.paint_spheres.pop()
             cx = int((a['x']+b['x'])/2); cy = int((a['y']+b['y'])/2)
             cr = int(min(80, a['r']+b['r']))
             self.paint_spheres.append({'x':cx,'y':cy,'r':cr})
         if highs>0.65 and len(self.paint_spheres)<20:
-            self.paint_spheres.append({'x':np.random.randint(80,self.width-80),'y':np.random.randint(80,self.height-80),'r':12})
+            self.paint_spheres.append({'x':self.rng.integers(80,self.width-80),'y':self.rng.integers(80,self.height-80),'r':12})
         for s in self.paint_spheres:
             cv2.circle(frame,(int(s['x']),int(s['y'])),int(s['r']),(160,200,255),-1)
         return frame
@@ -1286,13 +1283,13 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_196_supernova_countdown(self, frame, magnitudes):
         """Mode 196: Supernova Countdown - star swells with energy; blasts at threshold"""
-        self.supernova_state['energy'] += float(np.mean(magnitudes))*0.02
+        self.supernova_state['energy'] += self.get_energy(magnitudes)*0.02
         threshold = 1.0
         if not self.supernova_state['blasting'] and self.supernova_state['energy']>threshold:
             self.supernova_state['blasting'] = True
             for i in range(80):
                 ang = (i/80)*2*np.pi
-                self.supernova_state['filaments'].append({'x':self.center_x,'y':self.center_y,'vx':np.cos(ang)*(2+np.random.random()*3),'vy':np.sin(ang)*(2+np.random.random()*3),'life':60})
+                self.supernova_state['filaments'].append({'x':self.center_x,'y':self.center_y,'vx':np.cos(ang)*(2+self.rng.random()*3),'vy':np.sin(ang)*(2+self.rng.random()*3),'life':60})
         if not self.supernova_state['blasting']:
             r = int(40 + self.supernova_state['energy']*160)
             cv2.circle(frame,(self.center_x,self.center_y),r,(255,220,150),-1)
@@ -1307,23 +1304,23 @@ class Modes151_200(BaseModeVisualizer):
 
     def draw_mode_197_martian_wind_harp(self, frame, magnitudes):
         """Mode 197: Martian Wind Harp - dunes as strings; ripples by mids; dust devils on snares"""
-        mids = float(np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4]))
+        mids = self.get_mids(magnitudes)
         for y in range(200, self.height, 40):
             for x in range(0, self.width, 8):
                 dy = int(np.sin(x*0.05 + self.frame_counter*0.08)*mids*20)
                 frame[min(self.height-1,y+dy), min(self.width-1,x)] = (160,120,90)
         if mids>0.65:
             for _ in range(40):
-                cv2.circle(frame,(np.random.randint(0,self.width),np.random.randint(200,self.height)),2,(200,180,150),-1)
+                cv2.circle(frame,(self.rng.integers(0,self.width),self.rng.integers(200,self.height)),2,(200,180,150),-1)
         return frame
 
 
     def draw_mode_198_teleporting_bar_choir(self, frame, magnitudes):
         """Mode 198: Teleporting Bar Choir - bars pop at random radial positions; decay persists"""
-        if self.frame_counter % max(1, int(8 - np.mean(magnitudes[3*len(magnitudes)//4:]) * 6)) == 0:
-            idx = np.random.randint(0, len(magnitudes))
-            angle = np.random.random()*2*np.pi
-            radius = np.random.randint(40, self.max_radius)
+        if self.frame_counter % max(1, int(8 - self.get_highs(magnitudes) * 6)) == 0:
+            idx = self.rng.integers(0, len(magnitudes))
+            angle = self.rng.random()*2*np.pi
+            radius = self.rng.integers(40, self.max_radius)
             x = int(self.center_x + np.cos(angle)*radius)
             y = int(self.center_y + np.sin(angle)*radius)
             self.teleporting_bars.append({'x':x,'y':y,'h':int(30 + magnitudes[idx]*160),'life':50})
@@ -1354,8 +1351,8 @@ class Modes151_200(BaseModeVisualizer):
             idx = min(int(s/slit_count*len(magnitudes)), len(magnitudes)-1)
             rate = int(magnitudes[idx]*6)
             for _ in range(rate):
-                px = x + np.random.randint(-2,2)
-                py = self.center_y + np.random.randint(-2,2)
+                px = x + self.rng.integers(-2,2)
+                py = self.center_y + self.rng.integers(-2,2)
                 cv2.circle(frame,(px,py-70),1,(255,255,200),-1)
         return frame
 
@@ -17,7 +17,7 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_201_meteor_net(self, frame, magnitudes):
         """Mode 201: Meteor Net - hex net catches meteors; nodes glow by band"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         size = 24
         for y in range(100, self.height-100, size):
             for x in range(80, self.width-80, size):
@@ -31,23 +31,23 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_202_deep_space_garden_hose(self, frame, magnitudes):
         """Mode 202: Deep-Space Garden Hose - spray pressure by amplitude; droplets chime on highs"""
-        amp = float(np.mean(magnitudes))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        amp = self.get_energy(magnitudes)
+        highs = self.get_highs(magnitudes)
         for i in range(int(30 + amp*120)):
-            ang = -np.pi/6 + np.random.random()*np.pi/3
-            r = 10 + np.random.random()* (120 + amp*200)
+            ang = -np.pi/6 + self.rng.random()*np.pi/3
+            r = 10 + self.rng.random()* (120 + amp*200)
             x = int(self.center_x + np.cos(ang)*r)
             y = int(self.center_y + np.sin(ang)*r)
             cv2.circle(frame,(x,y),1,(200,200,255),-1)
         if highs>0.6:
             for _ in range(8):
-                cv2.circle(frame,(np.random.randint(self.center_x-80,self.center_x+80), np.random.randint(self.center_y-80,self.center_y+80)),1,(255,255,200),-1)
+                cv2.circle(frame,(self.rng.integers(self.center_x-80,self.center_x+80), self.rng.integers(self.center_y-80,self.center_y+80)),1,(255,255,200),-1)
         return frame
 
 
     def draw_mode_203_horizon_monoliths(self, frame, magnitudes):
         """Mode 203: Horizon Monoliths - distant monoliths rise with band; shadow sweeps on kicks"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         base_y = self.height-80
         count = min(20, len(magnitudes))
         gap = self.width//(count+1)
@@ -62,7 +62,7 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_204_gravity_slingshot_trails(self, frame, magnitudes):
         """Mode 204: Gravity Slingshot Trails - probes slingshot around planet; trail length by highs"""
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        highs = self.get_highs(magnitudes)
         for i in range(10):
             ang = self.frame_counter*0.02 + i*0.6
             r = 120 + i*6
@@ -93,7 +93,7 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_206_tesseract_window(self, frame, magnitudes):
         """Mode 206: Tesseract Window - 4D cube projection; face alpha by band energy"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         size = int(80 + bass*80)
         for dz in (-1,1):
             for dy in (-1,1):
@@ -139,8 +139,8 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_209_stellar_harpoon(self, frame, magnitudes):
         """Mode 209: Stellar Harpoon - line tension by amplitude; vibrato with highs"""
-        amp = float(np.mean(magnitudes))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        amp = self.get_energy(magnitudes)
+        highs = self.get_highs(magnitudes)
         length = int(80 + amp*260)
         wiggle = int(highs*20)
         x2 = int(self.center_x + length)
@@ -179,7 +179,7 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_212_star_nursery_conveyor(self, frame, magnitudes):
         """Mode 212: Star Nursery Conveyor - progression speed from energy"""
-        energy = float(np.mean(magnitudes))
+        energy = self.get_energy(magnitudes)
         for i in range(6):
             x = int((self.frame_counter*(2+energy*8) + i*140) % (self.width+160)) - 80
             for s in range(3):
@@ -217,7 +217,7 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_215_orbital_time_garden(self, frame, magnitudes):
         """Mode 215: Orbital Time Garden - planets are clock markers; orbits expand with bass"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         for h in range(12):
             ang = h/12*2*np.pi - np.pi/2
             r = int(120 + bass*60)
@@ -240,9 +240,9 @@ class Modes201_225(BaseModeVisualizer):
         """Mode 217: Dark-Matter Drizzle - invisible drizzle reveals when bands exceed threshold"""
         thr = 0.5
         for i in range(len(magnitudes)):
-            if magnitudes[i] > thr and np.random.random()<0.2:
-                x = np.random.randint(0,self.width)
-                y = np.random.randint(0,self.height)
+            if magnitudes[i] > thr and self.rng.random()<0.2:
+                x = self.rng.integers(0,self.width)
+                y = self.rng.integers(0,self.height)
                 cv2.circle(frame,(x,y),1,(200,200,255),-1)
         if np.max(magnitudes)>0.9:
             cv2.circle(frame,(self.center_x,self.center_y),100,(100,100,100),1)
@@ -277,7 +277,7 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_220_ion_thruster_plume(self, frame, magnitudes):
         """Mode 220: Ion Thruster Plume - plume length maps to amplitude; shock diamonds on peaks"""
-        amp = float(np.mean(magnitudes))
+        amp = self.get_energy(magnitudes)
         length = int(60 + amp*260)
         base = (120, self.center_y)
         cv2.rectangle(frame,(base[0]-10,base[1]-10),(base[0],base[1]+10),(180,180,200),-1)
@@ -293,7 +293,7 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_221_cosmic_dominoes(self, frame, magnitudes):
         """Mode 221: Cosmic Dominoes - curved domino line; fall rate by energy; tiles display local bars"""
-        energy = float(np.mean(magnitudes))
+        energy = self.get_energy(magnitudes)
         n = 20
         for i in range(n):
             t = i/n
@@ -309,13 +309,17 @@ class Modes201_225(BaseModeVisualizer):
     def draw_mode_222_spacesuit_hud(self, frame, magnitudes):
         """Mode 222: Spacesuit HUD - HUD overlays with spectrum wedges; warning flashes on peaks"""
         wedges = 24
+        def draw_ring(canvas):
+            for i in range(wedges):
+                ang1 = int(i/wedges*360)
+                cv2.ellipse(canvas,(self.center_x,self.center_y),(200,200),-90,ang1,ang1+6,(150,200,255),2)
+        self.cached_layer('spacesuit_hud', (self.center_x, self.center_y, wedges), draw_ring).composite(frame)
         for i in range(wedges):
             t = i/wedges
             idx = min(int(t*len(magnitudes)), len(magnitudes)-1)
             h = int(magnitudes[idx]*80)
             ang1 = int(t*360)
             ang2 = ang1 + 6
-            cv2.ellipse(frame,(self.center_x,self.center_y),(200,200),-90,ang1,ang2,(150,200,255),2)
             cv2.ellipse(frame,(self.center_x,self.center_y),(200+h,200+h),-90,ang1,ang2,(200,220,255),2)
         if np.max(magnitudes)>0.9:
             cv2.circle(frame,(self.center_x,self.center_y),10,(0,0,255),-1)
@@ -341,26 +345,26 @@ class Modes201_225(BaseModeVisualizer):
 
     def draw_mode_224_astro_terrarium(self, frame, magnitudes):
         """Mode 224: Astro Terrarium - micro planet ecosystem; eruptions on kicks; biolume with highs"""
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        bass = self.get_bass(magnitudes)
+        highs = self.get_highs(magnitudes)
         cv2.circle(frame,(self.center_x,self.center_y+60),90,(80,120,80),-1)
         if bass>0.7:
             for _ in range(30):
-                x = self.center_x + np.random.randint(-60,60)
-                y = self.center_y + 60 - np.random.randint(0,60)
+                x = self.center_x + self.rng.integers(-60,60)
+                y = self.center_y + 60 - self.rng.integers(0,60)
                 cv2.circle(frame,(x,y),2,(160,80,60),-1)
         for _ in range(int(highs*40)):
-            cv2.circle(frame,(np.random.randint(self.center_x-80,self.center_x+80), np.random.randint(self.center_y-20,self.center_y+120)),1,(120,220,200),-1)
+            cv2.circle(frame,(self.rng.integers(self.center_x-80,self.center_x+80), self.rng.integers(self.center_y-20,self.center_y+120)),1,(120,220,200),-1)
         return frame
 
 
     def draw_mode_225_micrometeor_spark_curtain(self, frame, magnitudes):
         """Mode 225: Micrometeor Spark Curtain - diagonal sparks; density with amplitude"""
-        amp = float(np.mean(magnitudes))
+        amp = self.get_energy(magnitudes)
         density = int(40 + amp*200)
         for _ in range(density):
-            x = np.random.randint(0,self.width)
-            y = np.random.randint(0,self.height)
+            x = self.rng.integers(0,self.width)
+            y = self.rng.integers(0,self.height)
             dx = 6; dy = 12
             cv2.line(frame,(x,y),(x+dx,y+dy),(200,200,255),1)
         return frame
@@ -3,6 +3,7 @@ Audio Spectrum Visualization Modes 226-275
 Auto-generated from audio_spectrum_creative.py
 """
 from .base import BaseModeVisualizer
+from . import fields
 import numpy as np
 import cv2
 
@@ -16,8 +17,8 @@ class Modes226_275(BaseModeVisualizer):
         # This ensures backward compatibility with the original code
 
     def draw_mode_226_golden_phyllotaxis_bloom(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        bass = self.get_bass(magnitudes)
+        highs = self.get_highs(magnitudes)
         self.phyllotaxis_breath = 0.98*self.phyllotaxis_breath + 0.02*(0.8 + bass*0.6)
         dot_count = 1200
         angle_deg = self.phyllotaxis_angle
@@ -26,16 +27,16 @@ class Modes226_275(BaseModeVisualizer):
         for i in range(dot_count):
             a = np.radians(i*angle_deg)
             r = scale*np.sqrt(i)
-            x = int(self.center_x + (r*np.cos(a)) + np.random.uniform(-jitter, jitter))
-            y = int(self.center_y + (r*np.sin(a)) + np.random.uniform(-jitter, jitter))
+            x = int(self.center_x + (r*np.cos(a)) + self.rng.uniform(-jitter, jitter))
+            y = int(self.center_y + (r*np.sin(a)) + self.rng.uniform(-jitter, jitter))
             if 0 <= x < self.width and 0 <= y < self.height:
                 frame[y, x] = (150, 180, 255)
         return frame
 
 
     def draw_mode_227_breathing_mandala_weave(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        tempo = float(np.mean(magnitudes))
+        bass = self.get_bass(magnitudes)
+        tempo = self.get_energy(magnitudes)
         self.mandala_weave_phase += 0.01 + tempo*0.02
         segments = 12
         radius = int(120 + bass*120)
@@ -51,8 +52,8 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_228_infinite_tunnel_lissajous(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        mids = float(np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
+        mids = self.get_mids(magnitudes)
         self.lissajous_t += 0.02
         for i in range(100):
             t = self.lissajous_t + i*0.1
@@ -64,8 +65,8 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_229_lotus_bloom_cascade(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        bass = self.get_bass(magnitudes)
+        highs = self.get_highs(magnitudes)
         rings = 8
         self.lotus_phase += 0.02
         for r in range(rings):
@@ -84,7 +85,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_230_orbital_hypno_pendula(self, frame, magnitudes):
-        tempo = float(np.mean(magnitudes))
+        tempo = self.get_energy(magnitudes)
         count = 24
         if not self.hypno_pendula:
             for i in range(count):
@@ -100,7 +101,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_231_moire_breathing_nets(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         self.moire_angle_a += 0.01
         self.moire_angle_b -= 0.012
         scale = 1.0 + bass*0.3
@@ -119,7 +120,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_232_spiral_shepard_rings(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         self.shepard_zoom *= 1.0 + (bass-0.5)*0.002
         for i in range(12):
             r = int((i+1)*20*self.shepard_zoom) % 240
@@ -128,18 +129,21 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_233_velvet_plasma_pool(self, frame, magnitudes):
-        highs = float(np.mean(magnitudes[3*len(magnitudes)//4:]))
+        highs = self.get_highs(magnitudes)
         self.plasma_shift += 0.01
-        for y in range(0, self.height, 4):
-            for x in range(0, self.width, 4):
-                v = np.sin(x*0.01 + self.plasma_shift) + np.cos(y*0.01 - self.plasma_shift)
-                c = int(120 + 40*v + highs*50)
-                frame[y:y+4, x:x+4] = (c, c, 200)
+        x, y = fields.sample_grid(self.width, self.height, 4)
+        v = np.sin(x*0.01 + self.plasma_shift) + np.cos(y*0.01 - self.plasma_shift)
+        c = np.trunc(120 + 40*v + highs*50)
+        colors = np.empty(v.shape + (3,))
+        colors[:, :, 0] = c
+        colors[:, :, 1] = c
+        colors[:, :, 2] = 200
+        fields.paint_blocks(frame, colors, 4)
         return frame
 
 
     def draw_mode_234_radial_pulse_cathedral(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         self.pulse_timer += 1
         if self.pulse_timer % int(max(5, 30 - bass*20)) == 0:
             for r in range(30, 260, 20):
@@ -148,7 +152,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_235_s_curve_serpents(self, frame, magnitudes):
-        mids = float(np.mean(magnitudes[len(magnitudes)//4:3*len(magnitudes)//4]))
+        mids = self.get_mids(magnitudes)
         amp = 60 + int(mids*120)
         points = []
         for t in range(0, 360, 4):
@@ -161,7 +165,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_236_orb_choir_orbitals(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         if not self.orb_choir:
             for i in range(20):
                 self.orb_choir.append({'ang':i*0.3})
@@ -186,7 +190,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_238_helmholtz_rings(self, frame, magnitudes):
-        tempo = float(np.mean(magnitudes))
+        tempo = self.get_energy(magnitudes)
         self.helmholtz_phase += 0.01 + tempo*0.01
         for i in range(12):
             r = int(40 + i*16 + np.sin(self.helmholtz_phase + i*0.2)*12)
@@ -208,7 +212,7 @@ class Modes226_275(BaseModeVisualizer):
         if len(self.fern_points) < 4000:
             x, y = 0.0, 0.0
             for _ in range(1000):
-                r = np.random.random()
+                r = self.rng.random()
                 if r < 0.01:
                     x, y = 0.0, 0.16*y
                 elif r < 0.86:
@@ -278,7 +282,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_246_oceanic_breather(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         self.ocean_swell = 0.98*self.ocean_swell + 0.02*(bass*60)
         for x in range(0, self.width, 6):
             y = int(self.center_y + np.sin(x*0.02 + self.frame_counter*0.04)* (20 + self.ocean_swell))
@@ -298,16 +302,16 @@ class Modes226_275(BaseModeVisualizer):
     def draw_mode_248_magnetic_ink_veins(self, frame, magnitudes):
         if len(self.ink_veins) < 400:
             for _ in range(20):
-                self.ink_veins.append({'x':np.random.randint(0,self.width),'y':np.random.randint(0,self.height)})
+                self.ink_veins.append({'x':self.rng.integers(0,self.width),'y':self.rng.integers(0,self.height)})
         for v in self.ink_veins:
-            v['x'] = (v['x'] + np.random.randint(-1,2)) % self.width
-            v['y'] = (v['y'] + np.random.randint(-1,2)) % self.height
+            v['x'] = (v['x'] + self.rng.integers(-1,2)) % self.width
+            v['y'] = (v['y'] + self.rng.integers(-1,2)) % self.height
             frame[int(v['y']), int(v['x'])] = (180, 200, 220)
         return frame
 
 
     def draw_mode_249_breath_linked_vortex(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         self.breath_vortex = 0.98*self.breath_vortex + 0.02*(120 + bass*160)
         for a in np.linspace(0, 2*np.pi, 180):
             r = int(self.breath_vortex * (a/(2*np.pi)))
@@ -342,9 +346,9 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_252_theta_lantern_field(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
-        if len(self.theta_lanterns) < 40 and np.random.random()<0.3:
-            self.theta_lanterns.append({'x':np.random.randint(40,self.width-40),'y':self.height+20,'vy':-1.0 - bass*1.5,'p':np.random.random()*2*np.pi})
+        bass = self.get_bass(magnitudes)
+        if len(self.theta_lanterns) < 40 and self.rng.random()<0.3:
+            self.theta_lanterns.append({'x':self.rng.integers(40,self.width-40),'y':self.height+20,'vy':-1.0 - bass*1.5,'p':self.rng.random()*2*np.pi})
         for lan in self.theta_lanterns[:]:
             lan['y'] += lan['vy']
             if lan['y'] < -40:
@@ -367,7 +371,7 @@ class Modes226_275(BaseModeVisualizer):
 
 
     def draw_mode_254_orbiting_eye(self, frame, magnitudes):
-        bass = float(np.mean(magnitudes[:len(magnitudes)//4]))
+        bass = self.get_bass(magnitudes)
         self.orbiting_eye_angle += 0.01
         r = int(60 + bass*60)
         cv2.circle(frame,(self.center_x,self.center_y), r, (160,160,220), 2)
@@ -424,7 +428,7 @@ class Modes226_275(BaseModeVisualizer):
     def draw_mode_259_morphic_kaleidofish(self, frame, magnitudes):
         if len(self.kaleidofish_school) < 50:
             for _ in range(50 - len(self.kaleidofish_school)):
-                self.kaleidofish_school.append({'x':np.random.randint(0,self.width),'y':np.random.randint(0,self.height),'vx':np.random.uniform(-1,1),'vy':np.random.uniform(-1,1)})
+                self.kaleidofish_school.append({'x':self.rng.integers(0,self.width),'y':self.rng.integers(0,self.height),'vx':self.rng.uniform(-1,1),'vy':self.rng.uniform(-1,1)})
         for f in self.kaleidofish_school:
             f['x'] = (f['x'] + f['vx']) % self.width
             f['y'] = (f['y'] + f['vy']) % self.height
@@ -446,7 +450,7 @@ class Modes226_275(BaseModeVisualizer):
     def draw_mode_261_glacial_bloom(self, frame, magnitudes):
         if len(self.glacial_bloom) < 200:
             for _ in range(10):
-                self.glacial_bloom.append({'x':self.center_x,'y':self.center_y,'vx':np.random.uniform(-1,1),'vy':np.random.uniform(-1,1),'life':200})
+                self.glacial_bloom.append({'x':self.center_x,'y':self.center_y,'vx':self.rng.uniform(-1,1),'vy':self.rng.uniform(-1,1),'life':200})
         for g in self.glacial_bloom[:]:
             g['x'] += g['vx']; g['y'] += g['vy']; g['life'] -= 1
             cv2.circle(frame,(int(g['x']),int(g['y'])),1,(200,220,255),-1)
@@ -506,10 +510,10 @@ class Modes226_275(BaseModeVisualizer):
             rows, cols = 18, 18
             for r in range(rows):
                 for c in range(cols):
-                    self.mosaic_cells.append({'r':r,'c':c,'val':np.random.randint(120,200)})
+                    self.mosaic_cells.append({'r':r,'c':c,'val':self.rng.integers(120,200)})
         for cell in self.mosaic_cells:
-            if np.random.random()<0.01:
-                cell['val'] = min(255, max(80, cell['val'] + np.random.randint(-5,6)))
+            if self.rng.random()<0.01:
+                cell['val'] = min(255, max(80, cell['val'] + self.rng.integers(-5,6)))
             x = int(cell['c']*self.width/18)
             y = int(cell['r']*self.height/18)
             w = self.width//18
@@ -521,7 +525,7 @@ class Modes226_275(BaseModeVisualizer):
     def draw_mode_267_whispering_bamboo(self, frame, magnitudes):
         if not self.bamboo_stalks:
             for x in range(60, self.width, 60):
-                self.bamboo_stalks.append({'x':x,'o':np.random.random()*6.28})
+                self.bamboo_stalks.append({'x':x,'o':self.rng.random()*6.28})
         for b in self.bamboo_stalks:
             sway = int(10*np.sin(self.frame_counter*0.03 + b['o']))
             cv2.line(frame,(b['x']+sway, self.height-40),(b['x']+sway, 160),(120,180,120),3)
@@ -539,7 +543,7 @@ class Modes226_275(BaseModeVisualizer):
     def draw_mode_269_drifting_paper_cranes(self, frame, magnitudes):
         if not self.paper_cranes:
             for _ in range(24):
-                self.paper_cranes.append({'x':np.random.randint(0,self.width),'y':np.random.randint(0,self.height),'vx':np.random.uniform(-0.6,0.6),'vy':np.random.uniform(-0.3,0.0)})
+                self.paper_cranes.append({'x':self.rng.integers(0,self.width),'y':self.rng.integers(0,self.height),'vx':self.rng.uniform(-0.6,0.6),'vy':self.rng.uniform(-0.3,0.0)})
         for c in self.paper_cranes:
             c['x'] = (c['x'] + c['vx']) % self.width
             c['y'] = (c['y'] + c['vy']) % self.height
@@ -561,11 +565,11 @@ class Modes226_275(BaseModeVisualizer):
     def draw_mode_271_serene_ribbon_canopy(self, frame, magnitudes):
         if not self.ribbon_canopy:
             for i in range(140):
-                self.ribbon_canopy.append({'x':np.random.randint(0,self.width),'y':np.random.randint(-self.height,0)})
+                self.ribbon_canopy.append({'x':self.rng.integers(0,self.width),'y':self.rng.integers(-self.height,0)})
         for r in self.ribbon_canopy:
             r['y'] += 1
             if r['y'] > self.height:
-                r['y'] = -np.random.randint(0,self.height)
+                r['y'] = -self.rng.integers(0,self.height)
             cv2.line(frame,(r['x'],r['y']),(r['x'],r['y']+8),(180,180,230),1)
         return frame
 
@@ -3,9 +3,12 @@ Audio Spectrum Visualization Modes 276-300
 Creative new visualizations to complete the 300 mode collection
 """
 from .base import BaseModeVisualizer
+from . import metaballs
 import numpy as np
 import cv2
 
+from color_lut import hsv_to_bgr_array
+
 
 class Modes276_300(BaseModeVisualizer):
     """Visualization modes 276 through 300"""
@@ -63,9 +66,9 @@ class Modes276_300(BaseModeVisualizer):
         # Add new cracks when highs spike
         if highs > 0.7 and len(self.ice_cracks) < 100:
             for _ in range(3):
-                x = np.random.randint(0, self.width)
-                y = np.random.randint(0, self.height)
-                angle = np.random.random() * 2 * np.pi
+                x = self.rng.integers(0, self.width)
+                y = self.rng.integers(0, self.height)
+                angle = self.rng.random() * 2 * np.pi
                 self.ice_cracks.append({'x': x, 'y': y, 'angle': angle, 'length': 0, 'max_len': 40})
 
         # Grow and draw cracks
@@ -86,7 +89,7 @@ class Modes276_300(BaseModeVisualizer):
             for i in range(12):
                 self.caravan_lights.append({
                     'x': -50 - i * 30,
-                    'y': self.center_y + np.random.randint(-60, 60),
+                    'y': self.center_y + self.rng.integers(-60, 60),
                     'speed': 1.2 + i * 0.1
                 })
 
@@ -94,7 +97,7 @@ class Modes276_300(BaseModeVisualizer):
             light['x'] += light['speed'] * (1 + mids * 0.5)
             if light['x'] > self.width + 50:
                 light['x'] = -50
-                light['y'] = self.center_y + np.random.randint(-60, 60)
+                light['y'] = self.center_y + self.rng.integers(-60, 60)
 
             # Draw light with glow
             x, y = int(light['x']), int(light['y'])
@@ -246,9 +249,9 @@ class Modes276_300(BaseModeVisualizer):
                 'x2': self.center_x, 'y2': self.center_y
             })
             for _ in range(30):
-                base = self.vein_network[np.random.randint(0, len(self.vein_network))]
-                angle = np.random.uniform(-np.pi/3, np.pi/3)
-                length = np.random.uniform(30, 80)
+                base = self.vein_network[self.rng.integers(0, len(self.vein_network))]
+                angle = self.rng.uniform(-np.pi/3, np.pi/3)
+                length = self.rng.uniform(30, 80)
                 x1, y1 = base['x2'], base['y2']
                 x2 = int(x1 + np.cos(angle - np.pi/2) * length)
                 y2 = int(y1 + np.sin(angle - np.pi/2) * length)
@@ -258,7 +261,7 @@ class Modes276_300(BaseModeVisualizer):
         pulse = int(50 + energy * 150)
 
         for vein in self.vein_network:
-            thickness = np.random.randint(1, 3)
+            thickness = self.rng.integers(1, 3)
             cv2.line(frame, (vein['x1'], vein['y1']), (vein['x2'], vein['y2']),
                     (pulse, 255, pulse), thickness, lineType=cv2.LINE_AA)
         return frame
@@ -274,11 +277,11 @@ class Modes276_300(BaseModeVisualizer):
             }]
             # Create initial branches
             for _ in range(6):
-                angle = np.random.random() * 2 * np.pi
+                angle = self.rng.random() * 2 * np.pi
                 self.glacial_cracks[0]['branches'].append({
                     'angle': angle,
                     'length': 0,
-                    'max_length': np.random.uniform(80, 160)
+                    'max_length': self.rng.uniform(80, 160)
                 })
 
         # Grow branches
@@ -299,11 +302,11 @@ class Modes276_300(BaseModeVisualizer):
             self.quantum_dots = []
             for _ in range(150):
                 self.quantum_dots.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
-                    'vx': np.random.uniform(-0.5, 0.5),
-                    'vy': np.random.uniform(-0.5, 0.5),
-                    'hue': np.random.randint(0, 180)
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
+                    'vx': self.rng.uniform(-0.5, 0.5),
+                    'vy': self.rng.uniform(-0.5, 0.5),
+                    'hue': self.rng.integers(0, 180)
                 })
 
         energy = self.get_energy(magnitudes)
@@ -324,9 +327,9 @@ class Modes276_300(BaseModeVisualizer):
             self.origami_cranes = []
             for _ in range(8):
                 self.origami_cranes.append({
-                    'x': np.random.randint(0, self.width),
-                    'y': np.random.randint(0, self.height),
-                    'angle': np.random.random() * 2 * np.pi,
+                    'x': self.rng.integers(0, self.width),
+                    'y': self.rng.integers(0, self.height),
+                    'angle': self.rng.random() * 2 * np.pi,
                     'flap': 0
                 })
 
@@ -358,26 +361,28 @@ class Modes276_300(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
 
         # Spawn new bubbles
-        if len(self.magma_bubbles) < 50 and np.random.random() < 0.3:
+        if len(self.magma_bubbles) < 50 and self.rng.random() < 0.3:
             self.magma_bubbles.append({
-                'x': np.random.randint(0, self.width),
+                'x': self.rng.integers(0, self.width),
                 'y': self.height,
                 'vy': -1.0 - bass * 2.0,
-                'size': np.random.randint(5, 20),
-                'hue': np.random.randint(0, 30)
+                'size': self.rng.integers(5, 20),
+                'hue': self.rng.integers(0, 30)
             })
 
         for bubble in self.magma_bubbles[:]:
             bubble['y'] += bubble['vy']
             if bubble['y'] < -bubble['size']:
                 self.magma_bubbles.remove(bubble)
-                continue
 
-            color = self.hsv_to_bgr(bubble['hue'], 255, 255)
-            cv2.circle(frame, (int(bubble['x']), int(bubble['y'])),
-                      bubble['size'], color, -1)
-            cv2.circle(frame, (int(bubble['x']), int(bubble['y'])),
-                      bubble['size'], (255, 200, 100), 1)
+        if self.magma_bubbles:
+            # Neighboring bubbles fuse into one outlined blob
+            x = [bubble['x'] for bubble in self.magma_bubbles]
+            y = [bubble['y'] for bubble in self.magma_bubbles]
+            size = [bubble['size'] for bubble in self.magma_bubbles]
+            hue = np.array([bubble['hue'] for bubble in self.magma_bubbles])
+            colors = hsv_to_bgr_array(hue, 255, 255)
+            metaballs.render_metaballs(frame, x, y, size, colors, step=2, outline=(255, 200, 100))
         return frame
 
     def draw_mode_291_spider_web_dew(self, frame, magnitudes):
@@ -428,14 +433,14 @@ class Modes276_300(BaseModeVisualizer):
         if not hasattr(self, 'nebula_particles'):
             self.nebula_particles = []
             for _ in range(400):
-                angle = np.random.random() * 2 * np.pi
-                dist = np.random.exponential(80)
+                angle = self.rng.random() * 2 * np.pi
+                dist = self.rng.exponential(80)
                 self.nebula_particles.append({
                     'x': self.center_x + np.cos(angle) * dist,
                     'y': self.center_y + np.sin(angle) * dist,
                     'vx': np.cos(angle) * 0.3,
                     'vy': np.sin(angle) * 0.3,
-                    'hue': np.random.randint(120, 160)
+                    'hue': self.rng.integers(120, 160)
                 })
 
         bass = self.get_bass(magnitudes)
@@ -466,18 +471,18 @@ class Modes276_300(BaseModeVisualizer):
             self.circuit_paths = []
             # Create circuit-like paths
             for _ in range(20):
-                x = np.random.randint(0, self.width)
-                y = np.random.randint(0, self.height)
+                x = self.rng.integers(0, self.width)
+                y = self.rng.integers(0, self.height)
                 path = [(x, y)]
-                for _ in range(np.random.randint(3, 8)):
-                    if np.random.random() < 0.5:
-                        x += np.random.randint(-60, 60)
+                for _ in range(self.rng.integers(3, 8)):
+                    if self.rng.random() < 0.5:
+                        x += self.rng.integers(-60, 60)
                     else:
-                        y += np.random.randint(-60, 60)
+                        y += self.rng.integers(-60, 60)
                     x = max(0, min(self.width - 1, x))
                     y = max(0, min(self.height - 1, y))
                     path.append((x, y))
-                self.circuit_paths.append({'path': path, 'pulse': np.random.random()})
+                self.circuit_paths.append({'path': path, 'pulse': self.rng.random()})
             self.circuit_initialized = True
 
         energy = self.get_energy(magnitudes)
@@ -515,8 +520,8 @@ class Modes276_300(BaseModeVisualizer):
                 cv2.line(frame, points[i], points[i+1], color, 2, lineType=cv2.LINE_AA)
 
             # Sparkles on wave
-            if np.random.random() < 0.3:
-                x = np.random.randint(0, self.width)
+            if self.rng.random() < 0.3:
+                x = self.rng.integers(0, self.width)
                 y = int(y_base + 30 * np.sin(self.tide_phase + x * 0.02 + y_offset * 0.5))
                 cv2.circle(frame, (x, y), 3, (255, 255, 255), -1)
         return frame
@@ -565,12 +570,12 @@ class Modes276_300(BaseModeVisualizer):
         highs = self.get_highs(magnitudes)
 
         # Spawn new crystal
-        if len(self.frost_crystals) < 10 and np.random.random() < 0.05:
+        if len(self.frost_crystals) < 10 and self.rng.random() < 0.05:
             self.frost_crystals.append({
-                'x': np.random.randint(0, self.width),
-                'y': np.random.randint(0, self.height),
+                'x': self.rng.integers(0, self.width),
+                'y': self.rng.integers(0, self.height),
                 'size': 0,
-                'angle': np.random.random() * 2 * np.pi
+                'angle': self.rng.random() * 2 * np.pi
             })
 
         for crystal in self.frost_crystals:
@@ -633,7 +638,7 @@ class Modes276_300(BaseModeVisualizer):
         if self.holo_glitch > 0:
             self.holo_glitch -= 1
             # RGB split effect
-            shift = np.random.randint(-5, 5)
+            shift = self.rng.integers(-5, 5)
             frame_shifted = np.roll(frame, shift, axis=1)
             frame[:, :, 0] = frame_shifted[:, :, 0]
             frame[:, :, 2] = np.roll(frame[:, :, 2], -shift, axis=1)
@@ -643,8 +648,8 @@ class Modes276_300(BaseModeVisualizer):
             cv2.line(frame, (0, y), (self.width, y), (20, 20, 20), 1)
 
         # Glitch bars
-        if np.random.random() < 0.1:
-            y = np.random.randint(0, self.height - 20)
+        if self.rng.random() < 0.1:
+            y = self.rng.integers(0, self.height - 20)
             frame[y:y+5, :] = 255
         return frame
 
@@ -657,8 +662,8 @@ class Modes276_300(BaseModeVisualizer):
 
         # Generate new arcs
         if len(self.plasma_arcs) < 15:
-            angle1 = np.random.random() * 2 * np.pi
-            angle2 = angle1 + np.random.uniform(-np.pi/2, np.pi/2)
+            angle1 = self.rng.random() * 2 * np.pi
+            angle2 = angle1 + self.rng.uniform(-np.pi/2, np.pi/2)
             self.plasma_arcs.append({
                 'angle1': angle1,
                 'angle2': angle2,
@@ -704,12 +709,12 @@ class Modes276_300(BaseModeVisualizer):
         if len(self.flame_particles) < 200:
             for _ in range(5):
                 self.flame_particles.append({
-                    'x': self.center_x + np.random.randint(-40, 40),
+                    'x': self.center_x + self.rng.integers(-40, 40),
                     'y': self.height - 20,
-                    'vx': np.random.uniform(-0.5, 0.5),
+                    'vx': self.rng.uniform(-0.5, 0.5),
                     'vy': -2.0 - bass * 2.0,
                     'life': 100,
-                    'hue': np.random.randint(0, 30)
+                    'hue': self.rng.integers(0, 30)
                 })
 
         for particle in self.flame_particles[:]:
@@ -119,8 +119,8 @@ class Modes301_350(BaseModeVisualizer):
         """Mode 306: Fireflies glowing and flickering"""
         for i, mag in enumerate(magnitudes):
             if mag > 0.25:
-                x = int(np.random.random() * self.width)
-                y = int(np.random.random() * self.height)
+                x = int(self.rng.random() * self.width)
+                y = int(self.rng.random() * self.height)
 
                 # Pulsing glow
                 glow = int(mag * 255)
@@ -159,7 +159,7 @@ class Modes301_350(BaseModeVisualizer):
         for i, mag in enumerate(magnitudes):
             if mag > 0.3:
                 x = int((i / len(magnitudes)) * self.width)
-                y = int(self.height * 0.3 + np.random.random() * self.height * 0.4)
+                y = int(self.height * 0.3 + self.rng.random() * self.height * 0.4)
 
                 ripple_phase = (self.frame_count + i) % 50
                 radius = int(ripple_phase * mag * 3)
@@ -175,7 +175,7 @@ class Modes301_350(BaseModeVisualizer):
         energy = self.get_energy(magnitudes)
 
         for i in range(int(energy * 50)):
-            x = int(np.random.random() * self.width)
+            x = int(self.rng.random() * self.width)
             y = int((self.frame_count * 2 + i * 10) % self.height)
 
             sway = int(np.sin(y * 0.1 + i) * 20)
@@ -211,12 +211,12 @@ class Modes301_350(BaseModeVisualizer):
 
         if highs > 0.6:
             # Random lightning bolt
-            x1 = int(np.random.random() * self.width)
+            x1 = int(self.rng.random() * self.width)
             y1 = 0
 
             for _ in range(10):
-                x2 = x1 + int(np.random.random() * 40 - 20)
-                y2 = y1 + int(np.random.random() * 60 + 40)
+                x2 = x1 + int(self.rng.random() * 40 - 20)
+                y2 = y1 + int(self.rng.random() * 60 + 40)
 
                 cv2.line(frame, (x1, y1), (x2, y2), (255, 255, 200), 2)
                 x1, y1 = x2, y2
@@ -255,8 +255,8 @@ class Modes301_350(BaseModeVisualizer):
             mag = magnitudes[mag_idx]
 
             if mag > 0.2:
-                x = int((np.random.random() * 0.8 + 0.1) * self.width)
-                y = int((np.random.random() * 0.8 + 0.1) * self.height)
+                x = int((self.rng.random() * 0.8 + 0.1) * self.width)
+                y = int((self.rng.random() * 0.8 + 0.1) * self.height)
 
                 spread = int(mag * 15)
                 hue = 70 + int(mag * 20)
@@ -283,7 +283,7 @@ class Modes301_350(BaseModeVisualizer):
         # Forest silhouette
         for i in range(20):
             x = int((i / 20) * self.width)
-            height = int(self.height * (0.3 + np.random.random() * 0.2))
+            height = int(self.height * (0.3 + self.rng.random() * 0.2))
             cv2.rectangle(frame, (x, self.height - height), (x + 30, self.height), (20, 20, 20), -1)
 
         return frame
@@ -421,7 +421,7 @@ class Modes301_350(BaseModeVisualizer):
         energy = self.get_energy(magnitudes)
 
         for i in range(int(energy * 80)):
-            x = int(np.random.random() * self.width)
+            x = int(self.rng.random() * self.width)
             y = int((self.frame_count + i * 5) % self.height)
 
             drift = int(np.sin(y * 0.1 + i) * 30)
@@ -604,8 +604,8 @@ class Modes301_350(BaseModeVisualizer):
             mag = magnitudes[mag_idx]
 
             if mag > 0.15:
-                x = int(np.random.random() * self.width)
-                y = int(np.random.random() * self.height)
+                x = int(self.rng.random() * self.width)
+                y = int(self.rng.random() * self.height)
 
                 # Organic blob shape
                 radius = 5 + int(mag * 15)
@@ -641,7 +641,7 @@ class Modes301_350(BaseModeVisualizer):
         energy = self.get_energy(magnitudes)
 
         for i in range(int(energy * 50)):
-            x = int(np.random.random() * self.width)
+            x = int(self.rng.random() * self.width)
             y = int((self.frame_count * 1.5 + i * 15) % self.height)
 
             mag_idx = i % len(magnitudes)
@@ -741,7 +741,7 @@ class Modes301_350(BaseModeVisualizer):
         # Steam particles
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 40)):
-            x = int(self.center_x + np.random.random() * 100 - 50)
+            x = int(self.center_x + self.rng.random() * 100 - 50)
             y = int(self.height - i * 10)
 
             cv2.circle(frame, (x, y), 3, (200, 200, 200), -1)
@@ -833,8 +833,8 @@ class Modes301_350(BaseModeVisualizer):
             mag = magnitudes[mag_idx]
 
             if mag > 0.4:
-                x = int(self.center_x + np.random.randint(-50, 50))
-                y = int(self.height * (0.3 + np.random.random() * 0.5))
+                x = int(self.center_x + self.rng.integers(-50, 50))
+                y = int(self.height * (0.3 + self.rng.random() * 0.5))
 
                 cv2.circle(frame, (x, y), 6, (40, 30, 20), -1)
 
@@ -914,18 +914,18 @@ class Modes301_350(BaseModeVisualizer):
         # Dendritic patterns from edges
         for edge in range(4):
             if edge == 0:  # Top
-                start_points = [(int(np.random.random() * self.width), 0) for _ in range(10)]
+                start_points = [(int(self.rng.random() * self.width), 0) for _ in range(10)]
             elif edge == 1:  # Bottom
-                start_points = [(int(np.random.random() * self.width), self.height) for _ in range(10)]
+                start_points = [(int(self.rng.random() * self.width), self.height) for _ in range(10)]
             elif edge == 2:  # Left
-                start_points = [(0, int(np.random.random() * self.height)) for _ in range(10)]
+                start_points = [(0, int(self.rng.random() * self.height)) for _ in range(10)]
             else:  # Right
-                start_points = [(self.width, int(np.random.random() * self.height)) for _ in range(10)]
+                start_points = [(self.width, int(self.rng.random() * self.height)) for _ in range(10)]
 
             for sp in start_points:
                 for i, mag in enumerate(magnitudes[::5]):
                     if mag > 0.3:
-                        angle = np.random.random() * 2 * np.pi
+                        angle = self.rng.random() * 2 * np.pi
                         length = mag * 30
 
                         x2 = int(sp[0] + np.cos(angle) * length)
@@ -978,11 +978,11 @@ class Modes301_350(BaseModeVisualizer):
         # Ash plume
         for i in range(int(bass * 100)):
             spread = max(1, int((self.frame_count + i) * 2))
-            x = int(self.center_x + np.random.randint(-spread, spread + 1))
+            x = int(self.center_x + self.rng.integers(-spread, spread + 1))
             y = int(self.height - self.frame_count * 3 - i * 5) % self.height
 
-            size = 2 + int(np.random.random() * 5)
-            brightness = int(50 + np.random.random() * 80)
+            size = 2 + int(self.rng.random() * 5)
+            brightness = int(50 + self.rng.random() * 80)
 
             cv2.circle(frame, (x, y), size, (brightness, brightness, brightness), -1)
 
@@ -1036,13 +1036,13 @@ class Modes301_350(BaseModeVisualizer):
             mag = magnitudes[mag_idx]
 
             if mag > 0.15:
-                x = int(np.random.random() * self.width)
-                y = int(np.random.random() * self.height)
+                x = int(self.rng.random() * self.width)
+                y = int(self.rng.random() * self.height)
 
                 # Organic spread
                 for j in range(int(mag * 10)):
-                    ox = x + int(np.random.random() * 20 - 10)
-                    oy = y + int(np.random.random() * 20 - 10)
+                    ox = x + int(self.rng.random() * 20 - 10)
+                    oy = y + int(self.rng.random() * 20 - 10)
 
                     size = 1 + int(mag * 4)
                     hue = 70 + int(mag * 20)
@@ -1094,7 +1094,7 @@ class Modes301_350(BaseModeVisualizer):
 
             # Trigger hairs
             for i in range(5):
-                hx = int(self.center_x + np.random.randint(-30, 30))
+                hx = int(self.center_x + self.rng.integers(-30, 30))
                 hy = int(self.center_y + lobe * 20)
                 cv2.line(frame, (hx, hy), (hx, hy + lobe * 15), (100, 200, 100), 2)
 
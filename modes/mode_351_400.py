@@ -266,15 +266,15 @@ class Modes351_400(BaseModeVisualizer):
             mag = magnitudes[mag_idx]
 
             if mag > 0.2:
-                center_x = int(np.random.random() * self.width)
-                center_y = int(np.random.random() * self.height)
+                center_x = int(self.rng.random() * self.width)
+                center_y = int(self.rng.random() * self.height)
 
                 # Spread from center
                 radius = int(5 + mag * 25)
 
                 for j in range(int(mag * 30)):
-                    angle = np.random.random() * 2 * np.pi
-                    dist = np.random.random() * radius
+                    angle = self.rng.random() * 2 * np.pi
+                    dist = self.rng.random() * radius
 
                     x = int(center_x + np.cos(angle) * dist)
                     y = int(center_y + np.sin(angle) * dist)
@@ -417,8 +417,8 @@ class Modes351_400(BaseModeVisualizer):
         """Mode 368: Coral polyps extending tentacles"""
         num_polyps = 20
         for i in range(num_polyps):
-            px = int(np.random.random() * self.width)
-            py = int(self.height * 0.7 + np.random.random() * self.height * 0.3)
+            px = int(self.rng.random() * self.width)
+            py = int(self.height * 0.7 + self.rng.random() * self.height * 0.3)
 
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
@@ -761,8 +761,8 @@ class Modes351_400(BaseModeVisualizer):
 
                 # Puffy cloud shape
                 for j in range(int(mag * 10)):
-                    cx = x + int(np.random.random() * 60 - 30)
-                    cy = y_base + int(np.random.random() * 30 - 15)
+                    cx = x + int(self.rng.random() * 60 - 30)
+                    cy = y_base + int(self.rng.random() * 30 - 15)
 
                     size = 10 + int(mag * 20)
                     brightness = 180 + int(mag * 75)
@@ -805,8 +805,8 @@ class Modes351_400(BaseModeVisualizer):
     def draw_mode_382_clover_field(self, frame, magnitudes):
         """Mode 382: Field of four-leaf clovers"""
         for i in range(40):
-            cx = int(np.random.random() * self.width)
-            cy = int(np.random.random() * self.height)
+            cx = int(self.rng.random() * self.width)
+            cy = int(self.rng.random() * self.height)
 
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
@@ -841,7 +841,7 @@ class Modes351_400(BaseModeVisualizer):
                     spread = j * 3
 
                     for s in range(-spread, spread, 5):
-                        sx = x + s + int(np.random.random() * 10 - 5)
+                        sx = x + s + int(self.rng.random() * 10 - 5)
                         brightness = 200 - j * 5
 
                         cv2.circle(frame, (sx, y), 4, (brightness, brightness, brightness), -1)
@@ -1252,13 +1252,13 @@ class Modes351_400(BaseModeVisualizer):
         # Multiple fern starts
         for i in range(6):
             start_x = int((i / 6) * self.width)
-            start_y = int(np.random.random() * self.height)
+            start_y = int(self.rng.random() * self.height)
 
             mag_idx = i * len(magnitudes) // 6
             mag = magnitudes[mag_idx]
 
             if mag > 0.3:
-                draw_fern(start_x, start_y, int(np.random.random() * 360), 0, mag)
+                draw_fern(start_x, start_y, int(self.rng.random() * 360), 0, mag)
 
         return frame
 
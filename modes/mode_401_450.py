@@ -3,6 +3,7 @@ Audio Spectrum Visualization Modes 401-450
 Science & Physics Category (Part 1)
 """
 from .base import BaseModeVisualizer
+from . import fields
 import numpy as np
 import cv2
 
@@ -471,8 +472,8 @@ class Modes401_450(BaseModeVisualizer):
                 x, y = coil_x, coil_base - 150
 
                 for step in range(15):
-                    x2 = x + int(np.random.random() * 60 - 30)
-                    y2 = y - int(np.random.random() * 40)
+                    x2 = x + int(self.rng.random() * 60 - 30)
+                    y2 = y - int(self.rng.random() * 40)
 
                     cv2.line(frame, (x, y), (x2, y2), (200, 200, 255), 2)
 
@@ -616,8 +617,8 @@ class Modes401_450(BaseModeVisualizer):
 
         # Particles aggregate in fractal pattern
         for i in range(int(energy * 100)):
-            angle = (i / 100) * 2 * np.pi + np.random.random() * 0.5
-            dist = 50 + i * 2 + np.random.random() * 30
+            angle = (i / 100) * 2 * np.pi + self.rng.random() * 0.5
+            dist = 50 + i * 2 + self.rng.random() * 30
 
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
@@ -645,7 +646,7 @@ class Modes401_450(BaseModeVisualizer):
                 x, y = self.center_x, self.center_y
 
                 for step in range(15):
-                    angle += (np.random.random() - 0.5) * 0.5
+                    angle += (self.rng.random() - 0.5) * 0.5
                     step_dist = 15 + mag * 10
 
                     x2 = int(x + np.cos(angle) * step_dist)
@@ -936,19 +937,16 @@ class Modes401_450(BaseModeVisualizer):
 
     def draw_mode_432_cymatics(self, frame, magnitudes):
         """Mode 432: Cymatic patterns from sound"""
-        # Sound-induced patterns in medium
-        for y in range(0, self.height, 8):
-            for x in range(0, self.width, 8):
-                # Multiple frequency modes
-                pattern = 0
-                for i, mag in enumerate(magnitudes[::10]):
-                    freq = (i + 1) * 0.02
-                    pattern += np.sin(x * freq) * np.cos(y * freq) * mag
+        # Sound-induced patterns in medium, sampled every 8 pixels
+        x, y = fields.sample_grid(self.width, self.height, 8)
+        pattern = np.zeros((y.shape[0], x.shape[1]))
+        # Multiple frequency modes
+        for i, mag in enumerate(magnitudes[::10]):
+            freq = (i + 1) * 0.02
+            pattern += np.sin(x * freq) * np.cos(y * freq) * mag
 
-                brightness = int(127 + pattern * 128)
-                color = (brightness, brightness, brightness)
-
-                cv2.circle(frame, (x, y), 3, color, -1)
+        brightness = np.trunc(127 + pattern * 128)
+        fields.paint_dots(frame, np.repeat(brightness[:, :, None], 3, axis=2), 8, 3)
 
         return frame
 
@@ -1119,8 +1117,8 @@ class Modes401_450(BaseModeVisualizer):
             num_particles = 200
             for i in range(num_particles):
                 # Very tight cluster
-                x = int(self.center_x + np.random.normal(0, 20))
-                y = int(self.center_y + np.random.normal(0, 20))
+                x = int(self.center_x + self.rng.normal(0, 20))
+                y = int(self.center_y + self.rng.normal(0, 20))
 
                 cv2.circle(frame, (x, y), 2, (100, 200, 255), -1)
 
@@ -1135,8 +1133,8 @@ class Modes401_450(BaseModeVisualizer):
             num_particles = 100
             for i in range(num_particles):
                 spread = temperature * 200
-                x = int(self.center_x + np.random.normal(0, spread))
-                y = int(self.center_y + np.random.normal(0, spread))
+                x = int(self.center_x + self.rng.normal(0, spread))
+                y = int(self.center_y + self.rng.normal(0, spread))
 
                 cv2.circle(frame, (x, y), 3, (200, 150, 100), -1)
 
@@ -1223,8 +1221,8 @@ class Modes401_450(BaseModeVisualizer):
 
         for i in range(num_points):
             # Probability distribution (s-orbital approximation)
-            r = abs(np.random.normal(0, 60))
-            angle = np.random.random() * 2 * np.pi
+            r = abs(self.rng.normal(0, 60))
+            angle = self.rng.random() * 2 * np.pi
 
             x = int(self.center_x + r * np.cos(angle))
             y = int(self.center_y + r * np.sin(angle))
@@ -1254,14 +1252,14 @@ class Modes401_450(BaseModeVisualizer):
         # Temperature gradient (hot to cold)
         # Hot end
         for i in range(int(bass * 20)):
-            x = int(self.width * 0.2 - 30 + np.random.random() * 20)
-            y = int(self.center_y + np.random.random() * 60 - 30)
+            x = int(self.width * 0.2 - 30 + self.rng.random() * 20)
+            y = int(self.center_y + self.rng.random() * 60 - 30)
             cv2.circle(frame, (x, y), 3, (255, 200, 100), -1)
 
         # Cold end
         for i in range(int(highs * 15)):
-            x = int(self.width * 0.8 + 10 + np.random.random() * 20)
-            y = int(self.center_y + np.random.random() * 60 - 30)
+            x = int(self.width * 0.8 + 10 + self.rng.random() * 20)
+            y = int(self.center_y + self.rng.random() * 60 - 30)
             cv2.circle(frame, (x, y), 3, (100, 200, 255), -1)
 
         # Generated voltage
@@ -1513,14 +1511,14 @@ class Modes401_450(BaseModeVisualizer):
         energy = self.get_energy(magnitudes)
 
         for i in range(int(energy * 30)):
-            angle = np.random.random() * 2 * np.pi
-            dist = horizon_radius + np.random.random() * 40
+            angle = self.rng.random() * 2 * np.pi
+            dist = horizon_radius + self.rng.random() * 40
 
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
 
             # Virtual particle pairs
-            if np.random.random() > 0.5:
+            if self.rng.random() > 0.5:
                 # Escaping particle (Hawking radiation)
                 cv2.circle(frame, (x, y), 3, (255, 255, 200), -1)
             else:
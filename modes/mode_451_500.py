@@ -28,12 +28,12 @@ class Modes451_500(BaseModeVisualizer):
 
         # Position distribution
         for i in range(50):
-            x = int(self.center_x + np.random.normal(0, x_uncertainty))
+            x = int(self.center_x + self.rng.normal(0, x_uncertainty))
             cv2.circle(frame, (x, int(self.height * 0.3)), 3, (255, 200, 200), -1)
 
         # Momentum distribution
         for i in range(50):
-            px = int(self.center_x + np.random.normal(0, p_uncertainty))
+            px = int(self.center_x + self.rng.normal(0, p_uncertainty))
             cv2.circle(frame, (px, int(self.height * 0.7)), 3, (200, 200, 255), -1)
 
         return frame
@@ -87,8 +87,8 @@ class Modes451_500(BaseModeVisualizer):
             x, y = self.width // 2, 0
 
             for step in range(20):
-                x2 = x + int(np.random.random() * 60 - 30)
-                y2 = y + int(np.random.random() * 40 + 30)
+                x2 = x + int(self.rng.random() * 60 - 30)
+                y2 = y + int(self.rng.random() * 40 + 30)
 
                 cv2.line(frame, (x, y), (x2, y2), (200, 220, 255), 3)
                 x, y = x2, y2
@@ -112,20 +112,20 @@ class Modes451_500(BaseModeVisualizer):
         # Virtual particles (more outside than inside)
         # Outside left
         for i in range(20):
-            x = int(np.random.random() * (plate1_x - 50))
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * (plate1_x - 50))
+            y = int(self.rng.random() * self.height)
             cv2.circle(frame, (x, y), 2, (200, 200, 255), -1)
 
         # Outside right
         for i in range(20):
-            x = int(plate2_x + 50 + np.random.random() * (self.width - plate2_x - 50))
-            y = int(np.random.random() * self.height)
+            x = int(plate2_x + 50 + self.rng.random() * (self.width - plate2_x - 50))
+            y = int(self.rng.random() * self.height)
             cv2.circle(frame, (x, y), 2, (200, 200, 255), -1)
 
         # Inside (fewer particles creates pressure difference)
         for i in range(5):
-            x = int(plate1_x + np.random.random() * (plate2_x - plate1_x))
-            y = int(np.random.random() * self.height)
+            x = int(plate1_x + self.rng.random() * (plate2_x - plate1_x))
+            y = int(self.rng.random() * self.height)
             cv2.circle(frame, (x, y), 2, (255, 200, 200), -1)
 
         # Plates attracted (get closer)
@@ -141,11 +141,11 @@ class Modes451_500(BaseModeVisualizer):
 
         # Ultrasound creates bubbles
         for i in range(int(bass * 30)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
 
             # Bubble collapse creates hotspots
-            if np.random.random() < bass:
+            if self.rng.random() < bass:
                 # Collapsing bubble with high temperature
                 for r in range(5):
                     cv2.circle(frame, (x, y), 20 - r * 4, (255, 200 - r * 40, 100 - r * 20), 2)
@@ -211,8 +211,8 @@ class Modes451_500(BaseModeVisualizer):
         radiation = int((bass ** 4) * 100)
 
         for i in range(radiation):
-            angle = np.random.random() * 2 * np.pi
-            dist = 70 + np.random.random() * 150
+            angle = self.rng.random() * 2 * np.pi
+            dist = 70 + self.rng.random() * 150
 
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
@@ -359,7 +359,7 @@ class Modes451_500(BaseModeVisualizer):
 
         # Incoming photons
         for i in range(int(highs * 20)):
-            x = int(self.width * (0.45 + np.random.random() * 0.1))
+            x = int(self.width * (0.45 + self.rng.random() * 0.1))
             y = int((self.frame_count * 3 + i * 15) % (self.height * 0.4))
 
             cv2.circle(frame, (x, y), 5, (255, 255, 100), -1)
@@ -368,8 +368,8 @@ class Modes451_500(BaseModeVisualizer):
         current = int(highs * 100)
 
         for i in range(current):
-            x = int(self.width * (0.4 + np.random.random() * 0.2))
-            y = int(self.height * (0.4 + np.random.random() * 0.2))
+            x = int(self.width * (0.4 + self.rng.random() * 0.2))
+            y = int(self.height * (0.4 + self.rng.random() * 0.2))
 
             # Electrons
             cv2.circle(frame, (x, y), 2, (100, 200, 255), -1)
@@ -470,14 +470,14 @@ class Modes451_500(BaseModeVisualizer):
 
         # High concentration side (left)
         for i in range(50):
-            x = int(np.random.random() * (self.center_x - 100))
-            y = int(np.random.random() * (self.height - 200) + 100)
+            x = int(self.rng.random() * (self.center_x - 100))
+            y = int(self.rng.random() * (self.height - 200) + 100)
             cv2.circle(frame, (x, y), 4, (255, 200, 100), -1)
 
         # Low concentration side (right)
         for i in range(10):
-            x = int(self.center_x + 100 + np.random.random() * (self.width - self.center_x - 100))
-            y = int(np.random.random() * (self.height - 200) + 100)
+            x = int(self.center_x + 100 + self.rng.random() * (self.width - self.center_x - 100))
+            y = int(self.rng.random() * (self.height - 200) + 100)
             cv2.circle(frame, (x, y), 4, (255, 200, 100), -1)
 
         # Voltage difference
@@ -519,8 +519,8 @@ class Modes451_500(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         if bass > 0.4:
             for i in range(int(bass * 20)):
-                x = int(self.width * (0.48 + np.random.random() * 0.04))
-                y = int(self.center_y + np.random.random() * 80 - 40)
+                x = int(self.width * (0.48 + self.rng.random() * 0.04))
+                y = int(self.center_y + self.rng.random() * 80 - 40)
                 cv2.circle(frame, (x, y), 3, (255, 200, 100), -1)
         return frame
 
@@ -633,7 +633,7 @@ class Modes451_500(BaseModeVisualizer):
         if bass > 0.5:
             # Electron channel
             for i in range(int(bass * 50)):
-                x = int(self.width * (0.3 + np.random.random() * 0.4))
+                x = int(self.width * (0.3 + self.rng.random() * 0.4))
                 y = int(self.height * 0.37)
                 cv2.circle(frame, (x, y), 2, (100, 200, 255), -1)
 
@@ -720,7 +720,7 @@ class Modes451_500(BaseModeVisualizer):
                 if bass < 0.5:  # Below Curie temp - ordered
                     angle = 90
                 else:  # Above Curie temp - random
-                    angle = np.random.random() * 360
+                    angle = self.rng.random() * 360
 
                 rad = np.deg2rad(angle)
                 x2 = int(x + np.cos(rad) * 15)
@@ -131,8 +131,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 510: Bauhaus visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -146,8 +146,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 511: Futurist visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -161,8 +161,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 512: Dadaist visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -214,8 +214,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 516: Suprematist visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -229,8 +229,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 517: Vorticism visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -281,8 +281,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 521: Precisionism visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -360,8 +360,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 527: Hard edge visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -388,8 +388,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 529: Tachisme visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -403,8 +403,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 530: Action painting visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -431,8 +431,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 532: Shaped canvas visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -620,8 +620,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 547: Fractal art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -635,8 +635,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 548: Algorithmic art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -650,8 +650,8 @@ class Modes501_550(BaseModeVisualizer):
         """Mode 549: Generative art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
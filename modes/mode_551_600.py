@@ -53,8 +53,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 554: Robotic art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -106,8 +106,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 558: Augmented reality art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -172,8 +172,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 563: Geometric art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -200,8 +200,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 565: Symmetry art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -214,16 +214,26 @@ class Modes551_600(BaseModeVisualizer):
     def draw_mode_566_kaleidoscope_art(self, frame, magnitudes):
         """Mode 566: Kaleidoscope art visualization"""
         energy = self.get_energy(magnitudes)
+        kaleido = self.kaleidoscope_art
+
+        # Scatter dots over one mirrored half-wedge reaching the frame corners
+        radius = int(np.hypot(self.width, self.height) / 2) + 1
+        canvas = kaleido.canvas(radius)
+        center_x, center_y = kaleido.center
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            distance = np.sqrt(self.rng.random()) * radius
+            angle = self.rng.random() * kaleido.wedge / 2
+            x = int(center_x + np.cos(angle) * distance)
+            y = int(center_y + np.sin(angle) * distance)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
                 size = int(2 + mag * 12)
                 hue = (i * 7) % 180
                 color = self.hsv_to_bgr(hue, 255, int(mag * 255))
-                cv2.circle(frame, (x, y), size, color, -1)
+                cv2.circle(canvas, (x, y), size, color, -1)
+
+        kaleido.compose(frame, (self.center_x, self.center_y))
         return frame
 
     def draw_mode_567_mandala_art(self, frame, magnitudes):
@@ -255,8 +265,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 569: Doodle art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -295,8 +305,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 572: Mural art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -310,8 +320,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 573: Stencil art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -338,8 +348,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 575: Spray paint art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -353,8 +363,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 576: Mosaic art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -368,8 +378,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 577: Collage art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -421,8 +431,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 581: Readymade art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -461,8 +471,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 584: Remix art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -512,8 +522,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 588: Exquisite corpse visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -565,8 +575,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 592: Aleatory art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -604,8 +614,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 595: Chaos art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -619,8 +629,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 596: Complexity art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -634,8 +644,8 @@ class Modes551_600(BaseModeVisualizer):
         """Mode 597: Emergence art visualization"""
         energy = self.get_energy(magnitudes)
         for i in range(int(energy * 100)):
-            x = int(np.random.random() * self.width)
-            y = int(np.random.random() * self.height)
+            x = int(self.rng.random() * self.width)
+            y = int(self.rng.random() * self.height)
             mag_idx = i % len(magnitudes)
             mag = magnitudes[mag_idx]
             if mag > 0.3:
@@ -30,11 +30,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -115,11 +115,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -152,11 +152,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -177,11 +177,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -214,11 +214,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -227,11 +227,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -300,11 +300,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -313,11 +313,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -326,11 +326,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -375,11 +375,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -400,11 +400,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -449,11 +449,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -462,11 +462,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -499,11 +499,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -512,11 +512,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -525,11 +525,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -586,11 +586,11 @@ class Modes601_650(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
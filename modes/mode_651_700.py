@@ -18,11 +18,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -55,11 +55,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -68,11 +68,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -81,11 +81,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -94,11 +94,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -119,11 +119,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -144,11 +144,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -157,11 +157,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -170,11 +170,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -195,11 +195,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -208,11 +208,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -221,11 +221,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -270,11 +270,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -307,11 +307,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -416,11 +416,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -429,11 +429,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -490,11 +490,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -515,11 +515,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -540,11 +540,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -565,11 +565,11 @@ class Modes651_700(BaseModeVisualizer):
         bass = self.get_bass(magnitudes)
         cv2.circle(frame, (self.center_x, self.center_y), 30, (20, 20, 40), -1)
         for i in range(int(bass * 50)):
-            angle = np.random.random() * 2 * np.pi
-            dist = 40 + np.random.random() * 200
+            angle = self.rng.random() * 2 * np.pi
+            dist = 40 + self.rng.random() * 200
             x = int(self.center_x + np.cos(angle) * dist)
             y = int(self.center_y + np.sin(angle) * dist)
-            brightness = int(np.random.random() * 200 + 55)
+            brightness = int(self.rng.random() * 200 + 55)
             cv2.circle(frame, (x, y), 2, (brightness, brightness, int(brightness * 1.2)), -1)
         return frame
 
@@ -0,0 +1,56 @@
+"""
+Voronoi Tessellation
+Nearest-seed labeling of a frame's sample grid for tessellation modes
+
+Every sample point (see fields.sample_grid) gets the index of its nearest seed,
+computed with one whole-grid distance pass per seed instead of a per-pixel scan.
+Cell colors then come from a per-seed color table, and cell_edges gives the
+boundaries for outlines:
+
+    labels, _ = voronoi_labels(width, height, seed_x, seed_y, step=4)
+    fields.paint_blocks(frame, seed_colors[labels], 4)
+    outline = fields.upscale(cell_edges(labels), 4)[:height, :width] > 0
+    frame[outline] = (0, 0, 0)
+"""
+import numpy as np
+
+from . import fields
+
+
+def nearest_seed(x, y, seed_x, seed_y):
+    """
+    Index of the nearest seed for every point
+
+    Ties go to the lower seed index, like a linear scan with a strict `<`.
+
+    Args:
+        x, y: Point coordinates (broadcast together, e.g. a sample grid)
+        seed_x, seed_y: Seed coordinates
+
+    Returns:
+        (labels, dist_sq): int64 seed indices and squared distances to that seed
+        (-1 and inf everywhere when there are no seeds)
+    """
+    x, y = np.broadcast_arrays(np.asarray(x), np.asarray(y))
+    labels = np.full(x.shape, -1, dtype=np.int64)
+    best = np.full(x.shape, np.inf)
+    for i, (sx, sy) in enumerate(zip(np.asarray(seed_x).tolist(), np.asarray(seed_y).tolist())):
+        dist = (x - sx)**2 + (y - sy)**2
+        closer = dist < best
+        labels[closer] = i
+        np.copyto(best, dist, where=closer)
+    return labels, best
+
+
+def voronoi_labels(width, height, seed_x, seed_y, step=1):
+    """Nearest-seed labels of the frame's sample grid (points every step pixels)"""
+    x, y = fields.sample_grid(width, height, step)
+    return nearest_seed(x, y, seed_x, seed_y)
+
+
+def cell_edges(labels):
+    """bool mask of the points whose right or lower neighbor lies in another cell"""
+    edges = np.zeros(labels.shape, dtype=bool)
+    edges[:, :-1] |= labels[:, :-1] != labels[:, 1:]
+    edges[:-1, :] |= labels[:-1, :] != labels[1:, :]
+    return edges
@@ -0,0 +1,175 @@
+"""
+Pipelined Render Loop
+Overlaps band analysis, drawing and encoding of a frame loop
+
+A serial render loop alternates three stages per frame: pick the bar magnitudes,
+draw, hand the frame to ffmpeg. Here the bar/feature iterator runs ahead in a
+prefetch thread and finished frames go to a writer thread that attaches the alpha
+plane and writes them to the ffmpeg pipe, while the mode draws the next frame on
+the calling thread. cv2 conversions and pipe writes release the GIL, so encoding
+overlaps drawing. Both queues are bounded: when the encoder falls behind, write()
+blocks, so at most `depth` frames are ever in flight.
+
+    writer = PipelinedWriter(FFmpegWriter(...), prepare=attach_alpha)
+    for features in prefetch(iter_frame_features(blocks)):
+        frame = draw(features.magnitudes)
+        writer.write(frame)     # the writer owns the frame from here on
+    writer.release()
+
+Frames are passed by reference, never copied, so the caller must give write() a
+frame it will not touch again (a fresh array per frame).
+"""
+import queue
+import threading
+from contextlib import nullcontext
+
+
+# Queue item ending a stream
+_DONE = object()
+_NO_OP = nullcontext()
+
+
+class _Failure:
+    """Exception raised in a worker thread, delivered through its queue"""
+
+    __slots__ = ('error',)
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _put(items, item, stop):
+    """Put into a bounded queue unless the consumer has stopped; False when stopped"""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def prefetch(iterable, depth=16, profiler=None, stage='bands'):
+    """
+    Iterate over iterable from a background thread, running up to depth items ahead
+
+    Exceptions raised by the iterable are re-raised in the consumer. Closing the
+    generator early stops the thread.
+
+    Args:
+        iterable: Items in order (e.g. audio_analysis.iter_frame_features)
+        depth: Maximum number of items produced ahead of the consumer
+        profiler: Optional render_profiler.StageProfiler timing each item
+        stage: Profiler stage name for producing one item
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce():
+        iterator = iter(iterable)
+        try:
+            while True:
+                with profiler.stage(stage) if profiler is not None else _NO_OP:
+                    item = next(iterator, _DONE)
+                if not _put(items, item, stop) or item is _DONE:
+                    return
+        except BaseException as e:
+            _put(items, _Failure(e), stop)
+
+    thread = threading.Thread(target=produce, name='render-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class PipelinedWriter:
+    """
+    Frame writer that converts and encodes frames on a background thread
+
+    Wraps a writer with write/release/abort (ffmpeg_writer.FFmpegWriter) and keeps
+    its interface, so a render loop only swaps the object it writes to.
+    """
+
+    def __init__(self, writer, prepare=None, depth=4, profiler=None):
+        """
+        Args:
+            writer: Underlying writer; only used from the writer thread until release()
+            prepare: Optional function applied to every frame before writing
+                (e.g. ffmpeg_writer.attach_alpha)
+            depth: Maximum number of frames waiting for the encoder
+            profiler: Optional render_profiler.StageProfiler ('alpha' and 'write' spans)
+        """
+        self.writer = writer
+        self.prepare = prepare
+        self.profiler = profiler
+        self.frames_written = 0
+        self._frames = queue.Queue(maxsize=depth)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name='render-writer', daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, name):
+        """Expose the wrapped writer's attributes (has_alpha, output_path, ...)"""
+        if name == 'writer':
+            raise AttributeError(name)
+        return getattr(self.writer, name)
+
+    def _stage(self, name):
+        return self.profiler.stage(name) if self.profiler is not None else _NO_OP
+
+    def _run(self):
+        while True:
+            frame = self._frames.get()
+            if frame is _DONE:
+                return
+            if self._error is not None:
+                # Keep draining so a blocked write() returns and raises the error
+                continue
+            try:
+                if self.prepare is not None:
+                    with self._stage('alpha'):
+                        frame = self.prepare(frame)
+                with self._stage('write'):
+                    self.writer.write(frame)
+                self.frames_written += 1
+            except BaseException as e:
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def write(self, frame):
+        """Queue a frame for encoding (blocks while `depth` frames are pending)"""
+        self._raise_error()
+        if not self._thread.is_alive():
+            raise RuntimeError("PipelinedWriter is closed")
+        self._frames.put(frame)
+
+    def _close(self):
+        """Let the writer thread finish the queued frames and stop"""
+        if self._thread.is_alive():
+            self._frames.put(_DONE)
+            self._thread.join()
+
+    def release(self):
+        """Write the remaining frames, then release the underlying writer"""
+        self._close()
+        self._raise_error()
+        self.writer.release()
+
+    def abort(self):
+        """Drop the pending frames and abort the underlying writer"""
+        self._error = self._error or RuntimeError("Render aborted")
+        self._close()
+        self.writer.abort()
+
@@ -0,0 +1,63 @@
+"""
+Deterministic Render Randomness
+Seeded random streams so renders are reproducible frame by frame
+
+Modes draw their random numbers from the visualizer's `rng`, a numpy Generator
+that is replaced at the start of every frame by the stream of that frame. The
+streams are derived from the render's entropy (audio content hash, mode and a
+user seed) and the frame number through SeedSequence spawn keys, so frame n gets
+the same numbers whether the render started at frame 0 or a segment worker
+started at frame n:
+
+    rng = frame_rng(render_entropy(audio_hash, mode, seed), frame_counter)
+"""
+import numpy as np
+
+
+def render_entropy(audio_hash=None, mode=0, seed=0):
+    """
+    SeedSequence entropy identifying one render
+
+    Args:
+        audio_hash: Hex content hash of the audio (audio_analysis.hash_audio_file),
+            or None when drawing without an audio file
+        mode: Visualization mode
+        seed: User seed (non-negative int) for variations of the same song and mode
+
+    Returns:
+        List of non-negative ints
+    """
+    if seed < 0:
+        raise ValueError(f"Seed must be non-negative, got {seed}")
+    entropy = [int(seed), int(mode)]
+    if audio_hash:
+        entropy += [int(audio_hash[i:i + 8], 16) for i in range(0, len(audio_hash), 8)]
+    return entropy
+
+
+class FrameGenerator(np.random.Generator):
+    """
+    numpy Generator whose scalar integers() are Python ints, like np.random.randint
+
+    Mode code passes random integers straight into cv2 colors, which reject numpy
+    integer scalars. uniform() also keeps np.random.uniform's acceptance of
+    high < low.
+    """
+
+    def integers(self, low, high=None, size=None, dtype=np.int64, endpoint=False):
+        values = super().integers(low, high, size, dtype, endpoint)
+        return int(values) if size is None and np.ndim(values) == 0 else values
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        if np.all(np.less_equal(low, high)):
+            return super().uniform(low, high, size)
+        # Reversed bounds draw from (high, low], as np.random.uniform does
+        if size is None:
+            size = np.broadcast(low, high).shape or None
+        return low + np.subtract(high, low) * self.random(size)
+
+
+def frame_rng(entropy, frame_index):
+    """Independent Generator of one frame of a render (PCG64, spawned per frame)"""
+    sequence = np.random.SeedSequence(entropy, spawn_key=(int(frame_index),))
+    return FrameGenerator(np.random.PCG64(sequence))
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Segment-Parallel Renderer
+Renders one long creative visualization as K timeline segments in parallel
+
+The timeline is split into contiguous segments, each rendered by a separate
+process into its own video file, and the files are joined losslessly with
+ffmpeg's concat demuxer (stream copy) while the audio is muxed in.
+
+Modes keep simulation state on the visualizer (particles, trails, histories), so
+a worker cannot start cold at its first frame. It warms the mode up by replaying
+a pre-roll of frames before its segment without encoding them: the features are
+computed for the whole track (cheap) so they match the serial render exactly,
+frame_counter is rewound, and the pre-roll frames are drawn and dropped. Most
+mode state only remembers the last few seconds, so a short pre-roll converges to
+what a serial render would show; pre-roll=None replays from frame 0. Random
+numbers come from per-frame seeded streams (render_random), so a fully replayed
+segment is bit-identical to the serial render.
+
+Examples:
+  # A 1-hour mix on 8 cores
+  python segment_render.py mix.wav out.mov --mode 12 --segments 8
+
+  # Replay everything before each segment (slow, for state that never settles)
+  python segment_render.py mix.wav out.mov --mode 12 --segments 4 --preroll full
+"""
+import io
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+import cv2
+
+from audio_analysis import load_spectrum, iter_frame_features
+from audio_spectrum_creative import CreativeSpectrumVisualizer
+from ffmpeg_writer import FFmpegWriter, attach_alpha, concat_videos
+from render_pipeline import PipelinedWriter
+
+
+# Default pre-roll: 10 seconds at 30 fps
+DEFAULT_PREROLL = 300
+
+
+class Segment:
+    """Frames [start, stop) of the timeline rendered to one part file"""
+
+    def __init__(self, index, start, stop, output_path):
+        self.index = index
+        self.start = start
+        self.stop = stop
+        self.output_path = str(output_path)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __repr__(self):
+        return f"<Segment {self.index} frames {self.start}-{self.stop}>"
+
+
+def plan_segments(total_frames, count, output_dir, suffix):
+    """
+    Split frames [0, total_frames) into up to count contiguous, near-equal segments
+
+    Args:
+        total_frames: Frames in the whole render
+        count: Number of segments wanted
+        output_dir: Directory for the part files
+        suffix: Part file extension (the final container's, e.g. '.mov')
+    """
+    count = max(1, min(count, total_frames))
+    bounds = np.linspace(0, total_frames, count + 1).round().astype(int).tolist()
+    return [Segment(i, start, stop, Path(output_dir) / f"part_{i:04d}{suffix}")
+            for i, (start, stop) in enumerate(zip(bounds, bounds[1:]))]
+
+
+def _init_worker():
+    """Per-process setup: one OpenCV thread per worker, the pool provides the parallelism"""
+    cv2.setNumThreads(1)
+
+
+def segment_frames(visualizer, segment, total_frames, preroll=DEFAULT_PREROLL):
+    """
+    Yield the frames of a segment, after warming the mode up with the pre-roll
+
+    Args:
+        visualizer: Fresh CreativeSpectrumVisualizer with its audio loaded
+        segment: Segment to draw
+        total_frames: Frames in the whole render
+        preroll: Frames replayed before segment.start (None = replay from frame 0)
+    """
+    # Features depend on every earlier frame (flux, beat tracking): compute from frame 0
+    warm_start = 0 if preroll is None else max(segment.start - preroll, 0)
+    features = iter_frame_features(visualizer.get_band_blocks(total_frames))
+    visualizer.frame_counter = warm_start
+
+    for frame_idx, frame_features in enumerate(islice(features, warm_start, segment.stop), warm_start):
+        frame = np.zeros((visualizer.height, visualizer.width, 3), dtype=np.uint8)
+        visualizer.features = frame_features
+        frame = visualizer.draw_spectrum(frame, frame_features.magnitudes)
+        if frame_idx >= segment.start:
+            yield frame
+
+
+def render_segment(audio_path, segment, options, profile, preroll=DEFAULT_PREROLL):
+    """
+    Render one segment to its part file in the current process (video only, no audio)
+
+    Args:
+        audio_path: Audio file of the whole render
+        segment: Segment to render
+        options: CreativeSpectrumVisualizer constructor arguments (mode, width, ...)
+        profile: ffmpeg_writer codec profile of the part file
+        preroll: Frames replayed before segment.start to warm up mode state
+
+    Returns:
+        (segment, seconds)
+    """
+    start_time = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        visualizer = CreativeSpectrumVisualizer(audio_path, segment.output_path, **options)
+        visualizer.load_audio()
+        total_frames = int(visualizer.duration * visualizer.fps)
+
+        encoder = FFmpegWriter(segment.output_path, visualizer.width, visualizer.height, visualizer.fps,
+                               profile=profile)
+        writer = PipelinedWriter(encoder, prepare=attach_alpha if encoder.has_alpha else None)
+        try:
+            for frame in segment_frames(visualizer, segment, total_frames, preroll):
+                writer.write(frame)
+            writer.release()
+        except BaseException:
+            writer.abort()
+            raise
+    return segment, time.perf_counter() - start_time
+
+
+def render_segmented(audio_path, output_path, mode=1, segments=None, workers=None,
+                     preroll=DEFAULT_PREROLL, fps=30, preview=False, on_segment=None, **options):
+    """
+    Render a creative visualization as parallel segments and join them
+
+    Args:
+        audio_path: Input audio file
+        output_path: Output video path (container picked like generate_video)
+        mode: Visualization mode
+        segments: Number of segments (default: workers)
+        workers: Worker processes (default: CPU count)
+        preroll: Warm-up frames replayed before each segment (None = from frame 0)
+        fps: Frames per second
+        preview: Fast h264 preview encode (AS_PREVIEW=1)
+        on_segment: Optional callback called with (segment, seconds) as parts finish
+        **options: Further CreativeSpectrumVisualizer arguments (width, height, ...)
+
+    Returns:
+        Final output path
+    """
+    options = {**options, 'mode': mode, 'fps': fps}
+
+    # Analyze once so every worker finds the spectrogram in the cache
+    analysis = load_spectrum(audio_path, fps)
+    total_frames = int(analysis.duration * fps)
+    if preview or os.getenv('AS_PREVIEW') == '1':
+        final_output, profile = str(output_path), 'h264'
+    else:
+        final_output, profile = CreativeSpectrumVisualizer(audio_path, output_path, **options).output_target()
+
+    workers = workers or os.cpu_count() or 1
+    part_dir = tempfile.mkdtemp(prefix='segments_', dir=Path(final_output).resolve().parent)
+    try:
+        plan = plan_segments(total_frames, segments or workers, part_dir, Path(final_output).suffix)
+        with ProcessPoolExecutor(max_workers=min(workers, len(plan)), initializer=_init_worker) as pool:
+            futures = [pool.submit(render_segment, audio_path, segment, options, profile, preroll)
+                       for segment in plan]
+            for future in as_completed(futures):
+                result = future.result()
+                if on_segment is not None:
+                    on_segment(*result)
+
+        concat_videos([segment.output_path for segment in plan], final_output,
+                      audio_path=audio_path, profile=profile)
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+    return final_output
+
+
+def parse_preroll(value):
+    """Pre-roll argument: a frame count or 'full' (replay from frame 0)"""
+    if value == 'full':
+        return None
+    frames = int(value)
+    if frames < 0:
+        raise argparse.ArgumentTypeError("pre-roll must be >= 0 or 'full'")
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Render a long creative visualization as parallel timeline segments',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('input', help='Input audio file')
+    parser.add_argument('output', help='Output video file (.mov recommended)')
+    parser.add_argument('--mode', type=int, default=1, help='Visualization mode (default: 1)')
+    parser.add_argument('--width', type=int, default=720, help='Video width (default: 720)')
+    parser.add_argument('--height', type=int, default=720, help='Video height (default: 720)')
+    parser.add_argument('--fps', type=int, default=30, help='Frames per second (default: 30)')
+    parser.add_argument('--segments', type=int, default=None, help='Timeline segments (default: workers)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--preroll', type=parse_preroll, default=DEFAULT_PREROLL,
+                        help=f"Warm-up frames before each segment, or 'full' (default: {DEFAULT_PREROLL})")
+    parser.add_argument('--seed', type=int, default=0, help='Seed for random elements (default: 0)')
+    parser.add_argument('--preview', action='store_true', help='Fast preview encode (AS_PREVIEW=1)')
+
+    args = parser.parse_args()
+
+    if not Path(args.input).exists():
+        print(f"Error: Input file not found: {args.input}")
+        sys.exit(1)
+
+    def report(segment, seconds):
+        print(f"  ✓ segment {segment.index} frames {segment.start}-{segment.stop} ({seconds:.1f}s)")
+
+    start = time.perf_counter()
+    output = render_segmented(args.input, args.output, mode=args.mode, segments=args.segments,
+                              workers=args.workers, preroll=args.preroll, fps=args.fps,
+                              preview=args.preview, on_segment=report,
+                              width=args.width, height=args.height, seed=args.seed)
+    print(f"\n✓ Output: {output} ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared audio analysis
+Checks the spectrogram cache and that the whole-song bar track matches the per-frame loop
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+import audio_analysis
+
+
+AUDIO = 'test_tone.wav'
+
+def write_test_clip(directory):
+    """Write a short two-tone clip and return its path"""
+    sr = 22050
+    t = np.arange(sr * 2) / sr
+    y = 0.5 * np.sin(2 * np.pi * 220 * t) + 0.25 * np.sin(2 * np.pi * 1760 * t) * (t > 1)
+    path = Path(directory) / 'clip.wav'
+    sf.write(path, y.astype(np.float32), sr)
+    return path
+
+
+def test_cache_roundtrip():
+    """Second load comes from the cache and matches the fresh analysis"""
+    print("Testing spectrogram cache roundtrip...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = write_test_clip(tmp)
+        os.environ['AS_CACHE_DIR'] = str(Path(tmp) / 'cache')
+        try:
+            for hop, scale in [('fps', 'norm'), ('frames', 'db')]:
+                fresh = audio_analysis.compute_spectrum(clip, 30, hop=hop, scale=scale)
+                first = audio_analysis.load_spectrum(clip, 30, hop=hop, scale=scale)
+                # Same process reuses the in-memory result
+                assert audio_analysis.load_spectrum(clip, 30, hop=hop, scale=scale) is first
+
+                # A fresh process (empty memo) reads the disk cache
+                audio_analysis._memo.clear()
+                cached = audio_analysis.load_spectrum(clip, 30, hop=hop, scale=scale)
+
+                assert isinstance(cached.spectrogram, np.memmap)
+                assert np.array_equal(first.spectrogram, fresh.spectrogram)
+                assert np.array_equal(cached.spectrogram, fresh.spectrogram)
+                assert cached.hop_length == fresh.hop_length
+                assert cached.duration == fresh.duration
+                print(f"  ✓ hop={hop}, scale={scale}")
+
+            # Different analysis parameters must not share an entry
+            other = audio_analysis.load_spectrum(clip, 24)
+            assert other.hop_length != first.hop_length or other.fps != first.fps
+        finally:
+            del os.environ['AS_CACHE_DIR']
+
+    print("\n✅ Cache roundtrip OK")
+
+
+def frame_bands(frame_magnitudes, num_bars):
+    """The per-frame band loop the visualizers used before band_weights"""
+    useful_freqs = int(len(frame_magnitudes) * 0.6)
+    bar_magnitudes = []
+    for i in range(num_bars):
+        t = i / num_bars
+        freq_pos = int(useful_freqs * (t ** 1.5))
+
+        window_size = max(1, useful_freqs // (num_bars * 2))
+        start_idx = max(0, freq_pos - window_size // 2)
+        end_idx = min(useful_freqs, freq_pos + window_size // 2)
+
+        if start_idx < end_idx:
+            avg_magnitude = np.mean(frame_magnitudes[start_idx:end_idx])
+        else:
+            avg_magnitude = frame_magnitudes[freq_pos] if freq_pos < len(frame_magnitudes) else 0
+        bar_magnitudes.append(avg_magnitude)
+    return np.array(bar_magnitudes)
+
+
+def smooth_loop(track, smoothing, prev=None):
+    """Reference smoothing: one frame at a time"""
+    out = []
+    for row in track.astype(np.float64):
+        prev = row if prev is None else smoothing * prev + (1 - smoothing) * row
+        out.append(prev)
+    return np.array(out)
+
+
+def test_smooth_track():
+    """Blocked smoothing matches the frame loop for any factor, and carries over with prev"""
+    print("Testing smoothing pass...")
+    track = np.random.default_rng(4).random((700, 6)).astype(np.float32)
+    for smoothing in (0.001, 0.01, 0.3, 0.7, 0.99, 0.999):
+        expected = smooth_loop(track, smoothing)
+        assert np.abs(audio_analysis.smooth_track(track, smoothing) - expected).max() < 1e-12, smoothing
+
+        # Smoothing in two pieces, the second continuing from the first's last frame
+        head = audio_analysis.smooth_track(track[:300], smoothing)
+        tail = audio_analysis.smooth_track(track[300:], smoothing, prev=head[-1])
+        assert np.abs(np.concatenate([head, tail]) - expected).max() < 1e-12, smoothing
+
+        prev = np.full(6, 0.5)
+        assert np.abs(audio_analysis.smooth_track(track, smoothing, prev=prev)
+                      - smooth_loop(track, smoothing, prev)).max() < 1e-12, smoothing
+    assert np.array_equal(audio_analysis.smooth_track(track, 0), track)
+    print("  ✓ Smoothing")
+
+
+def test_bar_track_matches_frame_loop():
+    """One matmul and smoothing pass give the bars the per-frame loop produced"""
+    print("Testing bar track...")
+    analysis = audio_analysis.load_spectrum(AUDIO, 30)
+    spectrogram = analysis.spectrogram
+    total_frames = int(analysis.duration * 30)
+    for num_bars, smoothing in ((120, 0.7), (64, 0.0), (200, 0.95)):
+        expected = []
+        prev = None
+        for frame_idx in range(total_frames):
+            bars = frame_bands(spectrogram[:, int(frame_idx * analysis.num_frames / total_frames)], num_bars)
+            prev = bars if prev is None else smoothing * prev + (1 - smoothing) * bars
+            expected.append(prev)
+
+        indices = audio_analysis.video_frame_indices(analysis.num_frames, total_frames)
+        track = audio_analysis.bar_track(spectrogram, num_bars, indices, smoothing)
+        assert track.shape == (total_frames, num_bars) and track.dtype == spectrogram.dtype
+        assert np.abs(track - np.array(expected)).max() < 1e-5, (num_bars, smoothing)
+    print("  ✓ Bar track")
+
+
+def test_streaming_matches_in_memory():
+    """Block-wise analysis gives the in-memory spectrogram and bars, whatever the block size"""
+    print("Testing streaming analysis...")
+    analysis = audio_analysis.load_spectrum(AUDIO, 30)
+    total_frames = int(analysis.duration * 30)
+    indices = audio_analysis.video_frame_indices(analysis.num_frames, total_frames)
+    expected = audio_analysis.bar_track(analysis.spectrogram, 120, indices, 0.7)
+
+    # One block, blocks ending mid-frame (not a multiple of the hop), blocks shorter than n_fft
+    for block_size in (1 << 18, 10007, 1000):
+        streaming = audio_analysis.StreamingSpectrum(AUDIO, 30, block_size=block_size)
+        assert streaming.hop_length == analysis.hop_length
+        assert streaming.num_frames == analysis.num_frames
+        assert streaming.duration == analysis.duration
+
+        spectrogram = np.concatenate(list(streaming._normalized_blocks()), axis=1)
+        assert np.array_equal(spectrogram, analysis.spectrogram), block_size
+
+        blocks = list(streaming.bar_blocks(120, 0.7))
+        assert block_size == 1 << 18 or len(blocks) > 1
+        assert np.abs(np.concatenate(blocks) - expected).max() < 1e-6, block_size
+        assert np.array_equal(np.array(list(streaming.bar_frames(120, 0.7))), np.concatenate(blocks))
+    print("  ✓ Streaming")
+
+
+def synthetic_bars(frames=600, num_bars=64):
+    """Noisy bars with a pulse roughly every 15 frames and a silent stretch"""
+    rng = np.random.default_rng(9)
+    bars = 0.2 + 0.05 * rng.random((frames, num_bars))
+    pulses = np.arange(10, frames, 15) + rng.integers(-2, 3, size=len(range(10, frames, 15)))
+    bars[pulses] += 0.6 * rng.random((len(pulses), num_bars))
+    bars[300:340] = 0
+    return bars.astype(np.float32)
+
+
+def features_loop(bars, tracker):
+    """Reference features computed one frame at a time"""
+    flux, onset, beat, peaks = [], [], [], []
+    last_beat = -tracker.beat_min_gap
+    for t, row in enumerate(bars.astype(np.float64)):
+        flux.append(0.0 if t == 0 else np.maximum(row - bars[t - 1], 0).mean())
+        window = np.array(flux[max(0, t - tracker.beat_window):t])
+        if len(window):
+            mean, std = window.mean(), window.std()
+            onset.append(max(flux[t] - mean, 0.0))
+            is_beat = (flux[t] > mean + tracker.beat_threshold * std and flux[t] > tracker.min_flux
+                       and t - last_beat >= tracker.beat_min_gap)
+        else:
+            onset.append(0.0)
+            is_beat = False
+        if is_beat:
+            last_beat = t
+        beat.append(is_beat)
+        peaks.append(row if t == 0 else np.maximum(row, peaks[-1] * tracker.peak_decay))
+    return np.array(flux), np.array(onset), np.array(beat), np.array(peaks)
+
+
+def test_feature_tracker():
+    """Vectorized features match the per-frame loop, and chunking does not change them"""
+    print("Testing feature tracker...")
+    bars = synthetic_bars()
+    whole = audio_analysis.FeatureTracker().process(bars)
+
+    flux, onset, beat, peaks = features_loop(bars, audio_analysis.FeatureTracker())
+    # The tracker takes differences in the bars' float32, the loop in float64
+    assert np.abs(whole.flux - flux).max() < 1e-7
+    assert np.abs(whole.onset - onset).max() < 1e-7
+    assert np.array_equal(whole.beat, beat) and 20 < beat.sum() < 45
+    assert whole.peaks.dtype == bars.dtype
+    assert np.abs(whole.peaks - peaks).max() < 1e-6
+    quarter = bars.shape[1] // 4
+    assert np.abs(whole.bass - bars[:, :quarter].mean(axis=1)).max() < 1e-6
+    assert np.abs(whole.highs - bars[:, 3 * quarter:].mean(axis=1)).max() < 1e-6
+
+    # Chunked like the streaming path, with empty and single-frame blocks
+    tracker = audio_analysis.FeatureTracker()
+    bounds = [0, 0, 1, 2, 45, 46, 300, 301, 333, 600]
+    chunks = [tracker.process(bars[a:b]) for a, b in zip(bounds, bounds[1:])]
+    assert np.array_equal(np.concatenate([c.flux for c in chunks]), whole.flux)
+    assert np.abs(np.concatenate([c.onset for c in chunks]) - whole.onset).max() < 1e-12
+    assert np.array_equal(np.concatenate([c.beat for c in chunks]), whole.beat)
+    assert np.abs(np.concatenate([c.peaks for c in chunks]) - whole.peaks).max() < 1e-6
+
+    # iter_frame_features over blocks gives one FeatureFrame per frame
+    frames = list(audio_analysis.iter_frame_features([bars[:100], bars[100:]]))
+    assert len(frames) == len(bars)
+    assert frames[150].beat == bool(whole.beat[150]) and frames[150].magnitudes is not None
+    assert type(frames[150].flux) is float
+    print("  ✓ Features")
+
+
+if __name__ == "__main__":
+    try:
+        test_cache_roundtrip()
+        test_smooth_track()
+        test_bar_track_matches_frame_loop()
+        test_streaming_matches_in_memory()
+        test_feature_tracker()
+        print("\n✅ All audio analysis tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Audio analysis test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the cellular automaton engine
+Checks stepping against a per-cell loop and cell painting against cv2.rectangle
+"""
+import sys
+
+import numpy as np
+import cv2
+
+from modes import automaton
+
+
+def test_step_matches_loop():
+    """Rule-table step equals counting wrapped neighbors cell by cell"""
+    print("Testing automaton step...")
+    rng = np.random.default_rng(0)
+    grid = rng.integers(0, 2, (23, 31))
+    for rule_text, birth, survive in [('B3/S23', {3}, {2, 3}), ('B36/S125', {3, 6}, {1, 2, 5})]:
+        rule = automaton.parse_rule(rule_text)
+        expected = np.zeros_like(grid)
+        h, w = grid.shape
+        for y in range(h):
+            for x in range(w):
+                n = sum(grid[(y + dy) % h, (x + dx) % w]
+                        for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx)
+                expected[y, x] = n in (survive if grid[y, x] else birth)
+        assert np.array_equal(automaton.step(grid, rule), expected), rule_text
+
+    # A glider returns to its shape one cell down-right after four generations
+    glider = np.zeros((8, 8), dtype=np.uint8)
+    glider[0, 1] = glider[1, 2] = glider[2, 0] = glider[2, 1] = glider[2, 2] = 1
+    grid = glider
+    for _ in range(4):
+        grid = automaton.step(grid)
+    assert np.array_equal(grid, np.roll(glider, (1, 1), axis=(0, 1)))
+    print("  ✓ Step")
+
+
+def test_paint_cells_matches_rectangles():
+    """Painted cells equal drawing each live cell with cv2.rectangle"""
+    print("Testing cell painting...")
+    rng = np.random.default_rng(1)
+    grid = rng.integers(0, 2, (12, 15))
+    for grow in (0, 1):
+        expected = np.zeros((100, 130, 3), dtype=np.uint8)
+        for y, x in zip(*np.nonzero(grid)):
+            cv2.rectangle(expected, (int(x) * 9, int(y) * 8),
+                          (int(x) * 9 + 8 + grow, int(y) * 8 + 7 + grow), (0, 200, 90), -1)
+        frame = np.zeros_like(expected)
+        automaton.paint_cells(frame, grid, 9, 8, (0, 200, 90), grow=grow)
+        assert np.array_equal(frame, expected), grow
+    print("  ✓ Painting")
+
+
+if __name__ == "__main__":
+    try:
+        test_step_matches_loop()
+        test_paint_cells_matches_rectangles()
+    except AssertionError as e:
+        print(f"\n❌ Automaton test failed: {e}")
+        sys.exit(1)
+    print("\n✅ Cellular automaton engine matches the reference loops")
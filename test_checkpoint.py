@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for render checkpoints
+Checks that restored mode state continues a render exactly and that a failed render resumes
+"""
+import io
+import sys
+import shutil
+import subprocess
+import tempfile
+import warnings
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from audio_spectrum_creative import CreativeSpectrumVisualizer
+from checkpoint import snapshot, restore, save_snapshot, load_snapshot, render_checkpointed
+
+
+AUDIO = 'test_tone.wav'
+
+
+def draw(visualizer, bars):
+    frames = []
+    with redirect_stdout(io.StringIO()):
+        for magnitudes in bars:
+            frame = np.zeros((visualizer.height, visualizer.width, 3), dtype=np.uint8)
+            frames.append(visualizer.draw_spectrum(frame, magnitudes))
+    return frames
+
+
+def test_snapshot_round_trip():
+    """A fresh visualizer restored from a snapshot draws the frames the original would"""
+    print("Testing snapshot round trip...")
+    bars = np.random.default_rng(3).random((60, 120))
+    # Rain and fireworks (random particle pools), level history, kaleidoscope
+    for mode in (2, 3, 25, 34):
+        original = CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=mode)
+        draw(original, bars[:30])
+        data = snapshot(original)
+        expected = draw(original, bars[30:])
+
+        resumed = CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=mode)
+        assert restore(resumed, data) == 30
+        frames = draw(resumed, bars[30:])
+        assert all(np.array_equal(a, b) for a, b in zip(frames, expected)), f"mode {mode} differs"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_snapshot(original, Path(tmp) / 'state.ckpt')
+        assert load_snapshot(CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=34),
+                             Path(tmp) / 'state.ckpt') == 60
+        try:
+            load_snapshot(CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=2),
+                          Path(tmp) / 'state.ckpt')
+            assert False, "snapshot of another mode accepted"
+        except ValueError:
+            pass
+    print("  ✓ Round trip")
+
+
+class Crash(Exception):
+    pass
+
+
+def decoded_frames(path):
+    probe = subprocess.run(['ffmpeg', '-hide_banner', '-i', str(path), '-map', '0:v', '-f', 'framemd5', '-'],
+                           capture_output=True, text=True)
+    return [line.split(',')[-1] for line in probe.stdout.splitlines() if not line.startswith('#')], probe.stderr
+
+
+def test_resume_after_failure():
+    """A render killed after a checkpoint resumes there and ends like an uninterrupted one"""
+    print("Testing resumed render...")
+    if shutil.which('ffmpeg') is None:
+        print("  - ffmpeg not installed, skipped")
+        return
+
+    def crash_at_40(frame):
+        if frame == 40:
+            raise Crash()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        with redirect_stdout(io.StringIO()):
+            def visualizer(name):
+                return CreativeSpectrumVisualizer(AUDIO, tmp / name, width=160, height=120, mode=2)
+
+            full_output = render_checkpointed(visualizer('full.mp4'), tmp / 'full.ckpt', every=20)
+            suffix = Path(full_output).suffix
+
+            try:
+                render_checkpointed(visualizer('resumed.mp4'), tmp / 'resumed.ckpt', every=20,
+                                    on_checkpoint=crash_at_40)
+                assert False, "render did not fail"
+            except Crash:
+                pass
+            left = sorted(p.name for p in (tmp / 'resumed.ckpt').iterdir())
+            assert left == ['manifest.json', f'part_00000000{suffix}', f'part_00000020{suffix}',
+                            'state_00000040.ckpt']
+
+            resumed_at = []
+            resumed_output = render_checkpointed(visualizer('resumed.mp4'), tmp / 'resumed.ckpt', every=20,
+                                                 on_checkpoint=resumed_at.append)
+        assert resumed_at == [60, 80]
+
+        full, _ = decoded_frames(full_output)
+        resumed, info = decoded_frames(resumed_output)
+        assert 'Audio' in info
+        assert len(full) == 90 and resumed == full
+        assert not (tmp / 'resumed.ckpt').exists()
+    print("  ✓ Resumed")
+
+
+def test_empty_render():
+    """Audio shorter than one frame is rejected before anything is written"""
+    print("Testing empty render...")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sf.write(tmp / 'blip.wav', np.zeros(1000), 44100)
+        visualizer = CreativeSpectrumVisualizer(str(tmp / 'blip.wav'), tmp / 'out.mp4', width=160, height=120,
+                                                mode=2)
+        try:
+            with redirect_stdout(io.StringIO()), warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                render_checkpointed(visualizer, tmp / 'out.ckpt')
+            assert False, "empty render accepted"
+        except ValueError as e:
+            assert 'shorter than one frame' in str(e)
+        assert sorted(p.name for p in tmp.iterdir()) == ['blip.wav']
+    print("  ✓ Rejected")
+
+
+if __name__ == "__main__":
+    try:
+        test_snapshot_round_trip()
+        test_resume_after_failure()
+        test_empty_render()
+        print("\n✅ All checkpoint tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Checkpoint test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script for the HSV/BGR color lookup tables
+Checks that table lookups match cv2.cvtColor on 1x1 images exactly
+"""
+import sys
+
+import numpy as np
+import cv2
+
+import color_lut
+
+
+def cvt_pixel(color, code):
+    """Reference conversion: one color as a 1x1 image"""
+    return cv2.cvtColor(np.array([[color]], dtype=np.uint8), code)[0][0]
+
+
+def test_hsv_to_bgr_matches_opencv():
+    """Scalar and batch HSV -> BGR equal the 1x1 cvtColor path"""
+    print("Testing HSV -> BGR lookups...")
+    rng = np.random.default_rng(0)
+    hsv = rng.integers(0, 256, (5000, 3))
+
+    for h, s, v in hsv.tolist():
+        expected = cvt_pixel([h, s, v], cv2.COLOR_HSV2BGR)
+        assert np.array_equal(color_lut.hsv_pixel(h, s, v), expected), (h, s, v)
+        assert color_lut.hsv_to_bgr(h, s, v) == tuple(int(c) for c in expected)
+
+    # Float components are truncated like np.array(..., dtype=np.uint8)
+    for h, s, v in rng.uniform(0, 180, (1000, 3)).tolist():
+        assert np.array_equal(color_lut.hsv_pixel(h, s, v), cvt_pixel([h, s, v], cv2.COLOR_HSV2BGR))
+
+    expected = np.stack([cvt_pixel(c, cv2.COLOR_HSV2BGR) for c in hsv])
+    assert np.array_equal(color_lut.hsv_to_bgr_array(hsv[:, 0], hsv[:, 1], hsv[:, 2]), expected)
+    wrapped = hsv % [180, 256, 256]
+    expected = np.stack([cvt_pixel(c, cv2.COLOR_HSV2BGR) for c in wrapped])
+    assert np.array_equal(color_lut.hsv_to_bgr_array(wrapped[:, 0], wrapped[:, 1], wrapped[:, 2]), expected)
+    print("  ✓ HSV -> BGR")
+
+
+def test_bgr_to_hsv_matches_opencv():
+    """The fixed-point BGR -> HSV formula is exact for every 8-bit color"""
+    print("Testing BGR -> HSV formula...")
+    levels = np.arange(256, dtype=np.uint8)
+    b, g, r = np.meshgrid(levels, levels, levels, indexing='ij')
+    image = np.stack([b, g, r], axis=-1).reshape(65536, 256, 3)
+    assert np.array_equal(color_lut.bgr_to_hsv_array(image), cv2.cvtColor(image, cv2.COLOR_BGR2HSV))
+
+    rng = np.random.default_rng(1)
+    for color in rng.integers(0, 256, (2000, 3)).tolist():
+        expected = cvt_pixel(color, cv2.COLOR_BGR2HSV)
+        assert color_lut.bgr_to_hsv(*color) == tuple(int(c) for c in expected), color
+    print("  ✓ BGR -> HSV")
+
+
+if __name__ == "__main__":
+    try:
+        test_hsv_to_bgr_matches_opencv()
+        test_bgr_to_hsv_matches_opencv()
+    except AssertionError as e:
+        print(f"\n❌ Color lookup test failed: {e}")
+        sys.exit(1)
+    print("\n✅ Color lookups match OpenCV")
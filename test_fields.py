@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for procedural field painting
+Checks block and dot painting against per-sample OpenCV drawing
+"""
+import sys
+
+import numpy as np
+import cv2
+
+from modes import fields
+
+
+def test_paint_blocks_matches_fill():
+    """Blocks equal filling frame[y:y+step, x:x+step] per sample point"""
+    print("Testing block painting...")
+    rng = np.random.default_rng(0)
+    x, y = fields.sample_grid(101, 67, 4)
+    colors = rng.integers(0, 256, (y.shape[0], x.shape[1], 3))
+    expected = np.zeros((67, 101, 3), dtype=np.uint8)
+    for j, sy in enumerate(y[:, 0]):
+        for i, sx in enumerate(x[0]):
+            expected[sy:sy + 4, sx:sx + 4] = colors[j, i]
+    frame = fields.paint_blocks(np.zeros_like(expected), colors, 4)
+    assert np.array_equal(frame, expected)
+    print("  ✓ Blocks")
+
+
+def test_paint_dots_matches_circles():
+    """Dots equal one cv2.circle per sample point"""
+    print("Testing dot painting...")
+    rng = np.random.default_rng(1)
+    for width, height, step, radius in [(130, 75, 8, 3), (64, 64, 5, 2)]:
+        x, y = fields.sample_grid(width, height, step)
+        colors = rng.integers(-40, 300, (y.shape[0], x.shape[1], 3))
+        expected = np.full((height, width, 3), 7, dtype=np.uint8)
+        for j, sy in enumerate(y[:, 0].tolist()):
+            for i, sx in enumerate(x[0].tolist()):
+                cv2.circle(expected, (sx, sy), radius, colors[j, i].tolist(), -1)
+        frame = fields.paint_dots(np.full_like(expected, 7), colors, step, radius)
+        assert np.array_equal(frame, expected), (width, height, step, radius)
+    print("  ✓ Dots")
+
+
+if __name__ == "__main__":
+    try:
+        test_paint_blocks_matches_fill()
+        test_paint_dots_matches_circles()
+    except AssertionError as e:
+        print(f"\n❌ Field painting test failed: {e}")
+        sys.exit(1)
+    print("\n✅ Field painting matches per-sample drawing")
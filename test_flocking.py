@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized flocking engine
+Checks grid neighbor search and boid rules against a brute-force loop
+"""
+import sys
+
+import numpy as np
+
+from modes.base import ParticleSystem
+from modes.flocking import flock_forces, flock_step, neighbor_pairs
+
+
+def test_neighbor_pairs_match_brute_force():
+    """Grid search finds exactly the pairs closer than the radius"""
+    print("Testing grid neighbor search...")
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-50, 700, 400)
+    y = rng.uniform(0, 500, 400)
+    i, j, dx, dy, dist = neighbor_pairs(x, y, 60)
+
+    d = np.hypot(x[None, :] - x[:, None], y[None, :] - y[:, None])
+    expected = (d < 60) & ~np.eye(len(x), dtype=bool)
+    found = np.zeros_like(expected)
+    found[i, j] = True
+    assert np.array_equal(found, expected)
+    assert np.allclose(dx, x[j] - x[i]) and np.allclose(dy, y[j] - y[i])
+    assert np.allclose(dist, d[i, j])
+    print("  ✓ Neighbor pairs")
+
+
+def test_flock_forces_match_loop():
+    """Cohesion, separation and alignment equal the per-boid loop of mode 92"""
+    print("Testing boid rules...")
+    rng = np.random.default_rng(1)
+    n = 200
+    x, y = rng.uniform(0, 640, n), rng.uniform(0, 480, n)
+    vx, vy = rng.normal(size=n), rng.normal(size=n)
+    cohesion, separation, alignment = flock_forces(x, y, vx, vy)
+
+    for k in range(n):
+        dx, dy = x - x[k], y - y[k]
+        dist = np.sqrt(dx ** 2 + dy ** 2) + 0.1
+        near = (dist < 100) & (np.arange(n) != k)
+        close = (dist < 30) & (np.arange(n) != k)
+        count = max(near.sum(), 1)
+        assert np.allclose(cohesion[k], [dx[near].sum() / count, dy[near].sum() / count])
+        assert np.allclose(alignment[k], [vx[near].sum() / count, vy[near].sum() / count])
+        assert np.allclose(separation[k], [-(dx[close] / dist[close]).sum(), -(dy[close] / dist[close]).sum()])
+    print("  ✓ Boid rules")
+
+
+def test_flock_step_limits_and_wraps():
+    """Stepping keeps speeds under the limit and positions inside the frame"""
+    print("Testing flock step...")
+    rng = np.random.default_rng(2)
+    boids = ParticleSystem()
+    boids.spawn(x=rng.uniform(0, 320, 500), y=rng.uniform(0, 240, 500),
+                vx=rng.normal(0, 10, 500), vy=rng.normal(0, 10, 500))
+    for _ in range(5):
+        flock_step(boids, 0.01, 1.0, 0.1, max_speed=4, width=320, height=240)
+    assert np.all(np.hypot(boids.vx, boids.vy) <= 4 + 1e-9)
+    assert np.all((boids.x >= 0) & (boids.x < 320) & (boids.y >= 0) & (boids.y < 240))
+    print("  ✓ Flock step")
+
+
+if __name__ == "__main__":
+    try:
+        test_neighbor_pairs_match_brute_force()
+        test_flock_forces_match_loop()
+        test_flock_step_limits_and_wraps()
+    except AssertionError as e:
+        print(f"\n❌ Flocking test failed: {e}")
+        sys.exit(1)
+    print("\n✅ Flocking engine matches the brute-force rules")
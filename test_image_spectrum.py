@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test script for image spectrum frames
+Checks that faded, straight-alpha particles keep their color on the way to the encoder
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import cv2
+
+from audio_spectrum_image import ImageSpectrumVisualizer
+
+
+COLOR = (100, 150, 200)
+
+
+def faded_particle_frame(tmp):
+    """Mode 3 frame with one fountain particle at half life over a solid image"""
+    image_path = str(Path(tmp) / 'solid.png')
+    cv2.imwrite(image_path, np.full((60, 80, 3), COLOR, dtype=np.uint8))
+    visualizer = ImageSpectrumVisualizer(None, None, image_path, width=80, height=60, mode=3)
+    # Odd frame: no new particles spawn
+    visualizer.frame_counter = 1
+    visualizer.fountain_particles = [{'x': 40, 'y': 30, 'vx': 0, 'vy': -0.5, 'color': COLOR + (255,),
+                                      'life': 0.51}]
+    frame = visualizer.generate_frame(np.zeros(visualizer.num_bars))
+    return visualizer, frame
+
+
+def test_faded_particle_alpha():
+    """The alpha encoders get the image color with the fade in the alpha plane"""
+    print("Testing faded particle with alpha...")
+    with tempfile.TemporaryDirectory() as tmp:
+        visualizer, frame = faded_particle_frame(tmp)
+        pixel = visualizer.encoder_frame(frame, has_alpha=True)[30, 40]
+        assert tuple(pixel[:3]) == COLOR, f"color changed to {tuple(pixel[:3])}"
+        assert pixel[3] == 127
+    print("  ✓ Color kept")
+
+
+def test_faded_particle_over_black():
+    """Without alpha the particle is composited over black at half strength"""
+    print("Testing faded particle over black...")
+    with tempfile.TemporaryDirectory() as tmp:
+        visualizer, frame = faded_particle_frame(tmp)
+        bgr = visualizer.encoder_frame(frame, has_alpha=False)
+        assert bgr.shape == (60, 80, 3)
+        assert np.abs(bgr[30, 40].astype(int) - np.array(COLOR) * 127 / 255).max() <= 1
+        assert not bgr[0, 0].any()
+    print("  ✓ Composited")
+
+
+if __name__ == "__main__":
+    try:
+        test_faded_particle_alpha()
+        test_faded_particle_over_black()
+        print("\n✅ All image spectrum tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Image spectrum test failed: {e}")
+        sys.exit(1)
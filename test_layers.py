@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for the static layer cache and compositor
+Checks that composited layers match drawing directly and are rasterized once per key
+"""
+import sys
+
+import numpy as np
+import cv2
+
+from modes.layers import LayerCache, rasterize
+
+
+def draw_chrome(canvas):
+    """Anti-aliased and hard-edged shapes, overlapping, in several colors"""
+    cv2.rectangle(canvas, (20, 20), (140, 90), (140, 130, 110), -1, lineType=cv2.LINE_AA)
+    cv2.rectangle(canvas, (20, 20), (140, 90), (100, 90, 70), 3, lineType=cv2.LINE_AA)
+    cv2.circle(canvas, (80, 55), 30, (20, 15, 10), -1, lineType=cv2.LINE_AA)
+    cv2.line(canvas, (0, 110), (159, 100), (255, 255, 255), 1, lineType=cv2.LINE_AA)
+    cv2.putText(canvas, "L", (5, 115), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (150, 140, 120), 2, cv2.LINE_AA)
+
+
+def test_matches_direct_drawing():
+    """On a black frame the composite is exactly the directly drawn frame"""
+    print("Testing composite on black...")
+    direct = np.zeros((120, 160, 3), dtype=np.uint8)
+    draw_chrome(direct)
+    frame = rasterize(direct.shape, draw_chrome).composite(np.zeros_like(direct))
+    assert np.array_equal(frame, direct)
+    print("  ✓ Bit-identical")
+
+
+def test_blends_over_content():
+    """Over existing content, opaque pixels replace it and AA edges blend"""
+    print("Testing composite over content...")
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+    direct = background.copy()
+    draw_chrome(direct)
+    frame = rasterize(background.shape, draw_chrome).composite(background.copy())
+    # (edges differ by 8-bit rounding, a few levels at most)
+    assert np.abs(frame.astype(int) - direct).max() <= 6
+    # Untouched pixels keep the background
+    assert np.array_equal(frame[119, 150], background[119, 150])
+    print("  ✓ Over blend")
+
+
+def test_black_mask_layer():
+    """Black content (scanlines) is kept as coverage and cuts through the frame"""
+    print("Testing black layer...")
+    def scanlines(canvas):
+        for y in range(0, canvas.shape[0], 4):
+            cv2.line(canvas, (0, y), (canvas.shape[1], y), (0, 0, 0), 1)
+    layer = rasterize((40, 50, 3), scanlines)
+    assert layer.opaque is not None
+    frame = layer.composite(np.full((40, 50, 3), 200, dtype=np.uint8))
+    assert np.all(frame[::4] == 0) and np.all(frame[1::4] == 200)
+    print("  ✓ Scanlines")
+
+
+def test_empty_layer():
+    """A layer that draws nothing on the canvas (here: only off-frame) leaves the frame alone"""
+    print("Testing empty layer...")
+    def off_frame(canvas):
+        cv2.circle(canvas, (20, 15), 200, (0, 255, 255), 2, lineType=cv2.LINE_AA)
+    for render in (off_frame, lambda canvas: None):
+        layer = rasterize((30, 40, 3), render)
+        background = np.random.default_rng(1).integers(0, 256, (30, 40, 3), dtype=np.uint8)
+        assert np.array_equal(layer.composite(background.copy()), background)
+    print("  ✓ Empty")
+
+
+def test_cache_keys():
+    """Layers are rasterized once per key and frame shape"""
+    print("Testing layer cache...")
+    calls = []
+    def render(canvas):
+        calls.append(canvas.shape)
+        cv2.circle(canvas, (10, 10), 5, (0, 255, 0), -1)
+    cache = LayerCache()
+    first = cache.get('dot', 1, (32, 32, 3), render)
+    assert cache.get('dot', 1, (32, 32, 3), render) is first
+    assert len(calls) == 2  # once on black, once on white
+    assert cache.get('dot', 2, (32, 32, 3), render) is not first
+    cache.get('dot', 2, (64, 32, 3), render)
+    assert len(calls) == 6
+    try:
+        first.composite(np.zeros((64, 32, 3), dtype=np.uint8))
+        assert False, "shape mismatch not detected"
+    except ValueError:
+        pass
+    print("  ✓ Keys")
+
+
+if __name__ == "__main__":
+    try:
+        test_matches_direct_drawing()
+        test_blends_over_content()
+        test_black_mask_layer()
+        test_empty_layer()
+        test_cache_keys()
+        print("\n✅ All layer tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Layer test failed: {e}")
+        sys.exit(1)
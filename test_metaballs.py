@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the metaball renderer
+Checks the potential field against a direct per-ball sum and blob merging
+"""
+import sys
+
+import numpy as np
+
+from modes import fields, metaballs
+
+
+def test_potential_matches_direct_sum():
+    """Windowed (ball, point) pairs give the same field as summing every ball everywhere"""
+    print("Testing metaball potential...")
+    rng = np.random.default_rng(0)
+    n = 40
+    bx, by = rng.uniform(-30, 230, n), rng.uniform(-30, 130, n)
+    radius = rng.uniform(3, 25, n)
+    colors = rng.integers(0, 256, (n, 3))
+    field, weighted = metaballs.potential(200, 100, bx, by, radius, colors, step=4)
+
+    x, y = fields.sample_grid(200, 100, 4)
+    x, y = x + 1.5, y + 1.5
+    expected = np.zeros(field.shape)
+    expected_weighted = np.zeros(weighted.shape)
+    for i in range(n):
+        d2 = (x - bx[i]) ** 2 + (y - by[i]) ** 2
+        p = np.maximum(1 - d2 / (radius[i] * metaballs.REACH) ** 2, 0) ** 2 / metaballs._SURFACE
+        expected += p
+        expected_weighted += p[:, :, None] * colors[i]
+    assert np.allclose(field, expected) and np.allclose(weighted, expected_weighted)
+    print("  ✓ Potential")
+
+
+def test_blobs_merge():
+    """A lone ball fills its circle; two nearby balls fill the gap between them"""
+    print("Testing blob shapes...")
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    metaballs.render_metaballs(frame, [50], [50], [20], (0, 0, 255), step=2)
+    assert frame[50, 50, 2] == 255 and frame[50, 66, 2] == 255
+    assert frame[50, 75, 2] == 0 and frame[10, 10, 2] == 0
+
+    frame[:] = 0
+    metaballs.render_metaballs(frame, [80, 122], [50, 50], [20, 20], (0, 0, 255), step=2)
+    assert frame[50, 101, 2] == 255
+    print("  ✓ Blobs")
+
+
+if __name__ == "__main__":
+    try:
+        test_potential_matches_direct_sum()
+        test_blobs_merge()
+    except AssertionError as e:
+        print(f"\n❌ Metaball test failed: {e}")
+        sys.exit(1)
+    print("\n✅ Metaball renderer works")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for per-mode state
+Checks that modes keep their state apart from each other and from the shared visualizer
+"""
+import io
+import sys
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from audio_spectrum_creative import CreativeSpectrumVisualizer
+from batch_render import RenderJob, plan_groups
+from modes import get_mode_instance
+
+
+BARS = np.random.default_rng(11).random((40, 120))
+
+
+def solo(mode, frames=40):
+    """Frames of a mode rendered alone"""
+    visualizer = CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=mode)
+    out = []
+    with redirect_stdout(io.StringIO()):
+        for magnitudes in BARS[:frames]:
+            out.append(visualizer.draw_spectrum(np.zeros((160, 200, 3), np.uint8), magnitudes))
+    return out
+
+
+def same(a, b):
+    return len(a) == len(b) and all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def test_state_isolated():
+    """Mode writes land in the mode's own state, never on the visualizer"""
+    print("Testing state isolation...")
+    visualizer = CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=2)
+    with redirect_stdout(io.StringIO()):
+        visualizer.draw_mode(2, np.zeros((160, 200, 3), np.uint8), BARS[0])
+        visualizer.draw_mode(12, np.zeros((160, 200, 3), np.uint8), BARS[0])
+    rain = get_mode_instance(2, visualizer)
+    assert len(rain.rain_system) > 0
+    assert len(get_mode_instance(12, visualizer).rain_system) == 0
+    assert 'rain_system' in vars(rain.state) and 'rain_system' not in vars(visualizer)
+    # Same class, separate instances per mode number
+    assert type(rain) is type(get_mode_instance(12, visualizer))
+    print("  ✓ Isolated")
+
+
+def test_modes_side_by_side():
+    """Modes drawn together on one visualizer match their solo renders"""
+    print("Testing modes side by side...")
+    modes = (2, 3, 12, 25, 54)
+    visualizer = CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=modes[0])
+    frames = {mode: [] for mode in modes}
+    with redirect_stdout(io.StringIO()):
+        for magnitudes in BARS:
+            visualizer.frame_counter += 1
+            for mode in modes:
+                frame = np.zeros((160, 200, 3), np.uint8)
+                frames[mode].append(visualizer.draw_mode(mode, frame, magnitudes))
+    for mode in modes:
+        assert same(frames[mode], solo(mode)), f"mode {mode} differs"
+
+    # A second visualizer in the same process does not take over the first one's modes
+    first = CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=3)
+    out = []
+    with redirect_stdout(io.StringIO()):
+        for i, magnitudes in enumerate(BARS):
+            if i == 20:
+                CreativeSpectrumVisualizer(None, None, width=120, height=90, mode=3)
+            out.append(first.draw_spectrum(np.zeros((160, 200, 3), np.uint8), magnitudes))
+    assert same(out, solo(3))
+    print("  ✓ Side by side")
+
+
+def test_reset():
+    """Resetting the modes starts the render over"""
+    print("Testing reset...")
+    visualizer = CreativeSpectrumVisualizer(None, None, width=200, height=160, mode=2)
+    with redirect_stdout(io.StringIO()):
+        for magnitudes in BARS[:15]:
+            visualizer.draw_spectrum(np.zeros((160, 200, 3), np.uint8), magnitudes)
+        visualizer.reset_modes()
+        frames = [visualizer.draw_spectrum(np.zeros((160, 200, 3), np.uint8), m) for m in BARS[:10]]
+    assert same(frames, solo(2, frames=10))
+    print("  ✓ Reset")
+
+
+def test_plan_groups():
+    """Creative jobs with the same options share units; other jobs stay alone"""
+    print("Testing batch groups...")
+    small, large = {'width': 160, 'height': 120}, {'width': 320, 'height': 240}
+    jobs = [RenderJob('audio_spectrum_creative', 1, 'a', small),
+            RenderJob('audio_spectrum_creative', 2, 'b', large),
+            RenderJob('audio_spectrum_lines', 1, 'c', small),
+            RenderJob('audio_spectrum_creative', 3, 'd', small),
+            RenderJob('audio_spectrum_creative', 4, 'e', small)]
+    assert plan_groups(jobs) == [[0], [1], [2], [3], [4]]
+    assert plan_groups(jobs, group=2) == [[0, 3], [1], [2], [4]]
+    print("  ✓ Groups")
+
+
+if __name__ == "__main__":
+    try:
+        test_state_isolated()
+        test_modes_side_by_side()
+        test_reset()
+        test_plan_groups()
+        print("\n✅ All mode state tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Mode state test failed: {e}")
+        sys.exit(1)
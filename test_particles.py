@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for batched circle drawing
+Checks draw_circles against one cv2.circle call per circle
+"""
+import sys
+
+import numpy as np
+import cv2
+
+from modes.base import draw_circles
+
+
+def circle_loop(frame, x, y, radius, color, thickness, line_type):
+    for i in range(len(x)):
+        cv2.circle(frame, (int(x[i]), int(y[i])), int(radius[i]), color[i].tolist(), int(thickness[i]),
+                   lineType=line_type)
+    return frame
+
+
+def test_stamped_circles_match_loop():
+    """Filled LINE_8 circles of one radius, overlapping and partly off-frame"""
+    print("Testing stamped circles...")
+    rng = np.random.default_rng(0)
+    for radius in (0, 1, 2, 5, 9):
+        for n in (1, 50, 400):
+            x, y = rng.integers(-15, 115, n), rng.integers(-15, 95, n)
+            color = rng.integers(-30, 300, (n, 3))
+            expected = circle_loop(np.full((80, 100, 3), 7, np.uint8), x, y, np.full(n, radius), color,
+                                   np.full(n, -1), cv2.LINE_8)
+            frame = draw_circles(np.full((80, 100, 3), 7, np.uint8), x, y, radius, color, line_type=cv2.LINE_8)
+            assert np.array_equal(frame, expected), (radius, n)
+
+    # A view into a larger frame is drawn in place
+    canvas = np.zeros((80, 200, 3), np.uint8)
+    draw_circles(canvas[:, 50:150], [10, 90], [40, 40], 4, (255, 0, 0), line_type=cv2.LINE_8)
+    expected = np.zeros((80, 200, 3), np.uint8)
+    for cx in (60, 140):
+        cv2.circle(expected, (cx, 40), 4, (255, 0, 0), -1, lineType=cv2.LINE_8)
+    assert np.array_equal(canvas, expected)
+    print("  ✓ Stamped")
+
+
+def test_mixed_circles_match_loop():
+    """Antialiased, outlined and mixed-radius circles keep their drawing order"""
+    print("Testing mixed circles...")
+    rng = np.random.default_rng(1)
+    n = 120
+    x, y = rng.uniform(-10, 110, n), rng.uniform(-10, 90, n)
+    radius = rng.integers(1, 8, n)
+    color = rng.integers(0, 256, (n, 3))
+    thickness = rng.choice([-1, 1, 2], n)
+    for line_type in (cv2.LINE_AA, cv2.LINE_8):
+        expected = circle_loop(np.zeros((80, 100, 3), np.uint8), x, y, radius, color, thickness, line_type)
+        frame = draw_circles(np.zeros((80, 100, 3), np.uint8), x, y, radius, color, thickness, line_type)
+        assert np.array_equal(frame, expected), line_type
+    print("  ✓ Mixed")
+
+
+if __name__ == "__main__":
+    try:
+        test_stamped_circles_match_loop()
+        test_mixed_circles_match_loop()
+        print("\n✅ All circle drawing tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Circle drawing test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test script for the pipelined render loop
+Checks ordering, backpressure and error propagation of the prefetch and writer threads
+"""
+import sys
+import threading
+import time
+
+import numpy as np
+
+from render_pipeline import PipelinedWriter, prefetch
+
+
+class ListWriter:
+    """Writer collecting frames in memory, optionally slow or failing"""
+
+    def __init__(self, delay=0.0, fail_at=None):
+        self.frames = []
+        self.delay = delay
+        self.fail_at = fail_at
+        self.released = self.aborted = False
+        self.has_alpha = False
+
+    def write(self, frame):
+        if len(self.frames) == self.fail_at:
+            raise RuntimeError("ffmpeg exited early")
+        time.sleep(self.delay)
+        self.frames.append(frame)
+
+    def release(self):
+        self.released = True
+
+    def abort(self):
+        self.aborted = True
+
+
+def test_prefetch():
+    """Items arrive in order, errors surface in the consumer, early exit stops the thread"""
+    print("Testing prefetch...")
+    assert list(prefetch(range(100), depth=3)) == list(range(100))
+    assert [row.tolist() for row in prefetch(np.arange(6).reshape(3, 2))] == [[0, 1], [2, 3], [4, 5]]
+
+    def failing():
+        yield 1
+        raise ValueError("bad block")
+    items = prefetch(failing())
+    assert next(items) == 1
+    try:
+        next(items)
+        assert False, "error not propagated"
+    except ValueError:
+        pass
+
+    produced = []
+    def endless():
+        while True:
+            produced.append(1)
+            yield len(produced)
+    items = prefetch(endless(), depth=4)
+    assert next(items) == 1
+    items.close()
+    count = len(produced)
+    time.sleep(0.05)
+    assert len(produced) == count <= 6
+    assert not any(t.name == 'render-prefetch' for t in threading.enumerate())
+    print("  ✓ Prefetch")
+
+
+def test_writer_order_and_prepare():
+    """Frames are prepared and written in order; release flushes the queue"""
+    print("Testing pipelined writer...")
+    sink = ListWriter(delay=0.001)
+    writer = PipelinedWriter(sink, prepare=lambda frame: frame * 2, depth=2)
+    for i in range(20):
+        writer.write(np.full((2, 2, 3), i, dtype=np.uint8))
+    assert writer.has_alpha is False  # wrapped writer attributes pass through
+    writer.release()
+    assert sink.released and writer.frames_written == 20
+    assert [int(frame[0, 0, 0]) for frame in sink.frames] == [2 * i for i in range(20)]
+    print("  ✓ Order")
+
+
+def test_writer_backpressure():
+    """A slow encoder blocks write() instead of queueing unbounded frames"""
+    print("Testing backpressure...")
+    sink = ListWriter(delay=0.02)
+    writer = PipelinedWriter(sink, depth=2)
+    start = time.perf_counter()
+    for i in range(8):
+        writer.write(i)
+        # Queued plus the frame being written never exceeds depth + 1
+        assert i + 1 - len(sink.frames) <= 2 + 1
+    assert time.perf_counter() - start > 0.08
+    writer.release()
+    assert sink.frames == list(range(8))
+    print("  ✓ Backpressure")
+
+
+def test_writer_errors():
+    """Encoder errors are raised in the render loop; abort drops pending frames"""
+    print("Testing writer errors...")
+    sink = ListWriter(fail_at=3)
+    writer = PipelinedWriter(sink, depth=2)
+    try:
+        for i in range(50):
+            writer.write(i)
+            time.sleep(0.001)
+        writer.release()
+        assert False, "encoder error not raised"
+    except RuntimeError as e:
+        assert "ffmpeg" in str(e)
+    writer.abort()
+    assert sink.aborted and sink.frames == [0, 1, 2]
+    print("  ✓ Errors")
+
+
+if __name__ == "__main__":
+    try:
+        test_prefetch()
+        test_writer_order_and_prepare()
+        test_writer_backpressure()
+        test_writer_errors()
+        print("\n✅ All render pipeline tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Render pipeline test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for the kaleidoscope symmetry compositor
+Checks that one drawn wedge becomes an N-fold (and mirrored) image
+"""
+import sys
+
+import numpy as np
+import cv2
+
+from modes.symmetry import Kaleidoscope, symmetry_maps
+
+
+def compose_dot(order, mirror, smooth=False):
+    """Compose a single dot drawn inside the first wedge onto a 121x121 frame"""
+    kaleido = Kaleidoscope(order, mirror=mirror, smooth=smooth)
+    canvas = kaleido.canvas(60)
+    cx, cy = kaleido.center
+    angle = kaleido.wedge * 0.3
+    cv2.circle(canvas, (int(cx + 40 * np.cos(angle)), int(cy + 40 * np.sin(angle))), 6, (0, 255, 0), -1)
+    frame = np.zeros((121, 121, 3), dtype=np.uint8)
+    return kaleido.compose(frame, (60, 60))
+
+
+def test_rotational_symmetry():
+    """Order 4 output is unchanged by a quarter turn; every wedge gets a copy"""
+    print("Testing rotational symmetry...")
+    for smooth in (False, True):
+        frame = compose_dot(4, mirror=False, smooth=smooth)
+        turned = np.rot90(frame)
+        assert np.count_nonzero(np.any(frame != turned, axis=2)) <= 8
+        _, labels = cv2.connectedComponents((frame[:, :, 1] > 127).astype(np.uint8))
+        assert labels.max() == 4
+    print("  ✓ Rotation")
+
+
+def test_mirror_symmetry():
+    """Mirrored output reflects across the wedge edges: 2 x order copies"""
+    print("Testing mirror symmetry...")
+    frame = compose_dot(3, mirror=True)
+    flipped = frame[::-1]
+    assert np.count_nonzero(np.any(frame != flipped, axis=2)) <= 8
+    _, labels = cv2.connectedComponents((frame[:, :, 1] > 127).astype(np.uint8))
+    assert labels.max() == 6
+    print("  ✓ Mirror")
+
+
+def test_cost_independent_of_order():
+    """Rotated patterns need three drawn copies and maps are cached"""
+    print("Testing copies and map cache...")
+    for order in (3, 8, 24):
+        assert len(Kaleidoscope(order).copies(1.234)) == 3
+    assert symmetry_maps(8, False, 30, (80, 90), (40, 40)) is symmetry_maps(8, False, 30, (80, 90), (40, 40))
+    print("  ✓ Copies and cache")
+
+
+if __name__ == "__main__":
+    try:
+        test_rotational_symmetry()
+        test_mirror_symmetry()
+        test_cost_independent_of_order()
+    except AssertionError as e:
+        print(f"\n❌ Symmetry test failed: {e}")
+        sys.exit(1)
+    print("\n✅ Symmetry compositor works")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script for Voronoi labeling
+Checks nearest-seed labels and cell edges against a per-point scan
+"""
+import sys
+
+import numpy as np
+
+from modes import voronoi
+
+
+def test_labels_match_linear_scan():
+    """Labels equal scanning every seed per point (first seed wins ties)"""
+    print("Testing nearest-seed labels...")
+    rng = np.random.default_rng(0)
+    seed_x = rng.uniform(0, 90, 15)
+    seed_y = rng.uniform(0, 60, 15)
+    seed_x[3], seed_y[3] = seed_x[7], seed_y[7] = 40.0, 30.0  # duplicate seed: tie
+    labels, dist_sq = voronoi.voronoi_labels(90, 60, seed_x, seed_y, step=3)
+
+    for j, y in enumerate(range(0, 60, 3)):
+        for i, x in enumerate(range(0, 90, 3)):
+            best, best_idx = float('inf'), 0
+            for k in range(len(seed_x)):
+                d = (x - seed_x[k])**2 + (y - seed_y[k])**2
+                if d < best:
+                    best, best_idx = d, k
+            assert labels[j, i] == best_idx and dist_sq[j, i] == best, (x, y)
+    assert not np.any(labels == 7)
+    print("  ✓ Labels")
+
+
+def test_cell_edges():
+    """Edges mark points next to a different cell on the right or below"""
+    print("Testing cell edges...")
+    labels = np.array([[0, 0, 1],
+                       [0, 0, 1],
+                       [2, 2, 2]])
+    expected = np.array([[False, True, False],
+                         [True, True, True],
+                         [False, False, False]])
+    assert np.array_equal(voronoi.cell_edges(labels), expected)
+    print("  ✓ Edges")
+
+
+if __name__ == "__main__":
+    try:
+        test_labels_match_linear_scan()
+        test_cell_edges()
+    except AssertionError as e:
+        print(f"\n❌ Voronoi test failed: {e}")
+        sys.exit(1)
+    print("\n✅ Voronoi labels match the linear scan")